@@ -450,6 +450,7 @@ mod transpiler {
                 export_fn!(vf2::qk_vf2_layout_configuration_set_max_trials),
                 export_fn!(vf2::qk_vf2_layout_configuration_set_shuffle_seed),
                 export_fn!(vf2::qk_vf2_layout_configuration_set_score_initial),
+                export_fn!(vf2::qk_vf2_layout_configuration_set_parallel),
             ]
         });
 
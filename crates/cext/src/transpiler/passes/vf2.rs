@@ -280,6 +280,29 @@ pub unsafe extern "C" fn qk_vf2_layout_configuration_set_score_initial(
 ) {
     unsafe { (*config).0.score_initial_layout = score_initial };
 }
+/// @ingroup QkVF2LayoutConfiguration
+/// Whether to search the branches of the root of the VF2 search tree on multiple threads.
+///
+/// The call and trial limits still apply to the whole search, but the branches that are searched
+/// at the same time each take a share of what is left of the call limit, so the two searches
+/// explore different parts of the search space when the limits are reached.  The result is the
+/// same as the serial search if none of the limits are reached, and is deterministic and does not
+/// depend on the number of threads unless the trial limit is reached.  The default is ``false``.
+///
+/// @param config The configuration to update.
+/// @param parallel Whether to search on multiple threads.
+///
+/// # Safety
+///
+/// Behavior is undefined if `config` is not a valid, aligned, non-null pointer to a
+/// `VF2LayoutConfiguration`.
+#[unsafe(no_mangle)]
+pub unsafe extern "C" fn qk_vf2_layout_configuration_set_parallel(
+    config: *mut VF2LayoutConfiguration,
+    parallel: bool,
+) {
+    unsafe { (*config).0.parallel = parallel };
+}
 
 /// @ingroup QkTranspilerPassesStandalone
 /// Use the VF2 algorithm to choose a layout (if possible) for the input circuit, using a
@@ -507,6 +530,7 @@ pub unsafe extern "C" fn qk_transpiler_pass_standalone_vf2_layout(
         max_trials,
         shuffle_seed: None,
         score_initial_layout: false,
+        parallel: false,
     });
     // SAFETY: this function is a deprecated thin wrapper around `_average`, and per documentation
     // the caller has upheld the requirements of that function.  `config` is safe to point to as it
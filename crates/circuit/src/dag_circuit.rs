@@ -14,6 +14,7 @@ use std::cmp::Ordering;
 use std::fmt::Debug;
 use std::hash::Hash;
 use std::iter::zip;
+use std::ops::{Deref, DerefMut};
 use std::sync::Arc;
 
 use foldhash::fast::RandomState;
@@ -339,7 +340,7 @@ pub struct DAGCircuit {
     #[pyo3(get, set)]
     pub metadata: Option<Py<PyAny>>,
 
-    dag: StableDiGraph<NodeType, Wire>,
+    dag: SharedGraph,
 
     qregs: RegisterData<QuantumRegister>,
     cregs: RegisterData<ClassicalRegister>,
@@ -383,6 +384,48 @@ pub struct DAGCircuit {
 
     /// Operation kind to count
     op_names: IndexMap<String, usize>,
+
+    /// The depth of the DAG, if it has been computed since the last time a node or an edge was
+    /// added to or removed from `dag`.  This is only used for DAGs without control flow.
+    depth_cache: OnceLock<usize>,
+}
+
+/// The graph of a [DAGCircuit], shared between clones of the circuit until one of them is
+/// modified.
+///
+/// Cloning a [DAGCircuit] only increments the reference count of its graph.  The first mutable
+/// access to the graph of a clone whose graph is still shared copies the graph, so clones that
+/// are only read from, such as the DAGs that passes keep to compare alternatives against, do not
+/// pay for a copy of the graph at all.
+#[derive(Clone, Debug, Default)]
+struct SharedGraph(Arc<StableDiGraph<NodeType, Wire>>);
+
+impl SharedGraph {
+    fn new(graph: StableDiGraph<NodeType, Wire>) -> Self {
+        Self(Arc::new(graph))
+    }
+}
+
+impl Deref for SharedGraph {
+    type Target = StableDiGraph<NodeType, Wire>;
+
+    #[inline]
+    fn deref(&self) -> &Self::Target {
+        &self.0
+    }
+}
+
+impl DerefMut for SharedGraph {
+    /// Get mutable access to the graph, copying it first if it is still shared with a clone.
+    ///
+    /// The copy clones the Python objects the graph refers to, so it has the same requirements as
+    /// cloning a [DAGCircuit] up front: the thread must be attached to the interpreter if the graph
+    /// holds any Python objects.  Code that modifies a circuit after detaching from Python should
+    /// call [DAGCircuit::unshare_graph] while it is still attached.
+    #[inline]
+    fn deref_mut(&mut self) -> &mut Self::Target {
+        Arc::make_mut(&mut self.0)
+    }
 }
 
 #[derive(Clone, Debug)]
@@ -796,6 +839,7 @@ impl DAGCircuit {
     }
 
     fn __setstate__(&mut self, py: Python, state: Py<PyAny>) -> PyResult<()> {
+        self.depth_cache.take();
         let dict_state = state.cast_bound::<PyDict>(py)?;
         self.name = dict_state.get_item("name")?.unwrap().extract()?;
         self.metadata = dict_state.get_item("metadata")?.unwrap().extract()?;
@@ -864,7 +908,7 @@ impl DAGCircuit {
         let binding = dict_state.get_item("edges")?.unwrap();
         let edges_lst = binding.cast::<PyList>()?;
         let node_removed: bool = dict_state.get_item("nodes_removed")?.unwrap().extract()?;
-        self.dag = StableDiGraph::default();
+        self.dag = SharedGraph::default();
         if !node_removed {
             for item in nodes_lst.iter() {
                 let node_w = item.cast::<PyTuple>().unwrap().get_item(1).unwrap();
@@ -1818,13 +1862,17 @@ impl DAGCircuit {
             return Ok(0);
         }
         if !self.has_control_flow() {
-            let weight_fn = |_| -> Result<usize, Infallible> { Ok(1) };
-            return match rustworkx_core::dag_algo::longest_path_length(&self.dag, weight_fn)
-                .unwrap()
-            {
-                Some(res) => Ok(res - 1),
-                None => panic!("not a DAG"),
-            };
+            // Optimization loops query the depth after every iteration, often without having
+            // changed the structure of the DAG since the last query.
+            let depth = *self.depth_cache.get_or_init(|| {
+                let weight_fn = |_| -> Result<usize, Infallible> { Ok(1) };
+                match rustworkx_core::dag_algo::longest_path_length(&*self.dag, weight_fn).unwrap()
+                {
+                    Some(res) => res - 1,
+                    None => panic!("not a DAG"),
+                }
+            });
+            return Ok(depth);
         }
         if !recurse {
             return Err(DAGError::General(
@@ -1862,7 +1910,7 @@ impl DAGCircuit {
         let weight_fn = |edge: EdgeReference<'_, Wire>| -> Result<usize, Infallible> {
             Ok(*node_lookup.get(&edge.target()).unwrap_or(&1))
         };
-        match rustworkx_core::dag_algo::longest_path_length(&self.dag, weight_fn).unwrap() {
+        match rustworkx_core::dag_algo::longest_path_length(&*self.dag, weight_fn).unwrap() {
             Some(res) => Ok(res - 1),
             None => panic!("not a DAG"),
         }
@@ -2608,8 +2656,8 @@ impl DAGCircuit {
             };
 
             vf2::is_isomorphic_with_semantics(
-                &slf.dag,
-                &other.dag,
+                &*slf.dag,
+                &*other.dag,
                 (node_match, vf2::NoSemantics::new()),
                 true,
                 vf2::Problem::Exact,
@@ -2991,6 +3039,7 @@ impl DAGCircuit {
         wires: Option<Bound<PyAny>>,
         propagate_condition: Option<bool>,
     ) -> PyResult<Py<PyDict>> {
+        self.depth_cache.take();
         if propagate_condition.is_some() {
             imports::WARNINGS_WARN.get_bound(py).call1((
                 intern!(
@@ -3183,7 +3232,8 @@ impl DAGCircuit {
                         false
                     }
                 })
-                .unwrap();
+                .unwrap()
+                .source();
             let succ = self
                 .dag
                 .edges_directed(node_index, Outgoing)
@@ -3194,10 +3244,11 @@ impl DAGCircuit {
                         false
                     }
                 })
-                .unwrap();
+                .unwrap()
+                .target();
             self.dag.add_edge(
-                pred.source(),
-                succ.target(),
+                pred,
+                succ,
                 Wire::Var(self.vars_stretches.vars().find(contracted_var).unwrap()),
             );
         }
@@ -3318,7 +3369,7 @@ impl DAGCircuit {
         remove_idle_qubits: bool,
         vars_mode: VarsMode,
     ) -> PyResult<Py<PyList>> {
-        let connected_components = rustworkx_core::connectivity::connected_components(&self.dag);
+        let connected_components = rustworkx_core::connectivity::connected_components(&*self.dag);
         let dags = PyList::empty(py);
 
         for comp_nodes in connected_components.iter() {
@@ -3378,7 +3429,7 @@ impl DAGCircuit {
             }
             let node_filter = |node: NodeIndex| -> bool { node_map.contains_key(&node) };
 
-            let filtered = NodeFiltered(&self.dag, node_filter);
+            let filtered = NodeFiltered(&*self.dag, node_filter);
 
             // Remove the edges added by copy_empty_like (as idle wires) to avoid duplication
             new_dag.dag.clear_edges();
@@ -3457,6 +3508,7 @@ impl DAGCircuit {
     /// Raises:
     ///     DAGCircuitError: if either node is not an OpNode or nodes are not connected
     fn swap_nodes(&mut self, node1: &DAGNode, node2: &DAGNode) -> PyResult<()> {
+        self.depth_cache.take();
         let node1 = node1.node.unwrap();
         let node2 = node2.node.unwrap();
 
@@ -3760,7 +3812,7 @@ impl DAGCircuit {
     /// Returns the longest path in the dag as a list of DAGOpNodes, DAGInNodes, and DAGOutNodes.
     fn longest_path(&self, py: Python) -> PyResult<Vec<Py<PyAny>>> {
         let weight_fn = |_| -> Result<usize, Infallible> { Ok(1) };
-        match rustworkx_core::dag_algo::longest_path(&self.dag, weight_fn).unwrap() {
+        match rustworkx_core::dag_algo::longest_path(&*self.dag, weight_fn).unwrap() {
             Some(res) => res.0,
             None => panic!("not a DAG"),
         }
@@ -3984,7 +4036,8 @@ impl DAGCircuit {
 
     /// Remove all of the ancestor operation nodes of node.
     fn remove_ancestors_of(&mut self, node: &DAGNode) {
-        let ancestors: Vec<_> = core_ancestors(&self.dag, node.node.unwrap())
+        self.depth_cache.take();
+        let ancestors: Vec<_> = core_ancestors(&*self.dag, node.node.unwrap())
             .filter(|next| {
                 next != &node.node.unwrap()
                     && matches!(self.dag.node_weight(*next), Some(NodeType::Operation(_)))
@@ -3997,7 +4050,8 @@ impl DAGCircuit {
 
     /// Remove all of the descendant operation nodes of node.
     fn remove_descendants_of(&mut self, node: &DAGNode) {
-        let descendants: Vec<_> = core_descendants(&self.dag, node.node.unwrap())
+        self.depth_cache.take();
+        let descendants: Vec<_> = core_descendants(&*self.dag, node.node.unwrap())
             .filter(|next| {
                 next != &node.node.unwrap()
                     && matches!(self.dag.node_weight(*next), Some(NodeType::Operation(_)))
@@ -4010,7 +4064,8 @@ impl DAGCircuit {
 
     /// Remove all of the non-ancestors operation nodes of node.
     fn remove_nonancestors_of(&mut self, node: &DAGNode) {
-        let ancestors: HashSet<_> = core_ancestors(&self.dag, node.node.unwrap())
+        self.depth_cache.take();
+        let ancestors: HashSet<_> = core_ancestors(&*self.dag, node.node.unwrap())
             .filter(|next| {
                 next != &node.node.unwrap()
                     && matches!(self.dag.node_weight(*next), Some(NodeType::Operation(_)))
@@ -4028,7 +4083,8 @@ impl DAGCircuit {
 
     /// Remove all of the non-descendants operation nodes of node.
     fn remove_nondescendants_of(&mut self, node: &DAGNode) {
-        let descendants: HashSet<_> = core_descendants(&self.dag, node.node.unwrap())
+        self.depth_cache.take();
+        let descendants: HashSet<_> = core_descendants(&*self.dag, node.node.unwrap())
             .filter(|next| {
                 next != &node.node.unwrap()
                     && matches!(self.dag.node_weight(*next), Some(NodeType::Operation(_)))
@@ -4341,7 +4397,7 @@ impl DAGCircuit {
         }
         let weight_fn = |_| -> Result<usize, Infallible> { Ok(1) };
         let longest_path =
-            match rustworkx_core::dag_algo::longest_path(&self.dag, weight_fn).unwrap() {
+            match rustworkx_core::dag_algo::longest_path(&*self.dag, weight_fn).unwrap() {
                 Some(res) => res.0,
                 None => panic!("not a DAG"),
             };
@@ -4760,7 +4816,7 @@ impl DAGCircuit {
     }
 
     fn _is_dag(&self) -> bool {
-        rustworkx_core::petgraph::algo::toposort(&self.dag, None).is_ok()
+        rustworkx_core::petgraph::algo::toposort(&*self.dag, None).is_ok()
     }
 
     fn _in_edges(&self, py: Python, node_index: usize) -> Vec<Py<PyTuple>> {
@@ -4920,7 +4976,7 @@ impl<'a> DAGCircuit {
             }
         };
 
-        match rustworkx_core::dag_algo::collect_runs(&self.dag, filter_fn) {
+        match rustworkx_core::dag_algo::collect_runs(&*self.dag, filter_fn) {
             Some(iter) => iter.map(|result| result.unwrap()),
             None => panic!("Invalid DAG cycle(s) detected"),
         }
@@ -5051,7 +5107,7 @@ impl DAGCircuit {
         DAGCircuit {
             name: None,
             metadata: None,
-            dag: StableDiGraph::default(),
+            dag: SharedGraph::default(),
             qregs: RegisterData::new(),
             cregs: RegisterData::new(),
             qargs_interner: Interner::new(),
@@ -5069,6 +5125,7 @@ impl DAGCircuit {
             clbit_io_map: Vec::new(),
             var_io_map: Vec::new(),
             op_names: IndexMap::default(),
+            depth_cache: OnceLock::new(),
         }
     }
     /// Create an empty DAG, but with all the same qubit data, classical data and metadata
@@ -5815,7 +5872,7 @@ impl DAGCircuit {
             }
         };
 
-        match rustworkx_core::dag_algo::collect_runs(&self.dag, filter_fn) {
+        match rustworkx_core::dag_algo::collect_runs(&*self.dag, filter_fn) {
             Some(iter) => iter.map(|result| result.unwrap()),
             None => panic!("invalid DAG: cycle(s) detected!"),
         }
@@ -5833,7 +5890,7 @@ impl DAGCircuit {
                 _ => Ok(false),
             }
         };
-        rustworkx_core::dag_algo::collect_runs(&self.dag, filter_fn)
+        rustworkx_core::dag_algo::collect_runs(&*self.dag, filter_fn)
             .map(|node_iter| node_iter.map(|x| x.unwrap()))
     }
 
@@ -5865,7 +5922,7 @@ impl DAGCircuit {
                 _ => Ok(None),
             }
         };
-        rustworkx_core::dag_algo::collect_bicolor_runs(&self.dag, filter_fn, color_fn).unwrap()
+        rustworkx_core::dag_algo::collect_bicolor_runs(&*self.dag, filter_fn, color_fn).unwrap()
     }
 
     /// Track an instruction from the [DAGCircuit].  This updates the name-count and blocks tracking
@@ -5975,6 +6032,7 @@ impl DAGCircuit {
         instr: PackedInstruction,
         dir: Direction,
     ) -> Result<NodeIndex, DAGError> {
+        self.depth_cache.take();
         self.track_instruction(&instr);
         let (all_cbits, vars) = self
             .get_classical_resources(&instr)
@@ -6176,7 +6234,7 @@ impl DAGCircuit {
     fn topological_nodes(&self, reverse: bool) -> Vec<NodeIndex> {
         let key = |node: NodeIndex| -> Result<SortKeyType, Infallible> { Ok(self.sort_key(node)) };
         let Ok(nodes) = rustworkx_core::dag_algo::lexicographical_topological_sort(
-            &self.dag, key, reverse, None,
+            &*self.dag, key, reverse, None,
         )
         .map_err(|e| match e {
             rustworkx_core::dag_algo::TopologicalSortError::CycleOrBadInitialState => {
@@ -6206,7 +6264,7 @@ impl DAGCircuit {
             key.call1((node,))?.extract()
         };
         Ok(rustworkx_core::dag_algo::lexicographical_topological_sort(
-            &self.dag, key, reverse, None,
+            &*self.dag, key, reverse, None,
         )
         .map_err(|e| match e {
             rustworkx_core::dag_algo::TopologicalSortError::CycleOrBadInitialState => {
@@ -6371,6 +6429,7 @@ impl DAGCircuit {
     /// Raises:
     ///     DAGCircuitError: if trying to add duplicate wire
     fn add_wire(&mut self, wire: Wire) -> Result<(NodeIndex, NodeIndex), DuplicateWireError> {
+        self.depth_cache.take();
         let (in_node, out_node) = match wire {
             Wire::Qubit(qubit) => {
                 if qubit.index() < self.qubit_io_map.len() {
@@ -6404,6 +6463,15 @@ impl DAGCircuit {
         Ok((in_node, out_node))
     }
 
+    /// Give this circuit its own copy of its graph if it still shares it with a clone.
+    ///
+    /// Copying the graph clones the Python objects it refers to, which requires the thread to be
+    /// attached to the interpreter.  Call this before modifying a circuit from code that has
+    /// detached from Python, so that the copy is not deferred to that code.
+    pub fn unshare_graph(&mut self, _py: Python) {
+        Arc::make_mut(&mut self.dag.0);
+    }
+
     /// Set the global phase to a float value.  Returns the old phase.
     ///
     /// Unlike the general [set_global_phase_param], this is infallible.
@@ -6447,6 +6515,7 @@ impl DAGCircuit {
     }
 
     fn remove_idle_wire(&mut self, wire: Wire) {
+        self.depth_cache.take();
         let [in_node, out_node] = match wire {
             Wire::Qubit(qubit) => self.qubit_io_map[qubit.index()],
             Wire::Clbit(clbit) => self.clbit_io_map[clbit.index()],
@@ -6490,6 +6559,7 @@ impl DAGCircuit {
     ///
     /// The removed [PackedInstruction] is returned
     pub fn remove_op_node(&mut self, index: NodeIndex) -> PackedInstruction {
+        self.depth_cache.take();
         let mut edge_list: Vec<(NodeIndex, NodeIndex, Wire)> = Vec::new();
         for (source, in_weight) in self
             .dag
@@ -6519,12 +6589,12 @@ impl DAGCircuit {
 
     /// Returns an iterator of the ancestors indices of a node.
     pub fn ancestors(&self, node: NodeIndex) -> impl Iterator<Item = NodeIndex> + '_ {
-        core_ancestors(&self.dag, node).filter(move |next| next != &node)
+        core_ancestors(&*self.dag, node).filter(move |next| next != &node)
     }
 
     /// Returns an iterator of the descendants of a node as DAGOpNodes and DAGOutNodes.
     pub fn descendants(&self, node: NodeIndex) -> impl Iterator<Item = NodeIndex> + '_ {
-        core_descendants(&self.dag, node).filter(move |next| next != &node)
+        core_descendants(&*self.dag, node).filter(move |next| next != &node)
     }
 
     /// Returns an iterator of tuples of (DAGNode, [DAGNodes]) where the DAGNode is the current node
@@ -6533,7 +6603,7 @@ impl DAGCircuit {
         &self,
         node: NodeIndex,
     ) -> impl Iterator<Item = (NodeIndex, Vec<NodeIndex>)> + '_ {
-        core_bfs_successors(&self.dag, node).filter(move |(_, others)| !others.is_empty())
+        core_bfs_successors(&*self.dag, node).filter(move |(_, others)| !others.is_empty())
     }
 
     /// Returns an iterator of tuples of (DAGNode, [DAGNodes]) where the DAGNode is the current node
@@ -6542,7 +6612,7 @@ impl DAGCircuit {
         &self,
         node: NodeIndex,
     ) -> impl Iterator<Item = (NodeIndex, Vec<NodeIndex>)> + '_ {
-        core_bfs_predecessors(&self.dag, node).filter(move |(_, others)| !others.is_empty())
+        core_bfs_predecessors(&*self.dag, node).filter(move |(_, others)| !others.is_empty())
     }
 
     fn pack_into(&mut self, py: Python, b: &Bound<PyAny>) -> Result<NodeType, PyErr> {
@@ -6736,7 +6806,7 @@ impl DAGCircuit {
         first_layer.extend(self.clbit_io_map.iter().map(|x| x[0]));
         first_layer.extend(self.var_io_map.iter().map(|x| x[0]));
         // A DAG is by definition acyclical, therefore unwrapping the layer should never fail.
-        layers(&self.dag, first_layer).map(|layer| match layer {
+        layers(&*self.dag, first_layer).map(|layer| match layer {
             Ok(layer) => layer,
             Err(_) => unreachable!("Not a DAG."),
         })
@@ -6983,6 +7053,7 @@ impl DAGCircuit {
         var_map: &HashMap<expr::Var, expr::Var>,
         block_map: &HashMap<Block, Block>,
     ) -> Result<IndexMap<NodeIndex, NodeIndex>, DAGError> {
+        self.depth_cache.take();
         if self.dag.node_weight(node).is_none() {
             return Err(DAGError::NodeNotInGraph(node));
         }
@@ -7001,7 +7072,8 @@ impl DAGCircuit {
                             false
                         }
                     })
-                    .unwrap();
+                    .unwrap()
+                    .source();
                 let succ = self
                     .dag
                     .edges_directed(node, Outgoing)
@@ -7012,9 +7084,9 @@ impl DAGCircuit {
                             false
                         }
                     })
-                    .unwrap();
-                self.dag
-                    .add_edge(pred.source(), succ.target(), Wire::Qubit(*self_wire));
+                    .unwrap()
+                    .target();
+                self.dag.add_edge(pred, succ, Wire::Qubit(*self_wire));
             }
         }
         for (in_dag_wire, self_wire) in clbit_map.iter() {
@@ -7030,7 +7102,8 @@ impl DAGCircuit {
                             false
                         }
                     })
-                    .unwrap();
+                    .unwrap()
+                    .source();
                 let succ = self
                     .dag
                     .edges_directed(node, Outgoing)
@@ -7041,9 +7114,9 @@ impl DAGCircuit {
                             false
                         }
                     })
-                    .unwrap();
-                self.dag
-                    .add_edge(pred.source(), succ.target(), Wire::Clbit(*self_wire));
+                    .unwrap()
+                    .target();
+                self.dag.add_edge(pred, succ, Wire::Clbit(*self_wire));
             }
         }
 
@@ -7356,7 +7429,7 @@ impl DAGCircuit {
         Self {
             name: None,
             metadata: None,
-            dag: StableDiGraph::with_capacity(num_nodes, num_edges),
+            dag: SharedGraph::new(StableDiGraph::with_capacity(num_nodes, num_edges)),
             qregs: RegisterData::new(),
             cregs: RegisterData::new(),
             qargs_interner: Interner::with_capacity(num_qubits),
@@ -7374,6 +7447,7 @@ impl DAGCircuit {
             clbit_io_map: Vec::with_capacity(num_clbits),
             var_io_map: Vec::with_capacity(num_vars),
             op_names: IndexMap::default(),
+            depth_cache: OnceLock::new(),
         }
     }
 
@@ -7398,6 +7472,7 @@ impl DAGCircuit {
         new_gate: (StandardGate, &[f64]),
         old_index: NodeIndex,
     ) {
+        self.depth_cache.take();
         let inst = if let NodeType::Operation(old_node) = &self.dag[old_index] {
             PackedInstruction {
                 op: new_gate.0.into(),
@@ -7432,6 +7507,7 @@ impl DAGCircuit {
     /// This must only be called if all the nodes operate
     /// on a single qubit with no other wires in or out of any nodes
     pub fn remove_1q_sequence(&mut self, sequence: &[NodeIndex]) {
+        self.depth_cache.take();
         let (parent_index, weight) = self
             .dag
             .edges_directed(*sequence.first().unwrap(), Incoming)
@@ -7459,6 +7535,7 @@ impl DAGCircuit {
     where
         F: Fn(Wire) -> (PackedOperation, SmallVec<[Param; 3]>),
     {
+        self.depth_cache.take();
         let mut edge_list: Vec<(NodeIndex, NodeIndex, Wire)> = Vec::with_capacity(2);
         for (source, in_weight) in self
             .dag
@@ -7779,6 +7856,7 @@ impl DAGCircuit {
         qubit_pos_map: &HashMap<Qubit, usize>,
         clbit_pos_map: &HashMap<Clbit, usize>,
     ) -> Result<NodeIndex, DAGError> {
+        self.depth_cache.take();
         let mut block_qargs: HashSet<Qubit> = HashSet::new();
         let mut block_cargs: HashSet<Clbit> = HashSet::new();
         for nd in block_ids {
@@ -8335,7 +8413,7 @@ impl DAGCircuit {
         let new_dag = self.copy_empty_like_with_same_capacity(vars_mode, blocks_mode);
         let mut builder = new_dag.into_builder();
         for node in
-            petgraph::algo::toposort(&self.dag, None).expect("DAGCircuit can't have a cycle")
+            petgraph::algo::toposort(&*self.dag, None).expect("DAGCircuit can't have a cycle")
         {
             if let NodeType::Operation(ref inst) = self.dag[node] {
                 callback(&mut builder, inst, node)?;
@@ -8409,6 +8487,7 @@ impl DAGCircuitBuilder {
     /// Finishes up the changes by re-connecting all of the output nodes back to the last
     /// recorded nodes.
     pub fn build(mut self) -> DAGCircuit {
+        self.dag.depth_cache.take();
         // Re-connects all of the output nodes with their respective last nodes.
         // Add the output_nodes back to qargs
         for (qubit, node) in self
@@ -8743,6 +8822,7 @@ mod test {
     use rustworkx_core::petgraph::prelude::*;
     use rustworkx_core::petgraph::stable_graph::DefaultIx;
     use rustworkx_core::petgraph::visit::IntoEdgeReferences;
+    use std::sync::Arc;
 
     fn new_dag(qubits: u32, clbits: u32) -> DAGCircuit {
         let qreg = QuantumRegister::new_owning("q".to_owned(), qubits);
@@ -8970,4 +9050,21 @@ mod test {
         // will need to be updated as well.
         let _: DefaultIx = 0u32;
     }
+
+    #[test]
+    fn test_clone_shares_graph_until_modified() -> PyResult<()> {
+        let mut dag = new_dag(2, 0);
+        let cx = cx_gate!(dag, 0, 1);
+        dag.push_back(cx)?;
+        let snapshot = dag.clone();
+        assert!(Arc::ptr_eq(&dag.dag.0, &snapshot.dag.0));
+
+        let cx = cx_gate!(dag, 1, 0);
+        dag.push_back(cx)?;
+        assert!(!Arc::ptr_eq(&dag.dag.0, &snapshot.dag.0));
+        assert_eq!(dag.dag.node_count(), 6);
+        assert_eq!(snapshot.dag.node_count(), 5);
+        assert_eq!(snapshot.dag.edge_count(), 4);
+        Ok(())
+    }
 }
@@ -611,6 +611,9 @@ impl<S> Restriction<S> {
 /// * [with_call_limit] limits the number of times the partial mapping can be extended before
 ///   terminating the isomorphism search.
 ///
+/// * [with_root_branch] limits the search to one branch of the root of the search tree, so that
+///   independent parts of the search space can be explored in parallel.
+///
 /// * [with_vf2pp_ordering] causes the algorithm to first use the VF2++ ordering heuristic to
 ///   generate the initial mapping priority for the nodes.
 ///
@@ -634,6 +637,7 @@ where
     restriction: Option<Restriction<NS::Score>>,
     problem: Problem,
     call_limit: Option<usize>,
+    root_branch: Option<usize>,
     marker: marker::PhantomData<(NG, HG)>,
 }
 
@@ -670,6 +674,7 @@ where
             restriction: None,
             problem,
             call_limit: None,
+            root_branch: None,
             marker: marker::PhantomData,
         }
     }
@@ -704,6 +709,7 @@ where
             restriction: self.restriction,
             problem: self.problem,
             call_limit: self.call_limit,
+            root_branch: self.root_branch,
             marker: marker::PhantomData,
         }
     }
@@ -736,6 +742,7 @@ where
             restriction: self.restriction,
             problem: self.problem,
             call_limit: self.call_limit,
+            root_branch: self.root_branch,
             marker: marker::PhantomData,
         }
     }
@@ -767,6 +774,7 @@ where
             restriction: None,
             problem: self.problem,
             call_limit: self.call_limit,
+            root_branch: self.root_branch,
             marker: marker::PhantomData,
         }
     }
@@ -791,6 +799,7 @@ where
             restriction: None,
             problem: self.problem,
             call_limit: self.call_limit,
+            root_branch: self.root_branch,
             marker: marker::PhantomData,
         }
     }
@@ -819,6 +828,25 @@ where
         Self { call_limit, ..self }
     }
 
+    /// Only search the branch of the search tree in which the first node of the needle (in the
+    /// search order) is mapped to the `branch`-th node of the haystack (also in the search order).
+    ///
+    /// The branches `0..haystack.node_count()` partition the search space, and an unrestricted
+    /// search visits them in increasing order.  This means that each branch can be searched
+    /// independently, for example on separate threads, and the results combined in branch order
+    /// to get the same result as an unrestricted search.  `None` removes the restriction.
+    pub fn with_root_branch(self, root_branch: Option<usize>) -> Self {
+        Self {
+            root_branch,
+            ..self
+        }
+    }
+
+    /// The restriction on the returned values, if any.
+    pub fn restriction(&self) -> Option<&Restriction<NS::Score>> {
+        self.restriction.as_ref()
+    }
+
     /// Apply a restriction to the returned values from the iterator.
     pub fn with_restriction(self, restriction: Restriction<NS::Score>) -> Self {
         Self {
@@ -839,6 +867,7 @@ where
             restriction: self.restriction,
             problem: self.problem,
             call_limit: self.call_limit,
+            root_branch: self.root_branch,
             marker: marker::PhantomData,
         }
     }
@@ -869,6 +898,7 @@ where
             restriction: self.restriction,
             problem: self.problem,
             call_limit: self.call_limit,
+            root_branch: self.root_branch,
             marker: marker::PhantomData,
         }
     }
@@ -954,6 +984,7 @@ where
             loop_stack,
             num_calls: 0,
             call_limit: self.call_limit,
+            root_branch: self.root_branch,
         }
     }
 }
@@ -1209,6 +1240,29 @@ impl PartialOrd for NeighborKind {
     }
 }
 
+/// Get the next haystack candidate from [State::next_haystack_from], but if `root_branch` is set,
+/// only allow the node with that index.
+#[inline]
+fn next_haystack_in_branch<G, OtherId>(
+    haystack: &mut State<G, OtherId>,
+    root_branch: Option<usize>,
+    skip: usize,
+    needle_kind: NeighborKind,
+    problem: Problem,
+) -> Option<G::NodeId>
+where
+    G: for<'a> alias::Vf2Graph<'a>,
+    OtherId: IndexType,
+{
+    match root_branch {
+        Some(branch) if skip > branch => None,
+        Some(branch) => haystack
+            .next_haystack_from(branch, needle_kind, problem)
+            .filter(|node| node.index() == branch),
+        None => haystack.next_haystack_from(skip, needle_kind, problem),
+    }
+}
+
 #[derive(Debug)]
 enum Frame<N, H> {
     ChooseNextHaystack { nodes: (N, H), kind: NeighborKind },
@@ -1236,6 +1290,8 @@ where
     loop_stack: Vec<Frame<N::NodeId, H::NodeId>>,
     num_calls: usize,
     pub call_limit: Option<usize>,
+    /// If set, the index of the only haystack node that the first needle node may be mapped to.
+    root_branch: Option<usize>,
 }
 
 impl<N, H, NId, HId, NS, ES> Vf2IntoIter<N, H, NId, HId, NS, ES>
@@ -1270,6 +1326,7 @@ where
     /// induced-subgraph problem, and will be _at least_ a neighbor in the same direction(s) for
     /// non-induced subgraphs).
     fn next_candidates(&mut self) -> Option<(N::NodeId, H::NodeId, NeighborKind)> {
+        let root_branch = self.active_root_branch();
         let mut needle_isolated: Option<N::NodeId> = None;
         let mut needle_outgoing: Option<N::NodeId> = None;
         let mut needle_incoming: Option<N::NodeId> = None;
@@ -1329,10 +1386,13 @@ where
             needle_pos = needle_node.index() + 1;
             // Strictly we could probably save the iteration state of the `haystack` search here,
             // but the performance difference is likely negligible in practice.
-            if let Some(haystack_node) =
-                self.haystack
-                    .next_haystack_from(0, needle_kind, self.problem)
-            {
+            if let Some(haystack_node) = next_haystack_in_branch(
+                &mut self.haystack,
+                root_branch,
+                0,
+                needle_kind,
+                self.problem,
+            ) {
                 return Some((needle_node, haystack_node, needle_kind));
             };
             if needle_kind == NeighborKind::Neither {
@@ -1342,6 +1402,19 @@ where
         }
     }
 
+    /// The number of times the partial mapping has been extended so far, as counted against the
+    /// call limit.
+    pub fn num_calls(&self) -> usize {
+        self.num_calls
+    }
+
+    /// The root branch that the next haystack candidate must be in, if it's being chosen for the
+    /// root of the search tree (i.e. nothing is mapped yet), and the search is restricted.
+    #[inline]
+    fn active_root_branch(&self) -> Option<usize> {
+        self.root_branch.filter(|_| self.needle.generation == 0)
+    }
+
     /// Remove this pair of nodes from the mapping.
     ///
     /// The pair of nodes must be on the top of the stack of pushes.
@@ -1832,10 +1905,13 @@ where
             let (mut nodes, kind) = match self.loop_stack.pop()? {
                 Frame::ChooseNextHaystack { nodes, kind } => {
                     self.pop_state(nodes);
-                    if let Some(haystack) =
-                        self.haystack
-                            .next_haystack_from(nodes.1.index() + 1, kind, self.problem)
-                    {
+                    if let Some(haystack) = next_haystack_in_branch(
+                        &mut self.haystack,
+                        self.active_root_branch(),
+                        nodes.1.index() + 1,
+                        kind,
+                        self.problem,
+                    ) {
                         ((nodes.0, haystack), kind)
                     } else {
                         continue;
@@ -1887,10 +1963,13 @@ where
                     }
                     self.pop_state(nodes);
                 }
-                if let Some(haystack) =
-                    self.haystack
-                        .next_haystack_from(nodes.1.index() + 1, kind, self.problem)
-                {
+                if let Some(haystack) = next_haystack_in_branch(
+                    &mut self.haystack,
+                    self.active_root_branch(),
+                    nodes.1.index() + 1,
+                    kind,
+                    self.problem,
+                ) {
                     nodes.1 = haystack;
                 } else {
                     break;
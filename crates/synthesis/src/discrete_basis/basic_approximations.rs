@@ -10,7 +10,7 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
-use binrw::{BinRead, BinWrite, binrw};
+use binrw::{BinRead, binread};
 use hashbrown::HashMap;
 use nalgebra::{Matrix2, Matrix3};
 use num_complex::{Complex, ComplexFloat};
@@ -60,17 +60,23 @@ pub struct GateSequence {
     pub phase: f64,
 }
 
-/// A serializable version of the [GateSequence] used to store and retrieve [BasicApproximations].
-#[binrw]
-#[brw(big)]
+/// The first bytes of a file written by [BasicApproximations::save].
+const MAGIC: &[u8; 8] = b"QKSKBA02";
+
+/// The size in bytes of the record of one sequence in a file written by
+/// [BasicApproximations::save]: its index, SO(3) point and phase.
+const RECORD_SIZE: usize = 8 + 9 * 8 + 8;
+
+/// A serializable version of the [GateSequence] in the format written by Qiskit 2.3, which can
+/// still be loaded into [BasicApproximations].
+#[binread]
+#[br(big)]
 #[derive(Clone, Debug)]
 struct SerializableGateSequence {
-    #[bw(calc = gates.len() as u64)]
     #[br(temp)]
     gates_len: u64,
     #[br(count = gates_len)]
     gates: Vec<u8>,
-    #[bw(calc = matrix_so3.len() as u64)]
     #[br(temp)]
     matrix_so3_len: u64,
     #[br(count = matrix_so3_len)]
@@ -78,12 +84,11 @@ struct SerializableGateSequence {
     phase: f64,
 }
 
-/// A serializable version of the [HashMap] used to store and retrieve [BasicApproximations].
-#[binrw]
-#[brw(big)]
+/// A serializable version of the [HashMap] in the format written by Qiskit 2.3.
+#[binread]
+#[br(big)]
 struct SerializableHashMap {
     #[br(temp)]
-    #[bw(calc = data.len() as u64)]
     len: u64,
 
     #[br(count = len)]
@@ -97,33 +102,6 @@ impl SerializableHashMap {
             .map(|(key, value)| (key as usize, value))
             .collect()
     }
-    fn from_hashmap(map: HashMap<usize, SerializableGateSequence>) -> Self {
-        let data = map
-            .iter()
-            .map(|(key, value)| (*key as u64, value.clone()))
-            .collect::<Vec<_>>();
-        SerializableHashMap { data }
-    }
-}
-
-impl From<&GateSequence> for SerializableGateSequence {
-    fn from(value: &GateSequence) -> Self {
-        // store the StandardGates as u8
-        let gates = value
-            .gates
-            .iter()
-            .map(|gate| *gate as u8)
-            .collect::<Vec<u8>>();
-
-        // store the SO(3) matrix as flattened vector
-        let matrix_so3 = value.matrix_so3.iter().copied().collect::<Vec<f64>>();
-
-        Self {
-            gates,
-            matrix_so3,
-            phase: value.phase,
-        }
-    }
 }
 
 impl From<&SerializableGateSequence> for GateSequence {
@@ -469,12 +447,21 @@ impl BasicApproximations {
     ///
     /// This is for legacy compatibility with the old Python version of SK.
     pub fn load_from_sequences(sequences: &[GateSequence]) -> Self {
-        let mut points: RTree<BasicPoint> = RTree::new();
-        let mut approximations: HashMap<usize, GateSequence> = HashMap::new();
-        for (unique_index, sequence) in sequences.iter().enumerate() {
-            approximations.insert(unique_index, sequence.clone());
-            points.insert(BasicPoint::from_sequence(sequence, unique_index));
-        }
+        Self::from_indexed_sequences(sequences.iter().cloned().enumerate())
+    }
+
+    /// Build the tree from sequences with their unique indices.
+    ///
+    /// The points are bulk loaded, which is much faster than inserting them one by one and gives
+    /// a better balanced tree.
+    fn from_indexed_sequences(sequences: impl Iterator<Item = (usize, GateSequence)>) -> Self {
+        let approximations = sequences.collect::<HashMap<usize, GateSequence>>();
+        let points = RTree::bulk_load(
+            approximations
+                .iter()
+                .map(|(index, sequence)| BasicPoint::from_sequence(sequence, *index))
+                .collect(),
+        );
         Self {
             points,
             approximations,
@@ -497,44 +484,137 @@ impl BasicApproximations {
     /// Save the basic approximations into a file. This can be used to load the object again,
     /// see [Self::load].
     pub fn save(&self, filename: &str) -> ::std::io::Result<()> {
-        // we turn the HashMap with GateSequences as keys into a HashMap
-        // with SerializableGateSequence as key
-        let serializable_approx = self
-            .approximations
-            .iter()
-            .map(|(key, value)| (*key, SerializableGateSequence::from(value)))
-            .collect::<HashMap<usize, SerializableGateSequence>>();
-
-        // Write the HashMap to file using binrw
-        let mut file = ::std::fs::File::create(filename)?;
-        SerializableHashMap::from_hashmap(serializable_approx)
-            .write(&mut file)
-            .map_err(::std::io::Error::other)
+        ::std::fs::write(filename, self.to_bytes())
     }
 
     /// Load the basic approximations from a file. See [Self::save] for saving the object.
+    ///
+    /// Files in the format written by Qiskit 2.3, which was parsed sequence by sequence, can
+    /// still be read.
     pub fn load(filename: &str) -> ::std::io::Result<Self> {
-        let mut file = ::std::fs::File::open(filename)?;
-        let serializable_approx = SerializableHashMap::read(&mut file)
-            .map_err(::std::io::Error::other)?
-            .into_hashmap();
+        let data = ::std::fs::read(filename)?;
+        match data.strip_prefix(MAGIC) {
+            Some(body) => Self::from_bytes(body),
+            None => Self::from_legacy_bytes(&data),
+        }
+    }
 
-        // construct the GateSequence from its serializable version
-        let approximations = serializable_approx
+    /// Serialize into the contiguous on-disk format.
+    ///
+    /// After the [MAGIC] bytes, this little-endian format holds the number of sequences and the
+    /// total number of gates as `u64`, then a fixed-width [RECORD_SIZE] record per sequence, then
+    /// `u64` offsets delimiting the gates of each sequence in the final array of gates, which
+    /// holds one `u8` per [StandardGate].  A record is the index of the sequence as `u64`, and
+    /// its SO(3) point and phase as `f64`.
+    ///
+    /// The records are in the iteration order of the R* tree, so sequences that are close in
+    /// SO(3) are close in the file, and loading it needs no parsing beyond fixed-offset reads.
+    fn to_bytes(&self) -> Vec<u8> {
+        let num_sequences = self.approximations.len();
+        let num_gates: usize = self
+            .approximations
+            .values()
+            .map(|sequence| sequence.gates.len())
+            .sum();
+        let mut out = Vec::with_capacity(
+            MAGIC.len() + 16 + num_sequences * (RECORD_SIZE + 8) + 8 + num_gates,
+        );
+        out.extend_from_slice(MAGIC);
+        out.extend_from_slice(&(num_sequences as u64).to_le_bytes());
+        out.extend_from_slice(&(num_gates as u64).to_le_bytes());
+        let ordered = self
+            .points
             .iter()
-            .map(|(key, value)| (*key, GateSequence::from(value)))
-            .collect::<HashMap<usize, GateSequence>>();
+            .map(|point| {
+                let index = point
+                    .index
+                    .expect("All registered sequences should have an index. Blame a dev.");
+                (index, &self.approximations[&index])
+            })
+            .collect::<Vec<_>>();
+        for (index, sequence) in ordered.iter() {
+            out.extend_from_slice(&(*index as u64).to_le_bytes());
+            for value in sequence.matrix_so3.iter() {
+                out.extend_from_slice(&value.to_le_bytes());
+            }
+            out.extend_from_slice(&sequence.phase.to_le_bytes());
+        }
+        let mut offset = 0u64;
+        out.extend_from_slice(&offset.to_le_bytes());
+        for (_, sequence) in ordered.iter() {
+            offset += sequence.gates.len() as u64;
+            out.extend_from_slice(&offset.to_le_bytes());
+        }
+        for (_, sequence) in ordered.iter() {
+            out.extend(sequence.gates.iter().map(|gate| *gate as u8));
+        }
+        out
+    }
 
-        // build the RTree from the sequences
-        let mut points: RTree<BasicPoint> = RTree::new();
-        for (index, sequence) in approximations.iter() {
-            points.insert(BasicPoint::from_sequence(sequence, *index));
+    /// Deserialize the contiguous on-disk format, without its [MAGIC] bytes. See [Self::to_bytes].
+    fn from_bytes(data: &[u8]) -> ::std::io::Result<Self> {
+        let invalid = |msg: &str| ::std::io::Error::new(::std::io::ErrorKind::InvalidData, msg);
+        let read_u64 = |bytes: &[u8]| u64::from_le_bytes(bytes.try_into().unwrap()) as usize;
+        let read_f64 = |bytes: &[u8]| f64::from_le_bytes(bytes.try_into().unwrap());
+
+        let (header, data) = data
+            .split_at_checked(16)
+            .ok_or_else(|| invalid("Truncated basic approximations header."))?;
+        let num_sequences = read_u64(&header[..8]);
+        let num_gates = read_u64(&header[8..]);
+        let expected_len = num_sequences
+            .checked_add(1)
+            .and_then(|n| n.checked_mul(RECORD_SIZE + 8))
+            .and_then(|n| n.checked_add(num_gates))
+            .map(|n| n - RECORD_SIZE);
+        if expected_len != Some(data.len()) {
+            return Err(invalid("Basic approximations file has an invalid size."));
+        }
+        let (records, data) = data.split_at(num_sequences * RECORD_SIZE);
+        let (offsets, gates) = data.split_at((num_sequences + 1) * 8);
+        let gates = gates
+            .iter()
+            .map(|gate_id| ::bytemuck::checked::try_cast::<_, StandardGate>(*gate_id))
+            .collect::<Result<Vec<_>, _>>()
+            .map_err(|_| invalid("Basic approximations file contains an invalid gate."))?;
+
+        let mut sequences = Vec::with_capacity(num_sequences);
+        let mut offsets = offsets.chunks_exact(8).map(read_u64);
+        let mut start = offsets.next().unwrap_or_default();
+        for (record, end) in records.chunks_exact(RECORD_SIZE).zip(offsets) {
+            if start > end || end > gates.len() {
+                return Err(invalid(
+                    "Basic approximations file has invalid gate offsets.",
+                ));
+            }
+            let mut values = record[8..].chunks_exact(8).map(read_f64);
+            let matrix_so3 = Matrix3::from_iterator(values.by_ref().take(9));
+            let phase = values.next().unwrap();
+            sequences.push((
+                read_u64(&record[..8]),
+                GateSequence {
+                    gates: gates[start..end].to_vec(),
+                    matrix_so3,
+                    phase,
+                },
+            ));
+            start = end;
         }
+        Ok(Self::from_indexed_sequences(sequences.into_iter()))
+    }
 
-        Ok(Self {
-            points,
-            approximations,
-        })
+    /// Deserialize the sequence-by-sequence format written by Qiskit 2.3.
+    fn from_legacy_bytes(data: &[u8]) -> ::std::io::Result<Self> {
+        let serializable_approx = SerializableHashMap::read(&mut ::std::io::Cursor::new(data))
+            .map_err(::std::io::Error::other)?
+            .into_hashmap();
+
+        // construct the GateSequence from its serializable version
+        Ok(Self::from_indexed_sequences(
+            serializable_approx
+                .iter()
+                .map(|(key, value)| (*key, GateSequence::from(value))),
+        ))
     }
 }
 
@@ -542,3 +622,32 @@ impl BasicApproximations {
 fn matrix3_from_pyreadonly(array: &PyReadonlyArray2<f64>) -> Matrix3<f64> {
     Matrix3::from_fn(|i, j| *array.get((i, j)).unwrap())
 }
+
+#[cfg(test)]
+mod test {
+    use super::*;
+
+    #[test]
+    fn round_trip() {
+        let basis = [StandardGate::H, StandardGate::T, StandardGate::Tdg];
+        let approximations = BasicApproximations::generate_from(&basis, 5, None).unwrap();
+        let bytes = approximations.to_bytes();
+        let loaded = BasicApproximations::from_bytes(bytes.strip_prefix(MAGIC).unwrap()).unwrap();
+        assert_eq!(
+            loaded.approximations.len(),
+            approximations.approximations.len()
+        );
+        for (index, sequence) in approximations.approximations.iter() {
+            let other = &loaded.approximations[index];
+            assert_eq!(other.gates, sequence.gates);
+            assert_eq!(other.matrix_so3, sequence.matrix_so3);
+            assert_eq!(other.phase, sequence.phase);
+        }
+        let target = approximations.approximations[&7].matrix_so3;
+        assert_eq!(
+            loaded.query(&target).unwrap().gates,
+            approximations.query(&target).unwrap().gates
+        );
+        assert!(BasicApproximations::from_bytes(&bytes[MAGIC.len()..bytes.len() - 1]).is_err());
+    }
+}
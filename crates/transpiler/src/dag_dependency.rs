@@ -0,0 +1,560 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2026
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+//! Dependency graphs of circuits.
+//!
+//! In the dependency graph of a sequence of operations, there is an edge from an operation to a
+//! later one if the two don't commute, and the later one can be brought next to the earlier one
+//! by commuting it through the operations in between.  This is the graph of the Python
+//! `DAGDependency`, which builds it by checking each new operation against every earlier one
+//! that is not already known to be an ancestor of it, so its construction takes a quadratic
+//! number of commutation checks.
+//!
+//! An operation that shares no wire with a new one always commutes with it, unless either is a
+//! control-flow operation.  The builder here keeps the operations on each wire, and only visits
+//! the ones on the wires of the new operation, from the most recent one backwards.  The scan of
+//! a wire stops at the first visited operation that is an ancestor of the new one if all the
+//! operations before it on the wire are its ancestors too, which is the common case of a wire
+//! whose operations don't commute.  The commutation relations between standard gates with
+//! numeric parameters are cached by the gates, their parameters and their relative placement.
+
+use fixedbitset::FixedBitSet;
+use hashbrown::HashMap;
+use pyo3::exceptions::PyIndexError;
+use pyo3::prelude::*;
+use smallvec::SmallVec;
+
+use qiskit_circuit::circuit_data::PyCircuitData;
+use qiskit_circuit::dag_circuit::{DAGCircuit, NodeType};
+use qiskit_circuit::operations::{OperationRef, Param};
+use qiskit_circuit::packed_instruction::PackedInstruction;
+use qiskit_circuit::{BlocksMode, Clbit, Qubit, VarsMode};
+
+use crate::commutation_checker::{
+    CommutationChecker, CommutationError, get_standard_commutation_checker,
+};
+
+/// The maximum number of qubits for which the matrix of an operation is computed in a commutation
+/// check.  This is the default of the Python `CommutationChecker.commute`.
+const MATRIX_MAX_NUM_QUBITS: u32 = 3;
+
+/// An operation of the sequence a [DependencyGraph] is built from.
+#[derive(Clone, Copy, Debug)]
+struct DependencyNode<'a> {
+    inst: &'a PackedInstruction,
+    qargs: &'a [Qubit],
+    cargs: &'a [Clbit],
+}
+
+/// The key of the commutation relation of two standard gates in the cache of a
+/// [DependencyBuilder].
+#[derive(Clone, Debug, PartialEq, Eq, Hash)]
+struct CommutationKey {
+    gates: [u8; 2],
+    /// The bits of the parameters of the first gate, followed by those of the second.
+    params: SmallVec<[u64; 4]>,
+    /// The position of each qubit of the second gate in the qubits of the first, or `u8::MAX` if
+    /// the first gate doesn't act on it.
+    placement: SmallVec<[u8; 4]>,
+}
+
+impl CommutationKey {
+    /// The key of the commutation relation of two operations, if it only depends on the key.
+    fn new(first: &DependencyNode, second: &DependencyNode) -> Option<Self> {
+        let (OperationRef::StandardGate(gate1), OperationRef::StandardGate(gate2)) =
+            (first.inst.op.view(), second.inst.op.view())
+        else {
+            return None;
+        };
+        let mut params = SmallVec::new();
+        for param in first
+            .inst
+            .params_view()
+            .iter()
+            .chain(second.inst.params_view())
+        {
+            let Param::Float(value) = param else {
+                return None;
+            };
+            params.push(value.to_bits());
+        }
+        let placement = second
+            .qargs
+            .iter()
+            .map(|qubit| {
+                first
+                    .qargs
+                    .iter()
+                    .position(|other| other == qubit)
+                    .map_or(u8::MAX, |index| index as u8)
+            })
+            .collect();
+        Some(Self {
+            gates: [gate1 as u8, gate2 as u8],
+            params,
+            placement,
+        })
+    }
+}
+
+/// An operation on a wire, in the order in which they were added to a [DependencyBuilder].
+#[derive(Clone, Copy, Debug)]
+struct WireEntry {
+    node: u32,
+    /// Whether all the earlier operations on the wire are ancestors of this one.
+    complete: bool,
+}
+
+/// The dependency graph of a sequence of operations.
+///
+/// The nodes are the indices of the operations in the sequence, which is a topological order of
+/// the graph.
+#[pyclass(module = "qiskit._accelerate.dag_dependency", frozen)]
+#[derive(Clone, Debug, Default)]
+pub struct DependencyGraph {
+    /// The direct predecessors of each node, in decreasing order.
+    predecessors: Vec<Vec<u32>>,
+    /// The direct successors of each node, in increasing order.
+    successors: Vec<Vec<u32>>,
+    /// The transitive predecessors of each node, as a set of the nodes before it.
+    ancestors: Vec<FixedBitSet>,
+}
+
+impl DependencyGraph {
+    /// Build the dependency graph of the operations of a circuit, in topological order.
+    pub fn from_dag(
+        checker: &CommutationChecker,
+        dag: &DAGCircuit,
+    ) -> Result<Self, CommutationError> {
+        let mut builder = DependencyBuilder::new(checker, dag.num_qubits(), dag.num_clbits());
+        for node in dag.topological_op_nodes(false) {
+            let NodeType::Operation(inst) = &dag[node] else {
+                unreachable!("topological_op_nodes only yields operations");
+            };
+            builder.push(DependencyNode {
+                inst,
+                qargs: dag.get_qargs(inst.qubits),
+                cargs: dag.get_cargs(inst.clbits),
+            })?;
+        }
+        Ok(builder.finish())
+    }
+
+    /// Build the dependency graph of the instructions of a circuit, in the order they appear in
+    /// the circuit.
+    pub fn from_circuit_data(
+        checker: &CommutationChecker,
+        circuit: &PyCircuitData,
+    ) -> Result<Self, CommutationError> {
+        let mut builder =
+            DependencyBuilder::new(checker, circuit.num_qubits(), circuit.num_clbits());
+        for inst in circuit.data() {
+            builder.push(DependencyNode {
+                inst,
+                qargs: circuit.get_qargs(inst.qubits),
+                cargs: circuit.get_cargs(inst.clbits),
+            })?;
+        }
+        Ok(builder.finish())
+    }
+
+    #[inline]
+    pub fn num_nodes(&self) -> usize {
+        self.predecessors.len()
+    }
+
+    pub fn num_edges(&self) -> usize {
+        self.predecessors.iter().map(Vec::len).sum()
+    }
+
+    /// The direct predecessors of a node, in decreasing order.
+    #[inline]
+    pub fn direct_predecessors(&self, node: usize) -> &[u32] {
+        &self.predecessors[node]
+    }
+
+    /// The direct successors of a node, in increasing order.
+    #[inline]
+    pub fn direct_successors(&self, node: usize) -> &[u32] {
+        &self.successors[node]
+    }
+
+    /// The transitive predecessors of a node.
+    #[inline]
+    pub fn ancestors(&self, node: usize) -> &FixedBitSet {
+        &self.ancestors[node]
+    }
+
+    /// Whether there is a path from `ancestor` to `node`.
+    #[inline]
+    pub fn is_ancestor(&self, ancestor: usize, node: usize) -> bool {
+        self.ancestors[node].contains(ancestor)
+    }
+
+    /// The edges of the graph, in the order in which the Python `DAGDependency` adds them.
+    pub fn edges(&self) -> impl Iterator<Item = (u32, u32)> + '_ {
+        self.predecessors
+            .iter()
+            .enumerate()
+            .flat_map(|(node, preds)| preds.iter().map(move |pred| (*pred, node as u32)))
+    }
+
+    fn check_node(&self, node: usize) -> PyResult<()> {
+        if node >= self.num_nodes() {
+            return Err(PyIndexError::new_err(format!(
+                "Node {node} is not in the dependency graph."
+            )));
+        }
+        Ok(())
+    }
+}
+
+#[pymethods]
+impl DependencyGraph {
+    fn __len__(&self) -> usize {
+        self.num_nodes()
+    }
+
+    /// The edges of the graph, as a list of ``(predecessor, successor)`` tuples.
+    #[pyo3(name = "edges")]
+    fn py_edges(&self) -> Vec<(u32, u32)> {
+        self.edges().collect()
+    }
+
+    /// The direct predecessors of a node, in increasing order.
+    #[pyo3(name = "direct_predecessors")]
+    fn py_direct_predecessors(&self, node: usize) -> PyResult<Vec<u32>> {
+        self.check_node(node)?;
+        Ok(self.predecessors[node].iter().rev().copied().collect())
+    }
+
+    /// The direct successors of a node, in increasing order.
+    #[pyo3(name = "direct_successors")]
+    fn py_direct_successors(&self, node: usize) -> PyResult<Vec<u32>> {
+        self.check_node(node)?;
+        Ok(self.successors[node].clone())
+    }
+
+    /// All the nodes that a node can be reached from, in increasing order.
+    fn predecessors(&self, node: usize) -> PyResult<Vec<usize>> {
+        self.check_node(node)?;
+        Ok(self.ancestors[node].ones().collect())
+    }
+
+    /// All the nodes that can be reached from a node, in increasing order.
+    fn successors(&self, node: usize) -> PyResult<Vec<usize>> {
+        self.check_node(node)?;
+        Ok((node + 1..self.num_nodes())
+            .filter(|other| self.ancestors[*other].contains(node))
+            .collect())
+    }
+}
+
+/// Builds a [DependencyGraph] one operation at a time.
+struct DependencyBuilder<'a> {
+    checker: &'a CommutationChecker,
+    num_qubits: usize,
+    nodes: Vec<DependencyNode<'a>>,
+    /// The operations on each qubit, followed by those on each clbit.
+    wires: Vec<Vec<WireEntry>>,
+    /// The control-flow operations, which commute with nothing.
+    control_flow: Vec<u32>,
+    cache: HashMap<CommutationKey, bool>,
+    graph: DependencyGraph,
+}
+
+impl<'a> DependencyBuilder<'a> {
+    fn new(checker: &'a CommutationChecker, num_qubits: usize, num_clbits: usize) -> Self {
+        Self {
+            checker,
+            num_qubits,
+            nodes: Vec::new(),
+            wires: vec![Vec::new(); num_qubits + num_clbits],
+            control_flow: Vec::new(),
+            cache: HashMap::new(),
+            graph: DependencyGraph::default(),
+        }
+    }
+
+    fn wire_indices(&self, node: &DependencyNode) -> SmallVec<[usize; 4]> {
+        node.qargs
+            .iter()
+            .map(|qubit| qubit.index())
+            .chain(
+                node.cargs
+                    .iter()
+                    .map(|clbit| self.num_qubits + clbit.index()),
+            )
+            .collect()
+    }
+
+    fn commute(
+        &mut self,
+        first: &DependencyNode,
+        second: &DependencyNode,
+    ) -> Result<bool, CommutationError> {
+        let key = CommutationKey::new(first, second);
+        if let Some(result) = key.as_ref().and_then(|key| self.cache.get(key)) {
+            return Ok(*result);
+        }
+        let result = self.checker.commute(
+            &first.inst.op.view(),
+            first.inst.params.as_deref(),
+            first.qargs,
+            first.cargs,
+            &second.inst.op.view(),
+            second.inst.params.as_deref(),
+            second.qargs,
+            second.cargs,
+            None,
+            MATRIX_MAX_NUM_QUBITS,
+            1.0,
+        )?;
+        if let Some(key) = key {
+            self.cache.insert(key, result);
+        }
+        Ok(result)
+    }
+
+    /// Visit an earlier operation while adding `node`, adding an edge from it if it is not an
+    /// ancestor of `node` yet and doesn't commute with it.  Returns whether `prev` is an ancestor
+    /// of `node`.
+    fn visit(
+        &mut self,
+        prev: u32,
+        node: &DependencyNode,
+        covered: &mut FixedBitSet,
+        predecessors: &mut Vec<u32>,
+    ) -> Result<bool, CommutationError> {
+        if covered.contains(prev as usize) {
+            return Ok(true);
+        }
+        let prev_node = self.nodes[prev as usize];
+        if self.commute(&prev_node, node)? {
+            return Ok(false);
+        }
+        predecessors.push(prev);
+        covered.union_with(&self.graph.ancestors[prev as usize]);
+        covered.insert(prev as usize);
+        Ok(true)
+    }
+
+    fn push(&mut self, node: DependencyNode<'a>) -> Result<(), CommutationError> {
+        let index = self.nodes.len() as u32;
+        let wires = self.wire_indices(&node);
+        let is_control_flow = node.inst.op.try_control_flow().is_some();
+        // The ancestors of the new node, which are the nodes that need not be visited any more.
+        let mut covered = FixedBitSet::with_capacity(index as usize);
+        let mut predecessors = Vec::new();
+        if is_control_flow {
+            for prev in (0..index).rev() {
+                self.visit(prev, &node, &mut covered, &mut predecessors)?;
+            }
+        } else {
+            // Merge the operations on the wires of the new node and the control-flow operations
+            // in decreasing order, each of them given by the end of its unvisited prefix.
+            let mut ends: SmallVec<[usize; 4]> =
+                wires.iter().map(|wire| self.wires[*wire].len()).collect();
+            let mut control_flow_end = self.control_flow.len();
+            loop {
+                let next = wires
+                    .iter()
+                    .zip(ends.iter())
+                    .filter(|(_, end)| **end > 0)
+                    .map(|(wire, end)| self.wires[*wire][end - 1].node)
+                    .chain((control_flow_end > 0).then(|| self.control_flow[control_flow_end - 1]))
+                    .max();
+                let Some(prev) = next else {
+                    break;
+                };
+                let is_ancestor = self.visit(prev, &node, &mut covered, &mut predecessors)?;
+                for (wire, end) in wires.iter().zip(ends.iter_mut()) {
+                    if *end == 0 || self.wires[*wire][*end - 1].node != prev {
+                        continue;
+                    }
+                    *end -= 1;
+                    if is_ancestor && self.wires[*wire][*end].complete {
+                        // Everything before `prev` on this wire is an ancestor of it.
+                        *end = 0;
+                    }
+                }
+                if control_flow_end > 0 && self.control_flow[control_flow_end - 1] == prev {
+                    control_flow_end -= 1;
+                }
+            }
+        }
+
+        for wire in wires {
+            let complete = self.wires[wire]
+                .last()
+                .is_none_or(|last| last.complete && covered.contains(last.node as usize));
+            self.wires[wire].push(WireEntry {
+                node: index,
+                complete,
+            });
+        }
+        if is_control_flow {
+            self.control_flow.push(index);
+        }
+        for pred in predecessors.iter() {
+            self.graph.successors[*pred as usize].push(index);
+        }
+        self.graph.predecessors.push(predecessors);
+        self.graph.successors.push(Vec::new());
+        self.graph.ancestors.push(covered);
+        self.nodes.push(node);
+        Ok(())
+    }
+
+    fn finish(self) -> DependencyGraph {
+        self.graph
+    }
+}
+
+/// A circuit stored as its dependency graph.
+///
+/// The operations are kept in a topological order of the circuit, which is the order of the nodes
+/// of the graph, so the circuit can be rebuilt from them without going through Python.
+#[pyclass(module = "qiskit._accelerate.dag_dependency")]
+#[derive(Clone, Debug)]
+pub struct DAGDependencyCircuit {
+    /// An empty copy of the circuit, holding its bits, registers, variables and metadata.
+    circuit: DAGCircuit,
+    instructions: Vec<PackedInstruction>,
+    graph: DependencyGraph,
+}
+
+impl DAGDependencyCircuit {
+    pub fn from_dag(dag: &DAGCircuit) -> Result<Self, CommutationError> {
+        let instructions: Vec<PackedInstruction> = dag
+            .topological_op_nodes(false)
+            .map(|node| match &dag[node] {
+                NodeType::Operation(inst) => inst.clone(),
+                _ => unreachable!("topological_op_nodes only yields operations"),
+            })
+            .collect();
+        let graph = DependencyGraph::from_dag(&get_standard_commutation_checker(), dag)?;
+        Ok(Self {
+            circuit: dag.copy_empty_like(VarsMode::Alike, BlocksMode::Keep),
+            instructions,
+            graph,
+        })
+    }
+
+    pub fn to_dag(&self) -> PyResult<DAGCircuit> {
+        let mut out = self
+            .circuit
+            .copy_empty_like_with_capacity(
+                self.instructions.len(),
+                0,
+                VarsMode::Alike,
+                BlocksMode::Keep,
+            )
+            .into_builder();
+        for inst in self.instructions.iter() {
+            out.push_back(inst.clone())?;
+        }
+        Ok(out.build())
+    }
+
+    #[inline]
+    pub fn graph(&self) -> &DependencyGraph {
+        &self.graph
+    }
+
+    #[inline]
+    pub fn instructions(&self) -> &[PackedInstruction] {
+        &self.instructions
+    }
+
+    /// The qubits and clbits of an operation.
+    pub fn wires(&self, node: usize) -> (&[Qubit], &[Clbit]) {
+        let inst = &self.instructions[node];
+        (
+            self.circuit.get_qargs(inst.qubits),
+            self.circuit.get_cargs(inst.clbits),
+        )
+    }
+}
+
+#[pymethods]
+impl DAGDependencyCircuit {
+    /// Build the dependency graph of a circuit.
+    ///
+    /// Args:
+    ///     dag (DAGCircuit): the circuit.
+    ///
+    /// Returns:
+    ///     DAGDependencyCircuit: the circuit with its operations in the order of
+    ///     :meth:`.DAGCircuit.topological_op_nodes`, and their dependency graph.
+    #[staticmethod]
+    #[pyo3(name = "from_dag")]
+    fn py_from_dag(dag: &DAGCircuit) -> PyResult<Self> {
+        Ok(Self::from_dag(dag)?)
+    }
+
+    /// Rebuild the circuit.
+    #[pyo3(name = "to_dag")]
+    fn py_to_dag(&self) -> PyResult<DAGCircuit> {
+        self.to_dag()
+    }
+
+    /// The dependency graph of the operations.
+    #[getter]
+    #[pyo3(name = "graph")]
+    fn py_graph(&self) -> DependencyGraph {
+        self.graph.clone()
+    }
+
+    fn __len__(&self) -> usize {
+        self.instructions.len()
+    }
+}
+
+/// Build the dependency graph of the operations of a circuit.
+///
+/// Args:
+///     dag (DAGCircuit): the circuit.
+///
+/// Returns:
+///     DependencyGraph: the graph, whose nodes are the indices of the operations in the order of
+///     :meth:`.DAGCircuit.topological_op_nodes`.
+#[pyfunction]
+pub fn dag_dependency_graph(dag: &DAGCircuit) -> PyResult<DependencyGraph> {
+    Ok(DependencyGraph::from_dag(
+        &get_standard_commutation_checker(),
+        dag,
+    )?)
+}
+
+/// Build the dependency graph of the instructions of a circuit.
+///
+/// Args:
+///     circuit_data (CircuitData): the data of the circuit.
+///
+/// Returns:
+///     DependencyGraph: the graph, whose nodes are the indices of the instructions in the circuit.
+#[pyfunction]
+pub fn circuit_dependency_graph(circuit_data: &PyCircuitData) -> PyResult<DependencyGraph> {
+    Ok(DependencyGraph::from_circuit_data(
+        &get_standard_commutation_checker(),
+        circuit_data,
+    )?)
+}
+
+pub fn dag_dependency_mod(m: &Bound<PyModule>) -> PyResult<()> {
+    m.add_class::<DependencyGraph>()?;
+    m.add_class::<DAGDependencyCircuit>()?;
+    m.add_wrapped(wrap_pyfunction!(dag_dependency_graph))?;
+    m.add_wrapped(wrap_pyfunction!(circuit_dependency_graph))?;
+    Ok(())
+}
@@ -12,6 +12,7 @@
 
 pub mod angle_bound_registry;
 pub mod commutation_checker;
+pub mod dag_dependency;
 pub mod equivalence;
 pub mod neighbors;
 pub mod passes;
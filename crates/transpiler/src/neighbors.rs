@@ -26,7 +26,7 @@ use thiserror::Error;
 /// containing the neighbours.  Looking whether a node _is_ a neighbour is done by iterating through
 /// the slice (it's allowable to binary search, but in practice the degree is likely sufficiently
 /// small that a linear search is faster).
-#[derive(Clone, Debug, PartialEq, Eq)]
+#[derive(Clone, Debug, PartialEq, Eq, Hash)]
 pub struct Neighbors {
     neighbors: Vec<PhysicalQubit>,
     partition: Vec<usize>,
@@ -0,0 +1,325 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2026
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use hashbrown::hash_map::Entry;
+use hashbrown::{HashMap, HashSet};
+use ndarray::{Array2, ArrayView2};
+use numpy::{IntoPyArray, PyArray2, PyReadonlyArray2};
+use pyo3::exceptions::{PyIndexError, PyKeyError, PyValueError};
+use pyo3::prelude::*;
+
+/// One instruction of a routed block of commuting two-qubit gates: either the gate at an index
+/// into the input gates, or a swap (`None`), and the two qubits it acts on.
+pub type RoutedInstruction = (Option<usize>, u32, u32);
+
+/// Compute the distance table of a swap strategy.
+///
+/// Entry `(i, j)` is the number of swap layers that must be applied before qubits `i` and `j` are
+/// adjacent, or -1 if they never are.
+pub fn swap_strategy_distance_matrix(
+    num_qubits: usize,
+    edges: &[[u32; 2]],
+    swap_layers: &[Vec<[u32; 2]>],
+) -> Array2<i64> {
+    let mut out = Array2::from_elem((num_qubits, num_qubits), -1);
+    for i in 0..num_qubits {
+        out[[i, i]] = 0;
+    }
+    // The inverse of the composition of the swap layers applied so far.  The edges of the coupling
+    // map after `layer` swap layers are the edges of the original map relabelled by it.
+    let mut permutation = (0..num_qubits as u32).collect::<Vec<_>>();
+    for layer in 0..=swap_layers.len() {
+        if layer > 0 {
+            for &[a, b] in swap_layers[layer - 1].iter() {
+                permutation.swap(a as usize, b as usize);
+            }
+        }
+        for &[a, b] in edges {
+            let (a, b) = (
+                permutation[a as usize] as usize,
+                permutation[b as usize] as usize,
+            );
+            if out[[a, b]] == -1 {
+                out[[a, b]] = layer as i64;
+                out[[b, a]] = layer as i64;
+            }
+        }
+    }
+    out
+}
+
+/// Route one block of commuting two-qubit gates with a swap strategy.
+///
+/// The gates are given by the pair of virtual qubits they act on, and `virtual_to_physical` is the
+/// layout at the start of the block.  Each gate is applied after as many swap layers as its
+/// qubits are apart in `distance`, in sub-layers of gates that act on disjoint qubits.  These are
+/// built with `edge_coloring` if it is given, and greedily otherwise.  As in a dictionary keyed by
+/// the qubits, a gate on the same ordered pair of qubits as an earlier gate replaces it.
+///
+/// Returns the routed instructions, and updates `virtual_to_physical` in place to account for the
+/// swaps.
+pub fn swap_decompose(
+    distance: ArrayView2<i64>,
+    swap_layers: &[Vec<[u32; 2]>],
+    virtual_to_physical: &mut [u32],
+    gates: &[[u32; 2]],
+    edge_coloring: Option<&HashMap<[u32; 2], usize>>,
+) -> PyResult<Vec<RoutedInstruction>> {
+    let mut physical_to_virtual = vec![0; virtual_to_physical.len()];
+    for (virt, &phys) in virtual_to_physical.iter().enumerate() {
+        physical_to_virtual[phys as usize] = virt as u32;
+    }
+
+    // The position in `layers[distance]` of the gate on each pair of qubits.
+    let mut slots: HashMap<[u32; 2], (usize, usize)> = HashMap::with_capacity(gates.len());
+    let mut layers: Vec<Vec<(usize, [u32; 2])>> = Vec::new();
+    let mut max_distance = None;
+    for (index, &[j, k]) in gates.iter().enumerate() {
+        let (a, b) = (
+            virtual_to_physical[j as usize] as usize,
+            virtual_to_physical[k as usize] as usize,
+        );
+        let Some(&dist) = distance.get([a, b]) else {
+            return Err(PyIndexError::new_err(format!(
+                "Qubits ({a}, {b}) are outside the swap strategy."
+            )));
+        };
+        max_distance = max_distance.max(Some(dist));
+        // Qubits that the swap strategy never makes adjacent have no layer.
+        let Ok(dist) = usize::try_from(dist) else {
+            continue;
+        };
+        match slots.entry([j, k]) {
+            Entry::Occupied(entry) => {
+                let (layer, pos) = *entry.get();
+                layers[layer][pos].0 = index;
+            }
+            Entry::Vacant(entry) => {
+                if layers.len() <= dist {
+                    layers.resize_with(dist + 1, Vec::new);
+                }
+                entry.insert((dist, layers[dist].len()));
+                layers[dist].push((index, [j, k]));
+            }
+        }
+    }
+    let Some(Ok(max_distance)) = max_distance.map(usize::try_from) else {
+        return Ok(Vec::new());
+    };
+
+    let num_colors = edge_coloring.map_or(0, |coloring| {
+        coloring.values().collect::<HashSet<_>>().len()
+    });
+    let mut out = Vec::with_capacity(gates.len());
+    let mut blocked = vec![false; virtual_to_physical.len()];
+    for layer in 0..=max_distance {
+        let current = layers
+            .get(layer)
+            .map(|gates| {
+                gates
+                    .iter()
+                    .map(|&(index, [j, k])| {
+                        (
+                            index,
+                            [
+                                physical_to_virtual[j as usize],
+                                physical_to_virtual[k as usize],
+                            ],
+                        )
+                    })
+                    .collect::<Vec<_>>()
+            })
+            .unwrap_or_default();
+        match edge_coloring {
+            Some(coloring) => {
+                let mut sub_layers = vec![Vec::new(); num_colors];
+                for (index, edge) in current {
+                    let Some(&color) = coloring.get(&edge) else {
+                        return Err(PyKeyError::new_err(format!("({}, {})", edge[0], edge[1])));
+                    };
+                    sub_layers
+                        .get_mut(color)
+                        .ok_or_else(|| PyIndexError::new_err("list index out of range"))?
+                        .push((index, edge));
+                }
+                for (index, [a, b]) in sub_layers.into_iter().flatten() {
+                    out.push((Some(index), a, b));
+                }
+            }
+            None => {
+                let mut remaining = current;
+                while !remaining.is_empty() {
+                    let mut touched = Vec::new();
+                    remaining.retain(|&(index, [a, b])| {
+                        if blocked[a as usize] || blocked[b as usize] {
+                            return true;
+                        }
+                        out.push((Some(index), a, b));
+                        blocked[a as usize] = true;
+                        blocked[b as usize] = true;
+                        touched.extend([a, b]);
+                        false
+                    });
+                    for qubit in touched {
+                        blocked[qubit as usize] = false;
+                    }
+                }
+            }
+        }
+        if layer < max_distance {
+            let swaps = swap_layers.get(layer).ok_or_else(|| {
+                PyIndexError::new_err(format!("The swap strategy has no swap layer {layer}."))
+            })?;
+            for &[a, b] in swaps.iter() {
+                out.push((None, a, b));
+                // The swap exchanges the positions of the virtual qubits that started the block
+                // at `a` and `b`.
+                virtual_to_physical.swap(a as usize, b as usize);
+                physical_to_virtual[virtual_to_physical[a as usize] as usize] = a;
+                physical_to_virtual[virtual_to_physical[b as usize] as usize] = b;
+            }
+        }
+    }
+    Ok(out)
+}
+
+/// Compute the distance table of a swap strategy.
+///
+/// Args:
+///     num_qubits (int): the number of qubits in the coupling map of the strategy.
+///     edges (list[tuple[int, int]]): the edges of the coupling map.
+///     swap_layers (list[list[tuple[int, int]]]): the swap layers of the strategy.
+///
+/// Returns:
+///     A 2D integer numpy array, whose entry ``(i, j)`` is the number of swap layers after which
+///     qubits ``i`` and ``j`` are adjacent, or -1 if they never are.
+#[pyfunction]
+#[pyo3(name = "swap_strategy_distance_matrix")]
+pub fn py_swap_strategy_distance_matrix(
+    py: Python,
+    num_qubits: usize,
+    edges: Vec<[u32; 2]>,
+    swap_layers: Vec<Vec<[u32; 2]>>,
+) -> PyResult<Py<PyArray2<i64>>> {
+    let in_range = |&[a, b]: &[u32; 2]| (a as usize) < num_qubits && (b as usize) < num_qubits;
+    if !edges
+        .iter()
+        .chain(swap_layers.iter().flatten())
+        .all(in_range)
+    {
+        return Err(PyValueError::new_err(
+            "Swap strategy refers to qubits outside its coupling map.",
+        ));
+    }
+    Ok(
+        swap_strategy_distance_matrix(num_qubits, &edges, &swap_layers)
+            .into_pyarray(py)
+            .unbind(),
+    )
+}
+
+/// Route one block of commuting two-qubit gates with a swap strategy.
+///
+/// Args:
+///     distance (numpy.ndarray): the distance table of the swap strategy.
+///     swap_layers (list[list[tuple[int, int]]]): the swap layers of the strategy.
+///     virtual_to_physical (list[int]): the layout at the start of the block, as the position of
+///         each virtual qubit.
+///     gates (list[tuple[int, int]]): the virtual qubits of each gate in the block.
+///     edge_coloring (dict[tuple[int, int], int] | None): an optional coloring of the edges of
+///         the coupling map to build the sub-layers of simultaneous gates with.
+///
+/// Returns:
+///     A tuple of the routed instructions and the layout at the end of the block.  Each
+///     instruction is a tuple ``(index, qubit0, qubit1)``, where ``index`` is the index of the
+///     gate in ``gates``, or ``None`` for a swap.
+#[pyfunction]
+#[pyo3(name = "swap_decompose", signature = (distance, swap_layers, virtual_to_physical, gates, edge_coloring=None))]
+pub fn py_swap_decompose(
+    distance: PyReadonlyArray2<i64>,
+    swap_layers: Vec<Vec<[u32; 2]>>,
+    mut virtual_to_physical: Vec<u32>,
+    gates: Vec<[u32; 2]>,
+    edge_coloring: Option<HashMap<[u32; 2], usize>>,
+) -> PyResult<(Vec<RoutedInstruction>, Vec<u32>)> {
+    let num_qubits = virtual_to_physical.len();
+    let in_range = |&[a, b]: &[u32; 2]| (a as usize) < num_qubits && (b as usize) < num_qubits;
+    if !gates
+        .iter()
+        .chain(swap_layers.iter().flatten())
+        .all(in_range)
+        || virtual_to_physical
+            .iter()
+            .any(|&phys| phys as usize >= num_qubits)
+    {
+        return Err(PyValueError::new_err(
+            "Gates or swaps refer to qubits outside the layout.",
+        ));
+    }
+    let out = swap_decompose(
+        distance.as_array(),
+        &swap_layers,
+        &mut virtual_to_physical,
+        &gates,
+        edge_coloring.as_ref(),
+    )?;
+    Ok((out, virtual_to_physical))
+}
+
+pub fn commuting_2q_gate_router_mod(m: &Bound<PyModule>) -> PyResult<()> {
+    m.add_wrapped(wrap_pyfunction!(py_swap_strategy_distance_matrix))?;
+    m.add_wrapped(wrap_pyfunction!(py_swap_decompose))?;
+    Ok(())
+}
+
+#[cfg(test)]
+mod test {
+    use super::*;
+    use ndarray::array;
+
+    #[test]
+    fn line_distance_matrix() {
+        let edges = [[0, 1], [1, 2], [2, 3]];
+        let swap_layers = vec![vec![[0, 1], [2, 3]], vec![[1, 2]]];
+        let distance = swap_strategy_distance_matrix(4, &edges, &swap_layers);
+        assert_eq!(
+            distance,
+            array![[0, 0, 1, 2], [0, 0, 1, 1], [1, 1, 0, 0], [2, 1, 0, 0]]
+        );
+    }
+
+    #[test]
+    fn swaps_between_layers() {
+        let edges = [[0, 1], [1, 2]];
+        let swap_layers = vec![vec![[0, 1]]];
+        let distance = swap_strategy_distance_matrix(3, &edges, &swap_layers);
+        let mut layout = vec![0, 1, 2];
+        let out = swap_decompose(
+            distance.view(),
+            &swap_layers,
+            &mut layout,
+            &[[0, 1], [0, 2], [1, 2]],
+            None,
+        )
+        .unwrap();
+        assert_eq!(
+            out,
+            vec![
+                (Some(0), 0, 1),
+                (Some(2), 1, 2),
+                (None, 0, 1),
+                (Some(1), 1, 2)
+            ]
+        );
+        assert_eq!(layout, vec![1, 0, 2]);
+    }
+}
@@ -0,0 +1,386 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2026
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use ndarray::ArrayView2;
+use numpy::PyReadonlyArray2;
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use rustworkx_core::petgraph::prelude::*;
+use smallvec::SmallVec;
+
+use qiskit_circuit::dag_circuit::{DAGCircuit, NodeType};
+use qiskit_circuit::operations::{Operation, StandardGate};
+use qiskit_circuit::packed_instruction::PackedInstruction;
+use qiskit_circuit::{BlocksMode, Qubit, VarsMode};
+
+use crate::TranspilerError;
+
+/// Sentinel in [State::p2v] for a physical qubit that holds no virtual qubit.
+const NONE: u32 = u32::MAX;
+
+/// One operation of the input circuit, in topological order.
+struct Gate {
+    node: NodeIndex,
+    /// The indices of the virtual qubits of the operation.
+    qubits: SmallVec<[u32; 2]>,
+    /// Whether the operation is not a directive, and so needs its qubits to be coupled.
+    partition: bool,
+}
+
+/// An operation of the output circuit.
+enum Mapped {
+    /// The operation at an index in the input gates, on the given physical qubits.
+    Gate(usize, SmallVec<[u32; 2]>),
+    Swap([u32; 2]),
+}
+
+impl Mapped {
+    fn num_qubits(&self, gates: &[Gate]) -> usize {
+        match self {
+            Self::Gate(index, _) => gates[*index].qubits.len(),
+            Self::Swap(_) => 2,
+        }
+    }
+}
+
+/// The layout of the virtual qubits on the physical qubits.
+#[derive(Clone)]
+struct State {
+    v2p: Vec<u32>,
+    p2v: Vec<u32>,
+}
+
+impl State {
+    fn trivial(num_virtual: usize, num_physical: usize) -> Self {
+        Self {
+            v2p: (0..num_virtual as u32).collect(),
+            p2v: (0..num_physical as u32)
+                .map(|phys| {
+                    if (phys as usize) < num_virtual {
+                        phys
+                    } else {
+                        NONE
+                    }
+                })
+                .collect(),
+        }
+    }
+
+    #[inline]
+    fn phys(&self, virt: u32) -> u32 {
+        self.v2p[virt as usize]
+    }
+
+    /// The physical qubit of `virt` if the qubits of `swap` were exchanged.
+    #[inline]
+    fn phys_after_swap(&self, virt: u32, [a, b]: [u32; 2]) -> u32 {
+        match self.v2p[virt as usize] {
+            phys if phys == a => b,
+            phys if phys == b => a,
+            phys => phys,
+        }
+    }
+
+    fn swap(&mut self, [a, b]: [u32; 2]) {
+        self.p2v.swap(a as usize, b as usize);
+        for phys in [a, b] {
+            let virt = self.p2v[phys as usize];
+            if virt != NONE {
+                self.v2p[virt as usize] = phys;
+            }
+        }
+    }
+}
+
+/// One step of the lookahead search.
+struct Step {
+    state: State,
+    swaps_added: Vec<[u32; 2]>,
+    gates_mapped: Vec<Mapped>,
+    gates_remaining: Vec<usize>,
+}
+
+impl Step {
+    /// The number of mapped two-qubit gates, less the cost of the added swaps.
+    fn score(&self, gates: &[Gate]) -> i64 {
+        let num_2q = self
+            .gates_mapped
+            .iter()
+            .filter(|mapped| mapped.num_qubits(gates) == 2)
+            .count();
+        // Each added swap is three two-qubit gates.
+        num_2q as i64 - 3 * self.swaps_added.len() as i64
+    }
+}
+
+struct LookaheadSearch<'a> {
+    gates: Vec<Gate>,
+    distance: ArrayView2<'a, f64>,
+    swaps: Vec<[u32; 2]>,
+    width: usize,
+    /// How many of the upcoming gates to take into account when scoring a layout.
+    max_scored_gates: usize,
+}
+
+impl LookaheadSearch<'_> {
+    #[inline]
+    fn distance(&self, a: u32, b: u32) -> f64 {
+        self.distance[[a as usize, b as usize]]
+    }
+
+    /// The sum of the distances between the qubits of each two-qubit gate near the front of
+    /// `gates`, where `phys` gives the physical qubit of each virtual qubit.
+    fn layout_distance(&self, gates: &[usize], phys: impl Fn(u32) -> u32) -> f64 {
+        gates
+            .iter()
+            .take(self.max_scored_gates)
+            .map(|&index| &self.gates[index])
+            .filter(|gate| gate.partition && gate.qubits.len() == 2)
+            .map(|gate| self.distance(phys(gate.qubits[0]), phys(gate.qubits[1])))
+            .sum()
+    }
+
+    /// Map all the gates that can be executed with the current layout, and return them and the
+    /// gates that cannot.
+    fn map_free_gates(&self, state: &State, gates: &[usize]) -> (Vec<Mapped>, Vec<usize>) {
+        let mut blocked = vec![false; state.v2p.len()];
+        let mut mapped = Vec::new();
+        let mut remaining = Vec::new();
+        let map = |index: usize| {
+            Mapped::Gate(
+                index,
+                self.gates[index]
+                    .qubits
+                    .iter()
+                    .map(|&virt| state.phys(virt))
+                    .collect(),
+            )
+        };
+        for &index in gates {
+            let gate = &self.gates[index];
+            // Directives with no qubits have nothing to map, and are dropped.
+            if !gate.partition && gate.qubits.is_empty() {
+                continue;
+            }
+            if gate.qubits.iter().any(|&virt| blocked[virt as usize]) {
+                for &virt in gate.qubits.iter() {
+                    blocked[virt as usize] = true;
+                }
+                remaining.push(index);
+            } else if !gate.partition
+                || gate.qubits.len() < 2
+                || self.distance(state.phys(gate.qubits[0]), state.phys(gate.qubits[1])) == 1.
+            {
+                mapped.push(map(index));
+            } else {
+                for &virt in gate.qubits.iter() {
+                    blocked[virt as usize] = true;
+                }
+                remaining.push(index);
+            }
+        }
+        (mapped, remaining)
+    }
+
+    /// Search for the swaps that allow the largest number of gates to be applied, down to `depth`
+    /// swaps away from `state`.
+    ///
+    /// Returns `None` if no swap leads to an improvement.
+    fn search_forward(&self, state: State, gates: &[usize], depth: usize) -> Option<Step> {
+        let (gates_mapped, gates_remaining) = self.map_free_gates(&state, gates);
+        if gates_remaining.is_empty() || depth == 0 {
+            return Some(Step {
+                state,
+                swaps_added: Vec::new(),
+                gates_mapped,
+                gates_remaining,
+            });
+        }
+
+        let mut ranked_swaps = self
+            .swaps
+            .iter()
+            .map(|&swap| {
+                let score = self.layout_distance(gates, |virt| state.phys_after_swap(virt, swap));
+                (score, swap)
+            })
+            .collect::<Vec<_>>();
+        // This must be a stable sort; the order of `swaps` is the tie-breaker.
+        ranked_swaps.sort_by(|a, b| a.0.total_cmp(&b.0));
+
+        let last_rank = self.width.min(ranked_swaps.len().saturating_sub(1));
+        let mut best: Option<([u32; 2], Step, i64)> = None;
+        let mut improved = false;
+        for (rank, &(_, swap)) in ranked_swaps.iter().enumerate() {
+            let mut new_state = state.clone();
+            new_state.swap(swap);
+            let Some(next_step) = self.search_forward(new_state, &gates_remaining, depth - 1)
+            else {
+                continue;
+            };
+            let next_score = next_step.score(&self.gates);
+            // The swaps are already ranked by distance, so that is the tie-breaker.
+            if best
+                .as_ref()
+                .is_none_or(|(_, _, best_score)| next_score > *best_score)
+            {
+                best = Some((swap, next_step, next_score));
+            }
+            let Some((_, best_step, _)) = best.as_ref() else {
+                continue;
+            };
+            // Once we've examined either `width` swaps, or all available swaps, return the
+            // best-scoring swap provided it leads to an improvement in either the number of gates
+            // mapped, the number of gates left to be mapped, or the score of the ending layout.
+            if rank >= last_rank
+                && (best_step.gates_mapped.len() > depth
+                    || best_step.gates_remaining.len() < gates_remaining.len()
+                    || self.layout_distance(&best_step.gates_remaining, |virt| {
+                        best_step.state.phys(virt)
+                    }) < self.layout_distance(&gates_remaining, |virt| {
+                        state.phys_after_swap(virt, swap)
+                    }))
+            {
+                improved = true;
+                break;
+            }
+        }
+        if !improved {
+            return None;
+        }
+        let (best_swap, best_step, _) = best.expect("an improvement was found");
+        let mut swaps_added = Vec::with_capacity(best_step.swaps_added.len() + 1);
+        swaps_added.push(best_swap);
+        swaps_added.extend(best_step.swaps_added);
+        let mut mapped = gates_mapped;
+        mapped.reserve(best_step.gates_mapped.len() + 1);
+        mapped.push(Mapped::Swap(best_swap));
+        mapped.extend(best_step.gates_mapped);
+        Some(Step {
+            state: best_step.state,
+            swaps_added,
+            gates_mapped: mapped,
+            gates_remaining: best_step.gates_remaining,
+        })
+    }
+}
+
+/// Run the LookaheadSwap pass on `dag`.
+///
+/// Args:
+///     dag (DAGCircuit): the physical circuit to route.
+///     distance (numpy.ndarray): the undirected distance matrix of the coupling map.
+///     swaps (list[tuple[int, int]]): the swaps to consider, one for each undirected edge of the
+///         coupling map.  Swaps with equal scores are tried in this order.
+///     search_depth (int): the lookahead tree depth when ranking swaps.
+///     search_width (int): the lookahead tree width when ranking swaps.
+///     fake_run (bool): if true, only compute the final layout, and do not build the routed DAG.
+///
+/// Returns:
+///     A tuple of the routed DAG, or ``None`` if ``fake_run`` is true, and the physical qubit of
+///     each qubit of ``dag`` at the end of the circuit.
+#[pyfunction]
+#[pyo3(name = "run")]
+pub fn run_lookahead_swap(
+    dag: &DAGCircuit,
+    distance: PyReadonlyArray2<f64>,
+    swaps: Vec<[u32; 2]>,
+    search_depth: usize,
+    search_width: usize,
+    fake_run: bool,
+) -> PyResult<(Option<DAGCircuit>, Vec<u32>)> {
+    let distance = distance.as_array();
+    let num_physical = distance.nrows();
+    if distance.ncols() != num_physical || dag.num_qubits() > num_physical {
+        return Err(PyValueError::new_err(
+            "The distance matrix does not match the circuit.",
+        ));
+    }
+    if swaps
+        .iter()
+        .flatten()
+        .any(|&qubit| qubit as usize >= num_physical)
+    {
+        return Err(PyValueError::new_err(
+            "Swaps refer to qubits outside the distance matrix.",
+        ));
+    }
+    let gates = dag
+        .topological_op_nodes(false)
+        .map(|node| {
+            let NodeType::Operation(inst) = &dag[node] else {
+                unreachable!("topological_op_nodes only yields operations");
+            };
+            Gate {
+                node,
+                qubits: dag.get_qargs(inst.qubits).iter().map(|q| q.0).collect(),
+                partition: !inst.op.directive(),
+            }
+        })
+        .collect::<Vec<_>>();
+    let search = LookaheadSearch {
+        gates,
+        distance,
+        swaps,
+        width: search_width,
+        max_scored_gates: 50 + 10 * num_physical,
+    };
+
+    let mut state = State::trivial(dag.num_qubits(), num_physical);
+    let mut mapped_gates = Vec::with_capacity(search.gates.len());
+    let mut gates_remaining = (0..search.gates.len()).collect::<Vec<_>>();
+    while !gates_remaining.is_empty() {
+        let Some(step) = search.search_forward(state, &gates_remaining, search_depth) else {
+            return Err(TranspilerError::new_err(
+                "Lookahead failed to find a swap which mapped gates or improved layout score.",
+            ));
+        };
+        state = step.state;
+        gates_remaining = step.gates_remaining;
+        mapped_gates.extend(step.gates_mapped);
+    }
+    if fake_run {
+        return Ok((None, state.v2p));
+    }
+
+    let mut out = dag
+        .copy_empty_like_with_same_capacity(VarsMode::Alike, BlocksMode::Keep)
+        .into_builder();
+    let mut qargs = Vec::with_capacity(4);
+    for mapped in mapped_gates {
+        let inst = match mapped {
+            Mapped::Gate(index, physical) => {
+                let NodeType::Operation(inst) = &dag[search.gates[index].node] else {
+                    unreachable!("the gates are all operations");
+                };
+                qargs.clear();
+                qargs.extend(physical.into_iter().map(Qubit));
+                PackedInstruction {
+                    qubits: out.insert_qargs(&qargs),
+                    ..inst.clone()
+                }
+            }
+            Mapped::Swap([a, b]) => PackedInstruction::from_standard_gate(
+                StandardGate::Swap,
+                None,
+                out.insert_qargs(&[Qubit(a), Qubit(b)]),
+            ),
+        };
+        out.push_back(inst)?;
+    }
+    Ok((Some(out.build()), state.v2p))
+}
+
+pub fn lookahead_swap_mod(m: &Bound<PyModule>) -> PyResult<()> {
+    m.add_wrapped(wrap_pyfunction!(run_lookahead_swap))?;
+    Ok(())
+}
@@ -29,6 +29,7 @@ pub mod common;
 mod commutation_analysis;
 mod commutation_cancellation;
 mod commutative_optimization;
+mod commuting_2q_gate_router;
 mod consolidate_blocks;
 mod constrained_reschedule;
 mod convert_to_pauli_rotations;
@@ -42,6 +43,7 @@ mod high_level_synthesis;
 mod instruction_duration_check;
 mod inverse_cancellation;
 mod litinski_transformation;
+mod lookahead_swap;
 mod optimize_1q_gates_decomposition;
 mod optimize_clifford_t;
 mod remove_diagonal_gates_before_measure;
@@ -49,8 +51,10 @@ mod remove_identity_equiv;
 pub mod sabre;
 mod schedule_analysis;
 mod split_2q_unitaries;
+mod star_prerouting;
 mod substitute_pi4_rotations;
 mod synthesize_rz_rotations;
+mod template_matching;
 mod two_qubit_peephole;
 pub mod unitary_synthesis;
 mod unroll_3q_or_more;
@@ -66,6 +70,9 @@ pub use check_map::{check_map_mod, run_check_map};
 pub use commutation_analysis::{analyze_commutations, commutation_analysis_mod};
 pub use commutation_cancellation::{cancel_commutations, commutation_cancellation_mod};
 pub use commutative_optimization::{commutative_optimization_mod, run_commutative_optimization};
+pub use commuting_2q_gate_router::{
+    commuting_2q_gate_router_mod, swap_decompose, swap_strategy_distance_matrix,
+};
 pub use consolidate_blocks::{DecomposerType, consolidate_blocks_mod, run_consolidate_blocks};
 pub use constrained_reschedule::{constrained_reschedule_mod, run_constrained_reschedule};
 pub use convert_to_pauli_rotations::{
@@ -88,6 +95,7 @@ pub use instruction_duration_check::{
 };
 pub use inverse_cancellation::{inverse_cancellation_mod, run_inverse_cancellation_standard_gates};
 pub use litinski_transformation::{litinski_transformation_mod, run_litinski_transformation};
+pub use lookahead_swap::{lookahead_swap_mod, run_lookahead_swap};
 pub use optimize_1q_gates_decomposition::{
     Optimize1qGatesDecompositionState, optimize_1q_gates_decomposition_mod,
     run_optimize_1q_gates_decomposition,
@@ -105,8 +113,12 @@ pub use schedule_analysis::asap_schedule_analysis::{
 };
 pub use schedule_analysis::scheduling_mod;
 pub use split_2q_unitaries::{run_split_2q_unitaries, split_2q_unitaries_mod};
+pub use star_prerouting::{run_star_prerouting, star_prerouting_mod};
 pub use substitute_pi4_rotations::{run_substitute_pi4_rotations, substitute_pi4_rotations_mod};
 pub use synthesize_rz_rotations::{py_run_synthesize_rz_rotations, synthesize_rz_rotations_mod};
+pub use template_matching::{
+    MatchingGraph, MatchingOptions, TemplateMatch, template_matching, template_matching_mod,
+};
 pub use two_qubit_peephole::{
     py_two_qubit_unitary_peephole_optimize, two_qubit_peephole_mod,
     two_qubit_unitary_peephole_optimize,
@@ -122,6 +122,20 @@ pub struct SabreDAG {
 
 impl SabreDAG {
     pub fn from_dag(dag: &DAGCircuit) -> Result<Self, SabreDAGError> {
+        Self::from_dag_nodes(dag, dag.topological_op_nodes(false))
+    }
+
+    /// Build the Sabre representation of a window of the operations of `dag`.
+    ///
+    /// The `nodes` must be operation nodes of `dag` in topological order, and must contain all
+    /// the predecessors in `dag` of each node, except for those that were in earlier windows.
+    /// Wires leaving earlier windows are treated as the inputs of the circuit, so routing each
+    /// window in turn, starting from the final layout of the window before, routes the whole
+    /// circuit.  Passing all the operation nodes gives the same result as [SabreDAG::from_dag].
+    pub fn from_dag_nodes(
+        dag: &DAGCircuit,
+        nodes: impl IntoIterator<Item = NodeIndex>,
+    ) -> Result<Self, SabreDAGError> {
         // The `NodeIndex` here is into `dag`.
         let mut initial = Vec::<NodeIndex>::new();
         let mut sabre = DiGraph::new();
@@ -154,7 +168,7 @@ impl SabreDAG {
                 single.map_or(Predecessors::AllUnmapped, Predecessors::Single)
             };
 
-        for dag_node in dag.topological_op_nodes(false) {
+        for dag_node in nodes {
             let NodeType::Operation(inst) = &dag[dag_node] else {
                 panic!("op nodes should always be of type `Operation`");
             };
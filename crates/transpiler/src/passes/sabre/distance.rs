@@ -0,0 +1,420 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2026
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use std::cell::RefCell;
+use std::collections::VecDeque;
+use std::sync::Arc;
+use std::sync::atomic::{AtomicUsize, Ordering};
+
+use ndarray::{Array2, ArrayView2};
+use thread_local::ThreadLocal;
+
+use qiskit_circuit::PhysicalQubit;
+
+use crate::neighbors::Neighbors;
+
+/// Targets with more qubits than this use a [LazyDistance] by default, rather than a dense matrix.
+///
+/// At this size, the dense matrix of `f64` is 128MiB.
+pub const DENSE_DISTANCE_MAX_QUBITS: usize = 4096;
+
+/// The approximate amount of memory, in bytes, that all the threads together may use to hold the
+/// rows of a [LazyDistance].
+const LAZY_DISTANCE_BYTES: usize = 128 << 20;
+
+/// The fewest rows that all the threads together may hold in a [LazyDistance], regardless of the
+/// size of the rows.
+const LAZY_DISTANCE_MIN_ROWS: usize = 64;
+
+/// Sentinel for "no entry" in the indices of a [RowCache], and for "unreachable" in its rows.
+const NONE: u32 = u32::MAX;
+
+/// Look up the distance between two physical qubits.
+///
+/// The Sabre heuristic is generic over this, so the scoring loop is monomorphised for each kind
+/// of storage.
+pub trait DistanceLookup {
+    /// The length of the shortest path between two qubits, or NaN if there is none.
+    ///
+    /// When one of the qubits is more likely to be looked up repeatedly than the other, it should
+    /// be `from`.
+    fn distance(&self, from: PhysicalQubit, to: PhysicalQubit) -> f64;
+}
+
+impl DistanceLookup for ArrayView2<'_, f64> {
+    #[inline]
+    fn distance(&self, from: PhysicalQubit, to: PhysicalQubit) -> f64 {
+        self[[from.index(), to.index()]]
+    }
+}
+
+/// The distances between all the qubits of a [RoutingTarget](super::route::RoutingTarget).
+#[derive(Clone, Debug)]
+pub enum Distance {
+    /// The full matrix, computed up front.
+    Dense(Arc<Array2<f64>>),
+    /// Distances computed on demand.
+    Lazy(Arc<LazyDistance>),
+}
+
+impl Distance {
+    /// The distance between two qubits.
+    ///
+    /// This dispatches on the storage for every call; hot loops should match on the variants
+    /// once, and use the [DistanceLookup] of the variant instead.
+    pub fn get(&self, from: PhysicalQubit, to: PhysicalQubit) -> f64 {
+        match self {
+            Self::Dense(dense) => dense.view().distance(from, to),
+            Self::Lazy(lazy) => lazy.lookup().distance(from, to),
+        }
+    }
+
+    #[inline]
+    pub fn is_lazy(&self) -> bool {
+        matches!(self, Self::Lazy(_))
+    }
+
+    /// Get the full distance matrix.
+    ///
+    /// For [Distance::Lazy], this computes every distance, so it takes as much time and memory as
+    /// the dense representation would.
+    pub fn to_dense(&self) -> Array2<f64> {
+        match self {
+            Self::Dense(dense) => Array2::clone(dense),
+            Self::Lazy(lazy) => lazy.to_dense(),
+        }
+    }
+}
+
+/// Distances between the qubits of a coupling graph, computed by a breadth-first search from each
+/// source qubit when it is first needed.
+///
+/// Each thread keeps its own cache of rows of the distance matrix, evicting the least recently used
+/// row when it is full, so concurrent routing trials never contend on a lock.  The number of rows
+/// held by all the threads together is bounded by a [RowBudget], which gives each thread of the
+/// Rayon pool an equal share.  The Sabre heuristic only needs the rows of the qubits in the front
+/// and lookahead layers, so the cache hit rate is high as long as those layers span fewer qubits
+/// than a thread's share of rows.
+#[derive(Debug)]
+pub struct LazyDistance {
+    neighbors: Neighbors,
+    budget: RowBudget,
+    rows: ThreadLocal<RefCell<RowCache>>,
+}
+
+impl LazyDistance {
+    pub fn new(neighbors: Neighbors) -> Self {
+        let num_qubits = neighbors.num_qubits().max(1);
+        let max_rows =
+            (LAZY_DISTANCE_BYTES / (num_qubits * size_of::<u32>())).max(LAZY_DISTANCE_MIN_ROWS);
+        Self::with_max_rows(neighbors, max_rows)
+    }
+
+    /// Create a lazy distance table whose threads together hold at most `max_rows` rows, or one
+    /// row per thread if there are more threads than that.
+    pub fn with_max_rows(neighbors: Neighbors, max_rows: usize) -> Self {
+        Self {
+            neighbors,
+            budget: RowBudget::new(max_rows, rayon::current_num_threads()),
+            rows: ThreadLocal::new(),
+        }
+    }
+
+    #[inline]
+    pub fn num_qubits(&self) -> usize {
+        self.neighbors.num_qubits()
+    }
+
+    /// Get a [DistanceLookup] that uses the row cache of the current thread.
+    #[inline]
+    pub fn lookup(&self) -> LazyDistanceLookup<'_> {
+        LazyDistanceLookup {
+            neighbors: &self.neighbors,
+            budget: &self.budget,
+            cache: self
+                .rows
+                .get_or(|| RefCell::new(RowCache::new(self.neighbors.num_qubits()))),
+        }
+    }
+
+    fn to_dense(&self) -> Array2<f64> {
+        let num_qubits = self.num_qubits();
+        let mut out = Array2::from_elem((num_qubits, num_qubits), f64::NAN);
+        let mut row = vec![NONE; num_qubits];
+        let mut queue = VecDeque::new();
+        for (source, mut out_row) in out.rows_mut().into_iter().enumerate() {
+            bfs(
+                &self.neighbors,
+                PhysicalQubit::new(source as u32),
+                &mut row,
+                &mut queue,
+            );
+            for (out, &dist) in out_row.iter_mut().zip(&row) {
+                *out = as_distance(dist);
+            }
+        }
+        out
+    }
+}
+
+/// A [DistanceLookup] into a [LazyDistance] from one thread.
+pub struct LazyDistanceLookup<'a> {
+    neighbors: &'a Neighbors,
+    budget: &'a RowBudget,
+    cache: &'a RefCell<RowCache>,
+}
+
+impl DistanceLookup for LazyDistanceLookup<'_> {
+    #[inline]
+    fn distance(&self, from: PhysicalQubit, to: PhysicalQubit) -> f64 {
+        as_distance(
+            self.cache
+                .borrow_mut()
+                .get(self.neighbors, self.budget, from, to),
+        )
+    }
+}
+
+#[inline]
+fn as_distance(dist: u32) -> f64 {
+    if dist == NONE { f64::NAN } else { dist as f64 }
+}
+
+/// The number of rows of a [LazyDistance] that its threads may hold.
+#[derive(Debug)]
+struct RowBudget {
+    /// The most rows that all the threads together may hold.
+    total: usize,
+    /// The most rows that any one thread may hold.
+    per_thread: usize,
+    /// The number of rows currently held by all the threads.
+    held: AtomicUsize,
+}
+
+impl RowBudget {
+    fn new(total: usize, num_threads: usize) -> Self {
+        let total = total.max(1);
+        Self {
+            total,
+            per_thread: (total / num_threads.max(1)).max(1),
+            held: AtomicUsize::new(0),
+        }
+    }
+
+    /// Take a row for a thread that currently holds `held_by_thread` rows, returning whether it
+    /// may add it.  A thread that holds no rows may always take one, so lookups can make progress
+    /// even if there are more threads than rows in the budget.
+    fn take(&self, held_by_thread: usize) -> bool {
+        if held_by_thread == 0 {
+            self.held.fetch_add(1, Ordering::Relaxed);
+            return true;
+        }
+        held_by_thread < self.per_thread
+            && self
+                .held
+                .fetch_update(Ordering::Relaxed, Ordering::Relaxed, |held| {
+                    (held < self.total).then_some(held + 1)
+                })
+                .is_ok()
+    }
+}
+
+/// The rows of the distance matrix held by one thread.
+#[derive(Debug)]
+struct RowCache {
+    /// For each qubit, the index of its row in `rows`, or [NONE].
+    slot: Vec<u32>,
+    /// The source qubit and distances of each row that is held.
+    rows: Vec<(PhysicalQubit, Box<[u32]>)>,
+    /// The value of `clock` at the most recent use of each row.
+    last_used: Vec<u64>,
+    clock: u64,
+    queue: VecDeque<PhysicalQubit>,
+}
+
+impl RowCache {
+    fn new(num_qubits: usize) -> Self {
+        Self {
+            slot: vec![NONE; num_qubits],
+            rows: Vec::new(),
+            last_used: Vec::new(),
+            clock: 0,
+            queue: VecDeque::new(),
+        }
+    }
+
+    fn get(
+        &mut self,
+        neighbors: &Neighbors,
+        budget: &RowBudget,
+        from: PhysicalQubit,
+        to: PhysicalQubit,
+    ) -> u32 {
+        self.clock += 1;
+        // The graph is undirected, so the row of either qubit will do.
+        for (source, target) in [(from, to), (to, from)] {
+            let slot = self.slot[source.index()];
+            if slot != NONE {
+                self.last_used[slot as usize] = self.clock;
+                return self.rows[slot as usize].1[target.index()];
+            }
+        }
+        let slot = if budget.take(self.rows.len()) {
+            self.rows
+                .push((from, vec![NONE; neighbors.num_qubits()].into_boxed_slice()));
+            self.last_used.push(0);
+            self.rows.len() - 1
+        } else {
+            // Finding the least recently used row is linear in the number of rows, but that's
+            // dwarfed by the breadth-first search that follows.
+            let lru = self
+                .last_used
+                .iter()
+                .enumerate()
+                .min_by_key(|(_, clock)| **clock)
+                .map(|(slot, _)| slot)
+                .expect("there is always at least one row");
+            self.slot[self.rows[lru].0.index()] = NONE;
+            self.rows[lru].0 = from;
+            lru
+        };
+        self.slot[from.index()] = slot as u32;
+        self.last_used[slot] = self.clock;
+        let row = &mut self.rows[slot].1;
+        bfs(neighbors, from, row, &mut self.queue);
+        row[to.index()]
+    }
+}
+
+/// Fill `row` with the distances from `source` to every qubit, using [NONE] for qubits that cannot
+/// be reached.
+fn bfs(
+    neighbors: &Neighbors,
+    source: PhysicalQubit,
+    row: &mut [u32],
+    queue: &mut VecDeque<PhysicalQubit>,
+) {
+    row.fill(NONE);
+    row[source.index()] = 0;
+    queue.clear();
+    queue.push_back(source);
+    while let Some(qubit) = queue.pop_front() {
+        let next = row[qubit.index()] + 1;
+        for &neighbor in neighbors[qubit].iter() {
+            if row[neighbor.index()] == NONE {
+                row[neighbor.index()] = next;
+                queue.push_back(neighbor);
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod test {
+    use super::*;
+    use rustworkx_core::shortest_path::distance_matrix;
+
+    fn heavy_square(size: u32) -> Neighbors {
+        // A square grid with some links missing, so the distances aren't trivial.
+        let index = |row: u32, col: u32| row * size + col;
+        let mut adjacency = vec![Vec::new(); (size * size) as usize];
+        for row in 0..size {
+            for col in 0..size {
+                let mut link = |a: u32, b: u32| {
+                    adjacency[a as usize].push(PhysicalQubit::new(b));
+                    adjacency[b as usize].push(PhysicalQubit::new(a));
+                };
+                if col + 1 < size {
+                    link(index(row, col), index(row, col + 1));
+                }
+                if row + 1 < size && (row + col) % 3 == 0 {
+                    link(index(row, col), index(row + 1, col));
+                }
+            }
+        }
+        let mut partition = vec![0];
+        let mut flat = Vec::new();
+        for mut adj in adjacency {
+            adj.sort();
+            flat.extend(adj);
+            partition.push(flat.len());
+        }
+        Neighbors::from_parts(flat, partition).unwrap()
+    }
+
+    #[test]
+    fn lazy_matches_dense() {
+        let neighbors = heavy_square(9);
+        let dense = distance_matrix(&neighbors, usize::MAX, false, f64::NAN);
+        // Few enough rows that the cache has to evict.
+        let lazy = LazyDistance::with_max_rows(neighbors, 5);
+        assert_eq!(lazy.to_dense(), dense);
+        let lookup = lazy.lookup();
+        let num_qubits = dense.nrows() as u32;
+        for step in 0..(3 * num_qubits * num_qubits) {
+            let from = PhysicalQubit::new((step * 7) % num_qubits);
+            let to = PhysicalQubit::new((step * 13 + step / num_qubits) % num_qubits);
+            assert_eq!(
+                lookup.distance(from, to),
+                dense[[from.index(), to.index()]],
+                "{from:?} -> {to:?}"
+            );
+        }
+        assert!(lookup.cache.borrow().rows.len() <= 5);
+    }
+
+    #[test]
+    fn lazy_rows_bounded_across_threads() {
+        let neighbors = heavy_square(9);
+        let dense = distance_matrix(&neighbors, usize::MAX, false, f64::NAN);
+        let num_qubits = dense.nrows() as u32;
+        let max_rows = 6;
+        let num_threads = 4;
+        let mut lazy = LazyDistance::with_max_rows(neighbors, max_rows);
+        // Split the budget between the threads of this test, rather than those of the Rayon pool.
+        lazy.budget = RowBudget::new(max_rows, num_threads as usize);
+        std::thread::scope(|scope| {
+            for thread in 0..num_threads {
+                let (lazy, dense) = (&lazy, &dense);
+                scope.spawn(move || {
+                    let lookup = lazy.lookup();
+                    for step in 0..(num_qubits * num_qubits) {
+                        let from = PhysicalQubit::new((step * 7 + thread) % num_qubits);
+                        let to = PhysicalQubit::new((step * 13) % num_qubits);
+                        assert_eq!(lookup.distance(from, to), dense[[from.index(), to.index()]]);
+                    }
+                });
+            }
+        });
+        let held = lazy
+            .rows
+            .iter_mut()
+            .map(|cache| cache.get_mut().rows.len())
+            .sum::<usize>();
+        assert_eq!(held, lazy.budget.held.load(Ordering::Relaxed));
+        assert!(held <= max_rows, "{held} rows held");
+    }
+
+    #[test]
+    fn lazy_unreachable_is_nan() {
+        // Two disconnected pairs of qubits.
+        let neighbors = Neighbors::from_parts(
+            [1, 0, 3, 2].map(PhysicalQubit::new).to_vec(),
+            vec![0, 1, 2, 3, 4],
+        )
+        .unwrap();
+        let lazy = LazyDistance::new(neighbors);
+        let lookup = lazy.lookup();
+        assert_eq!(lookup.distance(PhysicalQubit(0), PhysicalQubit(1)), 1.);
+        assert!(lookup.distance(PhysicalQubit(0), PhysicalQubit(2)).is_nan());
+    }
+}
@@ -17,6 +17,10 @@ use pyo3::prelude::*;
 use pyo3::types::PyString;
 
 use qiskit_circuit::impl_intopyobject_for_copy_pyclass;
+use qiskit_circuit::{PhysicalQubit, operations::Operation};
+
+use crate::neighbors::Neighbors;
+use crate::target::{Target, TargetOperation};
 
 /// Affect the dynamic scaling of the weight of node-set-based heuristics (basic and lookahead).
 #[pyclass(module = "qiskit._accelerate.sabre", frozen, eq, from_py_object)]
@@ -174,6 +178,159 @@ impl DecayHeuristic {
     }
 }
 
+/// The property of the two-qubit operations on a coupler that defines its cost in an
+/// :class:`.ErrorHeuristic`.
+#[pyclass(module = "qiskit._accelerate.sabre", frozen, eq, from_py_object)]
+#[derive(Clone, Copy, PartialEq, Eq, Debug)]
+pub enum ErrorSource {
+    /// The error rate of the operation, as the negative log of its fidelity.
+    Error,
+    /// The duration of the operation.
+    Duration,
+}
+impl_intopyobject_for_copy_pyclass!(ErrorSource);
+#[pymethods]
+impl ErrorSource {
+    pub fn __reduce__(&self, py: Python) -> PyResult<Py<PyAny>> {
+        let name = match self {
+            ErrorSource::Error => "Error",
+            ErrorSource::Duration => "Duration",
+        };
+        (
+            py.import("builtins")?.getattr("getattr")?,
+            (py.get_type::<Self>(), name),
+        )
+            .into_py_any(py)
+    }
+}
+
+/// Define the characteristics of the error-aware heuristic.  Instead of counting each coupler as
+/// one unit of distance, the distance between two qubits is the cheapest path between them, where
+/// each coupler costs ``1 + weight * cost / mean_cost``.  The cost of a coupler is the smallest
+/// error rate (or duration) of the two-qubit operations on it in the :class:`.Target`, and
+/// ``mean_cost`` is the mean of that over all the couplers, so a ``weight`` of zero is the same
+/// as the hop distance.  Couplers without any reported value are given the mean cost.
+///
+/// This changes the distances that the basic and lookahead heuristics sum over, so Sabre prefers
+/// moving qubits over good couplers, and avoids leaving gates on bad ones.
+#[pyclass(module = "qiskit._accelerate.sabre", frozen, from_py_object)]
+#[derive(Clone, Copy, PartialEq, Debug)]
+pub struct ErrorHeuristic {
+    /// The weight of the coupler costs relative to the hop count.
+    pub weight: f64,
+    /// Where the costs of the couplers come from.
+    pub source: ErrorSource,
+}
+impl_intopyobject_for_copy_pyclass!(ErrorHeuristic);
+impl ErrorHeuristic {
+    /// Calculate the weight of each edge of the coupling graph, in the same order as the flat
+    /// adjacency list of `neighbors` (i.e. indexed by the edge ids of its graph visitor).
+    ///
+    /// `to_target` maps the qubits of `neighbors` to those of `target`.  Returns `None` if `target`
+    /// doesn't report the relevant property for any two-qubit operation on the couplers.
+    pub fn edge_weights(
+        &self,
+        target: &Target,
+        neighbors: &Neighbors,
+        to_target: impl Fn(PhysicalQubit) -> PhysicalQubit,
+    ) -> Option<Vec<f64>> {
+        let coupler_cost = |a: PhysicalQubit, b: PhysicalQubit| -> Option<f64> {
+            let mut best: Option<f64> = None;
+            for qargs in [[a, b], [b, a]] {
+                let Ok(names) = target.operation_names_for_qargs(&qargs[..]) else {
+                    continue;
+                };
+                for name in names {
+                    let is_2q = matches!(
+                        target.operation_from_name(name),
+                        Some(TargetOperation::Normal(op)) if op.operation.num_qubits() == 2
+                    );
+                    if !is_2q {
+                        continue;
+                    }
+                    let cost = match self.source {
+                        ErrorSource::Error => {
+                            target.get_error(name, &qargs[..]).map(neg_log_fidelity)
+                        }
+                        ErrorSource::Duration => target.get_duration(name, &qargs[..]),
+                    };
+                    // Taking the minimum makes the result independent of the iteration order.
+                    if let Some(cost) = cost.filter(|cost| cost.is_finite()) {
+                        best = Some(best.map_or(cost, |best| best.min(cost)));
+                    }
+                }
+            }
+            best
+        };
+        let mut costs = Vec::new();
+        let mut total = 0.;
+        let mut count = 0usize;
+        for source in (0..neighbors.num_qubits() as u32).map(PhysicalQubit::new) {
+            for &other in neighbors[source].iter() {
+                let cost = coupler_cost(to_target(source), to_target(other));
+                if let Some(cost) = cost {
+                    total += cost;
+                    count += 1;
+                }
+                costs.push(cost);
+            }
+        }
+        if count == 0 {
+            return None;
+        }
+        let mean = total / count as f64;
+        Some(
+            costs
+                .into_iter()
+                .map(|cost| match cost {
+                    Some(cost) if mean > 0. => 1. + self.weight * cost / mean,
+                    _ => 1. + self.weight,
+                })
+                .collect(),
+        )
+    }
+}
+
+/// The negative log of the fidelity of an operation with the given error rate, which is additive
+/// along a path of operations.  Operations that always fail are clamped to a finite cost, so they
+/// don't swamp the mean cost that the weights are normalised by.
+fn neg_log_fidelity(error: f64) -> f64 {
+    if error.is_nan() || error <= 0. {
+        0.
+    } else {
+        -((-error.min(1. - f64::EPSILON)).ln_1p())
+    }
+}
+
+#[pymethods]
+impl ErrorHeuristic {
+    #[new]
+    #[pyo3(signature = (weight, source=ErrorSource::Error))]
+    pub fn new(weight: f64, source: ErrorSource) -> PyResult<Self> {
+        if weight.is_nan() || weight < 0. {
+            return Err(PyValueError::new_err(
+                "error heuristic weight must be non-negative",
+            ));
+        }
+        Ok(Self { weight, source })
+    }
+
+    pub fn __getnewargs__(&self, py: Python) -> PyResult<Py<PyAny>> {
+        (self.weight, self.source).into_py_any(py)
+    }
+
+    pub fn __eq__(&self, py: Python, other: Py<PyAny>) -> bool {
+        other.extract::<Self>(py).is_ok_and(|other| self == &other)
+    }
+
+    pub fn __repr__(&self, py: Python) -> PyResult<Py<PyAny>> {
+        let fmt = "ErrorHeuristic(weight={!r}, source={!r})";
+        PyString::new(py, fmt)
+            .call_method1("format", (self.weight, self.source))?
+            .into_py_any(py)
+    }
+}
+
 /// A complete description of the heuristic that Sabre will use.  See the individual elements for a
 /// greater description.
 ///
@@ -192,6 +349,7 @@ pub struct Heuristic {
     pub decay: Option<DecayHeuristic>,
     pub best_epsilon: f64,
     pub attempt_limit: usize,
+    pub error: Option<ErrorHeuristic>,
 }
 
 #[pymethods]
@@ -209,14 +367,17 @@ impl Heuristic {
     ///         disabled entirely, Sabre will enter an infinite loop.
     ///     best_epsilon (float): the floating-point epsilon to use when comparing scores to find
     ///         the best value.
+    ///     error (ErrorHeuristic): if given, weight the distances between qubits by the error
+    ///         rates (or durations) of the couplers in the :class:`.Target`.
     #[new]
-    #[pyo3(signature = (basic=None, lookahead=None, decay=None, attempt_limit=1000, best_epsilon=1e-10))]
+    #[pyo3(signature = (basic=None, lookahead=None, decay=None, attempt_limit=1000, best_epsilon=1e-10, error=None))]
     pub fn new(
         basic: Option<BasicHeuristic>,
         lookahead: Option<LookaheadHeuristic>,
         decay: Option<DecayHeuristic>,
         attempt_limit: Option<usize>,
         best_epsilon: f64,
+        error: Option<ErrorHeuristic>,
     ) -> Self {
         Self {
             basic,
@@ -224,6 +385,7 @@ impl Heuristic {
             decay,
             best_epsilon,
             attempt_limit: attempt_limit.unwrap_or(usize::MAX),
+            error,
         }
     }
 
@@ -234,6 +396,7 @@ impl Heuristic {
             self.decay,
             self.attempt_limit,
             self.best_epsilon,
+            self.error,
         )
             .into_py_any(py)
     }
@@ -270,8 +433,19 @@ impl Heuristic {
         }
     }
 
+    /// Weight the distances between qubits by the quality of the couplers in the
+    /// :class:`.Target`, with the given weight relative to the hop count.  See
+    /// :class:`.ErrorHeuristic` for details.
+    #[pyo3(signature = (weight, source=ErrorSource::Error))]
+    pub fn with_error(&self, weight: f64, source: ErrorSource) -> PyResult<Self> {
+        Ok(Self {
+            error: Some(ErrorHeuristic::new(weight, source)?),
+            ..self.clone()
+        })
+    }
+
     pub fn __repr__(&self, py: Python) -> PyResult<Py<PyAny>> {
-        let fmt = "Heuristic(basic={!r}, lookahead={!r}, decay={!r}, attempt_limit={!r}, best_epsilon={!r})";
+        let fmt = "Heuristic(basic={!r}, lookahead={!r}, decay={!r}, attempt_limit={!r}, best_epsilon={!r}, error={!r})";
         PyString::new(py, fmt)
             .call_method1(
                 "format",
@@ -281,6 +455,7 @@ impl Heuristic {
                     self.decay,
                     self.attempt_limit,
                     self.best_epsilon,
+                    self.error,
                 ),
             )?
             .into_py_any(py)
@@ -10,11 +10,11 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
-use ndarray::prelude::*;
 use rustworkx_core::petgraph::graph::IndexType;
 use rustworkx_core::petgraph::prelude::*;
 use std::num::NonZero;
 
+use super::distance::DistanceLookup;
 use super::vec_map::VecMap;
 use qiskit_circuit::{PhysicalQubit, VirtualQubit, nlayout::NLayout};
 
@@ -236,14 +236,14 @@ impl Layer {
 
     /// Calculate the score _difference_ caused by this swap, compared to not making the swap.
     #[inline]
-    pub fn score(&self, swap: [PhysicalQubit; 2], dist: &ArrayView2<f64>) -> f64 {
+    pub fn score(&self, swap: [PhysicalQubit; 2], dist: &impl DistanceLookup) -> f64 {
         let [a, b] = swap;
         let score = |cur: PhysicalQubit, new: PhysicalQubit| {
             let other = self.other[cur];
             if other == IndexType::max() {
                 0.0
             } else {
-                dist[[other.index(), new.index()]] - dist[[other.index(), cur.index()]]
+                dist.distance(other, new) - dist.distance(other, cur)
             }
         };
         if self.other[a] == b {
@@ -255,10 +255,10 @@ impl Layer {
 
     /// Calculate the total absolute score of the layer for the set layout.
     #[inline]
-    pub fn total_score(&self, layout: &NLayout, dist: &ArrayView2<f64>) -> f64 {
+    pub fn total_score(&self, layout: &NLayout, dist: &impl DistanceLookup) -> f64 {
         self.gates
             .iter()
-            .map(|&[a, b]| dist[[layout[a].index(), layout[b].index()]])
+            .map(|&[a, b]| dist.distance(layout[a], layout[b]))
             .sum()
     }
 
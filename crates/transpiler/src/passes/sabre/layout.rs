@@ -13,8 +13,11 @@
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 
-use hashbrown::HashSet;
-use ndarray::aview2;
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::time::Instant;
+
+use hashbrown::{HashMap, HashSet};
+use ndarray::{Array2, aview2};
 use rand::prelude::*;
 use rand::rngs::SysRng;
 use rand_pcg::Pcg64Mcg;
@@ -36,11 +39,67 @@ use crate::target::{Target, TargetCouplingError};
 
 use super::dag::SabreDAG;
 use super::heuristic::Heuristic;
-use super::route::{RoutingProblem, RoutingResult, RoutingTarget, swap_map, swap_map_trial};
+use super::route::{
+    DistanceCacheKey, RoutingProblem, RoutingResult, RoutingTarget, deadline_from_time_limit,
+    deadline_passed, swap_map_trial, swap_map_until,
+};
+
+/// Python entry point to [sabre_layout_and_routing].
+///
+/// This detaches from the Python interpreter while the layout trials run, so other Python threads
+/// (such as other circuits being transpiled on a thread pool) can make progress.  The interpreter
+/// is re-attached before the output DAG is built, since that may need to clone Python-owned
+/// objects in the circuit.
+///
+/// If ``time_limit`` is given, it is a budget in seconds for the whole search.  Once it is spent,
+/// no new layout or routing trial is started and the running layout trials stop refining their
+/// layouts, but the first trial is always completed, so there is always a result.
+///
+/// If ``lazy_distance`` is ``True``, the distances between qubits are computed on demand rather
+/// than as a dense matrix, and if it is ``None``, this is done for targets with more than 4096
+/// qubits.  See :class:`.RoutingTarget`.
+///
+/// Returns:
+///     A four-tuple of the routed :class:`.DAGCircuit`, the initial and final layouts, and the
+///     number of layout trials that were completed.
+#[allow(clippy::too_many_arguments)]
+#[pyfunction(name = "sabre_layout_and_routing")]
+#[pyo3(signature = (dag, target, heuristic, max_iterations, num_swap_trials, num_random_trials, seed=None, partial_layouts=vec![], skip_routing=false, time_limit=None, lazy_distance=None, target_fingerprint=None))]
+pub fn py_sabre_layout_and_routing(
+    py: Python,
+    dag: &mut DAGCircuit,
+    target: &Target,
+    heuristic: &Heuristic,
+    max_iterations: usize,
+    num_swap_trials: usize,
+    num_random_trials: usize,
+    seed: Option<u64>,
+    partial_layouts: Vec<Vec<Option<PhysicalQubit>>>,
+    skip_routing: bool,
+    time_limit: Option<f64>,
+    lazy_distance: Option<bool>,
+    target_fingerprint: Option<&str>,
+) -> PyResult<(DAGCircuit, NLayout, NLayout, usize)> {
+    let deadline = deadline_from_time_limit(time_limit)?;
+    sabre_layout_and_routing_inner(
+        Some(py),
+        dag,
+        target,
+        heuristic,
+        max_iterations,
+        num_swap_trials,
+        num_random_trials,
+        seed,
+        partial_layouts,
+        skip_routing,
+        deadline,
+        lazy_distance,
+        target_fingerprint,
+    )
+}
 
+/// A non-Python entry point to the Sabre layout and routing pass.
 #[allow(clippy::too_many_arguments)]
-#[pyfunction]
-#[pyo3(signature = (dag, target, heuristic, max_iterations, num_swap_trials, num_random_trials, seed=None, partial_layouts=vec![], skip_routing=false))]
 pub fn sabre_layout_and_routing(
     dag: &mut DAGCircuit,
     target: &Target,
@@ -52,6 +111,40 @@ pub fn sabre_layout_and_routing(
     partial_layouts: Vec<Vec<Option<PhysicalQubit>>>,
     skip_routing: bool,
 ) -> PyResult<(DAGCircuit, NLayout, NLayout)> {
+    sabre_layout_and_routing_inner(
+        None,
+        dag,
+        target,
+        heuristic,
+        max_iterations,
+        num_swap_trials,
+        num_random_trials,
+        seed,
+        partial_layouts,
+        skip_routing,
+        None,
+        None,
+        None,
+    )
+    .map(|(dag, initial_layout, final_layout, _)| (dag, initial_layout, final_layout))
+}
+
+#[allow(clippy::too_many_arguments)]
+fn sabre_layout_and_routing_inner(
+    py: Option<Python>,
+    dag: &mut DAGCircuit,
+    target: &Target,
+    heuristic: &Heuristic,
+    max_iterations: usize,
+    num_swap_trials: usize,
+    num_random_trials: usize,
+    seed: Option<u64>,
+    partial_layouts: Vec<Vec<Option<PhysicalQubit>>>,
+    skip_routing: bool,
+    deadline: Option<Instant>,
+    lazy_distance: Option<bool>,
+    target_fingerprint: Option<&str>,
+) -> PyResult<(DAGCircuit, NLayout, NLayout, usize)> {
     let Some(num_physical_qubits) = target.num_qubits else {
         return Err(TranspilerError::new_err(
             "given 'Target' was not initialized with a qubit count",
@@ -74,7 +167,7 @@ pub fn sabre_layout_and_routing(
             let mut out = dag.clone();
             out.make_physical(num_physical_qubits);
             let trivial = NLayout::generate_trivial_layout(num_physical_qubits as u32);
-            return Ok((out, trivial.clone(), trivial));
+            return Ok((out, trivial.clone(), trivial, 0));
         }
         Err(e @ TargetCouplingError::MultiQ(_)) => {
             return Err(TranspilerError::new_err(e.to_string()));
@@ -121,6 +214,22 @@ pub fn sabre_layout_and_routing(
         DisjointSplit::Arbitrary(components) => TargetSplit::Multiple(components),
     };
     let sabre_full = SabreDAG::from_dag(dag)?;
+    // `qubits` are the qubits of the full `Target` that `neighbors` is restricted to (empty if it
+    // is not), and `to_target` maps the qubits of `neighbors` to them, for looking up the coupler
+    // errors if the heuristic is error aware.
+    let routing_target =
+        |neighbors: Neighbors,
+         qubits: &[PhysicalQubit],
+         to_target: &dyn Fn(PhysicalQubit) -> PhysicalQubit| {
+            let weights = heuristic
+                .error
+                .and_then(|error| error.edge_weights(target, &neighbors, to_target));
+            let cache_key = target_fingerprint.map(|fingerprint| DistanceCacheKey {
+                fingerprint,
+                qubits,
+            });
+            RoutingTarget::with_edge_weights(neighbors, weights, lazy_distance, cache_key)
+        };
     match components {
         TargetSplit::Single(mut subset) => {
             // All the DAG fits into a single component of a disjoint `Target`, so we can safely
@@ -139,7 +248,11 @@ pub fn sabre_layout_and_routing(
                 }
                 None => Neighbors::from_coupling(&coupling),
             };
-            let target = RoutingTarget::from_neighbors(neighbors);
+            let target = routing_target(neighbors, subset.as_deref().unwrap_or_default(), &|q| {
+                subset
+                    .as_deref()
+                    .map_or(q, |subset: &[PhysicalQubit]| subset[q.index()])
+            })?;
             let problem = RoutingProblem {
                 target: &target,
                 sabre: &sabre_full,
@@ -147,28 +260,19 @@ pub fn sabre_layout_and_routing(
                 heuristic,
             };
             starting_layouts.extend(partial_layouts);
-            add_heuristic_layouts(&mut starting_layouts, problem, allow_parallel);
+            add_heuristic_layouts(&mut starting_layouts, problem);
             let num_layout_trials = starting_layouts.len();
-            let (_, result) = CondIterator::new(
+            let (result, trials_completed) = best_layout_trial(
+                py,
+                problem,
                 seeds(num_layout_trials),
+                max_iterations,
+                num_swap_trials,
                 allow_parallel && num_layout_trials > 1,
-            )
-            .enumerate()
-            .map(|(index, seed)| {
-                (
-                    index,
-                    layout_trial(
-                        problem,
-                        seed,
-                        max_iterations,
-                        num_swap_trials,
-                        allow_parallel && num_swap_trials > 1,
-                        &starting_layouts[index],
-                    ),
-                )
-            })
-            .min_by_key(|(index, result)| (result.swap_count(), *index))
-            .expect("should have at least one layout trial");
+                allow_parallel && num_swap_trials > 1,
+                &starting_layouts,
+                deadline,
+            );
             let num_swaps = result.swap_count();
             let out = dag.physical_empty_like_with_capacity(
                 num_physical_qubits,
@@ -190,35 +294,50 @@ pub fn sabre_layout_and_routing(
                 out,
                 expand_layout(num_physical_qubits as u32, &result.initial_layout, qubit_fn),
                 expand_layout(num_physical_qubits as u32, &result.final_layout, qubit_fn),
+                trials_completed,
             ))
         }
         TargetSplit::Multiple(components) => {
             // The DAG needs splitting across multiple chips.  We can build an initial layout
             // safely, but the final routing needs to be done altogether, with cross-chip
             // synchronisation points (e.g. barriers, classical communication, etc) fully in place.
-            let mut full_layout = vec![PhysicalQubit::new(u32::MAX); dag.num_qubits()];
-            // Mapping of the "proper" (full-target) physical qubits to the "fake" restricted
-            // physical qubit index used in the disjoint handling.  At the end of the loop, there
-            // will be duplicates in the list, and there may still be un-set entries, but that
-            // doesn't matter, because we only access physical qubits that come up.
-            let mut sub_from_full = vec![PhysicalQubit::new(u32::MAX); num_physical_qubits];
-            for component in &components {
-                let sabre = SabreDAG::from_dag(&component.sub_dag)?;
-                let target =
-                    RoutingTarget::from_neighbors(Neighbors::from_coupling_subset_with_map(
-                        &coupling,
+            let component_targets = components
+                .iter()
+                .map(|component| {
+                    routing_target(
+                        Neighbors::from_coupling_subset_with_map(
+                            &coupling,
+                            &component.physical_qubits,
+                            |q| NodeIndex::new(q.index()),
+                        ),
                         &component.physical_qubits,
-                        |q| NodeIndex::new(q.index()),
-                    ));
+                        &|q| component.physical_qubits[q.index()],
+                    )
+                })
+                .collect::<PyResult<Vec<_>>>()?;
+            // The components are independent layout problems on separate chips, so they're
+            // searched concurrently.  Each component seeds its own trials, so the result doesn't
+            // depend on the order the components finish in.
+            let layout_component = |(component, target): (
+                &disjoint_layout::DisjointComponent,
+                &RoutingTarget,
+            )|
+             -> PyResult<(Vec<(VirtualQubit, PhysicalQubit)>, usize)> {
+                let sabre = SabreDAG::from_dag(&component.sub_dag)?;
                 let sub_problem = RoutingProblem {
-                    target: &target,
+                    target,
                     sabre: &sabre,
                     dag: &component.sub_dag,
                     heuristic,
                 };
-                for (sub, full) in component.physical_qubits.iter().enumerate() {
-                    sub_from_full[full.index()] = PhysicalQubit::new(sub as u32);
-                }
+                // Mapping of the "proper" (full-target) physical qubits to the "fake" restricted
+                // physical qubit index used for this component.
+                let sub_from_full = component
+                    .physical_qubits
+                    .iter()
+                    .enumerate()
+                    .map(|(sub, full)| (*full, PhysicalQubit::new(sub as u32)))
+                    .collect::<HashMap<_, _>>();
                 let mut starting_layouts = starting_layouts.clone();
                 for partial in partial_layouts.iter() {
                     let assigned_physical = |v: &VirtualQubit| {
@@ -226,23 +345,19 @@ pub fn sabre_layout_and_routing(
                             .get(v.index())
                             .copied()
                             .flatten()
-                            .map(|p| {
-                                let sub = sub_from_full[p.index()];
-                                if component.physical_qubits[sub.index()] == p {
-                                    Ok(sub)
-                                } else {
-                                    // TODO: this handling sucks, but it's better than panicking
-                                    // later in Sabre routing when nothing makes any sense.
-                                    Err(PyValueError::new_err(format!(
-                                        "A custom starting layout assigned virtual qubit {} \
-                                        to physical qubit {}, which could not be satisfied on \
-                                        this disjoint QPU.  This might be a bug in Qiskit, or \
-                                        a bug in a custom transpiler pass that set the partial \
-                                        layout trials for SabreLayout.",
-                                        v.index(),
-                                        p.index(),
-                                    )))
-                                }
+                            .map(|p| match sub_from_full.get(&p) {
+                                Some(sub) => Ok(*sub),
+                                // TODO: this handling sucks, but it's better than panicking
+                                // later in Sabre routing when nothing makes any sense.
+                                None => Err(PyValueError::new_err(format!(
+                                    "A custom starting layout assigned virtual qubit {} \
+                                    to physical qubit {}, which could not be satisfied on \
+                                    this disjoint QPU.  This might be a bug in Qiskit, or \
+                                    a bug in a custom transpiler pass that set the partial \
+                                    layout trials for SabreLayout.",
+                                    v.index(),
+                                    p.index(),
+                                ))),
                             })
                             .transpose()
                     };
@@ -253,36 +368,52 @@ pub fn sabre_layout_and_routing(
                         .collect::<PyResult<Vec<_>>>()?;
                     starting_layouts.push(mapped_partial);
                 }
-                add_heuristic_layouts(&mut starting_layouts, sub_problem, allow_parallel);
+                add_heuristic_layouts(&mut starting_layouts, sub_problem);
                 let num_layout_trials = starting_layouts.len();
-                let (_, result) = CondIterator::new(
+                let (result, trials_completed) = best_layout_trial(
+                    None,
+                    sub_problem,
                     seeds(num_layout_trials),
+                    max_iterations,
+                    num_swap_trials,
                     allow_parallel && num_layout_trials > 1,
-                )
-                .enumerate()
-                .map(|(index, seed)| {
-                    (
-                        index,
-                        layout_trial(
-                            sub_problem,
-                            seed,
-                            max_iterations,
-                            num_swap_trials,
-                            allow_parallel && num_layout_trials == 1,
-                            &starting_layouts[index],
-                        ),
-                    )
-                })
-                .min_by_key(|(index, result)| (result.swap_count(), *index))
-                .expect("should have at least one layout trial");
-                for ((_, sub_phys), virt) in result
+                    allow_parallel && num_layout_trials == 1,
+                    &starting_layouts,
+                    deadline,
+                );
+                let assignments = result
                     .initial_layout
                     .iter_virtual()
                     // This zip might be shorter than `initial_layout`, but we _want_ the
                     // side-effect of truncating to the non-ancillas.
                     .zip(&component.virtual_qubits)
-                {
-                    full_layout[virt.index()] = component.physical_qubits[sub_phys.index()];
+                    .map(|((_, sub_phys), virt)| {
+                        (*virt, component.physical_qubits[sub_phys.index()])
+                    })
+                    .collect();
+                Ok((assignments, trials_completed))
+            };
+            let layout_components = || {
+                CondIterator::new(
+                    components
+                        .iter()
+                        .zip(&component_targets)
+                        .collect::<Vec<_>>(),
+                    allow_parallel,
+                )
+                .map(layout_component)
+                .collect::<PyResult<Vec<_>>>()
+            };
+            let component_layouts = match py {
+                Some(py) => py.detach(layout_components),
+                None => layout_components(),
+            }?;
+            let mut full_layout = vec![PhysicalQubit::new(u32::MAX); dag.num_qubits()];
+            let mut trials_completed = 0;
+            for (assignments, component_trials_completed) in component_layouts {
+                trials_completed += component_trials_completed;
+                for (virt, phys) in assignments {
+                    full_layout[virt.index()] = phys;
                 }
             }
             let max_virt = VirtualQubit::new(u32::MAX);
@@ -306,7 +437,7 @@ pub fn sabre_layout_and_routing(
                 // ...and assign them to the unassigned physical qubits in increasing order of both.
                 .zip(initial_physical.iter_mut().filter(|v| **v == max_virt))
                 .for_each(|(v, slot)| *slot = v);
-            let target = RoutingTarget::from_neighbors(Neighbors::from_coupling(&coupling));
+            let target = routing_target(Neighbors::from_coupling(&coupling), &[], &|q| q)?;
             let problem = RoutingProblem {
                 target: &target,
                 sabre: &sabre_full,
@@ -325,25 +456,86 @@ pub fn sabre_layout_and_routing(
                     )?,
                     initial_layout.clone(),
                     initial_layout,
+                    trials_completed,
                 ))
             } else {
-                let result = swap_map(
+                let (result, _) = swap_map_until(
                     problem,
                     &initial_layout,
                     seed,
                     num_swap_trials,
                     Some(allow_parallel),
+                    deadline,
                 );
                 Ok((
                     result.rebuild()?,
                     result.initial_layout,
                     result.final_layout,
+                    trials_completed,
                 ))
             }
         }
     }
 }
 
+/// Run one layout trial for each of the given seeds and return the result with the fewest swaps,
+/// breaking ties by the trial index, along with the number of trials that were completed.
+///
+/// If `py` is given, the trials are run detached from the Python interpreter.  The trials only
+/// read from the DAG, so they never need to touch Python-owned objects.
+///
+/// No trial other than the first is started once `deadline` has passed, so there is always a
+/// result.
+#[allow(clippy::too_many_arguments)]
+fn best_layout_trial<'a>(
+    py: Option<Python>,
+    problem: RoutingProblem<'a>,
+    seeds: Vec<u64>,
+    max_iterations: usize,
+    num_swap_trials: usize,
+    run_layouts_in_parallel: bool,
+    run_swaps_in_parallel: bool,
+    starting_layouts: &[Vec<Option<PhysicalQubit>>],
+    deadline: Option<Instant>,
+) -> (RoutingResult<'a>, usize) {
+    let run_trials = move || {
+        let trials_completed = AtomicUsize::new(0);
+        let result = CondIterator::new(seeds, run_layouts_in_parallel)
+            .enumerate()
+            .map(|(index, seed)| {
+                let result = (index == 0 || !deadline_passed(deadline)).then(|| {
+                    let result = layout_trial(
+                        problem,
+                        seed,
+                        max_iterations,
+                        num_swap_trials,
+                        run_swaps_in_parallel,
+                        &starting_layouts[index],
+                        deadline,
+                    );
+                    trials_completed.fetch_add(1, Ordering::Relaxed);
+                    result
+                });
+                (index, result)
+            })
+            .min_by_key(|(index, result)| {
+                (
+                    result
+                        .as_ref()
+                        .map_or(usize::MAX, |result| result.swap_count()),
+                    *index,
+                )
+            })
+            .and_then(|(_, result)| result)
+            .expect("should have at least one layout trial");
+        (result, trials_completed.into_inner())
+    };
+    match py {
+        Some(py) => py.detach(run_trials),
+        None => run_trials(),
+    }
+}
+
 fn layout_trial<'a>(
     problem: RoutingProblem<'a>,
     seed: u64,
@@ -351,6 +543,7 @@ fn layout_trial<'a>(
     num_swap_trials: usize,
     run_swap_in_parallel: bool,
     starting_layout: &'_ [Option<PhysicalQubit>],
+    deadline: Option<Instant>,
 ) -> RoutingResult<'a> {
     let num_physical_qubits: u32 = problem.target.neighbors.num_qubits().try_into().unwrap();
     let mut rng = Pcg64Mcg::seed_from_u64(seed);
@@ -390,7 +583,10 @@ fn layout_trial<'a>(
     // which means they don't actually affect any heuristics that affect our layout choice.
     let sabre_forwards = problem.sabre.only_interactions();
     let sabre_backwards = sabre_forwards.reverse_dag();
+    // Once the deadline has passed, stop refining the layout, but always do at least one
+    // forwards-backwards iteration.
     let initial_layout = (0..max_iterations)
+        .take_while(|iteration| *iteration == 0 || !deadline_passed(deadline))
         .flat_map(|_| [&sabre_forwards, &sabre_backwards])
         .fold(initial_layout, |initial, sabre| {
             swap_map_trial(problem.with_sabre(sabre), &initial, routing_seed).final_layout
@@ -407,26 +603,37 @@ fn layout_trial<'a>(
         }
         NLayout::from_vecs_unchecked(virt_to_phys, phys_to_virt)
     };
-    swap_map(
+    swap_map_until(
         problem,
         &initial_layout,
         Some(seed),
         num_swap_trials,
         Some(run_swap_in_parallel),
+        deadline,
     )
+    .0
+}
+
+/// The dense adjacency matrix of a coupling graph, with a one for each pair of coupled qubits.
+///
+/// This is built from the coupling graph itself rather than the distance matrix, since the
+/// distances are weighted when the heuristic is error aware.
+fn adjacency_matrix(neighbors: &Neighbors) -> Array2<f64> {
+    let num_qubits = neighbors.num_qubits();
+    let mut adj_matrix = Array2::zeros((num_qubits, num_qubits));
+    for (qubit, mut row) in adj_matrix.rows_mut().into_iter().enumerate() {
+        for neighbor in &neighbors[PhysicalQubit::new(qubit as u32)] {
+            row[neighbor.index()] = 1.;
+        }
+    }
+    adj_matrix
 }
 
 fn compute_dense_starting_layout(
     num_qubits: usize,
     target: &RoutingTarget,
-    run_in_parallel: bool,
 ) -> Vec<Option<PhysicalQubit>> {
-    let mut adj_matrix = target.distance.to_owned();
-    if run_in_parallel {
-        adj_matrix.par_mapv_inplace(|x| if x == 1. { 1. } else { 0. });
-    } else {
-        adj_matrix.mapv_inplace(|x| if x == 1. { 1. } else { 0. });
-    }
+    let adj_matrix = adjacency_matrix(&target.neighbors);
     let [_rows, _cols, map] = dense_layout::best_subset(
         num_qubits,
         adj_matrix.view(),
@@ -446,16 +653,16 @@ fn compute_dense_starting_layout(
 fn add_heuristic_layouts(
     starting_layouts: &mut Vec<Vec<Option<PhysicalQubit>>>,
     problem: RoutingProblem,
-    run_in_parallel: bool,
 ) {
     let lift = |i| Some(PhysicalQubit::new(i));
     let num_physical_qubits = problem.target.neighbors.num_qubits();
-    // Run a dense layout trial
-    starting_layouts.push(compute_dense_starting_layout(
-        problem.dag.num_qubits(),
-        problem.target,
-        run_in_parallel,
-    ));
+    // Run a dense layout trial, unless the target is too large for its dense adjacency matrix.
+    if !problem.target.distance.is_lazy() {
+        starting_layouts.push(compute_dense_starting_layout(
+            problem.dag.num_qubits(),
+            problem.target,
+        ));
+    }
     starting_layouts.push((0..num_physical_qubits as u32).map(lift).collect());
     starting_layouts.push((0..num_physical_qubits as u32).rev().map(lift).collect());
     // This layout targets the largest ring on an IBM eagle device. It has been
@@ -512,3 +719,45 @@ fn add_heuristic_layouts(
         );
     }
 }
+
+#[cfg(test)]
+mod test {
+    use super::*;
+
+    #[test]
+    fn dense_starting_layout_ignores_distance_weights() {
+        // A line of four qubits.
+        let line = || {
+            Neighbors::from_parts(
+                [1, 0, 2, 1, 3, 2].map(PhysicalQubit::new).to_vec(),
+                vec![0, 1, 3, 5, 6],
+            )
+            .unwrap()
+        };
+        let expected = Array2::from_shape_vec(
+            (4, 4),
+            vec![
+                0., 1., 0., 0., //
+                1., 0., 1., 0., //
+                0., 1., 0., 1., //
+                0., 0., 1., 0., //
+            ],
+        )
+        .unwrap();
+        assert_eq!(adjacency_matrix(&line()), expected);
+
+        // With every edge weighing a half, qubits two hops apart are at a distance of one, but are
+        // still not adjacent.
+        let hops = RoutingTarget::from_neighbors(line());
+        let weighted = RoutingTarget::with_edge_weights(line(), Some(vec![0.5; 6]), None, None)
+            .expect("dense distances with weights are valid");
+        assert_eq!(
+            weighted.distance.get(PhysicalQubit(0), PhysicalQubit(2)),
+            1.
+        );
+        assert_eq!(
+            compute_dense_starting_layout(3, &weighted),
+            compute_dense_starting_layout(3, &hops)
+        );
+    }
+}
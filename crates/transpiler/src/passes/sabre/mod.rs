@@ -11,6 +11,7 @@
 // that they have been altered from the originals.
 
 mod dag;
+pub mod distance;
 pub mod heuristic;
 mod layer;
 mod layout;
@@ -26,13 +27,16 @@ pub use layout::sabre_layout_and_routing;
 pub(crate) use route::sabre_routing;
 
 pub fn sabre(m: &Bound<PyModule>) -> PyResult<()> {
-    m.add_wrapped(wrap_pyfunction!(route::sabre_routing))?;
-    m.add_wrapped(wrap_pyfunction!(layout::sabre_layout_and_routing))?;
+    m.add_wrapped(wrap_pyfunction!(route::py_sabre_routing))?;
+    m.add_wrapped(wrap_pyfunction!(layout::py_sabre_layout_and_routing))?;
+    m.add_wrapped(wrap_pyfunction!(route::py_clear_distance_cache))?;
     m.add_class::<route::PyRoutingTarget>()?;
     m.add_class::<heuristic::SetScaling>()?;
     m.add_class::<heuristic::Heuristic>()?;
     m.add_class::<heuristic::BasicHeuristic>()?;
     m.add_class::<heuristic::LookaheadHeuristic>()?;
     m.add_class::<heuristic::DecayHeuristic>()?;
+    m.add_class::<heuristic::ErrorHeuristic>()?;
+    m.add_class::<heuristic::ErrorSource>()?;
     Ok(())
 }
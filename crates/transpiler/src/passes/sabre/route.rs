@@ -13,15 +13,20 @@
 use std::cmp::Ordering;
 use std::collections::VecDeque;
 use std::convert::Infallible;
+use std::env;
 use std::num::NonZero;
+use std::sync::atomic::{AtomicUsize, Ordering as AtomicOrdering};
+use std::sync::{Arc, LazyLock, Mutex};
+use std::time::{Duration, Instant};
 
-use numpy::{PyArray2, ToPyArray};
+use numpy::{IntoPyArray, PyArray2};
 use pyo3::Python;
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 
 use hashbrown::HashSet;
+use indexmap::{Equivalent, IndexMap};
 use ndarray::Array2;
 use rand::prelude::*;
 use rand::rngs::SysRng;
@@ -35,7 +40,8 @@ use rustworkx_core::token_swapper::token_swapper;
 use smallvec::{SmallVec, smallvec};
 
 use super::dag::{InteractionKind, SabreDAG};
-use super::heuristic::{BasicHeuristic, DecayHeuristic, Heuristic, SetScaling};
+use super::distance::{DENSE_DISTANCE_MAX_QUBITS, Distance, DistanceLookup, LazyDistance};
+use super::heuristic::{BasicHeuristic, DecayHeuristic, ErrorHeuristic, Heuristic, SetScaling};
 use super::layer::Layers;
 use super::vec_map::VecMap;
 use crate::TranspilerError;
@@ -329,26 +335,253 @@ impl RoutingResult<'_> {
     }
 }
 
+/// The maximum total size in bytes of the distance matrices held in [DISTANCE_CACHE].  This is
+/// enough for a single matrix of [DENSE_DISTANCE_MAX_QUBITS] qubits, or for several matrices of
+/// smaller devices.
+const DISTANCE_CACHE_BYTES: usize = 128 << 20;
+
+/// The distance matrices of the most recently used coupling graphs, in order of least to most
+/// recent use.
+///
+/// Computing the distance matrix takes a breadth-first search from every qubit, which dominates
+/// the setup cost of routing on large devices.  Typically, the same few devices are targeted over
+/// and over by the Sabre passes, both within one transpilation (layout and routing, and several
+/// disjoint components) and across transpilations in the same process, so we share the matrices
+/// between all of them.  Only coupling graphs taken from a `Target` whose fingerprint is known are
+/// cached, and the fingerprint, the qubits of the `Target` the graph is restricted to and the bit
+/// patterns of the edge weights are the key.
+///
+/// Setting the environment variable `QISKIT_SABRE_DISTANCE_CACHE` to `FALSE` disables the cache,
+/// and [py_clear_distance_cache] empties it.
+static DISTANCE_CACHE: LazyLock<Mutex<IndexMap<DistanceKey, Arc<Array2<f64>>>>> =
+    LazyLock::new(|| Mutex::new(IndexMap::new()));
+
+/// Where the coupling graph of a [RoutingTarget] was taken from, which identifies its distance
+/// matrix in [DISTANCE_CACHE].
+#[derive(Clone, Copy, Debug)]
+pub struct DistanceCacheKey<'a> {
+    /// The fingerprint of the `Target`, as returned by `Target.fingerprint` in Python space.
+    pub fingerprint: &'a str,
+    /// The qubits of the `Target` that the coupling graph is restricted to, in the order of the
+    /// qubits of the graph, or empty if it is the coupling graph of the whole `Target`.
+    pub qubits: &'a [PhysicalQubit],
+}
+
+/// The key of [DISTANCE_CACHE].  The weights are empty for the hop distance.
+#[derive(Hash, PartialEq, Eq, Debug)]
+struct DistanceKey {
+    fingerprint: Box<str>,
+    qubits: Box<[PhysicalQubit]>,
+    weights: Box<[u64]>,
+}
+
+/// A borrowed [DistanceKey], so that lookups don't need to allocate.  The fields hash the same as
+/// those of [DistanceKey].
+#[derive(Hash)]
+struct DistanceKeyRef<'a> {
+    fingerprint: &'a str,
+    qubits: &'a [PhysicalQubit],
+    weights: &'a [u64],
+}
+impl Equivalent<DistanceKey> for DistanceKeyRef<'_> {
+    fn equivalent(&self, key: &DistanceKey) -> bool {
+        *self.fingerprint == *key.fingerprint
+            && *self.qubits == *key.qubits
+            && *self.weights == *key.weights
+    }
+}
+
+/// Whether [DISTANCE_CACHE] is in use, which it is unless the environment variable
+/// `QISKIT_SABRE_DISTANCE_CACHE` is set to `FALSE`.
+fn use_distance_cache() -> bool {
+    env::var("QISKIT_SABRE_DISTANCE_CACHE")
+        .unwrap_or_else(|_| "TRUE".to_string())
+        .to_uppercase()
+        != "FALSE"
+}
+
+/// Empty the process-wide cache of the distance matrices of coupling graphs used by the Sabre
+/// passes.
+///
+/// Matrices that are still in use by a routing target are kept alive by it, but are no longer
+/// shared with new routing targets.
+#[pyfunction(name = "clear_distance_cache")]
+pub fn py_clear_distance_cache() {
+    DISTANCE_CACHE.lock().unwrap().clear();
+}
+
 /// A description of the QPU that we're routing to.
+///
+/// This is cheap to clone; a dense distance matrix is shared between all [RoutingTarget]s with the
+/// same coupling graph.
 #[derive(Clone, Debug)]
 pub struct RoutingTarget {
     pub neighbors: Neighbors,
-    pub distance: Array2<f64>,
+    pub distance: Distance,
+    /// The weights of the edges that `distance` is measured in, indexed by edge id, or `None` if
+    /// it is the number of edges.
+    pub edge_weights: Option<Arc<[f64]>>,
 }
 impl RoutingTarget {
+    /// Create the target, using a [LazyDistance] if it has more than [DENSE_DISTANCE_MAX_QUBITS]
+    /// qubits, and a dense distance matrix otherwise.
     pub fn from_neighbors(neighbors: Neighbors) -> Self {
+        Self::with_lazy_distance(neighbors, None, None)
+    }
+
+    /// Create the target, choosing the distance representation explicitly if `lazy` is given, or
+    /// as in [from_neighbors](Self::from_neighbors) otherwise.
+    ///
+    /// If `cache_key` is given, a dense distance matrix is looked up in and added to
+    /// [DISTANCE_CACHE].
+    pub fn with_lazy_distance(
+        neighbors: Neighbors,
+        lazy: Option<bool>,
+        cache_key: Option<DistanceCacheKey>,
+    ) -> Self {
+        if lazy.unwrap_or(neighbors.num_qubits() > DENSE_DISTANCE_MAX_QUBITS) {
+            // Building this is free, so there's nothing to gain from caching it.
+            return Self {
+                distance: Distance::Lazy(Arc::new(LazyDistance::new(neighbors.clone()))),
+                neighbors,
+                edge_weights: None,
+            };
+        }
+        let distance = cached_distance(cache_key, &[], || {
+            distance_matrix(&neighbors, usize::MAX, false, f64::NAN)
+        });
         Self {
-            distance: distance_matrix(&neighbors, usize::MAX, false, f64::NAN),
             neighbors,
+            distance: Distance::Dense(distance),
+            edge_weights: None,
         }
     }
 
+    /// Create the target with the distance between two qubits being the sum of the weights of the
+    /// edges along the cheapest path between them, rather than the number of edges.
+    ///
+    /// `weights` is indexed by the edge ids of `neighbors` (the positions in its flat adjacency
+    /// list), and must be symmetric.  If it is `None`, this is the same as
+    /// [with_lazy_distance](Self::with_lazy_distance).  Weighted distances are always held in a
+    /// dense matrix, so it is an error to explicitly ask for lazy distances with weights.
+    pub fn with_edge_weights(
+        neighbors: Neighbors,
+        weights: Option<Vec<f64>>,
+        lazy: Option<bool>,
+        cache_key: Option<DistanceCacheKey>,
+    ) -> PyResult<Self> {
+        let Some(weights) = weights else {
+            return Ok(Self::with_lazy_distance(neighbors, lazy, cache_key));
+        };
+        if lazy == Some(true) {
+            return Err(TranspilerError::new_err(
+                "lazy distances cannot be used with the error-aware heuristic",
+            ));
+        }
+        debug_assert_eq!(weights.len(), neighbors.edge_count());
+        let bits = weights.iter().map(|w| w.to_bits()).collect::<Vec<_>>();
+        let distance = cached_distance(cache_key, &bits, || {
+            weighted_distance_matrix(&neighbors, &weights)
+        });
+        Ok(Self {
+            neighbors,
+            distance: Distance::Dense(distance),
+            edge_weights: Some(weights.into()),
+        })
+    }
+
     #[inline]
     pub fn num_qubits(&self) -> usize {
         self.neighbors.num_qubits()
     }
 }
 
+/// Get the distance matrix for a coupling graph and edge weights from [DISTANCE_CACHE], computing
+/// and inserting it if it isn't there.  If there is no `key`, or the cache is disabled, the matrix
+/// is always computed.
+fn cached_distance(
+    key: Option<DistanceCacheKey>,
+    weights: &[u64],
+    compute: impl FnOnce() -> Array2<f64>,
+) -> Arc<Array2<f64>> {
+    let Some(key) = key.filter(|_| use_distance_cache()) else {
+        return Arc::new(compute());
+    };
+    let key_ref = DistanceKeyRef {
+        fingerprint: key.fingerprint,
+        qubits: key.qubits,
+        weights,
+    };
+    let cached = {
+        let mut cache = DISTANCE_CACHE.lock().unwrap();
+        cache.get_index_of(&key_ref).map(|index| {
+            let last = cache.len() - 1;
+            cache.move_index(index, last);
+            cache[last].clone()
+        })
+    };
+    cached.unwrap_or_else(|| {
+        // Computed without holding the lock, so other threads aren't blocked on unrelated
+        // targets.  Two threads may race to compute the same matrix, but that's harmless.
+        let distance = Arc::new(compute());
+        if distance_bytes(&distance) > DISTANCE_CACHE_BYTES {
+            return distance;
+        }
+        let mut cache = DISTANCE_CACHE.lock().unwrap();
+        cache.insert(
+            DistanceKey {
+                fingerprint: key.fingerprint.into(),
+                qubits: key.qubits.into(),
+                weights: weights.into(),
+            },
+            distance.clone(),
+        );
+        evict_distances(&mut cache, DISTANCE_CACHE_BYTES);
+        distance
+    })
+}
+
+/// The size in bytes of the elements of a distance matrix.
+fn distance_bytes(distance: &Array2<f64>) -> usize {
+    distance.len() * size_of::<f64>()
+}
+
+/// Remove the least recently used matrices from a distance cache until the total size of the rest
+/// is at most `budget` bytes.
+fn evict_distances(cache: &mut IndexMap<DistanceKey, Arc<Array2<f64>>>, budget: usize) {
+    let mut total = cache
+        .values()
+        .map(|distance| distance_bytes(&**distance))
+        .sum::<usize>();
+    while total > budget {
+        let Some((_, evicted)) = cache.shift_remove_index(0) else {
+            break;
+        };
+        total -= distance_bytes(&evicted);
+    }
+}
+
+/// The matrix of the lengths of the cheapest paths between all pairs of qubits, where the cost of
+/// each edge is given by `weights`, indexed by edge id.  Unreachable pairs are NaN.
+fn weighted_distance_matrix(neighbors: &Neighbors, weights: &[f64]) -> Array2<f64> {
+    let num_qubits = neighbors.num_qubits();
+    let mut out = Array2::from_elem((num_qubits, num_qubits), f64::NAN);
+    for (source, mut row) in out.rows_mut().into_iter().enumerate() {
+        let lengths = (dijkstra(
+            neighbors,
+            PhysicalQubit::new(source as u32),
+            None,
+            |edge| Ok(weights[edge.id()]),
+            None,
+        ) as Result<DictMap<PhysicalQubit, f64>, Infallible>)
+            .expect("error is infallible");
+        for (qubit, length) in lengths {
+            row[qubit.index()] = length;
+        }
+    }
+    out
+}
+
 /// Python wrapper for the Rust-space Sabre target object.
 ///
 /// Contains `None` when the target had all-to-all connectivity (in which case the two property
@@ -372,6 +605,16 @@ impl PyRoutingTarget {
         let out_dict = PyDict::new(py);
         out_dict.set_item("neighbors", neighbors)?;
         out_dict.set_item("partition", partition)?;
+        out_dict.set_item(
+            "lazy_distance",
+            self.0.as_ref().map(|tg| tg.distance.is_lazy()),
+        )?;
+        out_dict.set_item(
+            "edge_weights",
+            self.0
+                .as_ref()
+                .and_then(|tg| tg.edge_weights.as_ref().map(|weights| weights.to_vec())),
+        )?;
         Ok(out_dict)
     }
 
@@ -384,27 +627,69 @@ impl PyRoutingTarget {
             .get_item("partition")?
             .map(|x| x.extract())
             .transpose()?;
+        let lazy = value
+            .get_item("lazy_distance")?
+            .map(|x| x.extract())
+            .transpose()?
+            .flatten();
+        let weights: Option<Vec<f64>> = value
+            .get_item("edge_weights")?
+            .map(|x| x.extract())
+            .transpose()?
+            .flatten();
         let (Some(neighbors), Some(partition)) = (neighbors, partition) else {
             return Ok(());
         };
         let neighbors = Neighbors::from_parts(neighbors, partition)
             .map_err(|e| PyValueError::new_err(e.to_string()))?;
-        self.0 = Some(RoutingTarget::from_neighbors(neighbors));
+        if weights
+            .as_ref()
+            .is_some_and(|weights| weights.len() != neighbors.edge_count())
+        {
+            return Err(PyValueError::new_err(
+                "edge weights do not match the coupling graph",
+            ));
+        }
+        self.0 = Some(RoutingTarget::with_edge_weights(
+            neighbors, weights, lazy, None,
+        )?);
         Ok(())
     }
 
+    /// Build the routing target for the coupling graph of a :class:`.Target`.
+    ///
+    /// If ``lazy_distance`` is ``True``, the distances between qubits are computed on demand
+    /// during routing, with a bounded cache, rather than as a dense matrix up front.  If it is
+    /// ``None``, the lazy representation is used for targets with more than 4096 qubits.
+    ///
+    /// If ``heuristic`` is given and has an :class:`.ErrorHeuristic`, the distances are weighted
+    /// by the errors (or durations) of the couplers in the target, which needs the dense
+    /// representation.
+    ///
+    /// If ``fingerprint`` is given, it must be the :meth:`.Target.fingerprint` of ``target``, and
+    /// the dense distance matrix is shared with other routing targets for the same target.
     #[staticmethod]
-    pub(crate) fn from_target(target: &Target) -> PyResult<Self> {
-        let coupling = match target.coupling_graph() {
-            Ok(coupling) => coupling,
-            Err(TargetCouplingError::AllToAll) => return Ok(Self(None)),
-            Err(e @ TargetCouplingError::MultiQ(_)) => {
-                return Err(TranspilerError::new_err(e.to_string()));
-            }
-        };
-        Ok(Self(Some(RoutingTarget::from_neighbors(
-            Neighbors::from_coupling(&coupling),
-        ))))
+    #[pyo3(name = "from_target", signature = (target, lazy_distance=None, heuristic=None, fingerprint=None))]
+    fn py_from_target(
+        target: &Target,
+        lazy_distance: Option<bool>,
+        heuristic: Option<PyRef<Heuristic>>,
+        fingerprint: Option<&str>,
+    ) -> PyResult<Self> {
+        Self::from_target_with_options(
+            target,
+            lazy_distance,
+            heuristic
+                .as_ref()
+                .and_then(|heuristic| heuristic.error.as_ref()),
+            fingerprint,
+        )
+    }
+
+    /// Whether the distances between qubits are computed on demand.
+    #[getter]
+    fn lazy_distance(&self) -> Option<bool> {
+        self.0.as_ref().map(|target| target.distance.is_lazy())
     }
 
     fn coupling_list(&self) -> Option<Vec<[PhysicalQubit; 2]>> {
@@ -418,8 +703,46 @@ impl PyRoutingTarget {
         })
     }
 
+    /// The dense matrix of distances between qubits.
+    ///
+    /// If the distances are computed on demand, this computes all of them, which takes as much
+    /// time and memory as the dense representation.
     fn distance_matrix<'py>(&self, py: Python<'py>) -> Option<Bound<'py, PyArray2<f64>>> {
-        self.0.as_ref().map(|target| target.distance.to_pyarray(py))
+        self.0
+            .as_ref()
+            .map(|target| target.distance.to_dense().into_pyarray(py))
+    }
+}
+impl PyRoutingTarget {
+    pub(crate) fn from_target(target: &Target) -> PyResult<Self> {
+        Self::from_target_with_options(target, None, None, None)
+    }
+
+    pub(crate) fn from_target_with_options(
+        target: &Target,
+        lazy_distance: Option<bool>,
+        error: Option<&ErrorHeuristic>,
+        fingerprint: Option<&str>,
+    ) -> PyResult<Self> {
+        let coupling = match target.coupling_graph() {
+            Ok(coupling) => coupling,
+            Err(TargetCouplingError::AllToAll) => return Ok(Self(None)),
+            Err(e @ TargetCouplingError::MultiQ(_)) => {
+                return Err(TranspilerError::new_err(e.to_string()));
+            }
+        };
+        let neighbors = Neighbors::from_coupling(&coupling);
+        let weights = error.and_then(|error| error.edge_weights(target, &neighbors, |q| q));
+        let cache_key = fingerprint.map(|fingerprint| DistanceCacheKey {
+            fingerprint,
+            qubits: &[],
+        });
+        Ok(Self(Some(RoutingTarget::with_edge_weights(
+            neighbors,
+            weights,
+            lazy_distance,
+            cache_key,
+        )?)))
     }
 }
 
@@ -841,8 +1164,8 @@ impl State {
                 .iter_gates()
                 .map(|(node, virtuals)| (node, virtuals.map(|q| self.layout[q])))
                 .min_by(|(_, qubits_a), (_, qubits_b)| {
-                    dist[[qubits_a[0].index(), qubits_a[1].index()]]
-                        .partial_cmp(&dist[[qubits_b[0].index(), qubits_b[1].index()]])
+                    dist.get(qubits_a[0], qubits_a[1])
+                        .partial_cmp(&dist.get(qubits_b[0], qubits_b[1]))
                         .unwrap_or(Ordering::Equal)
                 })
                 .expect("front layer is never empty, except when routing is complete")
@@ -902,7 +1225,27 @@ impl State {
             }
         }
 
-        let dist = &problem.target.distance.view();
+        match &problem.target.distance {
+            Distance::Dense(dense) => self.score_swaps(problem, &dense.view()),
+            Distance::Lazy(lazy) => self.score_swaps(problem, &lazy.lookup()),
+        }
+
+        let mut min_score = f64::INFINITY;
+        let epsilon = problem.heuristic.best_epsilon;
+        for &(swap, score) in self.swap_scores.iter() {
+            if score - min_score < -epsilon {
+                min_score = score;
+                self.best_swaps.clear();
+                self.best_swaps.push(swap);
+            } else if (score - min_score).abs() <= epsilon {
+                self.best_swaps.push(swap);
+            }
+        }
+        *self.best_swaps.choose(&mut self.rng).unwrap()
+    }
+
+    /// Fill in the scores of the candidate swaps in `swap_scores`, according to the heuristic.
+    fn score_swaps(&mut self, problem: RoutingProblem, dist: &impl DistanceLookup) {
         let mut absolute_score = 0.0;
 
         if let Some(BasicHeuristic { weight, scale }) = problem.heuristic.basic {
@@ -947,29 +1290,58 @@ impl State {
                 *score = (absolute_score + *score) * self.decay[swap[0]].max(self.decay[swap[1]]);
             }
         }
-
-        let mut min_score = f64::INFINITY;
-        let epsilon = problem.heuristic.best_epsilon;
-        for &(swap, score) in self.swap_scores.iter() {
-            if score - min_score < -epsilon {
-                min_score = score;
-                self.best_swaps.clear();
-                self.best_swaps.push(swap);
-            } else if (score - min_score).abs() <= epsilon {
-                self.best_swaps.push(swap);
-            }
-        }
-        *self.best_swaps.choose(&mut self.rng).unwrap()
     }
 }
 
 /// Run Sabre swap on a circuit
 ///
+/// The routing trials are run detached from the Python interpreter, so other Python threads can
+/// make progress in the meantime.
+///
+/// If ``time_limit`` is given, it is a budget in seconds for the trials.  No new trial is started
+/// once it is spent, but the first trial is always run to completion, so there is always a result.
+///
+/// If ``window_size`` is given, the circuit is routed in windows of that many operations, in
+/// topological order, rather than all at once.  See [route_windowed].
+///
 /// Returns:
-///     A two-tuple of the newly routed :class:`.DAGCircuit`, and the layout that maps virtual
-///     qubits to their assigned physical qubits at the *end* of the circuit execution.
-#[pyfunction]
-#[pyo3(signature=(dag, target, heuristic, initial_layout, num_trials, seed=None, run_in_parallel=None))]
+///     A three-tuple of the newly routed :class:`.DAGCircuit`, the layout that maps virtual
+///     qubits to their assigned physical qubits at the *end* of the circuit execution, and the
+///     number of trials that were completed.
+#[allow(clippy::too_many_arguments)]
+#[pyfunction(name = "sabre_routing")]
+#[pyo3(signature=(dag, target, heuristic, initial_layout, num_trials, seed=None, run_in_parallel=None, time_limit=None, window_size=None))]
+pub fn py_sabre_routing(
+    py: Python,
+    dag: &DAGCircuit,
+    target: &PyRoutingTarget,
+    heuristic: &Heuristic,
+    initial_layout: &NLayout,
+    num_trials: usize,
+    seed: Option<u64>,
+    run_in_parallel: Option<bool>,
+    time_limit: Option<f64>,
+    window_size: Option<usize>,
+) -> PyResult<(DAGCircuit, NLayout, usize)> {
+    let deadline = deadline_from_time_limit(time_limit)?;
+    if window_size == Some(0) {
+        return Err(PyValueError::new_err("the window size must be positive"));
+    }
+    sabre_routing_inner(
+        Some(py),
+        dag,
+        target,
+        heuristic,
+        initial_layout,
+        num_trials,
+        seed,
+        run_in_parallel,
+        deadline,
+        window_size,
+    )
+}
+
+/// A non-Python entry point to Sabre swap.
 pub fn sabre_routing(
     dag: &DAGCircuit,
     target: &PyRoutingTarget,
@@ -979,24 +1351,174 @@ pub fn sabre_routing(
     seed: Option<u64>,
     run_in_parallel: Option<bool>,
 ) -> PyResult<(DAGCircuit, NLayout)> {
+    sabre_routing_inner(
+        None,
+        dag,
+        target,
+        heuristic,
+        initial_layout,
+        num_trials,
+        seed,
+        run_in_parallel,
+        None,
+        None,
+    )
+    .map(|(dag, final_layout, _)| (dag, final_layout))
+}
+
+#[allow(clippy::too_many_arguments)]
+fn sabre_routing_inner(
+    py: Option<Python>,
+    dag: &DAGCircuit,
+    target: &PyRoutingTarget,
+    heuristic: &Heuristic,
+    initial_layout: &NLayout,
+    num_trials: usize,
+    seed: Option<u64>,
+    run_in_parallel: Option<bool>,
+    deadline: Option<Instant>,
+    window_size: Option<usize>,
+) -> PyResult<(DAGCircuit, NLayout, usize)> {
     let Some(target) = target.0.as_ref() else {
         // All-to-all coupling.
-        return Ok((dag.clone(), initial_layout.clone()));
+        return Ok((dag.clone(), initial_layout.clone(), 0));
     };
+    if let Some(window_size) = window_size {
+        return route_windowed(
+            py,
+            dag,
+            target,
+            heuristic,
+            initial_layout,
+            num_trials,
+            seed,
+            run_in_parallel,
+            deadline,
+            window_size,
+        );
+    }
     let sabre = SabreDAG::from_dag(dag)?;
-    let result = swap_map(
-        RoutingProblem {
+    let problem = RoutingProblem {
+        target,
+        sabre: &sabre,
+        dag,
+        heuristic,
+    };
+    let run_trials = || {
+        swap_map_until(
+            problem,
+            initial_layout,
+            seed,
+            num_trials,
+            run_in_parallel,
+            deadline,
+        )
+    };
+    let (result, trials_completed) = match py {
+        Some(py) => py.detach(run_trials),
+        None => run_trials(),
+    };
+    // Building the output DAG may need to clone Python-owned objects, so must happen attached.
+    result
+        .rebuild()
+        .map(|dag| (dag, result.final_layout, trials_completed))
+}
+
+/// Route a circuit in windows of `window_size` operations, taken in topological order.
+///
+/// Each window is turned into its own [SabreDAG] and routed by [swap_map_until], starting from
+/// the final layout of the window before, and the result is appended to the output before the
+/// next window is built.  This bounds the memory used by the Sabre structures and the routing
+/// order by the size of a window, rather than of the whole circuit.  The router can't look ahead
+/// past the end of a window, so the output may have more swaps than routing all at once.
+///
+/// The first window is routed with `seed` itself, so if there is only one window, the result is
+/// the same as without windowing.  Later windows get their seeds from a stream seeded by `seed`.
+/// The number of trials returned is the fewest that completed in any window.
+#[allow(clippy::too_many_arguments)]
+fn route_windowed(
+    py: Option<Python>,
+    dag: &DAGCircuit,
+    target: &RoutingTarget,
+    heuristic: &Heuristic,
+    initial_layout: &NLayout,
+    num_trials: usize,
+    seed: Option<u64>,
+    run_in_parallel: Option<bool>,
+    deadline: Option<Instant>,
+    window_size: usize,
+) -> PyResult<(DAGCircuit, NLayout, usize)> {
+    let mut seeds = match seed {
+        Some(seed) => Pcg64Mcg::seed_from_u64(seed),
+        None => Pcg64Mcg::try_from_rng(&mut SysRng).unwrap(),
+    }
+    .sample_iter(rand::distr::StandardUniform);
+    let mut window_seed: u64 = match seed {
+        Some(seed) => seed,
+        None => seeds.next().expect("the seed stream is infinite"),
+    };
+    let mut out = dag.physical_empty_like_with_capacity(
+        initial_layout.num_qubits(),
+        dag.num_ops(),
+        dag.dag().edge_count(),
+        BlocksMode::Drop,
+    )?;
+    let mut layout = initial_layout.clone();
+    let mut min_trials_completed = num_trials;
+    let mut nodes = dag.topological_op_nodes(false).peekable();
+    let mut window = Vec::with_capacity(window_size.min(dag.num_ops()));
+    while nodes.peek().is_some() {
+        window.clear();
+        window.extend(nodes.by_ref().take(window_size));
+        let sabre = SabreDAG::from_dag_nodes(dag, window.iter().copied())?;
+        let problem = RoutingProblem {
             target,
             sabre: &sabre,
             dag,
             heuristic,
-        },
-        initial_layout,
-        seed,
-        num_trials,
-        run_in_parallel,
-    );
-    result.rebuild().map(|dag| (dag, result.final_layout))
+        };
+        let run_trials = || {
+            swap_map_until(
+                problem,
+                &layout,
+                Some(window_seed),
+                num_trials,
+                run_in_parallel,
+                deadline,
+            )
+        };
+        let (result, trials_completed) = match py {
+            Some(py) => py.detach(run_trials),
+            None => run_trials(),
+        };
+        min_trials_completed = min_trials_completed.min(trials_completed);
+        // Building the output may need to clone Python-owned objects, so must happen attached.
+        out = result.rebuild_onto(out, |q| q)?;
+        layout = result.final_layout;
+        window_seed = seeds.next().expect("the seed stream is infinite");
+    }
+    Ok((out, layout, min_trials_completed))
+}
+
+/// Convert an optional time budget in seconds into the instant it runs out at.
+pub fn deadline_from_time_limit(time_limit: Option<f64>) -> PyResult<Option<Instant>> {
+    time_limit
+        .map(|time_limit| {
+            Duration::try_from_secs_f64(time_limit)
+                .map(|budget| Instant::now() + budget)
+                .map_err(|_| {
+                    PyValueError::new_err(format!(
+                        "time limit must be a non-negative number of seconds, not {time_limit}"
+                    ))
+                })
+        })
+        .transpose()
+}
+
+/// Whether the given deadline (if any) has passed.
+#[inline]
+pub fn deadline_passed(deadline: Option<Instant>) -> bool {
+    deadline.is_some_and(|deadline| Instant::now() >= deadline)
 }
 
 /// Run (potentially in parallel) several trials of the Sabre routing algorithm on the given
@@ -1008,6 +1530,30 @@ pub fn swap_map<'a>(
     num_trials: usize,
     run_in_parallel: Option<bool>,
 ) -> RoutingResult<'a> {
+    swap_map_until(
+        problem,
+        initial_layout,
+        seed,
+        num_trials,
+        run_in_parallel,
+        None,
+    )
+    .0
+}
+
+/// Like [swap_map], but don't start any trial after `deadline` has passed.
+///
+/// The first trial always runs, so there is always a result.  The trials use the same seeds as
+/// in [swap_map], so the result only differs from it if a trial was skipped.  Returns the best
+/// result along with the number of trials that ran.
+pub fn swap_map_until<'a>(
+    problem: RoutingProblem<'a>,
+    initial_layout: &'_ NLayout,
+    seed: Option<u64>,
+    num_trials: usize,
+    run_in_parallel: Option<bool>,
+    deadline: Option<Instant>,
+) -> (RoutingResult<'a>, usize) {
     let seeds = match seed {
         Some(seed) => Pcg64Mcg::seed_from_u64(seed),
         None => Pcg64Mcg::try_from_rng(&mut SysRng).unwrap(),
@@ -1016,16 +1562,32 @@ pub fn swap_map<'a>(
     .take(num_trials)
     .collect::<Vec<_>>();
 
-    CondIterator::new(
+    let trials_completed = AtomicUsize::new(0);
+    let result = CondIterator::new(
         seeds,
         num_trials > 1
             && run_in_parallel.unwrap_or_else(|| getenv_use_multiple_threads() && num_trials > 1),
     )
-    .map(|seed| swap_map_trial(problem, initial_layout, seed))
     .enumerate()
-    .min_by_key(|(index, result)| (result.order.swap_count(), *index))
-    .map(|(_, result)| result)
-    .expect("must have at least one trial")
+    .map(|(index, seed)| {
+        let result = (index == 0 || !deadline_passed(deadline)).then(|| {
+            let result = swap_map_trial(problem, initial_layout, seed);
+            trials_completed.fetch_add(1, AtomicOrdering::Relaxed);
+            result
+        });
+        (index, result)
+    })
+    .min_by_key(|(index, result)| {
+        (
+            result
+                .as_ref()
+                .map_or(usize::MAX, |result| result.order.swap_count()),
+            *index,
+        )
+    })
+    .and_then(|(_, result)| result)
+    .expect("must have at least one trial");
+    (result, trials_completed.into_inner())
 }
 
 /// Run a single trial of the Sabre routing algorithm.
@@ -1093,3 +1655,98 @@ pub fn swap_map_trial<'a>(
         final_layout: state.layout,
     }
 }
+
+#[cfg(test)]
+mod test {
+    use super::*;
+
+    #[test]
+    fn routing_targets_share_distance_matrix() {
+        let dense = |target: &RoutingTarget| match &target.distance {
+            Distance::Dense(dense) => dense.clone(),
+            Distance::Lazy(_) => panic!("small targets should have dense distance matrices"),
+        };
+        // A line of four qubits.
+        let line = || {
+            Neighbors::from_parts(
+                [1, 0, 2, 1, 3, 2].map(PhysicalQubit::new).to_vec(),
+                vec![0, 1, 3, 5, 6],
+            )
+            .unwrap()
+        };
+        let key = |fingerprint| {
+            Some(DistanceCacheKey {
+                fingerprint,
+                qubits: &[],
+            })
+        };
+        let first = RoutingTarget::with_lazy_distance(line(), None, key("line"));
+        let second = RoutingTarget::with_lazy_distance(line(), None, key("line"));
+        assert!(Arc::ptr_eq(&dense(&first), &dense(&second)));
+        assert_eq!(dense(&first)[[0, 3]], 3.);
+
+        // Without a fingerprint, nothing is shared.
+        let uncached = RoutingTarget::from_neighbors(line());
+        assert!(!Arc::ptr_eq(&dense(&first), &dense(&uncached)));
+
+        // A ring of four qubits comes from a different target, so must not share the matrix.
+        let ring = Neighbors::from_parts(
+            [1, 3, 0, 2, 1, 3, 0, 2].map(PhysicalQubit::new).to_vec(),
+            vec![0, 2, 4, 6, 8],
+        )
+        .unwrap();
+        let ring = RoutingTarget::with_lazy_distance(ring, None, key("ring"));
+        assert!(!Arc::ptr_eq(&dense(&first), &dense(&ring)));
+        assert_eq!(dense(&ring)[[0, 3]], 1.);
+
+        // The same graph restricted to other qubits of the target is a different entry.
+        let qubits = [1, 2, 3, 4].map(PhysicalQubit::new);
+        let subset = RoutingTarget::with_lazy_distance(
+            line(),
+            None,
+            Some(DistanceCacheKey {
+                fingerprint: "line",
+                qubits: &qubits,
+            }),
+        );
+        assert!(!Arc::ptr_eq(&dense(&first), &dense(&subset)));
+
+        // A lazy target is never shared, but gives the same distances.
+        let lazy = RoutingTarget::with_lazy_distance(line(), Some(true), key("line"));
+        assert!(lazy.distance.is_lazy());
+        assert_eq!(lazy.distance.to_dense(), *dense(&first));
+    }
+
+    #[test]
+    fn distance_cache_stays_within_budget() {
+        let key = |fingerprint: &str| DistanceKey {
+            fingerprint: fingerprint.into(),
+            qubits: Box::new([]),
+            weights: Box::new([]),
+        };
+        let matrix = |num_qubits| Arc::new(Array2::<f64>::zeros((num_qubits, num_qubits)));
+        let mut cache = IndexMap::new();
+        cache.insert(key("oldest"), matrix(4));
+        cache.insert(key("middle"), matrix(4));
+        cache.insert(key("newest"), matrix(2));
+        // Each 4q matrix is 128 bytes, and the 2q one is 32.
+        evict_distances(&mut cache, 200);
+        assert_eq!(
+            cache
+                .keys()
+                .map(|key| &*key.fingerprint)
+                .collect::<Vec<_>>(),
+            vec!["middle", "newest"]
+        );
+        evict_distances(&mut cache, 160);
+        assert_eq!(cache.len(), 2);
+        evict_distances(&mut cache, 100);
+        assert_eq!(
+            cache
+                .keys()
+                .map(|key| &*key.fingerprint)
+                .collect::<Vec<_>>(),
+            vec!["newest"]
+        );
+    }
+}
@@ -0,0 +1,350 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2026
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+use std::convert::Infallible;
+
+use hashbrown::HashMap;
+use itertools::Itertools;
+use pyo3::prelude::*;
+use rustworkx_core::petgraph::prelude::*;
+use smallvec::SmallVec;
+
+use qiskit_circuit::dag_circuit::{DAGCircuit, NodeType};
+use qiskit_circuit::operations::{OperationRef, StandardGate, StandardInstruction};
+use qiskit_circuit::packed_instruction::PackedInstruction;
+use qiskit_circuit::{BlocksMode, Qubit, VarsMode};
+
+/// The qubit that all the two-qubit gates of a [StarBlock] act on.
+#[derive(Clone, Debug, PartialEq, Eq)]
+enum Center {
+    /// No multi-qubit gate has been added to the block yet.
+    Unset,
+    /// Only one multi-qubit gate has been added, and the center is any of its qubits.
+    Candidates(SmallVec<[Qubit; 2]>),
+    Qubit(Qubit),
+}
+
+/// A star-shaped piece of a circuit.
+#[derive(Clone, Debug)]
+struct StarBlock {
+    nodes: Vec<NodeIndex>,
+    center: Center,
+    num2q: usize,
+}
+
+impl StarBlock {
+    fn new() -> Self {
+        Self {
+            nodes: Vec::new(),
+            center: Center::Unset,
+            num2q: 0,
+        }
+    }
+
+    /// Add a node acting on `qargs` to the block if the block stays star-shaped with it, and
+    /// return whether it was added.
+    fn append_node(&mut self, node: NodeIndex, qargs: &[Qubit]) -> bool {
+        if qargs.len() == 1 {
+            self.nodes.push(node);
+            return true;
+        }
+        let center = match &self.center {
+            Center::Unset => Center::Candidates(qargs.iter().copied().collect()),
+            Center::Candidates(candidates) => {
+                match qargs[..qargs.len().min(2)]
+                    .iter()
+                    .find(|qubit| candidates.contains(qubit))
+                {
+                    Some(&qubit) => Center::Qubit(qubit),
+                    None => return false,
+                }
+            }
+            Center::Qubit(center) if qargs.contains(center) => Center::Qubit(*center),
+            Center::Qubit(_) => return false,
+        };
+        self.center = center;
+        self.nodes.push(node);
+        self.num2q += 1;
+        true
+    }
+}
+
+/// Whether a node can be collected into a star block.
+fn is_star_node(dag: &DAGCircuit, node: NodeIndex) -> bool {
+    let NodeType::Operation(inst) = &dag[node] else {
+        return false;
+    };
+    dag.get_qargs(inst.qubits).len() <= 2
+        && dag.get_cargs(inst.clbits).is_empty()
+        && !matches!(
+            inst.op.view(),
+            OperationRef::StandardInstruction(StandardInstruction::Barrier(_))
+        )
+}
+
+fn qargs_of(dag: &DAGCircuit, node: NodeIndex) -> &[Qubit] {
+    match &dag[node] {
+        NodeType::Operation(inst) => dag.get_qargs(inst.qubits),
+        _ => unreachable!("star blocks only contain operations"),
+    }
+}
+
+/// Collects blocks of nodes by repeatedly taking the largest block of nodes whose predecessors
+/// have all been collected.
+struct BlockCollector<'a> {
+    dag: &'a DAGCircuit,
+    /// The number of uncollected operation predecessors of each node.
+    in_degree: Vec<usize>,
+    pending: Vec<NodeIndex>,
+}
+
+impl<'a> BlockCollector<'a> {
+    fn new(dag: &'a DAGCircuit) -> Self {
+        let mut in_degree = vec![0; dag.dag().node_bound()];
+        let mut pending = Vec::new();
+        for node in dag.op_node_indices(true) {
+            let degree = dag
+                .predecessors(node)
+                .filter(|pred| matches!(dag[*pred], NodeType::Operation(_)))
+                .count();
+            in_degree[node.index()] = degree;
+            if degree == 0 {
+                pending.push(node);
+            }
+        }
+        Self {
+            dag,
+            in_degree,
+            pending,
+        }
+    }
+
+    /// Collect the largest star block of pending nodes for which [is_star_node] is `matching`.
+    fn collect_block(&mut self, matching: bool) -> StarBlock {
+        let mut unprocessed = std::mem::take(&mut self.pending);
+        let mut block = StarBlock::new();
+        while !unprocessed.is_empty() {
+            let mut new_pending = Vec::new();
+            for node in unprocessed {
+                let added = is_star_node(self.dag, node) == matching
+                    && block.append_node(node, qargs_of(self.dag, node));
+                if !added {
+                    self.pending.push(node);
+                    continue;
+                }
+                for succ in self.dag.successors(node) {
+                    if !matches!(self.dag[succ], NodeType::Operation(_)) {
+                        continue;
+                    }
+                    self.in_degree[succ.index()] -= 1;
+                    if self.in_degree[succ.index()] == 0 {
+                        new_pending.push(succ);
+                    }
+                }
+            }
+            unprocessed = new_pending;
+        }
+        block
+    }
+
+    /// Collect the star blocks with at least `min_block_size` two-qubit gates, and the order to
+    /// process the nodes of all the star blocks in, including the smaller ones.
+    fn collect_all(mut self, min_block_size: usize) -> (Vec<StarBlock>, Vec<NodeIndex>) {
+        let mut blocks = Vec::new();
+        let mut processing_order = Vec::new();
+        while !self.pending.is_empty() {
+            self.collect_block(false);
+            let block = self.collect_block(true);
+            processing_order.extend_from_slice(&block.nodes);
+            if block.num2q >= min_block_size {
+                blocks.push(block);
+            }
+        }
+        (blocks, processing_order)
+    }
+}
+
+/// Rewrite the star blocks of the circuit as linear sequences of gates with swaps.
+///
+/// The nodes are visited in the lexicographical topological order given by the same string keys
+/// as the Python implementation of the pass, so the output is identical.  The keys of the input
+/// and output nodes are the string forms of the wires, which are given in `qubit_keys` and
+/// `clbit_keys`.
+///
+/// Returns the rewritten circuit, and the virtual qubit at each position at its end.
+fn star_preroute(
+    dag: &DAGCircuit,
+    blocks: &[StarBlock],
+    processing_order: &[NodeIndex],
+    qubit_keys: &[String],
+    clbit_keys: &[String],
+) -> PyResult<(DAGCircuit, Vec<usize>)> {
+    let mut node_to_block: HashMap<NodeIndex, usize> = HashMap::new();
+    for (index, block) in blocks.iter().enumerate() {
+        for node in block.nodes.iter() {
+            node_to_block.insert(*node, index);
+        }
+    }
+    let last_2q_gate = processing_order
+        .iter()
+        .rev()
+        .find(|node| qargs_of(dag, **node).len() > 1)
+        .copied();
+    let int_digits = (processing_order.len() as f64).log10().floor() as usize + 1;
+    let order_keys: HashMap<NodeIndex, String> = processing_order
+        .iter()
+        .enumerate()
+        .map(|(index, node)| (*node, format!("a{index:0int_digits$}")))
+        .collect();
+    let key = |node: NodeIndex| -> Result<String, Infallible> {
+        if let Some(key) = order_keys.get(&node) {
+            return Ok(key.clone());
+        }
+        Ok(match &dag[node] {
+            NodeType::QubitIn(qubit) | NodeType::QubitOut(qubit) => {
+                qubit_keys[qubit.index()].clone()
+            }
+            NodeType::ClbitIn(clbit) | NodeType::ClbitOut(clbit) => {
+                clbit_keys[clbit.index()].clone()
+            }
+            NodeType::VarIn(_) | NodeType::VarOut(_) => String::new(),
+            NodeType::Operation(inst) => dag
+                .get_qargs(inst.qubits)
+                .iter()
+                .map(|qubit| qubit.index())
+                .chain(dag.get_cargs(inst.clbits).iter().map(|clbit| clbit.index()))
+                .map(|index| format!("{index:04}"))
+                .join(","),
+        })
+    };
+    let Ok(order) =
+        rustworkx_core::dag_algo::lexicographical_topological_sort(dag.dag(), key, false, None)
+            .map_err(|e| match e {
+                rustworkx_core::dag_algo::TopologicalSortError::CycleOrBadInitialState => {
+                    panic!("DAG should prevent itself from becoming cyclic");
+                }
+            });
+
+    let mut out = dag
+        .copy_empty_like_with_same_capacity(VarsMode::Alike, BlocksMode::Keep)
+        .into_builder();
+    let mut qubit_mapping = (0..dag.num_qubits()).collect::<Vec<_>>();
+    let mut processed = vec![false; blocks.len()];
+    let mut is_first_star = true;
+    let mut mapped_qargs = Vec::with_capacity(2);
+    macro_rules! apply_mapped {
+        ($node:expr) => {{
+            let NodeType::Operation(inst) = &dag[$node] else {
+                unreachable!("only operations are applied");
+            };
+            mapped_qargs.clear();
+            mapped_qargs.extend(
+                dag.get_qargs(inst.qubits)
+                    .iter()
+                    .map(|qubit| Qubit::new(qubit_mapping[qubit.index()])),
+            );
+            let qubits = out.insert_qargs(&mapped_qargs);
+            out.push_back(PackedInstruction {
+                qubits,
+                ..inst.clone()
+            })?;
+        }};
+    }
+
+    for node in order {
+        if !matches!(dag[node], NodeType::Operation(_)) {
+            continue;
+        }
+        let Some(&block_id) = node_to_block.get(&node) else {
+            apply_mapped!(node);
+            continue;
+        };
+        if processed[block_id] {
+            continue;
+        }
+        processed[block_id] = true;
+        let block = &blocks[block_id];
+        if block.nodes.len() == 2 {
+            for inner in block.nodes.iter() {
+                apply_mapped!(*inner);
+            }
+            continue;
+        }
+        let mut has_swap_source = false;
+        let mut prev: Option<&[Qubit]> = None;
+        for inner in block.nodes.iter().copied() {
+            let qargs = qargs_of(dag, inner);
+            if qargs.len() < 2 || prev == Some(qargs) {
+                apply_mapped!(inner);
+                continue;
+            }
+            if is_first_star && !has_swap_source {
+                has_swap_source = block.center != Center::Unset;
+                apply_mapped!(inner);
+                prev = Some(qargs);
+                continue;
+            }
+            // Place the two-qubit gate, followed by a swap that moves the center along the line.
+            apply_mapped!(inner);
+            if Some(inner) != last_2q_gate {
+                mapped_qargs.clear();
+                mapped_qargs.extend(
+                    qargs
+                        .iter()
+                        .map(|qubit| Qubit::new(qubit_mapping[qubit.index()])),
+                );
+                let qubits = out.insert_qargs(&mapped_qargs);
+                out.push_back(PackedInstruction::from_standard_gate(
+                    StandardGate::Swap,
+                    None,
+                    qubits,
+                ))?;
+                qubit_mapping.swap(qargs[0].index(), qargs[1].index());
+            }
+            prev = Some(qargs);
+        }
+        is_first_star = false;
+    }
+    Ok((out.build(), qubit_mapping))
+}
+
+/// Run the star pre-routing pass on a circuit without control flow or classical variables.
+///
+/// Args:
+///     dag (DAGCircuit): the circuit to pre-route.
+///     qubit_keys (list[str]): the string form of each qubit of the circuit.
+///     clbit_keys (list[str]): the string form of each clbit of the circuit.
+///
+/// Returns:
+///     ``None`` if the circuit has no star blocks to rewrite, and otherwise a tuple of the
+///     pre-routed circuit and the final position of each qubit, as a list of the index of the
+///     virtual qubit at each position.
+#[pyfunction]
+#[pyo3(name = "run")]
+pub fn run_star_prerouting(
+    dag: &DAGCircuit,
+    qubit_keys: Vec<String>,
+    clbit_keys: Vec<String>,
+) -> PyResult<Option<(DAGCircuit, Vec<usize>)>> {
+    let (blocks, processing_order) = BlockCollector::new(dag).collect_all(2);
+    // Stars of fewer than three two-qubit gates are only rewritten if there are larger stars in
+    // the circuit, otherwise they're considered to be lines.
+    if blocks.iter().all(|block| block.num2q < 3) {
+        return Ok(None);
+    }
+    star_preroute(dag, &blocks, &processing_order, &qubit_keys, &clbit_keys).map(Some)
+}
+
+pub fn star_prerouting_mod(m: &Bound<PyModule>) -> PyResult<()> {
+    m.add_wrapped(wrap_pyfunction!(run_star_prerouting))?;
+    Ok(())
+}
@@ -10,8 +10,11 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
+use indexmap::IndexMap;
 use pyo3::prelude::*;
 use std::f64::consts::{FRAC_PI_2, FRAC_PI_4, PI};
+use std::io::{Error, ErrorKind};
+use std::sync::{Arc, LazyLock, Mutex};
 
 use crate::QiskitError;
 use qiskit_circuit::dag_circuit::DAGCircuit;
@@ -58,18 +61,99 @@ static PHASE_GATE_LUT: [(f64, Option<StandardGate>); 8] = [
     (-7. * FRAC_PI_4, Some(StandardGate::Sdg)),
 ];
 
+/// The default maximum number of entries in [RZ_CACHE].
+pub const DEFAULT_RZ_CACHE_SIZE: usize = 16384;
+
+/// The first bytes of a file written by [save_rz_cache].
+const RZ_CACHE_MAGIC: &[u8; 8] = b"QKRZC001";
+
+/// The Clifford+T sequence approximating an RZ rotation, and the update to the global phase.
+#[derive(Clone, Debug, PartialEq)]
+pub struct RZSequence {
+    pub gates: Box<[StandardGate]>,
+    pub phase: f64,
+}
+
+/// The key of an [RZSequence] in [RZ_CACHE]: the bit patterns of the canonical angle and of the
+/// synthesis error it was approximated to.
+#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash)]
+struct RZCacheKey {
+    angle: u64,
+    epsilon: u64,
+}
+
+/// A bounded cache of RZ syntheses, in order of least to most recent use.
+#[derive(Debug)]
+struct RZCache {
+    entries: IndexMap<RZCacheKey, Arc<RZSequence>>,
+    max_size: usize,
+    hits: usize,
+    misses: usize,
+    evictions: usize,
+}
+
+impl RZCache {
+    fn get(&mut self, key: &RZCacheKey) -> Option<Arc<RZSequence>> {
+        match self.entries.get_index_of(key) {
+            Some(index) => {
+                let last = self.entries.len() - 1;
+                self.entries.move_index(index, last);
+                self.hits += 1;
+                Some(self.entries[last].clone())
+            }
+            None => {
+                self.misses += 1;
+                None
+            }
+        }
+    }
+
+    fn insert(&mut self, key: RZCacheKey, sequence: Arc<RZSequence>) {
+        if self.max_size == 0 {
+            return;
+        }
+        self.entries.insert(key, sequence);
+        self.shrink_to(self.max_size);
+    }
+
+    /// Evict the least recently used entries until at most `size` are left.
+    fn shrink_to(&mut self, size: usize) {
+        let excess = self.entries.len().saturating_sub(size);
+        if excess > 0 {
+            self.entries.drain(..excess);
+            self.evictions += excess;
+        }
+    }
+}
+
+/// The RZ syntheses of all the runs of the pass in this process.
+///
+/// Variational and repeated Clifford+T compilations resynthesize the same angles over and over,
+/// and `gridsynth` dominates the runtime of the pass, so the results are shared between all runs
+/// and pass instances, including the ones in the Clifford+T preset pass managers.  Entries are
+/// only reused for the exact canonical angle and synthesis error they were computed for, so the
+/// output of a run never depends on what was synthesized before it.
+static RZ_CACHE: LazyLock<Mutex<RZCache>> = LazyLock::new(|| {
+    Mutex::new(RZCache {
+        entries: IndexMap::new(),
+        max_size: DEFAULT_RZ_CACHE_SIZE,
+        hits: 0,
+        misses: 0,
+        evictions: 0,
+    })
+});
+
 /// Approximates RZ-rotation using gridsynth.
 ///
 /// Returns the sequence of gates in the synthesized circuit and
 /// an update to the global phase.
-fn synthesize_rz_gate_via_gridsynth(
-    angle: f64,
-    epsilon: f64,
-) -> PyResult<(Vec<StandardGate>, Param)> {
+fn synthesize_rz_gate_via_gridsynth(angle: f64, epsilon: f64) -> PyResult<RZSequence> {
     let circ_data = gridsynth_rz(angle, epsilon)?;
 
     // obtain phase from circuit data
-    let phase = circ_data.global_phase().clone();
+    let Param::Float(phase) = *circ_data.global_phase() else {
+        unreachable!("gridsynth only produces numeric global phases");
+    };
 
     // get sequence of standard gates
     let sequence: Vec<StandardGate> = circ_data
@@ -84,7 +168,10 @@ fn synthesize_rz_gate_via_gridsynth(
         })
         .collect();
 
-    Ok((sequence, phase))
+    Ok(RZSequence {
+        gates: sequence.into_boxed_slice(),
+        phase,
+    })
 }
 
 /// Synthesize RZ gates in the circuit, modifying the circuit in-place.
@@ -97,6 +184,7 @@ fn synthesize_rz_gate_via_gridsynth(
 ///   :math:`RZ(\theta)`.
 /// - `cache_error`: Maximum allowed error when reusing a cached synthesis
 ///   result for angles close to :math:`\theta`.
+/// - `use_cache`: Whether to reuse and store syntheses in the process-wide [RZ_CACHE].
 ///
 /// If both `synthesis_error` and `cache_error` are provided, they specify the error budget
 /// due to approximate synthesis and due to caching respectively. If either value is not
@@ -104,12 +192,13 @@ fn synthesize_rz_gate_via_gridsynth(
 /// suitable values for `synthesis_error` and `cache_error` are computed automatically.
 #[pyfunction]
 #[pyo3(name = "synthesize_rz_rotations")]
-#[pyo3(signature = (dag, approximation_degree=None, synthesis_error=None, cache_error=None))]
+#[pyo3(signature = (dag, approximation_degree=None, synthesis_error=None, cache_error=None, use_cache=true))]
 pub fn py_run_synthesize_rz_rotations(
     dag: &mut DAGCircuit,
     approximation_degree: Option<f64>,
     synthesis_error: Option<f64>,
     cache_error: Option<f64>,
+    use_cache: bool,
 ) -> PyResult<()> {
     // Skip the pass if there are no RZ rotation gates.
     if dag.get_op_counts().keys().all(|k| k != "rz") {
@@ -121,10 +210,11 @@ pub fn py_run_synthesize_rz_rotations(
     // precision changes. Fortunately, rsgridsynth exposes a method to clear some (though not all)
     // of these caches. The current approach is to clear the caches at the start of each run
     // of SynthesizeRZRotations, while the cached values can be safely reused for all
-    // rotation gates in the circuit.
+    // rotation gates in the circuit.  With the process-wide cache, a run may not need to
+    // synthesize anything at all, so the caches are only cleared before the first synthesis.
     // This is not a complete or perfect solution, so a major refactor of
     // gridsynth is probably needed.
-    gridsynth_cleanup();
+    let mut needs_cleanup = true;
 
     // Compute error budgets. When approximation degree is used, the total error is
     // computed as 1 - approximation_degree, and the error budget for synthesis and for
@@ -171,7 +261,7 @@ pub fn py_run_synthesize_rz_rotations(
             .expect("Angles are never NaN here, so we can compare f64.")
     });
 
-    let mut prev_result: Option<(f64, (Vec<StandardGate>, Param))> = None;
+    let mut prev_result: Option<(f64, Arc<RZSequence>)> = None;
 
     for (node_index, angle, interval_index) in candidates {
         // Get or compute the sequence and phase update.
@@ -180,19 +270,43 @@ pub fn py_run_synthesize_rz_rotations(
             .is_none_or(|(prev_angle, _)| *prev_angle + bin_width < angle);
 
         if should_recompute {
-            let (sequence, phase_update) = synthesize_rz_gate_via_gridsynth(angle, synthesis_error)
-                .map_err(|e| QiskitError::new_err(e.to_string()))?;
-
-            prev_result = Some((angle, (sequence, phase_update)));
+            let key = RZCacheKey {
+                angle: angle.to_bits(),
+                epsilon: synthesis_error.to_bits(),
+            };
+            let cached = if use_cache {
+                RZ_CACHE.lock().unwrap().get(&key)
+            } else {
+                None
+            };
+            let result = match cached {
+                Some(result) => result,
+                None => {
+                    if needs_cleanup {
+                        gridsynth_cleanup();
+                        needs_cleanup = false;
+                    }
+                    // Synthesized without holding the lock, so concurrent runs aren't blocked.
+                    let result = Arc::new(
+                        synthesize_rz_gate_via_gridsynth(angle, synthesis_error)
+                            .map_err(|e| QiskitError::new_err(e.to_string()))?,
+                    );
+                    if use_cache {
+                        RZ_CACHE.lock().unwrap().insert(key, result.clone());
+                    }
+                    result
+                }
+            };
+            prev_result = Some((angle, result));
         }
 
-        let (sequence, phase_update) = &prev_result
+        let result = &prev_result
             .as_ref()
             .expect("is_none_or ensures prev_result is never None")
             .1;
 
         // Add the gates and phase update to DAG, remove old node
-        for new_gate in sequence {
+        for new_gate in result.gates.iter() {
             dag.insert_1q_on_incoming_qubit((*new_gate, &[]), node_index);
         }
         if let Some(gate) = PHASE_GATE_LUT[interval_index as usize].1 {
@@ -200,15 +314,178 @@ pub fn py_run_synthesize_rz_rotations(
         }
         dag.remove_1q_sequence(&[node_index]);
 
-        let phase_update_with_shift =
-            add_param(phase_update, PHASE_GATE_LUT[interval_index as usize].0);
+        let phase_update_with_shift = add_param(
+            &Param::Float(result.phase),
+            PHASE_GATE_LUT[interval_index as usize].0,
+        );
         dag.add_global_phase(&phase_update_with_shift)?;
     }
 
     Ok(())
 }
 
+/// Get the statistics of the process-wide RZ synthesis cache.
+///
+/// Returns:
+///     A tuple of the number of hits, misses and evictions since the cache was last cleared, and
+///     the current and maximum number of entries.
+#[pyfunction]
+pub fn rz_cache_info() -> (usize, usize, usize, usize, usize) {
+    let cache = RZ_CACHE.lock().unwrap();
+    (
+        cache.hits,
+        cache.misses,
+        cache.evictions,
+        cache.entries.len(),
+        cache.max_size,
+    )
+}
+
+/// Remove all entries from the process-wide RZ synthesis cache, and reset its statistics.
+#[pyfunction]
+pub fn clear_rz_cache() {
+    let mut cache = RZ_CACHE.lock().unwrap();
+    cache.entries.clear();
+    cache.hits = 0;
+    cache.misses = 0;
+    cache.evictions = 0;
+}
+
+/// Set the maximum number of entries of the process-wide RZ synthesis cache, evicting the least
+/// recently used entries if it holds more.  A size of zero disables the cache.
+#[pyfunction]
+pub fn set_rz_cache_size(max_size: usize) {
+    let mut cache = RZ_CACHE.lock().unwrap();
+    cache.max_size = max_size;
+    cache.shrink_to(max_size);
+}
+
+/// Write the entries of the process-wide RZ synthesis cache to a file.
+///
+/// The little-endian format is the [RZ_CACHE_MAGIC] bytes and the number of entries as `u64`,
+/// followed by each entry in order of least to most recent use: the bit patterns of its angle and
+/// synthesis error as `u64`, the global phase as `f64`, the number of gates as `u32`, and one `u8`
+/// per [StandardGate].  The file is written under a temporary name and then moved into place, so
+/// concurrent readers never see a partial file.
+#[pyfunction]
+pub fn save_rz_cache(filename: &str) -> PyResult<()> {
+    let mut out = Vec::from(*RZ_CACHE_MAGIC);
+    {
+        let cache = RZ_CACHE.lock().unwrap();
+        out.extend_from_slice(&(cache.entries.len() as u64).to_le_bytes());
+        for (key, sequence) in cache.entries.iter() {
+            out.extend_from_slice(&key.angle.to_le_bytes());
+            out.extend_from_slice(&key.epsilon.to_le_bytes());
+            out.extend_from_slice(&sequence.phase.to_le_bytes());
+            out.extend_from_slice(&(sequence.gates.len() as u32).to_le_bytes());
+            out.extend(sequence.gates.iter().map(|gate| *gate as u8));
+        }
+    }
+    let tmp_filename = format!("{filename}.{}.tmp", std::process::id());
+    std::fs::write(&tmp_filename, out)?;
+    std::fs::rename(&tmp_filename, filename).inspect_err(|_| {
+        let _ = std::fs::remove_file(&tmp_filename);
+    })?;
+    Ok(())
+}
+
+/// Add the entries in a file written by [save_rz_cache] to the process-wide RZ synthesis cache,
+/// as its most recently used entries.
+///
+/// Returns:
+///     The number of entries read from the file.
+#[pyfunction]
+pub fn load_rz_cache(filename: &str) -> PyResult<usize> {
+    let data = std::fs::read(filename)?;
+    let entries = parse_rz_cache(&data)?;
+    let num_entries = entries.len();
+    let mut cache = RZ_CACHE.lock().unwrap();
+    for (key, sequence) in entries {
+        cache.insert(key, Arc::new(sequence));
+    }
+    Ok(num_entries)
+}
+
+fn invalid_rz_cache(msg: &str) -> Error {
+    Error::new(ErrorKind::InvalidData, msg.to_string())
+}
+
+/// Split the first `len` bytes off `data`.
+fn take_bytes<'a>(data: &mut &'a [u8], len: usize) -> Result<&'a [u8], Error> {
+    let (head, tail) = data
+        .split_at_checked(len)
+        .ok_or_else(|| invalid_rz_cache("Truncated RZ synthesis cache file."))?;
+    *data = tail;
+    Ok(head)
+}
+
+fn take_u64(data: &mut &[u8]) -> Result<u64, Error> {
+    Ok(u64::from_le_bytes(take_bytes(data, 8)?.try_into().unwrap()))
+}
+
+fn parse_rz_cache(data: &[u8]) -> Result<Vec<(RZCacheKey, RZSequence)>, Error> {
+    let mut data = data
+        .strip_prefix(RZ_CACHE_MAGIC)
+        .ok_or_else(|| invalid_rz_cache("Not an RZ synthesis cache file."))?;
+    let num_entries = take_u64(&mut data)?;
+    let mut out = Vec::new();
+    for _ in 0..num_entries {
+        let angle = take_u64(&mut data)?;
+        let epsilon = take_u64(&mut data)?;
+        let phase = f64::from_bits(take_u64(&mut data)?);
+        let num_gates = u32::from_le_bytes(take_bytes(&mut data, 4)?.try_into().unwrap());
+        let gates = take_bytes(&mut data, num_gates as usize)?
+            .iter()
+            .map(|gate_id| ::bytemuck::checked::try_cast::<_, StandardGate>(*gate_id))
+            .collect::<Result<_, _>>()
+            .map_err(|_| invalid_rz_cache("RZ synthesis cache file contains an invalid gate."))?;
+        out.push((RZCacheKey { angle, epsilon }, RZSequence { gates, phase }));
+    }
+    if !data.is_empty() {
+        return Err(invalid_rz_cache(
+            "Trailing data in RZ synthesis cache file.",
+        ));
+    }
+    Ok(out)
+}
+
 pub fn synthesize_rz_rotations_mod(m: &Bound<PyModule>) -> PyResult<()> {
     m.add_wrapped(wrap_pyfunction!(py_run_synthesize_rz_rotations))?;
+    m.add_wrapped(wrap_pyfunction!(rz_cache_info))?;
+    m.add_wrapped(wrap_pyfunction!(clear_rz_cache))?;
+    m.add_wrapped(wrap_pyfunction!(set_rz_cache_size))?;
+    m.add_wrapped(wrap_pyfunction!(save_rz_cache))?;
+    m.add_wrapped(wrap_pyfunction!(load_rz_cache))?;
     Ok(())
 }
+
+#[cfg(test)]
+mod test {
+    use super::*;
+
+    #[test]
+    fn lru_eviction() {
+        let mut cache = RZCache {
+            entries: IndexMap::new(),
+            max_size: 2,
+            hits: 0,
+            misses: 0,
+            evictions: 0,
+        };
+        let key = |angle: f64| RZCacheKey {
+            angle: angle.to_bits(),
+            epsilon: 1e-10f64.to_bits(),
+        };
+        let sequence = Arc::new(RZSequence {
+            gates: Box::new([StandardGate::T]),
+            phase: 0.,
+        });
+        cache.insert(key(0.1), sequence.clone());
+        cache.insert(key(0.2), sequence.clone());
+        assert!(cache.get(&key(0.1)).is_some());
+        cache.insert(key(0.3), sequence);
+        assert!(cache.get(&key(0.2)).is_none());
+        assert!(cache.get(&key(0.1)).is_some());
+        assert_eq!((cache.hits, cache.misses, cache.evictions), (2, 1, 1));
+    }
+}
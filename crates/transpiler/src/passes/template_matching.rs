@@ -0,0 +1,971 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2026
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+//! The matching part of the template-matching algorithm of [Iten et al.][1]
+//!
+//! This follows the forward and backward matching of the Python `TemplateMatching`, which it
+//! replaces in `TemplateOptimization`, step for step, so that both find the same matches.  The
+//! differences are in how the search is run: the transitive successors and predecessors of every
+//! node are precomputed as bit sets when the [MatchingGraph] is built, rather than stored as lists
+//! on the nodes of the dependency graph, the scenarios of the backward search only copy the state
+//! that they change, and the initial matches are searched from in parallel.
+//!
+//! [1]: https://arxiv.org/abs/1909.05270
+
+use std::collections::VecDeque;
+
+use fixedbitset::FixedBitSet;
+use hashbrown::HashMap;
+use itertools::Itertools;
+use ndarray::ArrayView2;
+use numpy::PyReadonlyArray2;
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use rayon::prelude::*;
+use smallvec::SmallVec;
+
+use qiskit_util::getenv_use_multiple_threads;
+
+/// A pair of the index of a template node and the index of the circuit node it is matched with.
+pub type NodeMatch = [usize; 2];
+
+/// The qubits of a node, in the order of the circuit or of the template.
+type Qargs = SmallVec<[u32; 4]>;
+
+/// A node of a [MatchingGraph].
+#[derive(Clone, Debug)]
+struct MatchingNode {
+    qargs: Qargs,
+    /// The number of control qubits, if the operation is a controlled gate.
+    controls: Option<u32>,
+    /// Whether the operation is symmetric in its qubits or, for a controlled gate, whether its base
+    /// gate is symmetric in the target qubits.
+    symmetric: bool,
+}
+
+/// The dependency graph of a circuit or of a template, as needed for template matching.
+///
+/// The nodes are in topological order, and each node only records what the matching compares:
+/// the qubits that it acts on, and how these may be permuted.  Whether the operations of two nodes
+/// match is given separately, for each pair of a circuit node and a template node.
+#[pyclass(module = "qiskit._accelerate.template_matching", frozen)]
+#[derive(Clone, Debug)]
+pub struct MatchingGraph {
+    num_qubits: usize,
+    num_clbits: usize,
+    nodes: Vec<MatchingNode>,
+    /// The direct successors of each node, in increasing order.
+    direct_successors: Vec<Vec<usize>>,
+    /// The transitive successors of each node.
+    successors: Vec<FixedBitSet>,
+    /// The transitive predecessors of each node.
+    predecessors: Vec<FixedBitSet>,
+}
+
+impl MatchingGraph {
+    fn new(
+        num_qubits: usize,
+        num_clbits: usize,
+        nodes: Vec<MatchingNode>,
+        mut direct_successors: Vec<Vec<usize>>,
+    ) -> PyResult<Self> {
+        let num_nodes = nodes.len();
+        if direct_successors.len() != num_nodes {
+            return Err(PyValueError::new_err(
+                "The successors of every node of the graph must be given.",
+            ));
+        }
+        if nodes
+            .iter()
+            .any(|node| node.qargs.iter().any(|&qubit| qubit as usize >= num_qubits))
+        {
+            return Err(PyValueError::new_err(
+                "A node acts on a qubit outside the graph.",
+            ));
+        }
+        for (node, successors) in direct_successors.iter_mut().enumerate() {
+            successors.sort_unstable();
+            successors.dedup();
+            if successors
+                .iter()
+                .any(|&succ| succ <= node || succ >= num_nodes)
+            {
+                return Err(PyValueError::new_err(
+                    "The nodes of the graph must be in topological order.",
+                ));
+            }
+        }
+        let mut successors = vec![FixedBitSet::with_capacity(num_nodes); num_nodes];
+        for node in (0..num_nodes).rev() {
+            let mut reachable = FixedBitSet::with_capacity(num_nodes);
+            for &succ in direct_successors[node].iter() {
+                reachable.insert(succ);
+                reachable.union_with(&successors[succ]);
+            }
+            successors[node] = reachable;
+        }
+        let mut predecessors = vec![FixedBitSet::with_capacity(num_nodes); num_nodes];
+        for (node, reachable) in successors.iter().enumerate() {
+            for succ in reachable.ones() {
+                predecessors[succ].insert(node);
+            }
+        }
+        Ok(Self {
+            num_qubits,
+            num_clbits,
+            nodes,
+            direct_successors,
+            successors,
+            predecessors,
+        })
+    }
+
+    #[inline]
+    pub fn num_nodes(&self) -> usize {
+        self.nodes.len()
+    }
+}
+
+#[pymethods]
+impl MatchingGraph {
+    /// Args:
+    ///     num_qubits (int): the number of qubits of the circuit.
+    ///     num_clbits (int): the number of clbits of the circuit.
+    ///     qargs (list[list[int]]): the qubits of each node.
+    ///     controls (list[int | None]): the number of control qubits of each node that is a
+    ///         controlled gate, and ``None`` for the other nodes.
+    ///     symmetric (list[bool]): whether each node is a gate that is symmetric in its qubits or,
+    ///         for a controlled gate, whose base gate is symmetric in the target qubits.
+    ///     direct_successors (list[list[int]]): the direct successors of each node.  Successors
+    ///         must come after their predecessors.
+    #[new]
+    fn py_new(
+        num_qubits: usize,
+        num_clbits: usize,
+        qargs: Vec<Qargs>,
+        controls: Vec<Option<u32>>,
+        symmetric: Vec<bool>,
+        direct_successors: Vec<Vec<usize>>,
+    ) -> PyResult<Self> {
+        if controls.len() != qargs.len() || symmetric.len() != qargs.len() {
+            return Err(PyValueError::new_err(
+                "The properties of every node of the graph must be given.",
+            ));
+        }
+        let nodes = qargs
+            .into_iter()
+            .zip(controls)
+            .zip(symmetric)
+            .map(|((qargs, controls), symmetric)| MatchingNode {
+                qargs,
+                controls,
+                symmetric,
+            })
+            .collect();
+        Self::new(num_qubits, num_clbits, nodes, direct_successors)
+    }
+
+    fn __len__(&self) -> usize {
+        self.num_nodes()
+    }
+}
+
+/// The tuning parameters of [template_matching].
+#[derive(Clone, Copy, Debug, Default)]
+pub struct MatchingOptions {
+    /// The number of successors, or non-successors, of the initial circuit node whose qubits must
+    /// be part of a qubit configuration for it to be explored.
+    pub heuristics_qubits: Option<usize>,
+    /// The interval, in circuit nodes, at which the backward search is pruned, and the number of
+    /// scenarios that survive each pruning.
+    pub heuristics_backward: Option<(usize, usize)>,
+    /// The most scenarios that the backward search extends for each initial match and qubit
+    /// configuration.  Once it is exhausted, the remaining scenarios are taken as they are.
+    pub search_budget: Option<usize>,
+}
+
+/// A maximal match of the template in the circuit.
+#[derive(Clone, Debug, PartialEq, Eq)]
+pub struct TemplateMatch {
+    /// The matched nodes, in increasing order of the template nodes.
+    pub matches: Vec<NodeMatch>,
+    /// The qubit configurations that the match was found with: the circuit qubit at each template
+    /// qubit.
+    pub qubits: Vec<Vec<u32>>,
+}
+
+/// Whether two lists of distinct elements have the same elements.
+#[inline]
+fn same_set(a: &[u32], b: &[u32]) -> bool {
+    a.len() == b.len() && a.iter().all(|x| b.contains(x))
+}
+
+/// The circuit nodes that are matched in a backward scenario, and their template nodes.
+///
+/// There are at most as many as there are template nodes, so this is a short list rather than an
+/// entry for every node of the circuit.
+#[derive(Clone, Debug, Default)]
+struct CircuitMatches(SmallVec<[(usize, usize); 8]>);
+
+impl CircuitMatches {
+    #[inline]
+    fn get(&self, circuit: usize) -> Option<usize> {
+        self.0
+            .iter()
+            .find(|(node, _)| *node == circuit)
+            .map(|(_, template)| *template)
+    }
+
+    #[inline]
+    fn set(&mut self, circuit: usize, template: usize) {
+        self.clear(circuit);
+        self.0.push((circuit, template));
+    }
+
+    #[inline]
+    fn clear(&mut self, circuit: usize) {
+        self.0.retain(|(node, _)| *node != circuit);
+    }
+}
+
+/// A partial match explored by the backward search.
+#[derive(Clone, Debug)]
+struct Scenario {
+    circuit_matched: CircuitMatches,
+    circuit_blocked: FixedBitSet,
+    template_matched: Vec<Option<usize>>,
+    template_blocked: FixedBitSet,
+    matches: Vec<NodeMatch>,
+    /// One more than the number of the candidate circuit nodes that have been considered.
+    counter: usize,
+}
+
+/// The result of the forward search.
+struct ForwardMatch {
+    circuit_matched: Vec<Option<usize>>,
+    circuit_blocked: FixedBitSet,
+    template_matched: Vec<Option<usize>>,
+    matches: Vec<NodeMatch>,
+}
+
+/// The search for the matches that extend one initial match, with one qubit configuration.
+struct Matcher<'a> {
+    circuit: &'a MatchingGraph,
+    template: &'a MatchingGraph,
+    compatible: ArrayView2<'a, bool>,
+    options: &'a MatchingOptions,
+    node_id_c: usize,
+    node_id_t: usize,
+    /// The circuit qubit at each template qubit.
+    qubits: &'a [u32],
+}
+
+impl Matcher<'_> {
+    /// The qubits of a circuit node in terms of the template qubits, or an empty list if some of
+    /// them are not in the qubit configuration.
+    fn qarg_indices(&self, node: usize) -> Qargs {
+        let mut out = Qargs::new();
+        for qubit in self.circuit.nodes[node].qargs.iter() {
+            match self.qubits.iter().position(|q| q == qubit) {
+                Some(index) => out.push(index as u32),
+                None => return Qargs::new(),
+            }
+        }
+        out
+    }
+
+    /// Whether a circuit node, whose qubits are `qarg` in terms of the template qubits, matches a
+    /// template node.
+    fn is_match(&self, node_c: usize, node_t: usize, qarg: &[u32]) -> bool {
+        let circuit = &self.circuit.nodes[node_c];
+        let template = &self.template.nodes[node_t];
+        if !same_set(qarg, &template.qargs) || !self.compatible[[node_c, node_t]] {
+            return false;
+        }
+        if circuit.controls.is_some() {
+            let num_controls = template.controls.unwrap_or(0) as usize;
+            if num_controls == 1 {
+                return qarg == template.qargs.as_slice();
+            }
+            let split = num_controls.min(qarg.len());
+            if !same_set(&qarg[..split], &template.qargs[..split]) {
+                return false;
+            }
+            if template.symmetric {
+                same_set(&qarg[split..], &template.qargs[split..])
+            } else {
+                qarg[split..] == template.qargs[split..]
+            }
+        } else if template.controls.is_none() && template.symmetric {
+            same_set(qarg, &template.qargs)
+        } else {
+            qarg == template.qargs.as_slice()
+        }
+    }
+
+    /// The template nodes that may be matched next after `node_t` in the forward search.
+    fn forward_candidates(&self, node_t: usize, matches: &[NodeMatch]) -> Vec<usize> {
+        let template = self.template;
+        let matched = |node: usize| matches.iter().any(|m| m[0] == node);
+        let maximal_index = template.direct_successors[node_t].last().copied();
+        let mut blocked = FixedBitSet::with_capacity(template.num_nodes());
+        for &[pred, _] in matches.iter() {
+            if pred == node_t || maximal_index.is_some_and(|max| pred > max) {
+                continue;
+            }
+            for &succ in template.direct_successors[pred].iter() {
+                if !matched(succ) {
+                    blocked.union_with(&template.successors[succ]);
+                }
+            }
+        }
+        template.direct_successors[node_t]
+            .iter()
+            .copied()
+            .filter(|&succ| !matched(succ) && !blocked.contains(succ))
+            .collect()
+    }
+
+    fn forward_match(&self) -> ForwardMatch {
+        let circuit = self.circuit;
+        let mut circuit_matched = vec![None; circuit.num_nodes()];
+        let mut circuit_blocked = FixedBitSet::with_capacity(circuit.num_nodes());
+        let mut template_matched = vec![None; self.template.num_nodes()];
+        let mut matches = vec![[self.node_id_t, self.node_id_c]];
+        circuit_matched[self.node_id_c] = Some(self.node_id_t);
+        template_matched[self.node_id_t] = Some(self.node_id_c);
+
+        // The successors that remain to be visited of each matched node, and the matched nodes
+        // ordered by them.
+        let mut to_visit: HashMap<usize, Vec<usize>> = HashMap::new();
+        to_visit.insert(
+            self.node_id_c,
+            circuit.direct_successors[self.node_id_c].clone(),
+        );
+        let mut stack = vec![self.node_id_c];
+        while !stack.is_empty() {
+            let v_first = stack.remove(0);
+            if to_visit[&v_first].is_empty() {
+                continue;
+            }
+            let label = to_visit.get_mut(&v_first).unwrap().remove(0);
+            stack.push(v_first);
+            stack.sort_by(|a, b| to_visit[a].cmp(&to_visit[b]));
+            if circuit_blocked.contains(label) || circuit_matched[label].is_some() {
+                continue;
+            }
+            let node_t = circuit_matched[v_first]
+                .expect("nodes with successors to visit are matched or blocked");
+            let qarg = self.qarg_indices(label);
+            let found = self
+                .forward_candidates(node_t, &matches)
+                .into_iter()
+                .find(|&candidate| self.is_match(label, candidate, &qarg));
+            if let Some(candidate) = found {
+                circuit_matched[label] = Some(candidate);
+                template_matched[candidate] = Some(label);
+                matches.push([candidate, label]);
+                // The Python implementation removes the blocked and matched successors from the
+                // list it is iterating over, which skips the successor after each removal.
+                let mut potential = circuit.direct_successors[label].clone();
+                let mut index = 0;
+                while index < potential.len() {
+                    let succ = potential[index];
+                    if circuit_blocked.contains(succ) || circuit_matched[succ].is_some() {
+                        potential.remove(index);
+                    }
+                    index += 1;
+                }
+                to_visit.insert(label, potential);
+                stack.push(label);
+                stack.sort_by(|a, b| to_visit[a].cmp(&to_visit[b]));
+            } else {
+                circuit_blocked.insert(label);
+                for succ in circuit.successors[label].ones() {
+                    circuit_blocked.insert(succ);
+                    if let Some(node_t) = circuit_matched[succ].take() {
+                        matches.retain(|m| *m != [node_t, succ]);
+                        template_matched[node_t] = None;
+                    }
+                }
+            }
+        }
+        ForwardMatch {
+            circuit_matched,
+            circuit_blocked,
+            template_matched,
+            matches,
+        }
+    }
+
+    /// The template nodes that may be matched in a backward scenario, in decreasing order.
+    fn backward_candidates(
+        &self,
+        template_blocked: &FixedBitSet,
+        matches: &[NodeMatch],
+    ) -> Vec<usize> {
+        let successors = &self.template.successors[self.node_id_t];
+        (self.node_id_t + 1..self.template.num_nodes())
+            .rev()
+            .filter(|&node| {
+                !successors.contains(node)
+                    && !template_blocked.contains(node)
+                    && !matches.iter().any(|m| m[0] == node)
+            })
+            .collect()
+    }
+
+    /// Prune the scenarios to the `survivor` longest matches, if they have all considered the same
+    /// number of circuit nodes and this is a multiple of `length`.
+    fn backward_heuristics(
+        scenarios: &mut VecDeque<Scenario>,
+        num_gates: usize,
+        length: usize,
+        survivor: usize,
+    ) {
+        let counter = scenarios[0].counter;
+        if length == 0
+            || counter > num_gates
+            || (counter - 1) % length != 0
+            || scenarios.iter().any(|scenario| scenario.counter != counter)
+        {
+            return;
+        }
+        let mut order = (0..scenarios.len()).collect::<Vec<_>>();
+        order.sort_by(|a, b| {
+            scenarios[*b]
+                .matches
+                .len()
+                .cmp(&scenarios[*a].matches.len())
+        });
+        let mut keep = vec![false; scenarios.len()];
+        for index in order.into_iter().take(survivor) {
+            keep[index] = true;
+        }
+        let mut index = 0;
+        scenarios.retain(|_| {
+            index += 1;
+            keep[index - 1]
+        });
+    }
+
+    fn backward_match(&self, forward: ForwardMatch) -> Vec<Vec<NodeMatch>> {
+        let circuit = self.circuit;
+        let first_match = [self.node_id_t, self.node_id_c];
+        let gate_indices = (0..circuit.num_nodes())
+            .rev()
+            .filter(|&node| {
+                forward.circuit_matched[node].is_none() && !forward.circuit_blocked.contains(node)
+            })
+            .collect::<Vec<_>>();
+        let forward_matches = forward.matches;
+        let number_of_gates_to_match = self.template.num_nodes() as isize
+            - (self.node_id_t as isize - 1)
+            - forward_matches.len() as isize;
+
+        let mut scenarios = VecDeque::new();
+        scenarios.push_back(Scenario {
+            circuit_matched: CircuitMatches(
+                forward
+                    .circuit_matched
+                    .iter()
+                    .enumerate()
+                    .filter_map(|(node, matched)| matched.map(|template| (node, template)))
+                    .collect(),
+            ),
+            circuit_blocked: forward.circuit_blocked,
+            template_matched: forward.template_matched,
+            template_blocked: FixedBitSet::with_capacity(self.template.num_nodes()),
+            matches: forward_matches.clone(),
+            counter: 1,
+        });
+        let mut stored = Vec::new();
+        let mut extended = 0;
+        while !scenarios.is_empty() {
+            if let Some((length, survivor)) = self.options.heuristics_backward {
+                Self::backward_heuristics(&mut scenarios, gate_indices.len(), length, survivor);
+            }
+            let Some(mut scenario) = scenarios.pop_front() else {
+                break;
+            };
+            let match_backward = scenario
+                .matches
+                .iter()
+                .filter(|m| !forward_matches.contains(m))
+                .copied()
+                .collect::<Vec<_>>();
+            let exhausted = self
+                .options
+                .search_budget
+                .is_some_and(|budget| extended >= budget);
+            if exhausted
+                || scenario.counter > gate_indices.len()
+                || match_backward.len() as isize == number_of_gates_to_match
+            {
+                scenario.matches.sort_by_key(|m| m[0]);
+                stored.push(scenario.matches);
+                continue;
+            }
+            extended += 1;
+            let counter = scenario.counter + 1;
+            let circuit_id = gate_indices[scenario.counter - 1];
+            if scenario.circuit_blocked.contains(circuit_id) {
+                scenario.counter = counter;
+                scenarios.push_back(scenario);
+                continue;
+            }
+            // Whether all the matches of the backward search so far are kept in a list of
+            // matches, and it still has the initial match.
+            let keeps_matches = |matches: &[NodeMatch]| {
+                matches.contains(&first_match) && match_backward.iter().all(|m| matches.contains(m))
+            };
+            let qarg = self.qarg_indices(circuit_id);
+            let mut global_match = false;
+            let mut all_broken = true;
+            for template_id in
+                self.backward_candidates(&scenario.template_blocked, &scenario.matches)
+            {
+                if !self.is_match(circuit_id, template_id, &qarg) {
+                    continue;
+                }
+                // Match the nodes, blocking the unmatched successors of the template node and
+                // breaking the matches of their successors.
+                let mut child = scenario.clone();
+                let mut block_list = Vec::new();
+                let mut broken = Vec::new();
+                for potential_block in self.template.successors[template_id].ones() {
+                    if child.template_matched[potential_block].is_some() {
+                        continue;
+                    }
+                    child.template_blocked.insert(potential_block);
+                    block_list.push(potential_block);
+                    for &block_id in block_list.iter() {
+                        for succ in self.template.successors[block_id].ones() {
+                            child.template_blocked.insert(succ);
+                            if let Some(node_c) = child.template_matched[succ].take() {
+                                child.circuit_matched.clear(node_c);
+                                broken.push(succ);
+                            }
+                        }
+                    }
+                }
+                all_broken &= !broken.is_empty();
+                child.matches.retain(|m| !broken.contains(&m[0]));
+                if keeps_matches(&child.matches) {
+                    child.template_matched[template_id] = Some(circuit_id);
+                    child.circuit_matched.set(circuit_id, template_id);
+                    child.matches.push([template_id, circuit_id]);
+                    child.counter = counter;
+                    scenarios.push_back(child);
+                    global_match = true;
+                }
+            }
+            let successors = &circuit.successors[circuit_id];
+            let matched_successors = scenario
+                .circuit_matched
+                .0
+                .iter()
+                .map(|(node, _)| *node)
+                .filter(|node| successors.contains(*node))
+                .collect::<Vec<_>>();
+            if global_match {
+                // Leave the circuit node unmatched, blocking its successors.
+                let mut child = scenario.clone();
+                child.circuit_blocked.insert(circuit_id);
+                child.circuit_blocked.union_with(successors);
+                for &node in matched_successors.iter() {
+                    if let Some(node_t) = child.circuit_matched.get(node) {
+                        child.template_matched[node_t] = None;
+                    }
+                    child.circuit_matched.clear(node);
+                }
+                child
+                    .matches
+                    .retain(|m| !matched_successors.contains(&m[1]));
+                if keeps_matches(&child.matches) {
+                    child.counter = counter;
+                    scenarios.push_back(child);
+                }
+                // Leave the circuit node unmatched, blocking its predecessors.
+                if !matched_successors.is_empty() && all_broken {
+                    let mut child = scenario.clone();
+                    child.circuit_blocked.insert(circuit_id);
+                    child
+                        .circuit_blocked
+                        .union_with(&circuit.predecessors[circuit_id]);
+                    child.counter = counter;
+                    scenarios.push_back(child);
+                }
+            } else {
+                scenario.circuit_blocked.insert(circuit_id);
+                let predecessors = &circuit.predecessors[circuit_id];
+                if predecessors.ones().next().is_none() || matched_successors.is_empty() {
+                    scenario.counter = counter;
+                    scenarios.push_back(scenario);
+                    continue;
+                }
+                let mut child = scenario.clone();
+                scenario.circuit_blocked.union_with(predecessors);
+                scenario.counter = counter;
+                scenarios.push_back(scenario);
+                // As in the Python implementation, the template nodes of the broken matches are
+                // left as they are.
+                child.circuit_blocked.union_with(successors);
+                for &node in matched_successors.iter() {
+                    child.circuit_matched.clear(node);
+                }
+                if child.matches.contains(&first_match) {
+                    child
+                        .matches
+                        .retain(|m| !matched_successors.contains(&m[1]));
+                    if match_backward.iter().all(|m| child.matches.contains(m)) {
+                        child.counter = counter;
+                        scenarios.push_back(child);
+                    }
+                }
+            }
+        }
+
+        let Some(length) = stored.iter().map(Vec::len).max() else {
+            return Vec::new();
+        };
+        let mut out: Vec<Vec<NodeMatch>> = Vec::new();
+        for matches in stored {
+            if matches.len() == length && !out.contains(&matches) {
+                out.push(matches);
+            }
+        }
+        out
+    }
+}
+
+/// The qubit configurations of the circuit that are fixed by matching a circuit node with a
+/// template node: the circuit qubit at each qubit of the template node, and `None` elsewhere.
+fn first_match_configurations(
+    circuit: &MatchingNode,
+    template: &MatchingNode,
+    num_qubits_t: usize,
+) -> Vec<Vec<Option<u32>>> {
+    let configuration = |qargs_c: &[u32]| {
+        let mut out = vec![None; num_qubits_t];
+        for (&qubit_t, &qubit_c) in template.qargs.iter().zip(qargs_c) {
+            out[qubit_t as usize] = Some(qubit_c);
+        }
+        out
+    };
+    let qargs_c = circuit.qargs.as_slice();
+    let num_controls = template.controls.unwrap_or(0) as usize;
+    if circuit.controls.is_some() && num_controls > 1 {
+        let (controls, targets) = qargs_c.split_at(num_controls.min(qargs_c.len()));
+        let target_orders: Vec<Vec<u32>> = if template.symmetric {
+            targets
+                .iter()
+                .copied()
+                .permutations(targets.len())
+                .collect()
+        } else {
+            vec![targets.to_vec()]
+        };
+        controls
+            .iter()
+            .copied()
+            .permutations(controls.len())
+            .flat_map(|controls| {
+                target_orders.iter().map(move |targets| {
+                    let mut qargs = controls.clone();
+                    qargs.extend_from_slice(targets);
+                    qargs
+                })
+            })
+            .map(|qargs| configuration(&qargs[..]))
+            .collect()
+    } else if template.controls.is_none() && template.symmetric {
+        qargs_c
+            .iter()
+            .copied()
+            .permutations(qargs_c.len())
+            .map(|qargs| configuration(&qargs[..]))
+            .collect()
+    } else {
+        vec![configuration(qargs_c)]
+    }
+}
+
+/// The qubits of the first nodes after the initial circuit node (if the initial template node has
+/// many successors) or before it (otherwise), up to `length` nodes and as long as there are no
+/// more qubits than in the template.
+fn explore_circuit(
+    circuit: &MatchingGraph,
+    template: &MatchingGraph,
+    node_id_c: usize,
+    node_id_t: usize,
+    length: usize,
+) -> Vec<u32> {
+    let num_template_nodes = template.num_nodes() - node_id_t - 1;
+    let successors = &circuit.successors[node_id_c];
+    let candidates: Vec<usize> =
+        if 2 * template.successors[node_id_t].count_ones(..) > num_template_nodes {
+            successors.ones().collect()
+        } else {
+            let not_successors = (0..circuit.num_nodes())
+                .filter(|&node| !successors.contains(node))
+                .collect::<Vec<_>>();
+            // Negative indices wrap around, as in the Python implementation.
+            let num = not_successors.len() as isize;
+            (0..length as isize)
+                .map(|offset| not_successors[(num - 1 - offset).rem_euclid(num) as usize])
+                .collect()
+        };
+    let mut qubits = circuit.nodes[node_id_c].qargs.to_vec();
+    let mut counter = 1;
+    for node in candidates {
+        let new = circuit.nodes[node]
+            .qargs
+            .iter()
+            .filter(|qubit| !qubits.contains(*qubit))
+            .copied()
+            .collect::<Qargs>();
+        if qubits.len() + new.len() > template.num_qubits {
+            break;
+        }
+        if counter <= length {
+            qubits.extend(new);
+            counter += 1;
+        }
+    }
+    qubits
+}
+
+/// The matches found from one initial match, with each qubit configuration that is explored.
+fn match_from(
+    circuit: &MatchingGraph,
+    template: &MatchingGraph,
+    compatible: ArrayView2<bool>,
+    options: &MatchingOptions,
+    node_id_c: usize,
+    node_id_t: usize,
+) -> Vec<(Vec<u32>, Vec<Vec<NodeMatch>>)> {
+    let node_c = &circuit.nodes[node_id_c];
+    let node_t = &template.nodes[node_id_t];
+    let first_matches = first_match_configurations(node_c, node_t, template.num_qubits);
+    let heuristics_qubits = options
+        .heuristics_qubits
+        .map(|length| explore_circuit(circuit, template, node_id_c, node_id_t, length))
+        .unwrap_or_default();
+    let num_free = template.num_qubits.saturating_sub(node_t.qargs.len());
+    let mut out = Vec::new();
+    for subset in (0..circuit.num_qubits as u32)
+        .filter(|qubit| !node_c.qargs.contains(qubit))
+        .combinations(num_free)
+    {
+        if !heuristics_qubits
+            .iter()
+            .all(|qubit| subset.contains(qubit) || node_c.qargs.contains(qubit))
+        {
+            continue;
+        }
+        for permutation in subset.into_iter().permutations(num_free) {
+            for first_match in first_matches.iter() {
+                let mut free = permutation.iter();
+                let qubits = first_match
+                    .iter()
+                    .map(|qubit| qubit.unwrap_or_else(|| *free.next().unwrap()))
+                    .collect::<Vec<_>>();
+                let matcher = Matcher {
+                    circuit,
+                    template,
+                    compatible,
+                    options,
+                    node_id_c,
+                    node_id_t,
+                    qubits: &qubits,
+                };
+                let matches = matcher.backward_match(matcher.forward_match());
+                out.push((qubits, matches));
+            }
+        }
+    }
+    out
+}
+
+/// Find the maximal matches of a template in a circuit.
+///
+/// `compatible` has an entry for each pair of a circuit node and a template node, which is whether
+/// their operations match.  The matches are found from every compatible pair of nodes in turn, by
+/// template node first, and with every qubit configuration of the circuit that is consistent with
+/// them.  A match that is found with several qubit configurations is returned once, with all of
+/// them.  The matches are sorted by decreasing length.
+pub fn template_matching(
+    circuit: &MatchingGraph,
+    template: &MatchingGraph,
+    compatible: ArrayView2<bool>,
+    options: &MatchingOptions,
+) -> Vec<TemplateMatch> {
+    // Only the qubits of the template are assigned; the Python caller matches a template with
+    // clbits itself, since the substitution needs the clbit configuration of each match.
+    if circuit.num_clbits > 0 && template.num_clbits > circuit.num_clbits {
+        return Vec::new();
+    }
+    let starts = (0..template.num_nodes())
+        .flat_map(|node_t| (0..circuit.num_nodes()).map(move |node_c| (node_c, node_t)))
+        .filter(|&(node_c, node_t)| compatible[[node_c, node_t]])
+        .collect::<Vec<_>>();
+    let search = |&(node_c, node_t): &(usize, usize)| {
+        match_from(circuit, template, compatible, options, node_c, node_t)
+    };
+    let found: Vec<_> = if starts.len() > 1 && getenv_use_multiple_threads() {
+        starts.par_iter().map(search).collect()
+    } else {
+        starts.iter().map(search).collect()
+    };
+
+    let mut out: Vec<TemplateMatch> = Vec::new();
+    let mut index: HashMap<Vec<NodeMatch>, usize> = HashMap::new();
+    for (qubits, configuration_matches) in found.into_iter().flatten() {
+        // Once one match of a configuration has been found before, the following new ones are
+        // not added, as in the Python implementation.
+        let mut already_in = false;
+        for matches in configuration_matches {
+            if let Some(&existing) = index.get(&matches) {
+                out[existing].qubits.push(qubits.clone());
+                already_in = true;
+            } else if !already_in {
+                index.insert(matches.clone(), out.len());
+                out.push(TemplateMatch {
+                    matches,
+                    qubits: vec![qubits.clone()],
+                });
+            }
+        }
+    }
+    out.sort_by(|a, b| b.matches.len().cmp(&a.matches.len()));
+    out
+}
+
+/// Find the maximal matches of a template in a circuit.
+///
+/// Args:
+///     circuit (MatchingGraph): the dependency graph of the circuit.
+///     template (MatchingGraph): the dependency graph of the template.
+///     compatible (numpy.ndarray): a boolean matrix with a row for each circuit node and a column
+///         for each template node, which is whether their operations match.
+///     heuristics_qubits (int | None): the length of the heuristics on the qubit configurations.
+///     heuristics_backward (tuple[int, int] | None): the length and the number of survivors of the
+///         heuristics on the backward search.
+///     search_budget (int | None): the most scenarios that the backward search extends for each
+///         initial match and qubit configuration.
+///
+/// Returns:
+///     list[tuple[list[list[int]], list[list[int]]]]: the matches, sorted by decreasing length,
+///     as lists of pairs of a template node and a circuit node, with the qubit configurations they
+///     were found with.
+#[pyfunction]
+#[pyo3(
+    name = "template_matching",
+    signature = (circuit, template, compatible, heuristics_qubits=None, heuristics_backward=None, search_budget=None)
+)]
+pub fn py_template_matching(
+    py: Python,
+    circuit: &MatchingGraph,
+    template: &MatchingGraph,
+    compatible: PyReadonlyArray2<bool>,
+    heuristics_qubits: Option<usize>,
+    heuristics_backward: Option<(usize, usize)>,
+    search_budget: Option<usize>,
+) -> PyResult<Vec<(Vec<NodeMatch>, Vec<Vec<u32>>)>> {
+    let compatible = compatible.as_array();
+    if compatible.dim() != (circuit.num_nodes(), template.num_nodes()) {
+        return Err(PyValueError::new_err(format!(
+            "The compatibility matrix must have shape ({}, {}).",
+            circuit.num_nodes(),
+            template.num_nodes()
+        )));
+    }
+    let options = MatchingOptions {
+        heuristics_qubits,
+        heuristics_backward,
+        search_budget,
+    };
+    let out = py.detach(|| template_matching(circuit, template, compatible, &options));
+    Ok(out
+        .into_iter()
+        .map(|found| (found.matches, found.qubits))
+        .collect())
+}
+
+pub fn template_matching_mod(m: &Bound<PyModule>) -> PyResult<()> {
+    m.add_class::<MatchingGraph>()?;
+    m.add_wrapped(wrap_pyfunction!(py_template_matching))?;
+    Ok(())
+}
+
+#[cfg(test)]
+mod test {
+    use super::*;
+    use ndarray::Array2;
+
+    fn graph(num_qubits: usize, qargs: &[&[u32]], successors: &[&[usize]]) -> MatchingGraph {
+        let nodes = qargs
+            .iter()
+            .map(|qargs| MatchingNode {
+                qargs: qargs.iter().copied().collect(),
+                controls: None,
+                symmetric: false,
+            })
+            .collect();
+        let successors = successors.iter().map(|succ| succ.to_vec()).collect();
+        MatchingGraph::new(num_qubits, 0, nodes, successors).unwrap()
+    }
+
+    #[test]
+    fn transitive_closure() {
+        let dag = graph(2, &[&[0], &[0, 1], &[1], &[0]], &[&[1], &[2, 3], &[], &[]]);
+        assert_eq!(dag.successors[0].ones().collect::<Vec<_>>(), vec![1, 2, 3]);
+        assert_eq!(dag.predecessors[3].ones().collect::<Vec<_>>(), vec![0, 1]);
+        assert!(dag.successors[2].ones().next().is_none());
+    }
+
+    #[test]
+    fn finds_full_match() {
+        // A template of two gates on two qubits, found at the end of a circuit of three.
+        let template = graph(2, &[&[0, 1], &[0, 1]], &[&[1], &[]]);
+        let circuit = graph(2, &[&[0], &[0, 1], &[0, 1]], &[&[1], &[2], &[]]);
+        let mut compatible = Array2::from_elem((3, 2), true);
+        compatible[[0, 0]] = false;
+        compatible[[0, 1]] = false;
+        let found = template_matching(
+            &circuit,
+            &template,
+            compatible.view(),
+            &MatchingOptions::default(),
+        );
+        assert_eq!(found[0].matches, vec![[0, 1], [1, 2]]);
+        assert_eq!(found[0].qubits[0], vec![0, 1]);
+    }
+
+    #[test]
+    fn search_budget_keeps_forward_match() {
+        let template = graph(2, &[&[0, 1], &[0, 1]], &[&[1], &[]]);
+        let circuit = graph(2, &[&[0, 1], &[0, 1]], &[&[1], &[]]);
+        let compatible = Array2::from_elem((2, 2), true);
+        let options = MatchingOptions {
+            search_budget: Some(0),
+            ..Default::default()
+        };
+        let found = template_matching(&circuit, &template, compatible.view(), &options);
+        assert!(
+            found
+                .iter()
+                .any(|found| found.matches == vec![[0, 0], [1, 1]])
+        );
+    }
+}
@@ -34,6 +34,7 @@ use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::types::{IntoPyDict, PyDict};
 
+use super::memo::Link2q;
 use super::{
     Approximation, DecompositionDirection2q, NormalizedFidelity, QpuConstraint, QpuConstraintKind,
     UnitarySynthesisConfig, UsePulseOptimizer,
@@ -500,6 +501,23 @@ impl DecomposerCache {
             )
         }))
     }
+
+    /// Which decomposers synthesize unitaries on the given link, as a key for memoizing the
+    /// synthesis results.
+    ///
+    /// This populates the cache if it is not already set.
+    pub(crate) fn get_2q_link(
+        &mut self,
+        qubits: [PhysicalQubit; 2],
+        config: &UnitarySynthesisConfig,
+        constraint: QpuConstraint,
+    ) -> PyResult<Link2q> {
+        self.get_2q(qubits, config, constraint)?;
+        match self.decomposers_2q[&qubits].as_slice() {
+            [(index, flip)] => Ok(Link2q::Decomposer(*index, *flip)),
+            _ => Ok(Link2q::Qubits(qubits)),
+        }
+    }
 }
 
 /// Get the [EulerBasisSet] denoting valid 1q decompositions for a given qubit in the target.
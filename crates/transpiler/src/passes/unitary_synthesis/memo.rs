@@ -0,0 +1,213 @@
+// This code is part of Qiskit.
+//
+// (C) Copyright IBM 2026
+//
+// This code is licensed under the Apache License, Version 2.0. You may
+// obtain a copy of this license in the LICENSE.txt file in the root directory
+// of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+//
+// Any modifications or derivative works of this code must retain this
+// copyright notice, and modified files need to carry a notice indicating
+// that they have been altered from the originals.
+
+//! Memoization of two-qubit synthesis results.
+//!
+//! Circuits built from repeated layers, such as Trotterized time evolutions, consolidate into the
+//! same few two-qubit unitaries over and over again, and the Weyl decomposition of each of them is
+//! most of the cost of unitary synthesis.  The memo maps a unitary, rounded to a fixed tolerance,
+//! and the decomposers it is synthesized with to the output sequence, so each distinct block is
+//! only decomposed once.
+
+use hashbrown::HashMap;
+use ndarray::ArrayView2;
+use num_complex::Complex64;
+
+use qiskit_circuit::PhysicalQubit;
+use qiskit_synthesis::two_qubit_decompose::TwoQubitGateSequence;
+
+use super::TwoQSynthesisResult;
+use super::decomposers::FlipDirection;
+
+/// The default number of entries at which a [SynthesisMemo2q] is emptied.
+pub const DEFAULT_MEMO_SIZE_2Q: usize = 4096;
+
+/// The resolution that the entries of a unitary are rounded to in a memo key.
+///
+/// This is several orders of magnitude below the accuracy of the decompositions themselves, so a
+/// hit on a unitary that only differs from the memoized one by rounding error returns a sequence
+/// that is as good a synthesis of it as a fresh decomposition would be.
+const MEMO_RESOLUTION: f64 = 1e-12;
+
+/// Which decomposers a two-qubit unitary is synthesized with.
+#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash)]
+pub(crate) enum Link2q {
+    /// A single decomposer, as an index into the decomposer cache, and how its direction is
+    /// handled.  The output of a single decomposer does not depend on the qubits, so all the links
+    /// with the same decomposer share memo entries.
+    Decomposer(usize, FlipDirection),
+    /// Several decomposers, whose outputs are chosen between by the fidelity of the gates on the
+    /// physical qubits of the link.
+    Qubits([PhysicalQubit; 2]),
+}
+
+/// The key of a two-qubit unitary in a [SynthesisMemo2q].
+#[derive(Clone, Debug, PartialEq, Eq, Hash)]
+pub(crate) struct MemoKey {
+    link: Link2q,
+    /// The real and imaginary parts of the entries of the unitary, in units of [MEMO_RESOLUTION].
+    matrix: [[i64; 2]; 16],
+}
+
+impl MemoKey {
+    pub(crate) fn new(link: Link2q, unitary: ArrayView2<Complex64>) -> Self {
+        let mut matrix = [[0; 2]; 16];
+        for (out, value) in matrix.iter_mut().zip(unitary.iter()) {
+            *out = [
+                (value.re / MEMO_RESOLUTION).round() as i64,
+                (value.im / MEMO_RESOLUTION).round() as i64,
+            ];
+        }
+        Self { link, matrix }
+    }
+}
+
+/// A memoized synthesis result, or `None` if the synthesis failed.
+pub(crate) type MemoEntry = Option<TwoQSynthesisResult<f64>>;
+
+/// The number of lookups in a [SynthesisMemo2q] that were served from it, and that needed a fresh
+/// synthesis.
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq)]
+pub struct MemoStats {
+    pub hits: usize,
+    pub misses: usize,
+}
+
+impl std::ops::AddAssign for MemoStats {
+    fn add_assign(&mut self, other: Self) {
+        self.hits += other.hits;
+        self.misses += other.misses;
+    }
+}
+
+/// A bounded memo of two-qubit synthesis results.
+///
+/// When the memo is full, it is emptied before the next insertion.  Circuits whose blocks repeat
+/// only hold a handful of entries, and circuits whose blocks don't repeat gain nothing from a
+/// more careful eviction policy.
+#[derive(Clone, Debug)]
+pub struct SynthesisMemo2q {
+    entries: HashMap<MemoKey, MemoEntry>,
+    max_size: usize,
+    stats: MemoStats,
+}
+
+impl Default for SynthesisMemo2q {
+    fn default() -> Self {
+        Self::new(DEFAULT_MEMO_SIZE_2Q)
+    }
+}
+
+impl SynthesisMemo2q {
+    /// Create a memo that holds at most `max_size` entries.  A `max_size` of zero disables the
+    /// memo.
+    pub fn new(max_size: usize) -> Self {
+        Self {
+            entries: HashMap::new(),
+            max_size,
+            stats: MemoStats::default(),
+        }
+    }
+
+    /// Look up a memoized synthesis result, counting the lookup as a hit or a miss.
+    pub(crate) fn get(&mut self, key: &MemoKey) -> Option<MemoEntry> {
+        if self.max_size == 0 {
+            return None;
+        }
+        let entry = self.entries.get(key).cloned();
+        if entry.is_some() {
+            self.stats.hits += 1;
+        } else {
+            self.stats.misses += 1;
+        }
+        entry
+    }
+
+    /// Store a synthesis result, emptying the memo first if it is full.
+    pub(crate) fn insert(&mut self, key: MemoKey, entry: MemoEntry) {
+        if self.max_size == 0 {
+            return;
+        }
+        if self.entries.len() >= self.max_size {
+            self.entries.clear();
+        }
+        self.entries.insert(key, entry);
+    }
+
+    /// Count lookups that were made in a copy of this memo.
+    pub(crate) fn add_stats(&mut self, stats: MemoStats) {
+        self.stats += stats;
+    }
+
+    #[inline]
+    pub fn stats(&self) -> MemoStats {
+        self.stats
+    }
+
+    #[inline]
+    pub fn len(&self) -> usize {
+        self.entries.len()
+    }
+
+    #[inline]
+    pub fn is_empty(&self) -> bool {
+        self.entries.is_empty()
+    }
+}
+
+#[cfg(test)]
+mod test {
+    use super::*;
+    use crate::passes::unitary_synthesis::Direction2q;
+    use ndarray::Array2;
+
+    fn result(global_phase: f64) -> MemoEntry {
+        Some(TwoQSynthesisResult {
+            sequence: TwoQubitGateSequence {
+                gates: Vec::new(),
+                global_phase,
+            },
+            dir: Direction2q::Forwards,
+            score: None,
+        })
+    }
+
+    #[test]
+    fn rounding_error_hits() {
+        let mut memo = SynthesisMemo2q::new(8);
+        let link = Link2q::Qubits([PhysicalQubit(0), PhysicalQubit(1)]);
+        let unitary = Array2::<Complex64>::eye(4);
+        let perturbed = unitary.mapv(|x| x + Complex64::new(1e-15, -1e-15));
+        let key = MemoKey::new(link, unitary.view());
+        assert!(memo.get(&key).is_none());
+        memo.insert(key, result(0.5));
+        let hit = memo.get(&MemoKey::new(link, perturbed.view()));
+        assert_eq!(
+            hit.flatten().map(|result| result.sequence.global_phase),
+            Some(0.5)
+        );
+        let other = MemoKey::new(link, unitary.mapv(|x| x * Complex64::i()).view());
+        assert!(memo.get(&other).is_none());
+        assert_eq!(memo.stats(), MemoStats { hits: 1, misses: 2 });
+    }
+
+    #[test]
+    fn bounded() {
+        let mut memo = SynthesisMemo2q::new(2);
+        let unitary = Array2::<Complex64>::eye(4);
+        for i in 0..5 {
+            let link = Link2q::Qubits([PhysicalQubit(i), PhysicalQubit(i + 1)]);
+            memo.insert(MemoKey::new(link, unitary.view()), None);
+            assert!(memo.len() <= 2);
+        }
+    }
+}
@@ -11,6 +11,7 @@
 // that they have been altered from the originals.
 
 mod decomposers;
+mod memo;
 
 use hashbrown::{HashMap, HashSet};
 use nalgebra::Matrix2;
@@ -31,6 +32,8 @@ use pyo3::{intern, wrap_pyfunction};
 pub(crate) use self::decomposers::Direction2q;
 
 use self::decomposers::{Decomposer2q, DecomposerCache, FlipDirection};
+use self::memo::MemoKey;
+pub use self::memo::{DEFAULT_MEMO_SIZE_2Q, MemoStats, SynthesisMemo2q};
 use crate::QiskitError;
 use crate::target::Target;
 use qiskit_circuit::bit::QuantumRegister;
@@ -237,14 +240,28 @@ impl Default for UnitarySynthesisConfig {
 pub struct UnitarySynthesisState {
     config: UnitarySynthesisConfig,
     cache: DecomposerCache,
+    /// Memoized two-qubit synthesis results, so repeated blocks are only decomposed once.
+    memo: SynthesisMemo2q,
 }
 impl UnitarySynthesisState {
     pub fn new(config: UnitarySynthesisConfig) -> Self {
         Self {
             config,
             cache: Default::default(),
+            memo: Default::default(),
         }
     }
+
+    /// Set the number of two-qubit synthesis results to memoize.  Zero disables the memo.
+    pub fn with_memo_size(mut self, max_size: usize) -> Self {
+        self.memo = SynthesisMemo2q::new(max_size);
+        self
+    }
+
+    /// The number of two-qubit syntheses that were served from the memo, and that weren't.
+    pub fn memo_stats(&self) -> MemoStats {
+        self.memo.stats()
+    }
 }
 
 /// The matcher for the set of standard gates that the TwoQubitControlledUDecomposer
@@ -332,7 +349,8 @@ fn parallel_synthesis(
     min_qubits: usize,
 ) -> PyResult<HashMap<NodeIndex, SynthesisOutput>> {
     let thread_local_states = ThreadLocal::new();
-    (0..dag.dag().node_bound())
+    let base_stats = state.memo.stats();
+    let out = (0..dag.dag().node_bound())
         .into_par_iter()
         .filter_map(|idx| -> Option<PyResult<(NodeIndex, SynthesisOutput)>> {
             let index = NodeIndex::new(idx);
@@ -359,7 +377,16 @@ fn parallel_synthesis(
                 Err(e) => Some(Err(e)),
             }
         })
-        .collect::<PyResult<_>>()
+        .collect::<PyResult<_>>();
+    // Each thread started from a copy of the memo, so only count the lookups made since.
+    for worker in thread_local_states {
+        let stats = worker.into_inner().memo.stats();
+        state.memo.add_stats(MemoStats {
+            hits: stats.hits - base_stats.hits,
+            misses: stats.misses - base_stats.misses,
+        });
+    }
+    out
 }
 
 /// Return a new DAG that takes a mapping as returned by [`parallel_synthesis`] and replaces those
@@ -608,8 +635,7 @@ fn synthesize_matrix(
         [q1_virt, q2_virt] => {
             let q_virt = [q1_virt, q2_virt];
             let q_phys = q_virt.map(|q| qubits_phys[q.index()]);
-            let result =
-                synthesize_2q_matrix(unitary, q_phys, state, constraint, fidelity_2q_sequence)?;
+            let result = synthesize_2q_matrix_memoized(unitary, q_phys, state, constraint)?;
             Ok(result.map(SynthesisOutput::TwoQ))
         }
         _ => {
@@ -871,7 +897,7 @@ fn synthesize_1q_matrix_onto(
     Ok(true)
 }
 
-#[derive(Debug)]
+#[derive(Clone, Debug)]
 pub struct TwoQSynthesisResult<S> {
     pub sequence: TwoQubitGateSequence,
     pub dir: Direction2q,
@@ -1034,6 +1060,27 @@ where
     }))
 }
 
+/// Synthesize a given two qubit unitary matrix with the scores of [fidelity_2q_sequence], reusing
+/// the memoized result for the same unitary on a link with the same decomposers, if there is one.
+fn synthesize_2q_matrix_memoized(
+    unitary: CowArray<Complex64, Ix2>,
+    qargs_phys: [PhysicalQubit; 2],
+    state: &mut UnitarySynthesisState,
+    constraint: QpuConstraint,
+) -> PyResult<Option<TwoQSynthesisResult<f64>>> {
+    let link = state
+        .cache
+        .get_2q_link(qargs_phys, &state.config, constraint)?;
+    let key = MemoKey::new(link, unitary.view());
+    if let Some(result) = state.memo.get(&key) {
+        return Ok(result);
+    }
+    let result =
+        synthesize_2q_matrix(unitary, qargs_phys, state, constraint, fidelity_2q_sequence)?;
+    state.memo.insert(key, result.clone());
+    Ok(result)
+}
+
 /// Synthesize a 2q unitary matrix and apply the result onto a DAGCircuit
 fn synthesize_2q_matrix_onto(
     out: &mut DAGCircuitBuilder,
@@ -1043,8 +1090,7 @@ fn synthesize_2q_matrix_onto(
     state: &mut UnitarySynthesisState,
     constraint: QpuConstraint,
 ) -> PyResult<bool> {
-    let Some(result) =
-        synthesize_2q_matrix(unitary, qargs_phys, state, constraint, fidelity_2q_sequence)?
+    let Some(result) = synthesize_2q_matrix_memoized(unitary, qargs_phys, state, constraint)?
     else {
         return Ok(false);
     };
@@ -1108,7 +1154,7 @@ fn conjugate_with_swaps(mut m: ArrayViewMut2<Complex64>) {
 /// Python entry point to [run_unitary_synthesis].
 #[allow(clippy::too_many_arguments)]
 #[pyfunction]
-#[pyo3(name = "run_main_loop", signature=(dag, qubit_indices, min_qubits, target, basis_gates, synth_gates, coupling_edges, approximation_degree=None, natural_direction=None, pulse_optimize=None))]
+#[pyo3(name = "run_main_loop", signature=(dag, qubit_indices, min_qubits, target, basis_gates, synth_gates, coupling_edges, approximation_degree=None, natural_direction=None, pulse_optimize=None, memo_size=DEFAULT_MEMO_SIZE_2Q))]
 pub fn py_unitary_synthesis(
     py: Python,
     dag: &DAGCircuit,
@@ -1121,7 +1167,8 @@ pub fn py_unitary_synthesis(
     approximation_degree: Option<f64>,
     natural_direction: Option<bool>,
     pulse_optimize: Option<bool>,
-) -> PyResult<Option<DAGCircuit>> {
+    memo_size: usize,
+) -> PyResult<(Option<DAGCircuit>, usize, usize)> {
     let config = UnitarySynthesisConfig {
         approximation: Approximation::from_py_approximation_degree(approximation_degree),
         use_pulse_optimizer: UsePulseOptimizer::from_py_pulse_optimize(pulse_optimize),
@@ -1130,7 +1177,7 @@ pub fn py_unitary_synthesis(
         ),
         run_python_decomposers: true,
     };
-    let mut state = UnitarySynthesisState::new(config);
+    let mut state = UnitarySynthesisState::new(config).with_memo_size(memo_size);
     let mut basis_gates_set: IndexSet<&str>;
     let constraint = match target {
         Some(target) => QpuConstraint::Target(target),
@@ -1150,7 +1197,7 @@ pub fn py_unitary_synthesis(
         .copied()
         .sum();
     if gate_counts == 0 {
-        return Ok(None);
+        return Ok((None, 0, 0));
     }
     let run_in_parallel = getenv_use_multiple_threads();
     if run_in_parallel && gate_counts > PARALLEL_THRESHOLD {
@@ -1166,7 +1213,7 @@ pub fn py_unitary_synthesis(
                 min_qubits,
             )
         })?;
-        Ok(Some(apply_synthesis(
+        let out = apply_synthesis(
             dag,
             node_replace_map,
             &qubit_indices,
@@ -1174,16 +1221,20 @@ pub fn py_unitary_synthesis(
             min_qubits,
             &mut state,
             constraint,
-        )?))
+        )?;
+        let stats = state.memo_stats();
+        Ok((Some(out), stats.hits, stats.misses))
     } else {
-        Ok(Some(serial_run_unitary_synthesis(
+        let out = serial_run_unitary_synthesis(
             dag,
             &synth_gates,
             min_qubits,
             &qubit_indices,
             &mut state,
             constraint,
-        )?))
+        )?;
+        let stats = state.memo_stats();
+        Ok((Some(out), stats.hits, stats.misses))
     }
 }
 
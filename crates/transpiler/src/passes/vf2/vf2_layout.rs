@@ -10,17 +10,20 @@
 // copyright notice, and modified files need to carry a notice indicating
 // that they have been altered from the originals.
 
+use std::cmp::Ordering;
 use std::convert::Infallible;
+use std::sync::atomic::{AtomicUsize, Ordering as AtomicOrdering};
 use std::time::Instant;
 
 use hashbrown::HashMap;
-use qiskit_util::{IndexMap, IndexSet};
+use qiskit_util::{IndexMap, IndexSet, getenv_use_multiple_threads};
 use rand::prelude::*;
 use rand::rngs::SysRng;
 use rand_pcg::Pcg64Mcg;
 use rayon::prelude::*;
 use rustworkx_core::petgraph::data::Create;
 use rustworkx_core::petgraph::prelude::*;
+use rustworkx_core::petgraph::visit::NodeCount;
 
 use pyo3::prelude::*;
 use pyo3::{IntoPyObjectExt, create_exception, wrap_pyfunction};
@@ -57,6 +60,11 @@ pub struct Vf2PassConfiguration {
     /// best-scoring match.  Scoring the initial layout is useful for seeding the tree-pruner
     /// component of the search, if the incoming layout is expected to already be valid.
     pub score_initial_layout: bool,
+    /// Whether to search the branches of the root of the search tree on multiple threads.  The
+    /// call limits and `max_trials` are still budgets for the whole search.  The result is the same
+    /// as the serial search if none of the limits are hit, and is deterministic unless `max_trials`
+    /// is hit; see [minimize_vf2].
+    pub parallel: bool,
 }
 impl Vf2PassConfiguration {
     /// A set of defaults that just runs everything completely unbounded.
@@ -67,6 +75,7 @@ impl Vf2PassConfiguration {
             max_trials: Some(0),
             shuffle_seed: None,
             score_initial_layout: false,
+            parallel: false,
         }
     }
 
@@ -81,6 +90,7 @@ impl Vf2PassConfiguration {
             max_trials: Some(1),
             shuffle_seed: None,
             score_initial_layout: false,
+            parallel: false,
         }
     }
 
@@ -94,19 +104,21 @@ impl Vf2PassConfiguration {
             max_trials: Some(0),
             shuffle_seed: None,
             score_initial_layout: true,
+            parallel: false,
         }
     }
 }
 #[pymethods]
 impl Vf2PassConfiguration {
     #[new]
-    #[pyo3(signature = (*, call_limit=(None, None), time_limit=None, max_trials=None, shuffle_seed=None, score_initial_layout=false))]
+    #[pyo3(signature = (*, call_limit=(None, None), time_limit=None, max_trials=None, shuffle_seed=None, score_initial_layout=false, parallel=false))]
     fn py_new(
         call_limit: (Option<usize>, Option<usize>),
         time_limit: Option<f64>,
         max_trials: Option<usize>,
         shuffle_seed: Option<u64>,
         score_initial_layout: bool,
+        parallel: bool,
     ) -> Self {
         Self {
             call_limit,
@@ -114,18 +126,20 @@ impl Vf2PassConfiguration {
             max_trials,
             shuffle_seed,
             score_initial_layout,
+            parallel,
         }
     }
 
     /// Construct the VF2 configuration from the legacy interface to the Python passes.
     #[staticmethod]
-    #[pyo3(signature = (*, call_limit=None, time_limit=None, max_trials=None, shuffle_seed=None, score_initial_layout=false))]
+    #[pyo3(signature = (*, call_limit=None, time_limit=None, max_trials=None, shuffle_seed=None, score_initial_layout=false, parallel=false))]
     fn from_legacy_api(
         call_limit: Option<Bound<PyAny>>,
         time_limit: Option<f64>,
         max_trials: Option<isize>,
         shuffle_seed: Option<i64>,
         score_initial_layout: bool,
+        parallel: bool,
     ) -> PyResult<Self> {
         let call_limit = match call_limit {
             Some(call_limit) => {
@@ -159,6 +173,7 @@ impl Vf2PassConfiguration {
             max_trials,
             shuffle_seed,
             score_initial_layout,
+            parallel,
         })
     }
 }
@@ -649,13 +664,28 @@ fn map_free_qubits(
     Some(partial_layout)
 }
 
-fn minimize_vf2<N, H, NG, HG, NO, HO, NS, ES>(
-    vf2: vf2::Vf2<N, H, NG, HG, NO, HO, NS, ES>,
+/// The number of root branches of the VF2 search tree that [minimize_vf2] searches concurrently
+/// in parallel mode, before sharing the best score between them.
+///
+/// This is fixed, rather than depending on the number of threads, so that the result doesn't
+/// depend on the machine.  Within a wave, rayon's work stealing balances the branches (which vary
+/// wildly in size) across the threads.
+const VF2_PARALLEL_WAVE: usize = 16;
+
+/// Find the best-scoring mapping that a VF2 search produces, within the limits of `config`, and
+/// the number of trials (matches taken as the new best) that were used.
+///
+/// `make_vf2` must produce the same search each time it is called.  In parallel mode, it is called
+/// once per branch of the root of the search tree.
+#[allow(clippy::type_complexity)]
+fn minimize_vf2<F, N, H, NG, HG, NO, HO, NS, ES>(
+    make_vf2: F,
     config: &Vf2PassConfiguration,
-) -> Option<IndexMap<N::NodeId, H::NodeId>>
+) -> (Option<IndexMap<N::NodeId, H::NodeId>>, usize)
 where
-    N: vf2::alias::IntoVf2Graph,
-    H: vf2::alias::IntoVf2Graph<EdgeType = N::EdgeType>,
+    F: Fn() -> vf2::Vf2<N, H, NG, HG, NO, HO, NS, ES> + Sync,
+    N: vf2::alias::IntoVf2Graph<NodeId: Send>,
+    H: vf2::alias::IntoVf2Graph<NodeId: Send, EdgeType = N::EdgeType>,
     NG: for<'a> vf2::alias::Vf2Graph<
             'a,
             NodeWeight = N::NodeWeight,
@@ -670,34 +700,164 @@ where
         > + Create,
     NO: vf2::NodeSorter<N>,
     HO: vf2::NodeSorter<H>,
-    NS: vf2::Semantics<N::NodeWeight, H::NodeWeight, Error = Infallible>,
+    NS: vf2::Semantics<N::NodeWeight, H::NodeWeight, Error = Infallible, Score: Send + Sync>,
     ES: vf2::Semantics<N::EdgeWeight, H::EdgeWeight, Score = NS::Score, Error = Infallible>,
 {
+    use vf2::Vf2Score;
+
     let start_time = Instant::now();
-    let mut times_up = false;
-    let mut trials: usize = 0;
+    let vf2 = make_vf2();
     let max_trials = config
         .max_trials
         .unwrap_or_else(|| 15 + vf2.needle().edge_count().max(vf2.haystack().edge_count()));
+    // The trials are a budget for the whole search, shared by all the branches in parallel mode.
+    let trials = AtomicUsize::new(0);
+    let num_branches = vf2.haystack().node_count();
+    if !config.parallel || vf2.needle().node_count() == 0 || num_branches < 2 {
+        let (best, _) = minimize_vf2_iter(
+            vf2,
+            config,
+            config.call_limit,
+            max_trials,
+            &trials,
+            start_time,
+        );
+        return (best.map(|(mapping, _)| mapping), trials.into_inner());
+    }
+    let mut bound = vf2
+        .restriction()
+        .and_then(|restriction| restriction.upper_bound())
+        .cloned();
+    drop(vf2);
+
+    // Each branch is searched with the best score from the previous waves as its bound, so the
+    // result of each wave (and so of the whole search) doesn't depend on the scheduling of the
+    // threads, unless the trial limit is hit.  The serial search visits the branches in order, and
+    // only accepts strict improvements, so taking the first of the best in branch order gives the
+    // same result as it when the limits aren't hit.
+    let mut best: Option<(IndexMap<N::NodeId, H::NodeId>, NS::Score)> = None;
+    let mut calls = 0usize;
     let time_limit = config.time_limit.unwrap_or(f64::INFINITY);
-    let mut can_continue = || {
-        if times_up {
-            return false;
+    let run_in_parallel = getenv_use_multiple_threads();
+    for wave_start in (0..num_branches).step_by(VF2_PARALLEL_WAVE) {
+        if best.is_some() && start_time.elapsed().as_secs_f64() >= time_limit {
+            break;
+        }
+        if max_trials != 0 && trials.load(AtomicOrdering::Relaxed) >= max_trials {
+            break;
+        }
+        let wave = wave_start..(wave_start + VF2_PARALLEL_WAVE).min(num_branches);
+        // The call limits are a budget for the whole search.  Each branch gets an even share of
+        // what is left of it between the branches that haven't been searched yet, and whatever a
+        // branch doesn't use is carried over to the next wave.  Once there is a match, every
+        // further match is an improvement on it, so only the limit after the first match applies.
+        let remaining = |limit: Option<usize>| limit.map(|limit| limit.saturating_sub(calls));
+        let after_first = remaining(config.call_limit.1);
+        let before_first = if best.is_some() {
+            after_first
+        } else {
+            remaining(config.call_limit.0)
+        };
+        if before_first == Some(0) || after_first == Some(0) {
+            break;
         }
-        times_up = start_time.elapsed().as_secs_f64() >= time_limit;
-        trials += 1;
-        max_trials == 0 || trials <= max_trials
+        let share =
+            |limit: Option<usize>| limit.map(|limit| limit.div_ceil(num_branches - wave_start));
+        let call_limit = (share(before_first), share(after_first));
+        let search_branch = |branch: usize| {
+            let vf2 = make_vf2()
+                .with_root_branch(Some(branch))
+                .with_restriction(vf2::Restriction::Decreasing(bound.clone()));
+            minimize_vf2_iter(vf2, config, call_limit, max_trials, &trials, start_time)
+        };
+        let results: Vec<_> = if run_in_parallel {
+            wave.into_par_iter().map(search_branch).collect()
+        } else {
+            wave.map(search_branch).collect()
+        };
+        for (result, branch_calls) in results {
+            calls += branch_calls;
+            let Some((mapping, score)) = result else {
+                continue;
+            };
+            if best
+                .as_ref()
+                .is_none_or(|(_, best)| Vf2Score::cmp(&score, best) == Ordering::Less)
+            {
+                bound = Some(score.clone());
+                best = Some((mapping, score));
+            }
+        }
+    }
+    (best.map(|(mapping, _)| mapping), trials.into_inner())
+}
+
+/// Run a single VF2 search, and return the last (and so best) mapping it produced within the
+/// limits, with its score, and the number of calls it made.
+///
+/// The `call_limit` is used instead of the one in `config`, but the time limit is taken from
+/// `config`, and counted from `start_time`.  Each match the search takes as its new best uses one
+/// of the `max_trials` trials counted by `trials`, which may be shared with other searches (`0`
+/// means there is no limit).  If there is no trial left for the first match, the search returns
+/// no mapping.
+#[allow(clippy::type_complexity)]
+fn minimize_vf2_iter<N, H, NG, HG, NO, HO, NS, ES>(
+    vf2: vf2::Vf2<N, H, NG, HG, NO, HO, NS, ES>,
+    config: &Vf2PassConfiguration,
+    call_limit: (Option<usize>, Option<usize>),
+    max_trials: usize,
+    trials: &AtomicUsize,
+    start_time: Instant,
+) -> (Option<(IndexMap<N::NodeId, H::NodeId>, NS::Score)>, usize)
+where
+    N: vf2::alias::IntoVf2Graph,
+    H: vf2::alias::IntoVf2Graph<EdgeType = N::EdgeType>,
+    NG: for<'a> vf2::alias::Vf2Graph<
+            'a,
+            NodeWeight = N::NodeWeight,
+            EdgeWeight = N::EdgeWeight,
+            EdgeType = N::EdgeType,
+        > + Create,
+    HG: for<'a> vf2::alias::Vf2Graph<
+            'a,
+            NodeWeight = H::NodeWeight,
+            EdgeWeight = H::EdgeWeight,
+            EdgeType = H::EdgeType,
+        > + Create,
+    NO: vf2::NodeSorter<N>,
+    HO: vf2::NodeSorter<H>,
+    NS: vf2::Semantics<N::NodeWeight, H::NodeWeight, Error = Infallible>,
+    ES: vf2::Semantics<N::EdgeWeight, H::EdgeWeight, Score = NS::Score, Error = Infallible>,
+{
+    let time_limit = config.time_limit.unwrap_or(f64::INFINITY);
+    let times_up = || start_time.elapsed().as_secs_f64() >= time_limit;
+    let take_trial = || {
+        trials
+            .fetch_update(AtomicOrdering::Relaxed, AtomicOrdering::Relaxed, |taken| {
+                (max_trials == 0 || taken < max_trials).then_some(taken + 1)
+            })
+            .is_ok()
     };
-    let mut vf2 = vf2.with_call_limit(config.call_limit.0).into_iter();
-    let Ok((mut mapping, _score)) = vf2.next()?;
-    if can_continue() {
-        vf2.call_limit = config.call_limit.1;
-        if let Some(result) = vf2.take_while(|_| can_continue()).last() {
-            let Ok((new_mapping, _)) = result;
-            mapping = new_mapping;
+    let mut vf2 = vf2.with_call_limit(call_limit.0).into_iter();
+    let Some(Ok(mut best)) = vf2.next() else {
+        return (None, vf2.num_calls());
+    };
+    if !take_trial() {
+        // Other branches of a parallel search used up all the trials first.
+        return (None, vf2.num_calls());
+    }
+    if !times_up() {
+        vf2.call_limit = call_limit.1;
+        if let Some(result) = vf2
+            .by_ref()
+            .take_while(|_| !times_up() && take_trial())
+            .last()
+        {
+            let Ok(new_best) = result;
+            best = new_best;
         }
     }
-    Some(mapping)
+    (Some(best), vf2.num_calls())
 }
 
 /// Produce an initial score for the identity mapping of the interaction graph onto the coupling
@@ -746,8 +906,23 @@ where
     Some(score)
 }
 
-#[pyfunction]
+/// Python entry point to [vf2_layout_pass_average].
+///
+/// The search only reads from the DAG and `Target`, so it runs entirely detached from the Python
+/// interpreter.
+#[pyfunction(name = "vf2_layout_pass_average")]
 #[pyo3(signature = (dag, target, config, *, strict_direction=false, avg_error_map=None))]
+pub fn py_vf2_layout_pass_average(
+    py: Python,
+    dag: &DAGCircuit,
+    target: &Target,
+    config: &Vf2PassConfiguration,
+    strict_direction: bool,
+    avg_error_map: Option<&ErrorMap>,
+) -> PyResult<Vf2PassReturn> {
+    py.detach(|| vf2_layout_pass_average(dag, target, config, strict_direction, avg_error_map))
+}
+
 pub fn vf2_layout_pass_average(
     dag: &DAGCircuit,
     target: &Target,
@@ -792,11 +967,13 @@ pub fn vf2_layout_pass_average(
         coupling_graph = vf2::reorder_nodes(&coupling_graph, &order);
     }
 
-    let vf2 = vf2::Vf2::new(&interactions.graph, &coupling_graph, vf2::Problem::Subgraph)
-        .with_scoring(score, score)
-        .with_restriction(vf2::Restriction::Decreasing(best_score))
-        .with_vf2pp_ordering();
-    let Some(mapping) = minimize_vf2(vf2, config) else {
+    let make_vf2 = || {
+        vf2::Vf2::new(&interactions.graph, &coupling_graph, vf2::Problem::Subgraph)
+            .with_scoring(score, score)
+            .with_restriction(vf2::Restriction::Decreasing(best_score))
+            .with_vf2pp_ordering()
+    };
+    let (Some(mapping), _) = minimize_vf2(make_vf2, config) else {
         if best_score.is_some() {
             return Ok(Vf2PassReturn::NoImprovement);
         } else {
@@ -814,8 +991,21 @@ pub fn vf2_layout_pass_average(
     }
 }
 
-#[pyfunction]
+/// Python entry point to [vf2_layout_pass_exact].
+///
+/// The search only reads from the DAG and `Target`, so it runs entirely detached from the Python
+/// interpreter.
+#[pyfunction(name = "vf2_layout_pass_exact")]
 #[pyo3(signature = (dag, target, config))]
+pub fn py_vf2_layout_pass_exact(
+    py: Python,
+    dag: &DAGCircuit,
+    target: &Target,
+    config: &Vf2PassConfiguration,
+) -> PyResult<Vf2PassReturn> {
+    py.detach(|| vf2_layout_pass_exact(dag, target, config))
+}
+
 pub fn vf2_layout_pass_exact(
     dag: &DAGCircuit,
     target: &Target,
@@ -875,11 +1065,13 @@ pub fn vf2_layout_pass_exact(
             .collect::<Vec<_>>();
         coupling_graph = vf2::reorder_nodes(&coupling_graph, &order);
     }
-    let vf2 = vf2::Vf2::new(&interactions.graph, &coupling_graph, vf2::Problem::Subgraph)
-        .with_semantics(score, score)
-        .with_restriction(vf2::Restriction::Decreasing(best_score))
-        .with_vf2pp_ordering();
-    let Some(mapping) = minimize_vf2(vf2, config) else {
+    let make_vf2 = || {
+        vf2::Vf2::new(&interactions.graph, &coupling_graph, vf2::Problem::Subgraph)
+            .with_semantics(score, score)
+            .with_restriction(vf2::Restriction::Decreasing(best_score))
+            .with_vf2pp_ordering()
+    };
+    let (Some(mapping), _) = minimize_vf2(make_vf2, config) else {
         if best_score.is_some() {
             return Ok(Vf2PassReturn::NoImprovement);
         } else {
@@ -909,8 +1101,8 @@ pub fn vf2_layout_pass_exact(
 }
 
 pub fn vf2_layout_mod(m: &Bound<PyModule>) -> PyResult<()> {
-    m.add_wrapped(wrap_pyfunction!(vf2_layout_pass_average))?;
-    m.add_wrapped(wrap_pyfunction!(vf2_layout_pass_exact))?;
+    m.add_wrapped(wrap_pyfunction!(py_vf2_layout_pass_average))?;
+    m.add_wrapped(wrap_pyfunction!(py_vf2_layout_pass_exact))?;
     m.add("MultiQEncountered", m.py().get_type::<MultiQEncountered>())?;
     m.add(
         "VF2PassConfiguration",
@@ -929,7 +1121,12 @@ mod test {
 
     use crate::target::{InstructionProperties, Qargs, Target};
 
-    use super::build_average_error_map;
+    use std::convert::Infallible;
+
+    use qiskit_circuit::vf2;
+    use rustworkx_core::petgraph::prelude::*;
+
+    use super::{Vf2PassConfiguration, build_average_error_map, minimize_vf2};
 
     /// The average error of a qarg is a floating-point sum over the operations defined on it.
     /// Floating-point addition is not associative, and a `Target` makes no ordering guarantee about
@@ -976,4 +1173,70 @@ mod test {
             );
         }
     }
+
+    #[test]
+    fn parallel_search_shares_trial_budget() {
+        // A path of three virtual qubits, placed on a ring of forty physical qubits with varied
+        // errors, so there are several improving matches and several waves of root branches.  The
+        // best placement is around qubit 34, in the last wave.
+        let mut needle = Graph::<usize, usize>::new();
+        let virt = (0..3).map(|_| needle.add_node(1)).collect::<Vec<_>>();
+        needle.add_edge(virt[0], virt[1], 1);
+        needle.add_edge(virt[1], virt[2], 1);
+        let num_physical = 40;
+        let mut haystack = Graph::<f64, f64>::new();
+        let phys = (0..num_physical)
+            .map(|i| haystack.add_node(1e-3 * (num_physical - i) as f64))
+            .collect::<Vec<_>>();
+        for i in 0..num_physical {
+            let error = if i == 33 || i == 34 {
+                1e-4
+            } else {
+                1e-2 * ((7 * i) % 11 + 1) as f64
+            };
+            let j = (i + 1) % num_physical;
+            haystack.add_edge(phys[i], phys[j], error);
+            haystack.add_edge(phys[j], phys[i], error);
+        }
+        let score =
+            |count: &usize, err: &f64| -> Result<f64, Infallible> { Ok(*err * (*count as f64)) };
+        let make_vf2 = || {
+            vf2::Vf2::new(&needle, &haystack, vf2::Problem::Subgraph)
+                .with_scoring(score, score)
+                .with_restriction(vf2::Restriction::Decreasing(None))
+                .with_vf2pp_ordering()
+        };
+        let config = |max_trials, parallel| Vf2PassConfiguration {
+            call_limit: (None, None),
+            time_limit: None,
+            max_trials: Some(max_trials),
+            shuffle_seed: None,
+            score_initial_layout: false,
+            parallel,
+        };
+
+        let (serial, unbounded_trials) = minimize_vf2(make_vf2, &config(0, false));
+        let (parallel, _) = minimize_vf2(make_vf2, &config(0, true));
+        assert!(serial.is_some());
+        assert_eq!(serial, parallel);
+        assert!(unbounded_trials > 2, "{unbounded_trials} trials");
+
+        // The limit applies to the whole search, not to each branch.
+        for max_trials in [1, 2] {
+            let (serial, serial_trials) = minimize_vf2(make_vf2, &config(max_trials, false));
+            let (parallel, parallel_trials) = minimize_vf2(make_vf2, &config(max_trials, true));
+            assert!(serial.is_some() && parallel.is_some());
+            assert_eq!(serial_trials, max_trials);
+            assert_eq!(parallel_trials, max_trials);
+        }
+
+        // Once there is a match, the limit before the first match no longer applies, so later
+        // waves still search their branches.
+        let limited = Vf2PassConfiguration {
+            call_limit: (Some(400), None),
+            ..config(0, true)
+        };
+        let (limited, _) = minimize_vf2(make_vf2, &limited);
+        assert_eq!(limited, serial);
+    }
 }
@@ -11,7 +11,9 @@
 // that they have been altered from the originals.
 
 use anyhow::Result;
+use pyo3::prelude::*;
 
+use crate::TranspilerError;
 use crate::commutation_checker::CommutationChecker;
 use crate::commutation_checker::get_standard_commutation_checker;
 use crate::equivalence::EquivalenceLibrary;
@@ -21,9 +23,10 @@ use crate::passes::*;
 use crate::standard_equivalence_library::generate_standard_equivalence_library;
 use crate::target::Target;
 use crate::transpile_layout::TranspileLayout;
-use qiskit_circuit::circuit_data::CircuitData;
+use qiskit_circuit::circuit_data::{CircuitData, PyCircuitData};
 use qiskit_circuit::dag_circuit::DAGCircuit;
 use qiskit_circuit::nlayout::NLayout;
+use qiskit_circuit::operations::OperationRef;
 use qiskit_circuit::{PhysicalQubit, Qubit, VirtualQubit};
 
 #[derive(Copy, Eq, PartialEq, Debug, Clone)]
@@ -140,6 +143,7 @@ pub fn layout_stage(
             max_trials: None,
             shuffle_seed: None,
             score_initial_layout: false,
+            parallel: false,
         },
         OptimizationLevel::Level3 => vf2::Vf2PassConfiguration {
             call_limit: (Some(30_000_000), Some(100_000)),
@@ -147,6 +151,7 @@ pub fn layout_stage(
             max_trials: None,
             shuffle_seed: None,
             score_initial_layout: false,
+            parallel: false,
         },
     };
 
@@ -279,6 +284,7 @@ pub fn routing_stage(
                 max_trials: None,
                 shuffle_seed: None,
                 score_initial_layout: true,
+                parallel: false,
             },
             OptimizationLevel::Level3 => vf2::Vf2PassConfiguration {
                 call_limit: (Some(30_000_000), Some(100_000)),
@@ -286,6 +292,7 @@ pub fn routing_stage(
                 max_trials: None,
                 shuffle_seed: None,
                 score_initial_layout: true,
+                parallel: false,
             },
         };
 
@@ -435,6 +442,7 @@ pub fn optimization_stage(
                 max_trials: None,
                 shuffle_seed: None,
                 score_initial_layout: true,
+                parallel: false,
             },
             OptimizationLevel::Level3 => vf2::Vf2PassConfiguration {
                 call_limit: (Some(30_000_000), Some(100_000)),
@@ -442,6 +450,7 @@ pub fn optimization_stage(
                 max_trials: None,
                 shuffle_seed: None,
                 score_initial_layout: true,
+                parallel: false,
             },
         };
 
@@ -464,6 +473,7 @@ pub fn get_sabre_heuristic(target: &Target) -> Result<sabre::Heuristic> {
         None,
         target.num_qubits.map(|x| (x * 10) as usize),
         1e-10,
+        None,
     )
     .with_basic(1.0, sabre::SetScaling::Constant)
     .with_lookahead(
@@ -554,6 +564,69 @@ pub fn transpile(
     Ok((CircuitData::from_dag_ref(&dag)?, transpile_layout))
 }
 
+/// Check whether every instruction in ``circuit`` can be handled by [`transpile`].
+///
+/// The native pipeline only understands standard gates and instructions and unitary gates, and
+/// has no support for control flow or classical variables.
+fn native_pipeline_supports(circuit: &CircuitData) -> bool {
+    if circuit.vars_stretches_view().num_identifiers() > 0 {
+        return false;
+    }
+    circuit.data().iter().all(|inst| {
+        matches!(
+            inst.op.view(),
+            OperationRef::StandardGate(_)
+                | OperationRef::StandardInstruction(_)
+                | OperationRef::Unitary(_)
+        )
+    })
+}
+
+/// Run the native preset pipeline for ``optimization_level`` over ``circuit``.
+///
+/// Returns ``None`` without doing any work if the circuit contains instructions the native
+/// pipeline cannot handle, in which case the caller is expected to fall back to the Python-space
+/// preset pass managers.  Otherwise, returns the output circuit data and its
+/// :class:`.TranspileLayout`.  The GIL is released while the circuit is compiled, so several
+/// circuits can be compiled concurrently from Python threads.
+#[pyfunction(name = "transpile")]
+#[pyo3(signature = (circuit, target, optimization_level, approximation_degree=None, seed=None))]
+pub fn py_transpile<'py>(
+    py: Python<'py>,
+    circuit: &PyCircuitData,
+    target: &Target,
+    optimization_level: u8,
+    approximation_degree: Option<f64>,
+    seed: Option<u64>,
+) -> PyResult<Option<(PyCircuitData, Bound<'py, PyAny>)>> {
+    if optimization_level > 3 {
+        return Err(TranspilerError::new_err(format!(
+            "Invalid optimization level specified {optimization_level}"
+        )));
+    }
+    if !native_pipeline_supports(circuit) {
+        return Ok(None);
+    }
+    let (out, layout) = py
+        .detach(|| {
+            transpile(
+                circuit,
+                target,
+                optimization_level.into(),
+                approximation_degree,
+                seed,
+            )
+        })
+        .map_err(|e| TranspilerError::new_err(e.to_string()))?;
+    let layout = layout.to_py_native(py, out.qubits().objects())?;
+    Ok(Some((out.into(), layout)))
+}
+
+pub fn transpiler_mod(m: &Bound<PyModule>) -> PyResult<()> {
+    m.add_wrapped(wrap_pyfunction!(py_transpile))?;
+    Ok(())
+}
+
 struct MinPointState {
     best_depth: Option<usize>,
     best_size: Option<usize>,
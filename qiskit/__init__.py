@@ -95,6 +95,7 @@ sys.modules["qiskit._accelerate.standard_generators"] = _accelerate.standard_gen
 sys.modules["qiskit._accelerate.sparse_pauli_op"] = _accelerate.sparse_pauli_op
 sys.modules["qiskit._accelerate.elide_permutations"] = _accelerate.elide_permutations
 sys.modules["qiskit._accelerate.target"] = _accelerate.target
+sys.modules["qiskit._accelerate.transpiler"] = _accelerate.transpiler
 sys.modules["qiskit._accelerate.two_qubit_decompose"] = _accelerate.two_qubit_decompose
 sys.modules["qiskit._accelerate.unitary_synthesis"] = _accelerate.unitary_synthesis
 sys.modules["qiskit._accelerate.vf2_layout"] = _accelerate.vf2_layout
@@ -108,6 +109,7 @@ sys.modules["qiskit._accelerate.commutation_checker"] = _accelerate.commutation_
 sys.modules["qiskit._accelerate.commutation_analysis"] = _accelerate.commutation_analysis
 sys.modules["qiskit._accelerate.commutation_cancellation"] = _accelerate.commutation_cancellation
 sys.modules["qiskit._accelerate.commutative_optimization"] = _accelerate.commutative_optimization
+sys.modules["qiskit._accelerate.commuting_2q_gate_router"] = _accelerate.commuting_2q_gate_router
 sys.modules["qiskit._accelerate.consolidate_blocks"] = _accelerate.consolidate_blocks
 sys.modules["qiskit._accelerate.constrained_reschedule"] = _accelerate.constrained_reschedule
 sys.modules["qiskit._accelerate.synthesis.linear_phase"] = _accelerate.synthesis.linear_phase
@@ -119,6 +121,7 @@ sys.modules["qiskit._accelerate.synthesis.multi_controlled"] = (
 sys.modules["qiskit._accelerate.synthesis.pauli_products"] = _accelerate.synthesis.pauli_products
 sys.modules["qiskit._accelerate.synthesis.qft"] = _accelerate.synthesis.qft
 sys.modules["qiskit._accelerate.split_2q_unitaries"] = _accelerate.split_2q_unitaries
+sys.modules["qiskit._accelerate.star_prerouting"] = _accelerate.star_prerouting
 sys.modules["qiskit._accelerate.gate_direction"] = _accelerate.gate_direction
 sys.modules["qiskit._accelerate.instruction_duration_check"] = (
     _accelerate.instruction_duration_check
@@ -137,9 +140,12 @@ sys.modules["qiskit._accelerate.ross_selinger"] = _accelerate.ross_selinger
 sys.modules["qiskit._accelerate.wrap_angles"] = _accelerate.wrap_angles
 sys.modules["qiskit._accelerate.angle_bound_registry"] = _accelerate.angle_bound_registry
 sys.modules["qiskit._accelerate.litinski_transformation"] = _accelerate.litinski_transformation
+sys.modules["qiskit._accelerate.lookahead_swap"] = _accelerate.lookahead_swap
 sys.modules["qiskit._accelerate.unroll_3q_or_more"] = _accelerate.unroll_3q_or_more
 sys.modules["qiskit._accelerate.substitute_pi4_rotations"] = _accelerate.substitute_pi4_rotations
 sys.modules["qiskit._accelerate.synthesize_rz_rotations"] = _accelerate.synthesize_rz_rotations
+sys.modules["qiskit._accelerate.template_matching"] = _accelerate.template_matching
+sys.modules["qiskit._accelerate.dag_dependency"] = _accelerate.dag_dependency
 sys.modules["qiskit._accelerate.convert_to_pauli_rotations"] = (
     _accelerate.convert_to_pauli_rotations
 )
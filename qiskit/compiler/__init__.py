@@ -21,9 +21,24 @@ Circuit Compilation Functions
 =======================================
 
 .. autofunction:: transpile
+.. autofunction:: transpile_iter
+
+Caching Compiled Circuits
+=========================
+
+.. autoclass:: TranspileCache
+   :members:
+
+Rebinding Transpiled Parametric Circuits
+========================================
+
+.. autoclass:: TranspiledTemplate
+   :members:
 
 """
 
-from .transpiler import transpile
+from .transpiler import transpile, transpile_iter
+from .transpile_cache import TranspileCache
+from .transpiled_template import TranspiledTemplate
 
-__all__ = ["transpile"]
+__all__ = ["transpile", "transpile_iter", "TranspileCache", "TranspiledTemplate"]
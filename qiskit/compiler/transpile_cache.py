@@ -0,0 +1,295 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Cache of transpiled circuits keyed on the structure of the input circuit."""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import logging
+import os
+import pathlib
+import tempfile
+import threading
+
+import numpy as np
+
+from qiskit import qpy
+from qiskit.circuit import ControlFlowOp, Gate, Instruction, ParameterExpression, QuantumCircuit
+from qiskit.circuit.annotated_operation import AnnotatedOperation
+from qiskit.qpy.exceptions import QpyError
+from qiskit.version import __version__
+
+logger = logging.getLogger(__name__)
+
+
+class TranspileCache:
+    """A cache of transpiled circuits, keyed on the structure of the input circuit and a description
+    of how it was compiled.
+
+    Pass an instance of this class as the ``cache`` argument to :func:`.transpile` to reuse the
+    result of an earlier compilation of a structurally identical circuit with the same
+    :class:`.Target` and options, instead of running the transpiler again.  This is most useful
+    for workloads that repeatedly compile the same circuits, such as variational algorithms that
+    rebuild their ansatz on each iteration::
+
+        from qiskit import transpile
+        from qiskit.compiler import TranspileCache
+
+        cache = TranspileCache()
+        for _ in range(num_iterations):
+            isa_circuit = transpile(build_ansatz(), backend, seed_transpiler=42, cache=cache)
+
+    The key of a circuit covers its qubits, clbits, registers, global phase and every instruction,
+    including the values of bound parameters.  The name and metadata of the circuit are not part of
+    the key, and the circuit returned on a cache hit takes the name and metadata of the input
+    circuit.  Unbound parameters are keyed by name, so an input circuit that uses different
+    :class:`.Parameter` instances of the same names hits the cache, and the returned circuit is
+    expressed in terms of the parameters of the input circuit.
+
+    Entries are held in memory up to ``max_size``, after which the least recently used entry is
+    evicted.  If ``directory`` is given, every entry is also written to that directory in QPY
+    format, so that it can be reused by later processes.  Entries on disk are never evicted by
+    this class, but the directory can safely be cleared while no process is using it.
+
+    Args:
+        max_size: The maximum number of transpiled circuits to hold in memory.
+        directory: An optional directory in which to store every transpiled circuit in QPY format.
+            It is created if it does not exist.
+
+    Raises:
+        ValueError: If ``max_size`` is less than 1.
+    """
+
+    def __init__(self, max_size: int = 128, directory: str | os.PathLike | None = None):
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, not {max_size}")
+        self.max_size = max_size
+        self.directory = None if directory is None else pathlib.Path(directory)
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        """The number of lookups that found a cached circuit."""
+        self.misses = 0
+        """The number of lookups that did not find a cached circuit."""
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, circuit: QuantumCircuit, config: str | tuple) -> str:
+        """Get the key that ``circuit`` is cached under when compiled with ``config``.
+
+        Args:
+            circuit: The input circuit.
+            config: A description of how the circuit is compiled.  This must be a string or a
+                (possibly nested) tuple of strings, numbers and ``None``, and should cover every
+                option that can change the output of the compilation, including the target and
+                the seed.
+
+        Returns:
+            A hexadecimal digest of the circuit and configuration.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(f"qiskit-{__version__};{config!r};".encode())
+        _hash_circuit(hasher, circuit)
+        return hasher.hexdigest()
+
+    def get(self, circuit: QuantumCircuit, config: str | tuple) -> QuantumCircuit | None:
+        """Get a copy of the cached output for ``circuit`` compiled with ``config``.
+
+        Args:
+            circuit: The input circuit.
+            config: A description of how the circuit is compiled.  See :meth:`key`.
+
+        Returns:
+            A copy of the cached transpiled circuit, or ``None`` if there is no entry.
+        """
+        return self._get(self.key(circuit, config), circuit)
+
+    def put(self, circuit: QuantumCircuit, config: str | tuple, transpiled: QuantumCircuit):
+        """Store ``transpiled`` as the output for ``circuit`` compiled with ``config``.
+
+        Args:
+            circuit: The input circuit.
+            config: A description of how the circuit is compiled.  See :meth:`key`.
+            transpiled: The transpiled circuit.  A copy is stored, so later modifications to
+                ``transpiled`` do not affect the cache.
+        """
+        self._put(self.key(circuit, config), transpiled)
+
+    def clear(self):
+        """Remove all entries held in memory, and reset the hit and miss counters.
+
+        Entries stored in ``directory`` are not removed.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _get(self, key, circuit):
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+        if cached is None and self.directory is not None:
+            cached = self._load(key)
+            if cached is not None:
+                self._insert(key, cached)
+        with self._lock:
+            if cached is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return _restore(cached, circuit)
+
+    def _put(self, key, transpiled):
+        cached = transpiled.copy()
+        self._insert(key, cached)
+        if self.directory is not None:
+            self._store(key, cached)
+
+    def _insert(self, key, cached):
+        with self._lock:
+            self._entries[key] = cached
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _path(self, key):
+        return self.directory / f"{key}.qpy"
+
+    def _load(self, key):
+        path = self._path(key)
+        if not path.is_file():
+            return None
+        try:
+            with open(path, "rb") as fd:
+                return qpy.load(fd)[0]
+        except (OSError, QpyError) as err:
+            logger.warning("Ignoring unreadable transpile cache entry %s: %s", path, err)
+            return None
+
+    def _store(self, key, cached):
+        # Write to a temporary file first and then move it into place, so that concurrent readers
+        # never see a partially written entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                qpy.dump(cached, tmp)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, QpyError) as err:
+            logger.warning("Could not store transpile cache entry %s on disk: %s", key, err)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def _restore(cached, circuit):
+    out = cached.copy(name=circuit.name)
+    out.metadata = circuit.metadata.copy()
+    if circuit.num_parameters:
+        # Unbound parameters are keyed by name, so the cached circuit may contain parameters that
+        # are equal in name but not in identity to those of the input circuit.
+        by_name = {param.name: param for param in circuit.parameters}
+        replacements = {
+            param: by_name[param.name]
+            for param in out.parameters
+            if param.name in by_name and by_name[param.name] != param
+        }
+        if replacements:
+            out.assign_parameters(replacements, inplace=True, strict=False)
+    return out
+
+
+def _hash_circuit(hasher, circuit):
+    qubit_indices = {bit: i for i, bit in enumerate(circuit.qubits)}
+    clbit_indices = {bit: i for i, bit in enumerate(circuit.clbits)}
+    hasher.update(
+        repr(
+            (
+                circuit.num_qubits,
+                circuit.num_clbits,
+                [(reg.name, [qubit_indices[bit] for bit in reg]) for reg in circuit.qregs],
+                [(reg.name, [clbit_indices[bit] for bit in reg]) for reg in circuit.cregs],
+                list(circuit.iter_vars()),
+                list(circuit.iter_stretches()),
+            )
+        ).encode()
+    )
+    _hash_value(hasher, circuit.global_phase)
+    if (layout := circuit.layout) is not None:
+        hasher.update(
+            repr(
+                (layout.initial_index_layout(filter_ancillas=False), layout.routing_permutation())
+            ).encode()
+        )
+    for instruction in circuit.data:
+        _hash_operation(hasher, instruction.operation)
+        hasher.update(
+            repr(
+                (
+                    tuple(qubit_indices[bit] for bit in instruction.qubits),
+                    tuple(clbit_indices[bit] for bit in instruction.clbits),
+                )
+            ).encode()
+        )
+
+
+def _hash_operation(hasher, operation):
+    hasher.update(
+        repr(
+            (
+                type(operation).__module__,
+                type(operation).__qualname__,
+                operation.name,
+                operation.num_qubits,
+                operation.num_clbits,
+                getattr(operation, "ctrl_state", None),
+                getattr(operation, "unit", None),
+            )
+        ).encode()
+    )
+    if isinstance(operation, AnnotatedOperation):
+        _hash_operation(hasher, operation.base_op)
+        hasher.update(repr(operation.modifiers).encode())
+        return
+    if isinstance(operation, ControlFlowOp):
+        hasher.update(repr(getattr(operation, "condition", None)).encode())
+        hasher.update(repr(getattr(operation, "target", None)).encode())
+        if hasattr(operation, "cases_specifier"):
+            hasher.update(repr([labels for labels, _ in operation.cases_specifier()]).encode())
+    for param in getattr(operation, "params", ()):
+        _hash_value(hasher, param)
+    # Instances of the base classes are typically built with `QuantumCircuit.to_gate` or
+    # `to_instruction`, so their action is only defined by their definition.  Subclasses are
+    # defined by their type and parameters.
+    if type(operation) in (Gate, Instruction) and operation.definition is not None:
+        _hash_circuit(hasher, operation.definition)
+
+
+def _hash_value(hasher, value):
+    if isinstance(value, QuantumCircuit):
+        hasher.update(b"circuit(")
+        _hash_circuit(hasher, value)
+        hasher.update(b")")
+    elif isinstance(value, ParameterExpression):
+        hasher.update(f"expr({value})".encode())
+    elif isinstance(value, float):
+        hasher.update(f"float({value.hex()})".encode())
+    elif isinstance(value, np.ndarray):
+        hasher.update(f"array({value.dtype},{value.shape})".encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    else:
+        hasher.update(repr(value).encode())
@@ -0,0 +1,127 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""A parametric circuit transpiled once, for binding to many sets of parameter values."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from qiskit.circuit import Parameter, QuantumCircuit
+from qiskit.providers.backend import Backend
+from qiskit.transpiler.layout import TranspileLayout
+from qiskit.transpiler.target import Target
+
+from .transpiler import transpile
+
+
+class TranspiledTemplate:
+    """A parametric circuit that is transpiled once, and can then be bound to many sets of
+    parameter values without running the transpiler again.
+
+    Transpiling a circuit after binding its parameters repeats layout, routing and synthesis for
+    every set of values.  Instead, this class transpiles the parametric circuit once, and records
+    where each parameter of the input circuit ends up in the transpiled circuit, including the
+    angles of the gates that parametric gates are translated and optimized into.  The
+    :meth:`bind` method then produces an ISA circuit for each set of values by only substituting
+    the values into the transpiled circuit::
+
+        import numpy as np
+        from qiskit.circuit.library import real_amplitudes
+        from qiskit.compiler import TranspiledTemplate
+
+        ansatz = real_amplitudes(5, reps=2)
+        template = TranspiledTemplate(ansatz, backend, optimization_level=3)
+        isa_circuits = template.bind(np.random.default_rng(0).random((1000, ansatz.num_parameters)))
+
+    All the circuits returned by :meth:`bind` have the same :attr:`.QuantumCircuit.layout`.
+
+    Since the transpiler cannot simplify gates whose angles are unknown, the bound circuits may be
+    larger than the output of transpiling each bound circuit separately.  For example, a gate
+    that is the identity for a particular set of values is not removed.
+
+    Args:
+        circuit: The parametric circuit to transpile.
+        backend: The backend to transpile for, as in :func:`.transpile`.
+        **transpile_options: Further keyword arguments to :func:`.transpile`.
+    """
+
+    def __init__(
+        self,
+        circuit: QuantumCircuit,
+        backend: Backend | Target | None = None,
+        **transpile_options,
+    ):
+        self._parameters = tuple(circuit.parameters)
+        self._circuit = transpile(circuit, backend, **transpile_options)
+        index = {param: i for i, param in enumerate(self._parameters)}
+        # The transpiled circuit may not contain every parameter of the input, for example if a
+        # parametric gate was optimized away entirely.  This maps each parameter of the transpiled
+        # circuit to its column in an array of values for the input parameters.
+        self._columns = np.array(
+            [index[param] for param in self._circuit.parameters], dtype=np.intp
+        )
+
+    @property
+    def parameters(self) -> tuple[Parameter, ...]:
+        """The parameters of the input circuit, in the order :meth:`bind` takes their values in."""
+        return self._parameters
+
+    @property
+    def num_parameters(self) -> int:
+        """The number of parameters of the input circuit."""
+        return len(self._parameters)
+
+    @property
+    def circuit(self) -> QuantumCircuit:
+        """The transpiled parametric circuit."""
+        return self._circuit
+
+    @property
+    def layout(self) -> TranspileLayout | None:
+        """The layout of the transpiled circuit, which is shared by all the bound circuits."""
+        return self._circuit.layout
+
+    def bind(self, values) -> QuantumCircuit | list[QuantumCircuit]:
+        """Get ISA circuits with the parameters bound to the given values.
+
+        The values of all the rows are reordered onto the parameters of the transpiled circuit at
+        once, but each row is then bound by its own copy of the transpiled circuit and call to
+        :meth:`.QuantumCircuit.assign_parameters`.  That only updates the instructions that
+        refer to the parameters, but the cost of binding a batch still grows linearly with its
+        number of rows, and with the size of the transpiled circuit.
+
+        Args:
+            values: The values of the parameters, as an array-like of floats.  The last axis
+                must have length :attr:`num_parameters`, with values in the same order as
+                :attr:`parameters`.  A 1D array is a single set of values, and a 2D array is one
+                set of values per row.
+
+        Returns:
+            A bound circuit for a 1D input, or a list of bound circuits, one for each row, for a 2D
+            input.
+
+        Raises:
+            ValueError: If ``values`` has the wrong shape.
+        """
+        values = np.asarray(values, dtype=float)
+        if values.ndim not in (1, 2) or values.shape[-1] != self.num_parameters:
+            raise ValueError(
+                f"Expected values with a last axis of length {self.num_parameters} and at most"
+                f" two dimensions, but got an array of shape {values.shape}."
+            )
+        single = values.ndim == 1
+        # Reorder and filter all the sets of values at once, so that each row lines up with the
+        # sorted parameters of the transpiled circuit.  The binding itself is done row by row.
+        columns = np.atleast_2d(values)[:, self._columns]
+        out = [self._circuit.assign_parameters(row.tolist(), inplace=False) for row in columns]
+        return out[0] if single else out
@@ -13,14 +13,19 @@
 
 """Circuit transpile function"""
 
+import functools
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from time import time
 from typing import Any, TypeVar
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 
 from qiskit import user_config
+from qiskit._accelerate.transpiler import transpile as _native_transpile
+from qiskit.circuit.library.standard_gates import get_standard_gate_name_mapping
 from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.compiler.transpile_cache import TranspileCache
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.providers.backend import Backend
 from qiskit.transpiler import Layout, CouplingMap, PropertySet
@@ -28,7 +33,9 @@ from qiskit.transpiler.basepasses import BasePass
 from qiskit.transpiler.exceptions import TranspilerError, CircuitTooWideForTarget
 from qiskit.transpiler.passes.synthesis.high_level_synthesis import HLSConfig
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
+from qiskit.transpiler.preset_passmanagers.common import is_clifford_t_basis
 from qiskit.transpiler.target import Target
+from qiskit.utils.parallel import default_num_processes, should_run_in_parallel
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +67,9 @@ def transpile(
     ignore_backend_supplied_default_methods: bool = False,
     num_processes: int | None = None,
     qubits_initially_zero: bool = True,
+    executor: str = "processes",
+    native_pipeline: bool | None = False,
+    cache: TranspileCache | None = None,
 ) -> _CircuitT:
     """Transpile one or more circuits, according to some desired transpilation targets.
 
@@ -250,6 +260,31 @@ def transpile(
             environment variable. If set to ``None`` the system default or local user configuration
             will be used.
         qubits_initially_zero: Indicates whether the input circuit is zero-initialized.
+        executor: How to transpile several circuits concurrently.  The default, ``"processes"``,
+            uses a pool of processes if parallel execution is enabled.  ``"threads"`` uses a pool
+            of at most ``num_processes`` threads in the current process instead, which share the
+            :class:`.Target` rather than each holding a serialized copy.  See
+            :meth:`.PassManager.run` for more detail.
+        native_pipeline: Whether to compile with the preset pipeline implemented natively in
+            Rust, which avoids the overhead of running the individual passes from Python.  The
+            native pipeline only supports compiling against a :class:`.Target` (either given
+            directly or through ``backend``) made up of standard gates, with the default stage
+            methods, no ``initial_layout``, ``callback``, ``hls_config`` or unitary-synthesis
+            plugin, and only for circuits containing standard gates, unitary gates and standard
+            instructions (so no control flow or classical variables).  It is not guaranteed to
+            produce the same output as the Python-space preset pass managers for the same seed.
+            If ``False`` (the default), the native pipeline is never used.  If ``None``, the
+            native pipeline is used whenever the options and each individual circuit are
+            supported, and the other circuits fall back to the Python-space preset pass managers.
+            If ``True``, a :class:`.TranspilerError` is raised if the native pipeline cannot be
+            used.  Which path was taken is logged at ``INFO`` level.  Several circuits are
+            compiled by the native pipeline concurrently, in at most ``num_processes`` threads.
+        cache: An optional :class:`.TranspileCache` to look the output up in before compiling
+            each circuit, and to store the output of each compiled circuit in.  The cache is keyed
+            on the structure of each circuit, the :class:`.Target` (or the loose constraints) and
+            all the options that affect the output, including ``seed_transpiler``.  The cache is
+            not used if ``callback``, ``hls_config`` or ``unitary_synthesis_plugin_config`` are
+            given, or if ``initial_layout`` is not a list of integers.
 
     Returns:
         The transpiled circuit(s).
@@ -268,6 +303,316 @@ def transpile(
 
     start_time = time()
 
+    (
+        backend,
+        target,
+        optimization_level,
+        seed_transpiler,
+        scheduling_method,
+        translation_method,
+    ) = _resolve_defaults(
+        backend,
+        target,
+        optimization_level,
+        seed_transpiler,
+        scheduling_method,
+        translation_method,
+        ignore_backend_supplied_default_methods,
+    )
+
+    output_name = _parse_output_name(output_name, circuits)
+    coupling_map = _parse_coupling_map(coupling_map)
+    _check_circuits_coupling_map(circuits, coupling_map, backend)
+
+    out_circuits = [None] * len(circuits)
+    pending = list(range(len(circuits)))
+    cache_keys = {}
+    if cache is not None:
+        cache_config = _transpile_cache_config(
+            target if target is not None else getattr(backend, "target", None),
+            optimization_level=optimization_level,
+            seed_transpiler=seed_transpiler,
+            approximation_degree=approximation_degree,
+            basis_gates=basis_gates,
+            coupling_map=coupling_map,
+            dt=dt,
+            initial_layout=initial_layout,
+            methods=(
+                layout_method,
+                routing_method,
+                translation_method,
+                scheduling_method,
+                init_method,
+                optimization_method,
+            ),
+            callback=callback,
+            unitary_synthesis_method=unitary_synthesis_method,
+            unitary_synthesis_plugin_config=unitary_synthesis_plugin_config,
+            hls_config=hls_config,
+            qubits_initially_zero=qubits_initially_zero,
+            native_pipeline=native_pipeline,
+        )
+        if cache_config is None:
+            logger.info("Not using the transpile cache: the options cannot be used as a key.")
+        else:
+            misses = []
+            for i in pending:
+                key = cache.key(circuits[i], cache_config)
+                if (cached := cache._get(key, circuits[i])) is None:
+                    cache_keys[i] = key
+                    misses.append(i)
+                else:
+                    out_circuits[i] = cached
+            logger.info(
+                "Found %d of %d circuits in the transpile cache.",
+                len(pending) - len(misses),
+                len(pending),
+            )
+            pending = misses
+
+    python_indices = pending
+    if pending and native_pipeline is not False:
+        native_target = target if target is not None else getattr(backend, "target", None)
+        reason = _native_pipeline_unsupported_reason(
+            native_target,
+            optimization_level=optimization_level,
+            seed_transpiler=seed_transpiler,
+            basis_gates=basis_gates,
+            coupling_map=coupling_map,
+            dt=dt,
+            initial_layout=initial_layout,
+            methods=(
+                layout_method,
+                routing_method,
+                translation_method,
+                scheduling_method,
+                init_method,
+                optimization_method,
+            ),
+            callback=callback,
+            unitary_synthesis_method=unitary_synthesis_method,
+            unitary_synthesis_plugin_config=unitary_synthesis_plugin_config,
+            hls_config=hls_config,
+            qubits_initially_zero=qubits_initially_zero,
+        )
+        if reason is not None:
+            if native_pipeline:
+                raise TranspilerError(f"Cannot use the native preset pipeline: {reason}.")
+            logger.info("Using the Python preset pass managers: %s.", reason)
+        else:
+            python_indices = []
+            run_native = functools.partial(
+                _run_native_pipeline,
+                target=native_target,
+                optimization_level=optimization_level,
+                approximation_degree=approximation_degree,
+                seed=seed_transpiler,
+            )
+            native_circuits = [circuits[i] for i in pending]
+            # The native pipeline releases the GIL, so the circuits are compiled concurrently in
+            # threads, which share the target.
+            num_threads = min(
+                len(native_circuits),
+                default_num_processes() if num_processes is None else num_processes,
+            )
+            if num_threads > 1 and should_run_in_parallel(num_threads):
+                with ThreadPoolExecutor(max_workers=num_threads) as pool:
+                    native_out = list(pool.map(run_native, native_circuits))
+            else:
+                native_out = [run_native(circuit) for circuit in native_circuits]
+            for i, circuit, out in zip(pending, native_circuits, native_out):
+                if out is None:
+                    if native_pipeline:
+                        raise TranspilerError(
+                            f"Cannot use the native preset pipeline: circuit '{circuit.name}' "
+                            "contains instructions that are only supported in Python."
+                        )
+                    python_indices.append(i)
+                else:
+                    out_circuits[i] = out
+            logger.info(
+                "Transpiled %d of %d circuits with the native preset pipeline.",
+                len(pending) - len(python_indices),
+                len(pending),
+            )
+
+    if python_indices:
+        _run_python_pipeline(
+            [circuits[i] for i in python_indices],
+            python_indices,
+            out_circuits,
+            optimization_level,
+            target=target,
+            backend=backend,
+            basis_gates=basis_gates,
+            coupling_map=coupling_map,
+            initial_layout=initial_layout,
+            layout_method=layout_method,
+            routing_method=routing_method,
+            translation_method=translation_method,
+            scheduling_method=scheduling_method,
+            approximation_degree=approximation_degree,
+            seed_transpiler=seed_transpiler,
+            unitary_synthesis_method=unitary_synthesis_method,
+            unitary_synthesis_plugin_config=unitary_synthesis_plugin_config,
+            hls_config=hls_config,
+            init_method=init_method,
+            optimization_method=optimization_method,
+            dt=dt,
+            qubits_initially_zero=qubits_initially_zero,
+            callback=callback,
+            num_processes=num_processes,
+            executor=executor,
+        )
+
+    for i, key in cache_keys.items():
+        cache._put(key, out_circuits[i])
+
+    for name, circ in zip(output_name, out_circuits):
+        circ.name = name
+    end_time = time()
+    _log_transpile_time(start_time, end_time)
+    if arg_circuits_list:
+        return out_circuits
+    else:
+        return out_circuits[0]
+
+
+def transpile_iter(
+    circuits: Iterable[QuantumCircuit],
+    backend: Backend | Target | None = None,
+    *,
+    basis_gates: list[str] | None = None,
+    coupling_map: CouplingMap | list[list[int]] | None = None,
+    initial_layout: Layout | dict | list | None = None,
+    layout_method: str | None = None,
+    routing_method: str | None = None,
+    translation_method: str | None = None,
+    scheduling_method: str | None = None,
+    dt: float | None = None,
+    approximation_degree: float | None = 1.0,
+    seed_transpiler: int | None = None,
+    optimization_level: int | None = None,
+    callback: Callable[[BasePass, DAGCircuit, float, PropertySet, int], Any] | None = None,
+    unitary_synthesis_method: str = "default",
+    unitary_synthesis_plugin_config: dict | None = None,
+    target: Target | None = None,
+    hls_config: HLSConfig | None = None,
+    init_method: str | None = None,
+    optimization_method: str | None = None,
+    ignore_backend_supplied_default_methods: bool = False,
+    num_processes: int | None = None,
+    qubits_initially_zero: bool = True,
+    executor: str = "processes",
+    max_in_flight: int | None = None,
+    ordered: bool = True,
+) -> Iterator[QuantumCircuit]:
+    """Transpile each circuit of an iterable, and yield the transpiled circuits as they become
+    available.
+
+    This is the streaming counterpart of :func:`.transpile`.  The circuits are taken from
+    ``circuits`` only as workers become free, and at most ``max_in_flight`` circuits are held in
+    memory at any one time, so arbitrarily many circuits can be transpiled without building lists
+    of all the inputs and outputs::
+
+        from qiskit import qpy
+        from qiskit.compiler import transpile_iter
+
+        def read_circuits(paths):
+            for path in paths:
+                with open(path, "rb") as fd:
+                    yield from qpy.load(fd)
+
+        for isa_circuit in transpile_iter(read_circuits(paths), backend, optimization_level=2):
+            ...
+
+    The transpilation options have the same meaning as for :func:`.transpile`, and the pass
+    manager is built once for all the circuits, as :func:`.transpile` does.  Each transpiled
+    circuit has the name of its input circuit.  This function does not support the
+    ``output_name``, ``native_pipeline`` and ``cache`` arguments of :func:`.transpile`.
+
+    Args:
+        circuits: An iterable of the circuits to transpile.
+        backend: The backend or :class:`.Target` to transpile for, as in :func:`.transpile`.
+        max_in_flight: The maximum number of circuits that have been taken from ``circuits`` but
+            whose outputs have not yet been yielded.  Defaults to twice the number of workers.
+        ordered: If ``True`` (the default), the transpiled circuits are yielded in the order of
+            the input circuits.  If ``False``, each one is yielded as soon as it is ready.
+
+    See :func:`.transpile` for the other arguments.
+
+    Returns:
+        An iterator over the transpiled circuits.
+
+    Raises:
+        CircuitTooWideForTarget: If a circuit has more qubits than the target, when that circuit
+            is reached.
+        TypeError: if a :class:`~qiskit.transpiler.Target` is passed as the ``backend``
+            positional argument and ``target`` is also specified as a keyword argument.
+    """
+    (
+        backend,
+        target,
+        optimization_level,
+        seed_transpiler,
+        scheduling_method,
+        translation_method,
+    ) = _resolve_defaults(
+        backend,
+        target,
+        optimization_level,
+        seed_transpiler,
+        scheduling_method,
+        translation_method,
+        ignore_backend_supplied_default_methods,
+    )
+    coupling_map = _parse_coupling_map(coupling_map)
+    pm = generate_preset_pass_manager(
+        optimization_level,
+        target=target,
+        backend=backend,
+        basis_gates=basis_gates,
+        coupling_map=coupling_map,
+        initial_layout=initial_layout,
+        layout_method=layout_method,
+        routing_method=routing_method,
+        translation_method=translation_method,
+        scheduling_method=scheduling_method,
+        approximation_degree=approximation_degree,
+        seed_transpiler=seed_transpiler,
+        unitary_synthesis_method=unitary_synthesis_method,
+        unitary_synthesis_plugin_config=unitary_synthesis_plugin_config,
+        hls_config=hls_config,
+        init_method=init_method,
+        optimization_method=optimization_method,
+        dt=dt,
+        qubits_initially_zero=qubits_initially_zero,
+    )
+
+    def checked(circuits):
+        for circuit in circuits:
+            _check_circuits_coupling_map([circuit], coupling_map, backend)
+            yield circuit
+
+    return pm.run_iter(
+        checked(circuits),
+        callback=callback,
+        num_processes=num_processes,
+        max_in_flight=max_in_flight,
+        ordered=ordered,
+        executor=executor,
+    )
+
+
+def _resolve_defaults(
+    backend,
+    target,
+    optimization_level,
+    seed_transpiler,
+    scheduling_method,
+    translation_method,
+    ignore_backend_supplied_default_methods,
+):
     if isinstance(backend, Target):
         if target is not None:
             raise TypeError(
@@ -295,45 +640,141 @@ def transpile(
         if translation_method is None and hasattr(backend, "get_translation_stage_plugin"):
             translation_method = backend.get_translation_stage_plugin()
 
-    output_name = _parse_output_name(output_name, circuits)
-    coupling_map = _parse_coupling_map(coupling_map)
-    _check_circuits_coupling_map(circuits, coupling_map, backend)
+    return (
+        backend,
+        target,
+        optimization_level,
+        seed_transpiler,
+        scheduling_method,
+        translation_method,
+    )
+
 
+def _run_python_pipeline(
+    circuits,
+    indices,
+    out_circuits,
+    optimization_level,
+    *,
+    callback,
+    num_processes,
+    executor,
+    **pm_kwargs,
+):
     # Edge cases require using the old model (loose constraints) instead of building a target,
     # but we don't populate the passmanager config with loose constraints unless it's one of
     # the known edge cases to control the execution path.
-    pm = generate_preset_pass_manager(
+    pm = generate_preset_pass_manager(optimization_level, **pm_kwargs)
+    results = pm.run(circuits, callback=callback, num_processes=num_processes, executor=executor)
+    for index, result in zip(indices, results):
+        out_circuits[index] = result
+
+
+def _transpile_cache_config(
+    target,
+    *,
+    optimization_level,
+    seed_transpiler,
+    approximation_degree,
+    basis_gates,
+    coupling_map,
+    dt,
+    initial_layout,
+    methods,
+    callback,
+    unitary_synthesis_method,
+    unitary_synthesis_plugin_config,
+    hls_config,
+    qubits_initially_zero,
+    native_pipeline,
+):
+    """Return a description of the compilation options for use as a :class:`.TranspileCache`
+    configuration, or ``None`` if the options cannot be described stably."""
+    if (
+        callback is not None
+        or hls_config is not None
+        or unitary_synthesis_plugin_config is not None
+    ):
+        return None
+    if initial_layout is not None:
+        if not isinstance(initial_layout, list) or not all(
+            isinstance(bit, int) for bit in initial_layout
+        ):
+            return None
+        initial_layout = tuple(initial_layout)
+    return (
+        "transpile",
+        None if target is None else target.fingerprint(),
+        None if basis_gates is None else tuple(basis_gates),
+        None if coupling_map is None else tuple(sorted(coupling_map.get_edges())),
+        dt,
+        initial_layout,
+        methods,
         optimization_level,
-        target=target,
-        backend=backend,
-        basis_gates=basis_gates,
-        coupling_map=coupling_map,
-        initial_layout=initial_layout,
-        layout_method=layout_method,
-        routing_method=routing_method,
-        translation_method=translation_method,
-        scheduling_method=scheduling_method,
-        approximation_degree=approximation_degree,
-        seed_transpiler=seed_transpiler,
-        unitary_synthesis_method=unitary_synthesis_method,
-        unitary_synthesis_plugin_config=unitary_synthesis_plugin_config,
-        hls_config=hls_config,
-        init_method=init_method,
-        optimization_method=optimization_method,
-        dt=dt,
-        qubits_initially_zero=qubits_initially_zero,
+        seed_transpiler,
+        approximation_degree,
+        unitary_synthesis_method,
+        qubits_initially_zero,
+        native_pipeline,
     )
 
-    out_circuits = pm.run(circuits, callback=callback, num_processes=num_processes)
 
-    for name, circ in zip(output_name, out_circuits):
-        circ.name = name
-    end_time = time()
-    _log_transpile_time(start_time, end_time)
-    if arg_circuits_list:
-        return out_circuits
-    else:
-        return out_circuits[0]
+def _native_pipeline_unsupported_reason(
+    target,
+    *,
+    optimization_level,
+    seed_transpiler,
+    basis_gates,
+    coupling_map,
+    dt,
+    initial_layout,
+    methods,
+    callback,
+    unitary_synthesis_method,
+    unitary_synthesis_plugin_config,
+    hls_config,
+    qubits_initially_zero,
+):
+    """Return a string explaining why the native preset pipeline can't be used with these options,
+    or ``None`` if it can."""
+    if target is None or target.num_qubits is None:
+        return "no target with a fixed number of qubits was given"
+    if basis_gates is not None or coupling_map is not None or dt is not None:
+        return "loose constraints were given"
+    if optimization_level not in (0, 1, 2, 3):
+        return f"optimization level {optimization_level} is not supported"
+    if seed_transpiler is not None and seed_transpiler < 0:
+        return "negative seeds are not supported"
+    if initial_layout is not None:
+        return "an initial layout was given"
+    if any(method is not None for method in methods):
+        return "a non-default stage method was requested"
+    if callback is not None:
+        return "a callback was given"
+    if unitary_synthesis_method != "default" or unitary_synthesis_plugin_config is not None:
+        return "a unitary-synthesis plugin was requested"
+    if hls_config is not None:
+        return "a high-level-synthesis configuration was given"
+    if not qubits_initially_zero:
+        return "the qubits are not assumed to be initially zero"
+    if not set(target.operation_names).issubset(get_standard_gate_name_mapping()):
+        return "the target contains non-standard operations"
+    if is_clifford_t_basis(target=target):
+        return "the target has a Clifford+T basis"
+    return None
+
+
+def _run_native_pipeline(circuit, target, optimization_level, approximation_degree, seed):
+    result = _native_transpile(
+        circuit._data, target, optimization_level, approximation_degree, seed
+    )
+    if result is None:
+        return None
+    data, layout = result
+    out = QuantumCircuit._from_circuit_data(data, name=circuit.name)
+    out._layout = layout
+    out.metadata = circuit.metadata
+    return out
 
 
 def _check_circuits_coupling_map(circuits, cmap, backend):
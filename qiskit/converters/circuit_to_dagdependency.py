@@ -12,6 +12,7 @@
 
 """Helper function for converting a circuit to a dag dependency"""
 
+from qiskit._accelerate.dag_dependency import circuit_dependency_graph
 from qiskit.dagcircuit.dagdependency import DAGDependency
 
 
@@ -40,11 +41,14 @@ def circuit_to_dagdependency(circuit, create_preds_and_succs=True):
         dagdependency.add_creg(register)
 
     for instruction in circuit.data:
-        dagdependency.add_op_node(instruction.operation, instruction.qubits, instruction.clbits)
-
-    if create_preds_and_succs:
-        dagdependency._add_predecessors()
-        dagdependency._add_successors()
+        dagdependency._add_multi_graph_node(
+            dagdependency._create_op_node(
+                instruction.operation, instruction.qubits, instruction.clbits
+            )
+        )
+    dagdependency._add_dependency_graph(
+        circuit_dependency_graph(circuit._data), create_preds_and_succs
+    )
 
     # copy global phase
     dagdependency.global_phase = circuit.global_phase
@@ -12,6 +12,7 @@
 
 """Helper function for converting a circuit to a dag dependency"""
 
+from qiskit._accelerate.dag_dependency import circuit_dependency_graph
 from qiskit.dagcircuit.dagdependency_v2 import _DAGDependencyV2
 
 
@@ -39,8 +40,7 @@ def _circuit_to_dagdependency_v2(circuit):
         dagdependency.add_creg(register)
 
     for instruction in circuit.data:
-        dagdependency.apply_operation_back(
-            instruction.operation, instruction.qubits, instruction.clbits
-        )
+        dagdependency._add_op_node(instruction.operation, instruction.qubits, instruction.clbits)
+    dagdependency._add_dependency_graph(circuit_dependency_graph(circuit._data))
 
     return dagdependency
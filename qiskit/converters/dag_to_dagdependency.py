@@ -11,6 +11,7 @@
 # that they have been altered from the originals.
 
 """Helper function for converting a dag circuit to a dag dependency"""
+from qiskit._accelerate.dag_dependency import dag_dependency_graph
 from qiskit.dagcircuit.dagdependency import DAGDependency
 
 
@@ -39,14 +40,14 @@ def dag_to_dagdependency(dag, create_preds_and_succs=True):
     for register in dag.cregs.values():
         dagdependency.add_creg(register)
 
+    # The nodes of the graph are the operations in the order of ``topological_op_nodes``.
+    graph = dag_dependency_graph(dag)
     for node in dag.topological_op_nodes():
-        # Get arguments for classical control (if any)
         inst = node.op.copy()
-        dagdependency.add_op_node(inst, node.qargs, node.cargs)
-
-    if create_preds_and_succs:
-        dagdependency._add_predecessors()
-        dagdependency._add_successors()
+        dagdependency._add_multi_graph_node(
+            dagdependency._create_op_node(inst, node.qargs, node.cargs)
+        )
+    dagdependency._add_dependency_graph(graph, create_preds_and_succs)
 
     # copy metadata
     dagdependency.global_phase = dag.global_phase
@@ -11,6 +11,7 @@
 # that they have been altered from the originals.
 
 """Helper function for converting a dag circuit to a dag dependency"""
+from qiskit._accelerate.dag_dependency import dag_dependency_graph
 from qiskit.dagcircuit.dagdependency_v2 import _DAGDependencyV2
 
 
@@ -38,6 +39,7 @@ def _dag_to_dagdependency_v2(dag):
         dagdependency.add_creg(register)
 
     for node in dag.topological_op_nodes():
-        dagdependency.apply_operation_back(node.op.copy(), node.qargs, node.cargs)
+        dagdependency._add_op_node(node.op.copy(), node.qargs, node.cargs)
+    dagdependency._add_dependency_graph(dag_dependency_graph(dag))
 
     return dagdependency
@@ -462,6 +462,26 @@ class DAGDependency:
                 for predecessor_id in predecessor_ids:
                     reachable[predecessor_id] = False
 
+    def _add_dependency_graph(self, graph, create_preds_and_succs=True):
+        """
+        Add the edges of a native dependency graph between the op nodes. It has to be used
+        when the nodes have been added without updating the edges, in the order of the nodes
+        of the graph (i.e. converters).
+
+        Args:
+            graph (DependencyGraph): the dependency graph of the operations of the nodes.
+            create_preds_and_succs (bool): whether to set the lists of predecessors and
+                successors of every node from the graph.
+        """
+        self._multi_graph.add_edges_from(
+            [(pred, succ, {"commute": False}) for pred, succ in graph.edges()]
+        )
+        if create_preds_and_succs:
+            for node_id in range(len(graph)):
+                node = self._multi_graph.get_node_data(node_id)
+                node.predecessors = graph.predecessors(node_id)
+                node.successors = graph.successors(node_id)
+
     def _add_successors(self):
         """
         Create the list of successors. Update DAGDependency 'successors' attribute. It has to
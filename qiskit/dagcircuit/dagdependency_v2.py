@@ -263,14 +263,32 @@ class _DAGDependencyV2:
             qargs (list[~qiskit.circuit.Qubit]): list of qubits on which the operation acts
             cargs (list[Clbit]): list of classical wires to attach to
         """
+        self._add_op_node(operation, qargs, cargs)
+        self._update_edges()
+
+    def _add_op_node(self, operation, qargs, cargs):
+        """Add a DAGOpNode to the graph without updating the edges."""
         new_node = DAGOpNode(
             op=operation,
             qargs=qargs,
             cargs=cargs,
         )
         new_node._node_id = self._multi_graph.add_node(new_node)
-        self._update_edges()
         self._increment_op(new_node.op)
+        return new_node
+
+    def _add_dependency_graph(self, graph):
+        """
+        Add the edges of a native dependency graph between the op nodes. It has to be used
+        when the nodes have been added with ``_add_op_node``, in the order of the nodes of the
+        graph (i.e. converters).
+
+        Args:
+            graph (DependencyGraph): the dependency graph of the operations of the nodes.
+        """
+        self._multi_graph.add_edges_from(
+            [(pred, succ, {"commute": False}) for pred, succ in graph.edges()]
+        )
 
     def _update_edges(self):
         """
@@ -237,6 +237,7 @@ Pass managers
 
    BasePassManager
    MultiStagePassManager
+   PassManagerPool
 
 Flow controllers
 ----------------
@@ -259,13 +260,22 @@ Compilation state
    WorkflowStatus
    PassManagerState
 
+Profiling
+---------
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   PassProfiler
+   TaskProfile
+
 Exceptions
 ----------
 
 .. autoexception:: PassManagerError
 """
 
-from .passmanager import BasePassManager
+from .passmanager import BasePassManager, PassManagerPool
 from .multistage_passmanager import MultiStagePassManager
 from .flow_controllers import (
     FlowControllerLinear,
@@ -275,6 +285,7 @@ from .flow_controllers import (
 from .base_tasks import GenericPass, BaseController, Task
 from .compilation_status import PropertySet, WorkflowStatus, PassManagerState
 from .exceptions import PassManagerError
+from .profiling import PassProfiler, TaskProfile
 
 __all__ = [
     "BaseController",
@@ -285,8 +296,11 @@ __all__ = [
     "GenericPass",
     "MultiStagePassManager",
     "PassManagerError",
+    "PassManagerPool",
     "PassManagerState",
+    "PassProfiler",
     "PropertySet",
     "Task",
+    "TaskProfile",
     "WorkflowStatus",
 ]
@@ -21,6 +21,7 @@ from collections.abc import Iterable, Callable, Generator
 from typing import Any, TypeVar, Generic, TypeAlias
 
 from .compilation_status import RunState, PassManagerState, PropertySet
+from .profiling import _is_native
 
 logger = logging.getLogger(__name__)
 
@@ -96,9 +97,12 @@ class GenericPass(Task[IR, IR_OUT], ABC):
 
         run_state = None
         ret = None
+        profile = None
         start_time = time.time()
         try:
             if self not in state.workflow_status.completed_passes:
+                if state.profiler is not None:
+                    profile = state.profiler._start(passmanager_ir)
                 ret = self.run(passmanager_ir)
                 run_state = RunState.SUCCESS
             else:
@@ -108,6 +112,15 @@ class GenericPass(Task[IR, IR_OUT], ABC):
             raise
         finally:
             ret = passmanager_ir if ret is None else ret
+            if profile is not None:
+                state.profiler._finish(
+                    profile,
+                    name=self.name(),
+                    kind="task",
+                    native=_is_native(type(self)),
+                    passmanager_ir=ret,
+                    count=state.workflow_status.count,
+                )
             if run_state != RunState.SKIP:
                 running_time = time.time() - start_time
                 logger.info("Pass: %s - %.5f (ms)", self.name(), running_time * 1000)
@@ -12,10 +12,15 @@
 
 """A property set dictionary that is shared among optimization passes."""
 
+from __future__ import annotations
 
+import typing
 from dataclasses import dataclass, field
 from enum import Enum
 
+if typing.TYPE_CHECKING:
+    from .profiling import PassProfiler
+
 
 class PropertySet(dict):
     """A default dictionary-like object."""
@@ -72,3 +77,6 @@ class PassManagerState:
 
     property_set: PropertySet
     """Information about IR being optimized."""
+
+    profiler: PassProfiler | None = None
+    """An optional profiler, which records the execution of every task of the workflow."""
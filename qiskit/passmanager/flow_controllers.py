@@ -88,9 +88,15 @@ class DoWhileController(BaseController[IR, IR]):
         self, state: PassManagerState
     ) -> Generator[Task[Any, Any], PassManagerState, None]:
         max_iteration = self._options.get("max_iteration", 1000)
-        for _ in range(max_iteration):
+        profiler = state.profiler
+        for iteration in range(max_iteration):
+            profile = None if profiler is None else profiler._start()
             for task in self.tasks:
                 state = yield task
+            if profile is not None:
+                profiler._finish(
+                    profile, name=type(self).__name__, kind="iteration", iteration=iteration
+                )
             if not self.do_while(state.property_set):
                 return
             # Remove stored tasks from the completed task collection for next loop
@@ -14,19 +14,40 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import io
 import logging
+import os
+import threading
+import uuid
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from itertools import chain
 from typing import Any, Generic
 
 import dill
 
-from qiskit.utils.parallel import parallel_map, should_run_in_parallel
+from qiskit.utils.parallel import (
+    default_num_processes,
+    parallel_map,
+    should_run_in_parallel,
+    _IN_PARALLEL_FORBID_PARALLELISM,
+)
 from .base_tasks import Task, IR, Callback
 from .exceptions import PassManagerError
 from .flow_controllers import FlowControllerLinear
 from .compilation_status import PropertySet, WorkflowStatus, PassManagerState
+from .profiling import PassProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -177,6 +198,8 @@ class BasePassManager(Generic[IR], ABC):
         num_processes: int | None = None,
         *,
         property_set: dict[str, object] | None = None,
+        executor: str = "processes",
+        profiler: PassProfiler | None = None,
         **kwargs,
     ) -> Any:
         """Run all the passes on the specified ``in_programs``.
@@ -219,11 +242,27 @@ class BasePassManager(Generic[IR], ABC):
                 another, in cases where you know the analysis is safe to share.  Beware that some
                 analysis will be specific to the input circuit and the particular :class:`.Target`,
                 so you should take a lot of care when using this argument.
+            executor: How to run several input programs concurrently.  The default,
+                ``"processes"``, uses :func:`.parallel_map` to run the programs in separate
+                processes if :func:`.should_run_in_parallel` allows it.  ``"threads"`` runs the
+                programs on a pool of threads within this process, with at most ``num_processes``
+                threads.  Each thread works on its own copy of the pass manager.  This avoids
+                serializing the pass manager, but only gives a speedup if the tasks spend most of
+                their time in code that does not hold the Python global interpreter lock (or on a
+                free-threaded build of Python).  If ``callback`` is given, it must be safe to call
+                concurrently from several threads.
+            profiler: If given, a :class:`.PassProfiler` that records the time and memory used by
+                every task of the run.  Runs with a profiler never use parallel processes.
             kwargs: Arbitrary arguments passed to the compiler frontend and backend.
 
         Returns:
             The transformed program(s).
+
+        Raises:
+            PassManagerError: if ``executor`` is not a known executor.
         """
+        if executor not in ("processes", "threads"):
+            raise PassManagerError(f"Unknown executor '{executor}'.")
         if not self._tasks and not kwargs and callback is None:
             return in_programs
 
@@ -232,15 +271,34 @@ class BasePassManager(Generic[IR], ABC):
             in_programs = [in_programs]
             is_list = False
 
+        if executor == "threads":
+            num_threads = default_num_processes() if num_processes is None else num_processes
+            if len(in_programs) > 1 and num_threads > 1:
+                return _run_workflows_in_threads(
+                    in_programs,
+                    pass_manager=self,
+                    num_threads=num_threads,
+                    callback=callback,
+                    initial_property_set=property_set,
+                    profiler=profiler,
+                    **kwargs,
+                )
+
         # If we're not going to run in parallel, we want to avoid spending time `dill` serializing
-        # ourselves, since that can be quite expensive.
-        if len(in_programs) == 1 or not should_run_in_parallel(num_processes):
+        # ourselves, since that can be quite expensive.  A profiler can only record the runs that
+        # happen in this process, so it forces serial execution too.
+        if (
+            len(in_programs) == 1
+            or profiler is not None
+            or not should_run_in_parallel(num_processes)
+        ):
             out = [
                 _run_workflow(
                     program=program,
                     pass_manager=self,
                     callback=callback,
                     initial_property_set=property_set,
+                    profiler=profiler,
                     **kwargs,
                 )
                 for program in in_programs
@@ -253,17 +311,177 @@ class BasePassManager(Generic[IR], ABC):
         # See https://github.com/Qiskit/qiskit-terra/pull/3290
         # Note that serialized object is deserialized as a different object.
         # Thus, we can reuse the same manager without state collision, without building it per thread.
+        pass_manager_bin, shared_bin = _dumps_with_shared_objects(self)
         return parallel_map(
             _run_workflow_in_new_process,
             values=in_programs,
             task_kwargs={
-                "pass_manager_bin": dill.dumps(self),
+                "pass_manager_bin": pass_manager_bin,
+                "shared_bin": shared_bin,
                 "callback": dill.dumps(callback),
                 "initial_property_set": property_set,
             },
             num_processes=num_processes,
         )
 
+    def run_iter(
+        self,
+        in_programs: Iterable[Any],
+        callback: Callback[IR] | None = None,
+        num_processes: int | None = None,
+        *,
+        max_in_flight: int | None = None,
+        ordered: bool = True,
+        property_set: dict[str, object] | None = None,
+        executor: str = "processes",
+        **kwargs,
+    ) -> Iterator[Any]:
+        """Run all the passes on each program of an iterable, and yield the transformed programs
+        as they become available.
+
+        Unlike :meth:`run`, this takes the input programs from ``in_programs`` only as workers
+        become free, and holds at most ``max_in_flight`` programs at any one time, so arbitrarily
+        many programs can be streamed through the pass manager (for example, read one by one from
+        files) in bounded memory::
+
+            for out in pass_manager.run_iter(read_programs(), max_in_flight=16):
+                save(out)
+
+        If the returned iterator is closed before it is exhausted, for example by breaking out of
+        the loop, programs that have not yet started running are cancelled.
+
+        Args:
+            in_programs: An iterable of the programs to transform.  Unlike for :meth:`run`, each
+                item is always one program, even if it is a list.
+            callback: A callback function that will be called after each pass execution, as
+                described in :meth:`run`.
+            num_processes: The maximum number of parallel processes (or threads, if ``executor`` is
+                ``"threads"``) to use, as described in :meth:`run`.
+            max_in_flight: The maximum number of programs that have been taken from
+                ``in_programs`` but whose outputs have not yet been yielded.  Defaults to twice
+                the number of workers.
+            ordered: If ``True`` (the default), the outputs are yielded in the order of the
+                inputs.  If ``False``, each output is yielded as soon as it is ready, which keeps
+                all the workers busy even if one program takes much longer than the others.
+            property_set: If given, the initial value to use as the :class:`.PropertySet` for
+                each program, as described in :meth:`run`.
+            executor: How to run several programs concurrently, as described in :meth:`run`.  If
+                ``"processes"``, the pass manager is serialized once, and each worker process
+                deserializes it once, when it starts.
+            kwargs: Arbitrary arguments passed to the compiler frontend and backend.  These must
+                be serializable with :mod:`pickle` if the programs are run in worker processes.
+
+        Returns:
+            An iterator over the transformed programs.
+
+        Raises:
+            PassManagerError: if ``executor`` is not a known executor, or ``max_in_flight`` is less
+                than 1.
+        """
+        if executor not in ("processes", "threads"):
+            raise PassManagerError(f"Unknown executor '{executor}'.")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise PassManagerError(f"'max_in_flight' must be at least 1, not {max_in_flight}.")
+        num_workers = default_num_processes() if num_processes is None else num_processes
+        if max_in_flight is None:
+            max_in_flight = 2 * num_workers
+        if executor == "threads" and num_workers > 1:
+
+            def start():
+                pool, get_pass_manager = _workflow_thread_pool(self, num_workers)
+
+                def submit(program):
+                    return pool.submit(
+                        lambda: _run_workflow(
+                            program=program,
+                            pass_manager=get_pass_manager(),
+                            callback=callback,
+                            initial_property_set=property_set,
+                            **kwargs,
+                        )
+                    )
+
+                return pool, submit
+
+        elif executor == "processes" and should_run_in_parallel(num_processes):
+            pass_manager_bin = dill.dumps(self)
+            callback_bin = dill.dumps(callback)
+            run = functools.partial(
+                _run_workflow_in_pool_worker, initial_property_set=property_set, kwargs=kwargs
+            )
+
+            def start():
+                pool = ProcessPoolExecutor(
+                    max_workers=num_workers,
+                    initializer=_initialize_pool_worker,
+                    initargs=(pass_manager_bin, callback_bin),
+                )
+                return pool, functools.partial(pool.submit, run)
+
+        else:
+            return (
+                _run_workflow(
+                    program=program,
+                    pass_manager=self,
+                    callback=callback,
+                    initial_property_set=property_set,
+                    **kwargs,
+                )
+                for program in in_programs
+            )
+        return _iter_futures(start, in_programs, max_in_flight, ordered)
+
+    def worker_pool(
+        self,
+        num_processes: int | None = None,
+        *,
+        callback: Callback[IR] | None = None,
+    ) -> PassManagerPool:
+        """Create a persistent pool of worker processes for repeatedly running this pass manager.
+
+        Each call to :meth:`run` with several input programs starts a new set of worker processes
+        and serializes the pass manager (and everything it references, such as a :class:`.Target`)
+        once per call.  The returned :class:`PassManagerPool` instead serializes the pass manager
+        once, when it is created, and keeps its worker processes alive between calls to
+        :meth:`PassManagerPool.run`, so that only the input and output programs need to be sent
+        between processes.  This is useful when the same pass manager is used to transform many
+        small batches of programs.
+
+        The pool should be closed when it is no longer needed, most conveniently by using it as a
+        context manager::
+
+            with pass_manager.worker_pool() as pool:
+                for batch in batches:
+                    out = pool.run(batch)
+
+        Args:
+            num_processes: The maximum number of worker processes to launch.  This has the same
+                meaning as the argument of the same name to :meth:`run`.
+            callback: A callback function that will be called after each pass execution, in the
+                same form as for :meth:`run`.  It is serialized along with the pass manager.
+
+        Returns:
+            A new pool of workers for this pass manager.
+        """
+        return PassManagerPool(self, num_processes, callback=callback)
+
+    def _shared_objects(self) -> Iterable[Any]:
+        """Objects referenced by this pass manager that need not be copied for each run.
+
+        When running with ``executor="threads"``, each worker thread makes a deep copy of the pass
+        manager, since tasks are free to store state on themselves during a run.  Any object
+        returned by this method is instead shared between all the copies; these must be safe to
+        use concurrently from several threads.
+
+        When running in worker processes, these objects are serialized separately from the rest of
+        the pass manager, and each worker process deserializes each of them at most once, rather
+        than once per program.  If an object has a ``fingerprint()`` method, its return value is
+        used to identify the object between processes.
+
+        Subclasses can override this to avoid duplicating large, read-only objects.
+        """
+        return ()
+
     def to_flow_controller(self) -> FlowControllerLinear[IR, IR]:
         """Linearize this manager into a single :class:`.FlowControllerLinear`,
         so that it can be nested inside another pass manager.
@@ -281,11 +499,270 @@ class BasePassManager(Generic[IR], ABC):
         return chain(*map(self._flatten_tasks, elements))
 
 
+class PassManagerPool:
+    """A persistent pool of worker processes, each holding a copy of one pass manager.
+
+    Instances of this class should be created by :meth:`BasePassManager.worker_pool`.
+
+    The pass manager (and its callback, if any) is serialized once, when the pool is created, and
+    is deserialized once in each worker process as it starts, and once in the calling process.
+    Every run uses one of these snapshots, including the runs of a single program and those of a
+    pool that runs in serial, so subsequent modifications of the pass manager are never seen by
+    the pool.  If process-based parallelism is not enabled (see :func:`.should_run_in_parallel`),
+    no worker processes are started and the pool runs all programs serially in the calling
+    process.
+    """
+
+    def __init__(
+        self,
+        pass_manager: BasePassManager,
+        num_processes: int | None = None,
+        *,
+        callback: Callback | None = None,
+    ):
+        """
+        Args:
+            pass_manager: The pass manager to run in each of the workers.
+            num_processes: The maximum number of worker processes to launch.  If ``None``, the
+                value of :func:`.default_num_processes` is used.
+            callback: A callback function that will be called after each pass execution.
+        """
+        pass_manager_bin = dill.dumps(pass_manager)
+        callback_bin = dill.dumps(callback)
+        # The runs in the calling process use their own copy of the snapshot the workers start
+        # from, so that they see the same pass manager regardless of the path they take.
+        self._pass_manager = dill.loads(pass_manager_bin)  # noqa: S301 Only used for IPC
+        self._callback = dill.loads(callback_bin)  # noqa: S301 Only used for IPC
+        self._num_processes = default_num_processes() if num_processes is None else num_processes
+        self._executor = None
+        self._closed = False
+        if should_run_in_parallel(self._num_processes):
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._num_processes,
+                initializer=_initialize_pool_worker,
+                initargs=(pass_manager_bin, callback_bin),
+            )
+
+    @property
+    def num_processes(self) -> int:
+        """The maximum number of worker processes used by this pool."""
+        return self._num_processes
+
+    @property
+    def is_parallel(self) -> bool:
+        """Whether this pool runs programs in worker processes, rather than in serial."""
+        return self._executor is not None
+
+    def run(
+        self,
+        in_programs: Any | list[Any],
+        *,
+        property_set: dict[str, object] | None = None,
+        **kwargs,
+    ) -> Any:
+        """Run the pass manager of this pool on the specified ``in_programs``.
+
+        Args:
+            in_programs: Input programs to transform.  As in :meth:`BasePassManager.run`, a list
+                object is considered as multiple input objects.
+            property_set: If given, the initial value to use as the :class:`.PropertySet` for
+                each program.
+            kwargs: Arbitrary arguments passed to the compiler frontend and backend.  These must
+                be serializable with :mod:`pickle` if the pool is parallel.
+
+        Returns:
+            The transformed program(s).
+
+        Raises:
+            PassManagerError: if the pool has already been closed.
+        """
+        if self._closed:
+            raise PassManagerError("Cannot run programs on a closed worker pool.")
+        is_list = isinstance(in_programs, list)
+        programs = in_programs if is_list else [in_programs]
+        if self._executor is None or len(programs) == 1:
+            out = [
+                _run_workflow(
+                    program=program,
+                    pass_manager=self._pass_manager,
+                    callback=self._callback,
+                    initial_property_set=property_set,
+                    **kwargs,
+                )
+                for program in programs
+            ]
+        else:
+            out = list(
+                self._executor.map(
+                    functools.partial(
+                        _run_workflow_in_pool_worker,
+                        initial_property_set=property_set,
+                        kwargs=kwargs,
+                    ),
+                    programs,
+                )
+            )
+        return out if is_list else out[0]
+
+    def close(self) -> None:
+        """Shut down the worker processes of this pool.
+
+        This waits for any pending work to complete.  It is safe to call this method more than
+        once.
+        """
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# The pass manager and callback of a `PassManagerPool` worker process.  These are set once per
+# worker by `_initialize_pool_worker`.
+_POOL_WORKER_PASS_MANAGER = None
+_POOL_WORKER_CALLBACK = None
+
+
+def _initialize_pool_worker(pass_manager_bin: bytes, callback: bytes) -> None:
+    global _POOL_WORKER_PASS_MANAGER, _POOL_WORKER_CALLBACK  # noqa: PLW0603
+
+    # A pool worker must not attempt to start its own subprocesses.  Since the pool's workers may
+    # be started lazily, we set this in the worker itself rather than around the spawn in the
+    # parent, and clear any inherited cached decision.
+    os.environ["QISKIT_IN_PARALLEL"] = _IN_PARALLEL_FORBID_PARALLELISM
+    should_run_in_parallel.cache_clear()
+    _POOL_WORKER_PASS_MANAGER = dill.loads(pass_manager_bin)  # noqa: S301 Only used for IPC
+    _POOL_WORKER_CALLBACK = dill.loads(callback)  # noqa: S301 Only used for IPC
+
+
+def _run_workflow_in_pool_worker(
+    program: Any,
+    *,
+    initial_property_set: dict[str, object] | None,
+    kwargs: dict[str, Any],
+) -> Any:
+    return _run_workflow(
+        program=program,
+        pass_manager=_POOL_WORKER_PASS_MANAGER,
+        initial_property_set=initial_property_set,
+        callback=_POOL_WORKER_CALLBACK,
+        **kwargs,
+    )
+
+
+def _run_workflows_in_threads(
+    programs: list[Any],
+    pass_manager: BasePassManager,
+    *,
+    num_threads: int,
+    initial_property_set: dict[str, object] | None,
+    profiler: PassProfiler | None = None,
+    **kwargs,
+) -> list[Any]:
+    """Run each of several programs through a pass manager, using a pool of threads.
+
+    Args:
+        programs: The programs to optimize.
+        pass_manager: Pass manager with scheduled passes.  This is not modified; each thread works
+            on its own copy.
+        num_threads: The maximum number of threads to use.
+        initial_property_set: An optional dictionary to preseed the property set of each run with.
+        profiler: An optional profiler to record the runs with.
+        **kwargs: Keyword arguments for IR conversion.
+
+    Returns:
+        The optimized programs, in the same order as the input.
+    """
+    executor, get_pass_manager = _workflow_thread_pool(pass_manager, num_threads)
+
+    def run(program):
+        return _run_workflow(
+            program=program,
+            pass_manager=get_pass_manager(),
+            initial_property_set=initial_property_set,
+            profiler=profiler,
+            **kwargs,
+        )
+
+    with executor:
+        return list(executor.map(run, programs))
+
+
+def _workflow_thread_pool(
+    pass_manager: BasePassManager, num_threads: int
+) -> tuple[ThreadPoolExecutor, Callable[[], BasePassManager]]:
+    """Create a pool of threads that each work on their own copy of a pass manager.
+
+    Args:
+        pass_manager: The pass manager to copy into each thread.  Its shared objects are not
+            copied.
+        num_threads: The maximum number of threads to use.
+
+    Returns:
+        The pool, and a function that returns the copy of the pass manager belonging to the thread
+        it is called from.
+    """
+    shared = {id(obj): obj for obj in pass_manager._shared_objects()}
+    local = threading.local()
+
+    def initialize():
+        # Pre-seeding the `deepcopy` memo makes these objects be "copied" as themselves.
+        local.pass_manager = copy.deepcopy(pass_manager, dict(shared))
+
+    executor = ThreadPoolExecutor(max_workers=num_threads, initializer=initialize)
+    return executor, lambda: local.pass_manager
+
+
+def _iter_futures(
+    start: Callable[[], tuple[Executor, Callable[[Any], Future]]],
+    items: Iterable[Any],
+    max_in_flight: int,
+    ordered: bool,
+) -> Iterator[Any]:
+    """Yield the results of submitting each of ``items`` to an executor, with at most
+    ``max_in_flight`` items submitted but not yet yielded at any time.
+
+    ``start`` is called to create the executor, and a function that submits one item to it, only
+    once the first result is requested.  The executor is shut down when the iterator is exhausted
+    or closed; in the latter case, any work that has not started is cancelled.  An iterator that
+    is closed before it is started never creates an executor."""
+    executor, submit = start()
+    try:
+        if ordered:
+            pending = deque()
+            for item in items:
+                pending.append(submit(item))
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        else:
+            pending = set()
+            for item in items:
+                pending.add(submit(item))
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 def _run_workflow(
     program: Any,
     pass_manager: BasePassManager,
     *,
     initial_property_set: dict[str, object] | None = None,
+    profiler: PassProfiler | None = None,
     **kwargs,
 ) -> Any:
     """Run single program optimization with a pass manager.
@@ -295,6 +772,7 @@ def _run_workflow(
         pass_manager: Pass manager with scheduled passes.
         initial_property_set: An optional dictionary to preseed the
             property set in the pass manager with.
+        profiler: An optional profiler to record the run with.
         **kwargs: Keyword arguments for IR conversion.
 
     Returns:
@@ -314,7 +792,9 @@ def _run_workflow(
     passmanager_ir, final_state = flow_controller.execute(
         passmanager_ir=passmanager_ir,
         state=PassManagerState(
-            workflow_status=initial_status, property_set=pass_manager.property_set
+            workflow_status=initial_status,
+            property_set=pass_manager.property_set,
+            profiler=profiler,
         ),
         callback=kwargs.get("callback", None),
     )
@@ -339,6 +819,7 @@ def _run_workflow_in_new_process(
     program: Any,
     pass_manager_bin: bytes,
     *,
+    shared_bin: dict[str, bytes] | None = None,
     initial_property_set: dict[str, object] | None,
     callback: bytes,
 ) -> Any:
@@ -347,6 +828,8 @@ def _run_workflow_in_new_process(
     Args:
         program: Arbitrary program to optimize.
         pass_manager_bin: Binary of the pass manager with scheduled passes.
+        shared_bin: Binaries of the objects shared by the pass manager, keyed by their
+            identifiers, as returned by :func:`_dumps_with_shared_objects`.
         initial_property_set: An optional dictionary to preseed the
             property set in the pass manager with.
         callback: An optional callable that will be called after each pass
@@ -357,7 +840,73 @@ def _run_workflow_in_new_process(
     """
     return _run_workflow(
         program=program,
-        pass_manager=dill.loads(pass_manager_bin),  # noqa: S301 Only used for IPC
+        pass_manager=_loads_with_shared_objects(pass_manager_bin, shared_bin or {}),
         initial_property_set=initial_property_set,
         callback=dill.loads(callback),  # noqa: S301 Only used for IPC
     )
+
+
+# The shared objects most recently loaded by `_loads_with_shared_objects` in this process, keyed by
+# their identifiers.  A worker process typically runs several programs through the same pass
+# manager, so this lets it deserialize large shared objects (such as a `Target`) once only.
+_LOADED_SHARED_OBJECTS: dict[str, Any] = {}
+
+
+class _SharedObjectPickler(dill.Pickler):
+    def __init__(self, file, shared: dict[int, str]):
+        super().__init__(file)
+        self._shared = shared
+
+    def persistent_id(self, obj):
+        return self._shared.get(id(obj))
+
+
+class _SharedObjectUnpickler(dill.Unpickler):
+    def __init__(self, file, shared: dict[str, Any]):
+        super().__init__(file)
+        self._shared = shared
+
+    def persistent_load(self, pid):
+        return self._shared[pid]
+
+
+def _dumps_with_shared_objects(pass_manager: BasePassManager) -> tuple[bytes, dict[str, bytes]]:
+    """Serialize a pass manager, with each of its shared objects serialized separately.
+
+    Returns:
+        The serialized pass manager, in which the shared objects are replaced by references, and a
+        mapping of the identifiers of the shared objects to their serialized forms.
+    """
+    shared = {}
+    shared_bin = {}
+    for obj in pass_manager._shared_objects():
+        if id(obj) in shared:
+            continue
+        fingerprint = getattr(obj, "fingerprint", None)
+        key = (
+            f"{type(obj).__qualname__}:{fingerprint()}"
+            if callable(fingerprint)
+            else uuid.uuid4().hex
+        )
+        shared[id(obj)] = key
+        shared_bin[key] = dill.dumps(obj)
+    buffer = io.BytesIO()
+    _SharedObjectPickler(buffer, shared).dump(pass_manager)
+    return buffer.getvalue(), shared_bin
+
+
+def _loads_with_shared_objects(pass_manager_bin: bytes, shared_bin: dict[str, bytes]) -> Any:
+    """Deserialize a pass manager serialized by :func:`_dumps_with_shared_objects`, reusing any
+    shared objects already loaded in this process."""
+    loaded = {
+        key: (
+            _LOADED_SHARED_OBJECTS[key]
+            if key in _LOADED_SHARED_OBJECTS
+            else dill.loads(data)  # noqa: S301 Only used for IPC
+        )
+        for key, data in shared_bin.items()
+    }
+    # Only keep the objects of the most recent pass manager alive.
+    _LOADED_SHARED_OBJECTS.clear()
+    _LOADED_SHARED_OBJECTS.update(loaded)
+    return _SharedObjectUnpickler(io.BytesIO(pass_manager_bin), loaded).load()
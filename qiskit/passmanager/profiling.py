@@ -0,0 +1,285 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Recording of the time and memory used by each task of a pass manager run."""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import types
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows has no `resource` module.
+    resource = None
+
+
+@dataclasses.dataclass(frozen=True)
+class TaskProfile:
+    """The measurements of one execution of a task, or of one iteration of a looping flow
+    controller, recorded by a :class:`PassProfiler`."""
+
+    name: str
+    """The name of the task, or the class name of the flow controller."""
+
+    kind: str
+    """Either ``"task"`` for the execution of a single pass, or ``"iteration"`` for one iteration of
+    a looping flow controller, which covers the execution of all the tasks within it."""
+
+    start: float
+    """The wall-clock time at which the execution started, in seconds since the profiler was
+    created."""
+
+    wall_time: float
+    """The wall-clock time taken, in seconds."""
+
+    cpu_time: float
+    """The CPU time used by the whole process, in seconds.  This includes time spent in threads
+    started by the task, such as those of multithreaded native passes."""
+
+    peak_rss_delta: int | None
+    """The amount, in bytes, by which the peak resident set size of the process grew during the
+    execution.  This is zero if the execution did not use more memory than the previous peak, and
+    ``None`` on platforms where it cannot be measured."""
+
+    native: bool | None
+    """Whether the ``run`` method of the pass calls into Qiskit's compiled extension module, as
+    opposed to being implemented in Python only.  This is ``None`` for flow-controller
+    iterations."""
+
+    ir_before: dict[str, Any]
+    """Metrics of the IR before the execution, such as its size and depth."""
+
+    ir_after: dict[str, Any]
+    """Metrics of the IR after the execution."""
+
+    iteration: int | None
+    """The index of the iteration of a looping flow controller, or ``None`` for a task."""
+
+    count: int | None
+    """The index of this pass execution within the workflow, as in the ``count`` argument of
+    pass-manager callbacks.  This is ``None`` for iterations."""
+
+    thread: int
+    """The identifier of the thread the execution ran in."""
+
+
+class PassProfiler:
+    """Record the wall time, CPU time, memory growth and IR size of every task in pass-manager
+    runs.
+
+    Pass an instance of this class as the ``profiler`` argument of :meth:`.BasePassManager.run`
+    (or :meth:`.PassManager.run` in :mod:`qiskit.transpiler`), and it records a
+    :class:`TaskProfile` for every pass that runs, and for every iteration of a looping flow
+    controller such as :class:`.DoWhileController`.  The same profiler can be used for several
+    runs, and its records can be exported as JSON or in the Chrome trace-event format, which can
+    be loaded into ``chrome://tracing`` or `Perfetto <https://ui.perfetto.dev>`__::
+
+        from qiskit.passmanager import PassProfiler
+        from qiskit.transpiler import generate_preset_pass_manager
+
+        profiler = PassProfiler()
+        pm = generate_preset_pass_manager(optimization_level=3, backend=backend)
+        pm.run(circuits, profiler=profiler)
+        with open("transpile-trace.json", "w") as fd:
+            fd.write(profiler.to_chrome_trace())
+
+    Runs that are given a profiler do not use parallel processes, since the records would be lost
+    in the worker processes.  Runs on several threads (``executor="threads"``) are supported.
+
+    Args:
+        ir_metrics: How to measure the IR before and after each task.  If ``True`` (the default),
+            the ``size``, ``depth`` and ``num_qubits`` methods of the IR are called, if it has
+            them, which is the case for :class:`.DAGCircuit`.  The size and depth recurse into
+            control flow, and are ``None`` if they can't be evaluated, such as for a circuit with
+            a ``while`` loop.  If ``False``, the IR is not measured, which avoids the cost of
+            computing the depth twice per pass.  Otherwise, a callable that takes the IR and
+            returns a dictionary of JSON-serializable metrics.
+    """
+
+    def __init__(self, ir_metrics: bool | Callable[[Any], dict[str, Any]] = True):
+        if ir_metrics is True:
+            ir_metrics = _default_ir_metrics
+        elif ir_metrics is False:
+            ir_metrics = None
+        self._ir_metrics = ir_metrics
+        self._origin = time.perf_counter()
+        self._records = []
+        self._lock = threading.Lock()
+
+    @property
+    def records(self) -> list[TaskProfile]:
+        """The profiles recorded so far, in the order the executions finished."""
+        with self._lock:
+            return list(self._records)
+
+    def clear(self):
+        """Remove all the recorded profiles."""
+        with self._lock:
+            self._records.clear()
+
+    def to_dict(self) -> list[dict[str, Any]]:
+        """Get the recorded profiles as a list of dictionaries.
+
+        Returns:
+            One dictionary per :class:`TaskProfile`, with the same fields.
+        """
+        return [dataclasses.asdict(record) for record in self.records]
+
+    def to_json(self, **kwargs) -> str:
+        """Export the recorded profiles as JSON.
+
+        Args:
+            kwargs: Further arguments to :func:`json.dumps`, such as ``indent``.
+
+        Returns:
+            A JSON array with one object per :class:`TaskProfile`.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_chrome_trace(self, **kwargs) -> str:
+        """Export the recorded profiles in the Chrome trace-event format.
+
+        Each profile is a complete (``"X"``) event, whose ``args`` hold the measurements other
+        than the timings.
+
+        Args:
+            kwargs: Further arguments to :func:`json.dumps`, such as ``indent``.
+
+        Returns:
+            A JSON object in the trace-event format.
+        """
+        pid = os.getpid()
+        events = []
+        for record in self.records:
+            args = dataclasses.asdict(record)
+            for key in ("name", "kind", "start", "wall_time", "thread"):
+                del args[key]
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.kind,
+                    "ph": "X",
+                    "ts": record.start * 1e6,
+                    "dur": record.wall_time * 1e6,
+                    "pid": pid,
+                    "tid": record.thread,
+                    "args": args,
+                }
+            )
+        return json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}, **kwargs)
+
+    def _start(self, passmanager_ir=None):
+        ir_before = (
+            {}
+            if self._ir_metrics is None or passmanager_ir is None
+            else self._ir_metrics(passmanager_ir)
+        )
+        return (time.perf_counter(), time.process_time(), _peak_rss(), ir_before)
+
+    def _finish(
+        self, token, *, name, kind, native=None, passmanager_ir=None, iteration=None, count=None
+    ):
+        wall_start, cpu_start, rss_start, ir_before = token
+        wall_end, cpu_end, rss_end = time.perf_counter(), time.process_time(), _peak_rss()
+        ir_after = (
+            {}
+            if self._ir_metrics is None or passmanager_ir is None
+            else self._ir_metrics(passmanager_ir)
+        )
+        record = TaskProfile(
+            name=name,
+            kind=kind,
+            start=wall_start - self._origin,
+            wall_time=wall_end - wall_start,
+            cpu_time=cpu_end - cpu_start,
+            peak_rss_delta=None if rss_start is None else rss_end - rss_start,
+            native=native,
+            ir_before=ir_before,
+            ir_after=ir_after,
+            iteration=iteration,
+            count=count,
+            thread=threading.get_ident(),
+        )
+        with self._lock:
+            self._records.append(record)
+
+
+def _default_ir_metrics(passmanager_ir):
+    metrics = {}
+    for name in ("size", "depth", "num_qubits"):
+        method = getattr(passmanager_ir, name, None)
+        if callable(method):
+            metrics[name] = _measure(method, recurse=name != "num_qubits")
+    return metrics
+
+
+def _measure(method, recurse):
+    """Call an IR metric method, recursing into control flow if the method supports it.
+
+    The size and depth of a :class:`.DAGCircuit` with control flow are ambiguous without recursion,
+    and still fail to evaluate with some control flow (such as ``while`` loops) even with it.  A
+    metric that can't be evaluated is recorded as ``None``, rather than failing the pass."""
+    try:
+        if recurse:
+            try:
+                return method(recurse=True)
+            except TypeError:
+                # The IR is not a DAGCircuit, and its method takes no arguments.
+                pass
+        return method()
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+
+def _peak_rss():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports the peak in kilobytes, but macOS in bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@functools.cache
+def _is_native(task_type: type) -> bool:
+    """Whether the ``run`` method of a task type refers to any object from Qiskit's compiled
+    extension module."""
+    run = getattr(task_type, "run", None)
+    code = getattr(run, "__code__", None)
+    if code is None:
+        return False
+    namespace = run.__globals__
+    return any(_is_native_object(namespace.get(name)) for name in code.co_names)
+
+
+def _is_native_object(obj) -> bool:
+    if obj is None:
+        return False
+    # Functions of the extension module are bound to their submodule, which is registered under
+    # its full name in `sys.modules` even though its `__name__` is the short one.
+    module = obj if isinstance(obj, types.ModuleType) else getattr(obj, "__self__", None)
+    if isinstance(module, types.ModuleType):
+        name = module.__name__
+        return (
+            name.startswith("qiskit._accelerate")
+            or sys.modules.get(f"qiskit._accelerate.{name}") is module
+        )
+    module_name = getattr(obj, "__module__", None)
+    return isinstance(module_name, str) and module_name.startswith("qiskit._accelerate")
@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+import os
+import tempfile
 import typing
 import warnings
 import numpy as np
@@ -44,6 +46,7 @@ class SolovayKitaevDecomposition:
         basis_gates: list[str | Gate] | None = None,
         depth: int = 12,
         check_input: bool = False,
+        use_cache: bool = True,
     ) -> None:
         """
 
@@ -53,6 +56,15 @@ class SolovayKitaevDecomposition:
             to load the data. This is a potential security vulnerability and only trusted files
             should be loaded.
 
+        .. note::
+
+            Basic approximations generated from ``basis_gates`` and ``depth`` are stored in a
+            cache directory the first time they are built, and loaded from there by later
+            instances, including those in other processes.  The directory is given by the
+            ``QISKIT_SK_CACHE_DIR`` environment variable, and defaults to ``qiskit/solovay_kitaev``
+            in the user cache directory (``$XDG_CACHE_HOME``, or ``~/.cache``).  Setting the
+            environment variable to an empty string disables the cache.
+
         Args:
             basic_approximations: A specification of the basic SO(3) approximations in terms
                 of discrete gates. At each iteration of this algorithm, the remaining error is
@@ -72,11 +84,19 @@ class SolovayKitaevDecomposition:
                 sufficiently high.
             check_input: If ``True``, perform intermediate steps checking whether the matrices
                 are of expected form.
+            use_cache: If ``True``, load basic approximations generated from ``basis_gates`` and
+                ``depth`` from the cache directory, and store them there if they are not yet
+                cached. Has no effect if ``basic_approximations`` is given.
         """
         if basic_approximations is None:
             if basis_gates is not None:
                 basis_gates = normalize_gates(basis_gates)
-            self._sk = RustSolovayKitaevSynthesis(basis_gates, depth, None, check_input)
+            cache_file = _cache_file(basis_gates, depth) if use_cache else None
+            self._sk = _load_cached(cache_file, check_input)
+            if self._sk is None:
+                self._sk = RustSolovayKitaevSynthesis(basis_gates, depth, None, check_input)
+                if cache_file is not None:
+                    _store_cached(self._sk, cache_file)
 
         elif basis_gates is not None:
             raise ValueError(
@@ -270,6 +290,60 @@ class SolovayKitaevDecomposition:
         return self._sk.find_basic_approximation(sequence)
 
 
+def _cache_dir() -> str | None:
+    """The directory of cached basic approximations, or ``None`` if caching is disabled."""
+    cache_dir = os.environ.get("QISKIT_SK_CACHE_DIR")
+    if cache_dir is not None:
+        return cache_dir or None
+    user_cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(user_cache, "qiskit", "solovay_kitaev")
+
+
+def _cache_file(basis_gates: list[Gate] | None, depth: int) -> str | None:
+    """The path of the cached basic approximations for ``basis_gates`` and ``depth``."""
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return None
+    names = ["h", "t", "tdg"] if basis_gates is None else [gate.name for gate in basis_gates]
+    # The version of the file format is part of the name, so that files in an old format are
+    # regenerated rather than loaded through the slower legacy path.
+    return os.path.join(cache_dir, f"{'_'.join(names)}-depth{depth}-v2.bin")
+
+
+def _load_cached(cache_file: str | None, check_input: bool) -> RustSolovayKitaevSynthesis | None:
+    """Load cached basic approximations, or return ``None`` if they are not (validly) cached."""
+    if cache_file is None or not os.path.isfile(cache_file):
+        return None
+    try:
+        return RustSolovayKitaevSynthesis.from_basic_approximations(cache_file, check_input)
+    except RuntimeError:
+        # A corrupted file is regenerated and overwritten.
+        return None
+
+
+def _store_cached(sk: RustSolovayKitaevSynthesis, cache_file: str) -> None:
+    """Store basic approximations in the cache, ignoring failures to write to it.
+
+    The file is written under a temporary name and then moved into place, so that concurrent
+    processes populating the cache never read a partially written file.
+    """
+    cache_dir = os.path.dirname(cache_file)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        os.close(fd)
+    except OSError:
+        return
+    try:
+        sk.save_basic_approximations(tmp_file)
+        os.replace(tmp_file, cache_file)
+    except (OSError, RuntimeError):
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+
+
 def normalize_gates(gates: list[Gate | str]) -> list[Gate]:
     """Normalize a list[Gate | str] into list[Gate]."""
     name_to_gate = get_standard_gate_name_mapping()
@@ -146,6 +146,7 @@ The synthesis transpiler plugin documentation can be found in the
    LinearFunctionsToPermutations
    SolovayKitaev
    SynthesizeRZRotations
+   RZSynthesisCacheInfo
    UnitarySynthesis
 
 Post Layout
@@ -157,6 +158,7 @@ These are post qubit selection.
    :toctree: ../stubs/
 
    VF2PostLayout
+   VF2PostLayoutCache
 
 Additional Passes
 =================
@@ -18,7 +18,7 @@ from .dense_layout import DenseLayout
 from .sabre_layout import SabreLayout
 from .csp_layout import CSPLayout
 from .vf2_layout import VF2Layout
-from .vf2_post_layout import VF2PostLayout
+from .vf2_post_layout import VF2PostLayout, VF2PostLayoutCache
 from .apply_layout import ApplyLayout
 from .layout_2q_distance import Layout2qDistance
 from .enlarge_with_ancilla import EnlargeWithAncilla
@@ -38,4 +38,5 @@ __all__ = [
     "TrivialLayout",
     "VF2Layout",
     "VF2PostLayout",
+    "VF2PostLayoutCache",
 ]
@@ -90,6 +90,10 @@ class SabreLayout(TransformationPass):
     ``final_layout`` (:class:`.Layout`)
         A permutation of how swaps have been applied to the input qubits at the end of the circuit.
 
+    ``sabre_layout_trials_completed`` (``int``)
+        The number of layout trials that were completed.  This is less than the number of trials
+        requested if the ``time_limit`` ran out.
+
     **References:**
 
     [1] Henry Zou and Matthew Treinish and Kevin Hartman and Alexander Ivrii and Jake Lishman.
@@ -109,6 +113,9 @@ class SabreLayout(TransformationPass):
         swap_trials=None,
         layout_trials=None,
         skip_routing=False,
+        time_limit=None,
+        lazy_distance=None,
+        error_weight=None,
     ):
         """SabreLayout initializer.
 
@@ -147,10 +154,36 @@ class SabreLayout(TransformationPass):
                 will be set in the property set. This is a tradeoff to run custom
                 routing with multiple layout trials, as using this option will cause
                 SabreLayout to run the routing stage internally but not use that result.
+            time_limit (float): An optional budget, in seconds, for the layout and routing trials.
+                Once it is spent, no further trials are started and the running trials stop
+                refining their layouts, and the best result found so far is used.  The first
+                trial is always completed, so the pass can take longer than this if a single
+                trial does.  The number of trials that were completed is written to the
+                ``sabre_layout_trials_completed`` field of the property set.  Since the number of
+                trials depends on the speed of the machine, the output is not reproducible when
+                this is set, even with a fixed ``seed``.  This option is mutually exclusive with
+                the ``routing_pass`` argument.
+            lazy_distance (bool): If ``True``, the distances between physical qubits are computed
+                on demand during layout and routing, and a bounded number of them are cached,
+                rather than computing the dense matrix of all distances up front.  This saves
+                memory and setup time for devices with thousands of qubits, but it also skips the
+                layout trial seeded by :class:`.DenseLayout`, which needs the dense matrix.  If
+                ``False``, the dense matrix is always used.  If not specified, the distances are
+                computed on demand for devices with more than 4096 qubits.
+            error_weight (float): If given, the distances between physical qubits that the layout
+                and routing heuristic minimizes are weighted by the error rates of the two-qubit
+                operations in the :class:`.Target`, so that the output prefers the better couplers.
+                Each coupler costs ``1 + error_weight * c / c_mean`` rather than one, where ``c``
+                is the negative log of the fidelity of the best two-qubit operation on it, and
+                ``c_mean`` is the mean of that over all couplers.
+                This needs the dense distance matrix, so cannot be used with
+                ``lazy_distance=True``, and is mutually exclusive with the ``routing_pass``
+                argument.
 
         Raises:
             TranspilerError: If both ``routing_pass`` and ``swap_trials`` or
-            both ``routing_pass`` and ``layout_trials`` are specified
+                both ``routing_pass`` and ``layout_trials`` are specified, or if ``time_limit``
+                or ``error_weight`` is negative.
         """
         super().__init__()
         if isinstance(coupling_map, Target) and not isinstance(coupling_map, _FakeTarget):
@@ -170,16 +203,30 @@ class SabreLayout(TransformationPass):
             self._coupling_map = coupling_map
             if self._coupling_map is not None:
                 self._coupling_map.make_symmetric()
-        if routing_pass is not None and (swap_trials is not None or layout_trials is not None):
+        if routing_pass is not None and (
+            swap_trials is not None
+            or layout_trials is not None
+            or time_limit is not None
+            or error_weight is not None
+        ):
             raise TranspilerError(
-                "The 'routing_pass' argument cannot be set alongside 'swap_trials' or 'layout_trials'."
+                "The 'routing_pass' argument cannot be set alongside 'swap_trials',"
+                " 'layout_trials', 'time_limit' or 'error_weight'."
             )
+        if time_limit is not None and not time_limit >= 0:
+            raise TranspilerError(f"The time limit must be non-negative, not {time_limit}.")
+        if error_weight is not None and not error_weight >= 0:
+            raise TranspilerError(f"The error weight must be non-negative, not {error_weight}.")
         self.routing_pass = routing_pass
         self.seed = seed
         self.max_iterations = max_iterations
         self.swap_trials = default_num_processes() if swap_trials is None else swap_trials
         self.layout_trials = default_num_processes() if layout_trials is None else layout_trials
         self.skip_routing = skip_routing
+        self.time_limit = time_limit
+        self.lazy_distance = lazy_distance
+        self.error_weight = error_weight
+        self._target_fingerprint = None
 
     @property
     def coupling_map(self):
@@ -271,9 +318,14 @@ class SabreLayout(TransformationPass):
             .with_lookahead([0.5 / self.target.num_qubits], SetScaling.Constant)
             .with_decay(0.001, 5)
         )
+        if self.error_weight is not None:
+            heuristic = heuristic.with_error(self.error_weight)
+        if self._target_fingerprint is None:
+            # The target is fixed for the lifetime of the pass, so it only needs hashing once.
+            self._target_fingerprint = self.target.fingerprint()
         sabre_start = time.perf_counter()
         # If `skip_routing`, then `out_dag` and `final` are meaningless but well-typed.
-        out_dag, initial, final = sabre_layout_and_routing(
+        out_dag, initial, final, trials_completed = sabre_layout_and_routing(
             dag,
             self.target,
             heuristic,
@@ -283,12 +335,16 @@ class SabreLayout(TransformationPass):
             seed=self.seed,
             partial_layouts=starting_layouts,
             skip_routing=self.skip_routing,
+            time_limit=self.time_limit,
+            lazy_distance=self.lazy_distance,
+            target_fingerprint=self._target_fingerprint,
         )
         sabre_stop = time.perf_counter()
         logger.debug(
             "Sabre layout algorithm execution for all components complete in: %s sec.",
             sabre_stop - sabre_start,
         )
+        self.property_set["sabre_layout_trials_completed"] = trials_completed
 
         if self.skip_routing:
             virtuals = list(dag.qubits)
@@ -80,6 +80,7 @@ class VF2Layout(AnalysisPass):
         time_limit=None,
         max_trials=None,
         target=None,
+        parallel=False,
     ):
         """Initialize a ``VF2Layout`` pass instance
 
@@ -112,6 +113,13 @@ class VF2Layout(AnalysisPass):
                 of ``target`` models an ideal backend without any constraints then the value of
                 ``coupling_map``
                 will be used.
+            parallel (bool): If ``True``, search the branches of the root of the VF2 search tree
+                on multiple threads.  ``call_limit`` and ``max_trials`` still limit the whole
+                search, but the branches searched at the same time each take a share of what is
+                left of the call limit, so the searches explore different parts of the space when
+                the limits are reached.  The result is the same as the serial search if none of the
+                limits are reached, and is deterministic and independent of the number of threads
+                unless ``max_trials`` is reached.
 
         Raises:
             TypeError: At runtime, if neither ``coupling_map`` or ``target`` are provided.
@@ -124,6 +132,7 @@ class VF2Layout(AnalysisPass):
         self.call_limit = call_limit
         self.time_limit = time_limit
         self.max_trials = max_trials
+        self.parallel = parallel
         self.avg_error_map = None
 
     def run(self, dag):
@@ -150,6 +159,7 @@ class VF2Layout(AnalysisPass):
             max_trials=self.max_trials,
             shuffle_seed=self.seed,
             score_initial_layout=False,
+            parallel=self.parallel,
         )
         try:
             output = vf2_layout_pass_average(
@@ -13,8 +13,12 @@
 
 """VF2PostLayout pass to find a layout after transpile using subgraph isomorphism"""
 
+import collections
+import hashlib
+import threading
 from enum import Enum
 
+from qiskit.circuit import ControlFlowOp
 from qiskit.transpiler.layout import Layout
 from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.transpiler.exceptions import TranspilerError
@@ -35,6 +39,79 @@ class VF2PostLayoutStopReason(Enum):
     MORE_THAN_2Q = ">2q gates in basis"
 
 
+class VF2PostLayoutCache:
+    """A cache of the results of :class:`.VF2PostLayout`, for circuits with the same interactions.
+
+    Variational workloads typically compile many circuits that differ only in the angles of their
+    gates, so :class:`.VF2PostLayout` repeatedly solves the same layout problem.  Pass an instance
+    of this class as the ``cache`` argument of several :class:`.VF2PostLayout` instances (or to the
+    same instance for several runs) to reuse the result of an earlier run on a circuit with the
+    same interactions, instead of repeating the search::
+
+        from qiskit.transpiler.passes import VF2PostLayout, VF2PostLayoutCache
+
+        cache = VF2PostLayoutCache()
+        vf2_post_layout = VF2PostLayout(target=backend.target, seed=42, cache=cache)
+
+    A result is reused if the circuit has the same number of qubits, and the same number of each
+    operation on each tuple of qubits, including those in control-flow blocks, and the pass has
+    the same options, and the :class:`.Target` has the same :meth:`~.Target.fingerprint`.  Each pass
+    takes the fingerprint of its target once, so a target should not be modified after it is given
+    to a pass that uses a cache.  The parameters of the operations are not part of the key, since they do not affect the score of a
+    layout.  The circuit is compared in terms of the physical qubits it currently uses, since the
+    current layout is the baseline that the pass tries to improve upon.
+
+    Results are not cached for runs that use a ``vf2_avg_error_map`` from the property set, or that
+    set a ``time_limit``, since their results are not determined by the key.
+
+    Entries are held up to ``max_size``, after which the least recently used entry is evicted.
+
+    Args:
+        max_size: The maximum number of results to hold.
+
+    Raises:
+        ValueError: If ``max_size`` is less than 1.
+    """
+
+    def __init__(self, max_size: int = 128):
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, not {max_size}")
+        self.max_size = max_size
+        self.hits = 0
+        """The number of runs that reused a cached result."""
+        self.misses = 0
+        """The number of runs that did not find a cached result."""
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all entries, and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
 class VF2PostLayout(AnalysisPass):
     """A pass for improving an existing Layout after transpilation of a circuit onto a
     Coupling graph, as a subgraph isomorphism problem, solved by VF2++.
@@ -81,6 +158,11 @@ class VF2PostLayout(AnalysisPass):
     supported by the target. This will be used for scoring if it's set as the
     ``vf2_avg_error_map`` key in the property set when :class:`~.VF2PostLayout`
     is run.
+
+    If the pass is given a :class:`.VF2PostLayoutCache`, it reuses the result of an earlier run on
+    a circuit with the same interactions and the same target, rather than searching again.  In
+    that case, ``property_set['VF2PostLayout_cache_hit']`` is set to whether the result was taken
+    from the cache, and the cache itself holds the cumulative number of hits and misses.
     """
 
     def __init__(
@@ -91,6 +173,8 @@ class VF2PostLayout(AnalysisPass):
         time_limit=None,
         strict_direction=True,
         max_trials=0,
+        parallel=False,
+        cache=None,
     ):
         """Initialize a ``VF2PostLayout`` pass instance
 
@@ -112,6 +196,15 @@ class VF2PostLayout(AnalysisPass):
                 the target set of instructions.
             max_trials (int): The maximum number of trials to run VF2 to find
                 a layout. A value of ``0`` (the default) means 'unlimited'.
+            parallel (bool): If ``True``, search the branches of the root of the VF2 search tree
+                on multiple threads.  ``call_limit`` and ``max_trials`` still limit the whole
+                search, but the branches searched at the same time each take a share of what is
+                left of the call limit, so the searches explore different parts of the space when
+                the limits are reached.  The result is the same as the serial search if none of the
+                limits are reached, and is deterministic and independent of the number of threads
+                unless ``max_trials`` is reached.
+            cache (VF2PostLayoutCache): A cache of results to reuse between runs on circuits with
+                the same interactions.  If ``None`` (the default), the search always runs.
 
         Raises:
             TypeError: At runtime, if ``target`` isn't provided.
@@ -123,19 +216,37 @@ class VF2PostLayout(AnalysisPass):
         self.max_trials = max_trials
         self.seed = seed
         self.strict_direction = strict_direction
+        self.parallel = parallel
+        self.cache = cache
         self.avg_error_map = None
+        self._target_fingerprint = None
 
     def run(self, dag):
         """run the layout method"""
         if self.target is None:
             raise TranspilerError("A target must be specified")
         self.avg_error_map = self.property_set["vf2_avg_error_map"]
+        cache_key = None
+        if self.cache is not None and self.avg_error_map is None and self.time_limit is None:
+            cache_key = self._cache_key(dag)
+            if (entry := self.cache._get(cache_key)) is not None:
+                self.property_set["VF2PostLayout_cache_hit"] = True
+                self._set_result(dag, *entry)
+                return
+            self.property_set["VF2PostLayout_cache_hit"] = False
+        stop_reason, mapping = self._search(dag)
+        if cache_key is not None:
+            self.cache._put(cache_key, (stop_reason, mapping))
+        self._set_result(dag, stop_reason, mapping)
+
+    def _search(self, dag):
         config = VF2PassConfiguration.from_legacy_api(
             call_limit=self.call_limit,
             time_limit=self.time_limit,
             max_trials=self.max_trials,
             shuffle_seed=self.seed,
             score_initial_layout=True,
+            parallel=self.parallel,
         )
         try:
             if self.strict_direction:
@@ -149,20 +260,57 @@ class VF2PostLayout(AnalysisPass):
                     config=config,
                 )
         except MultiQEncountered:
-            self.property_set["VF2PostLayout_stop_reason"] = VF2PostLayoutStopReason.MORE_THAN_2Q
-            return
+            return VF2PostLayoutStopReason.MORE_THAN_2Q, None
         if not output.has_solution:
-            self.property_set["VF2PostLayout_stop_reason"] = (
-                VF2PostLayoutStopReason.NO_SOLUTION_FOUND
-            )
-            return
-        if dag.is_empty() or (layout := output.new_mapping()) is None:
-            self.property_set["VF2PostLayout_stop_reason"] = (
-                VF2PostLayoutStopReason.NO_BETTER_SOLUTION_FOUND
-            )
+            return VF2PostLayoutStopReason.NO_SOLUTION_FOUND, None
+        if dag.is_empty() or (mapping := output.new_mapping()) is None:
+            return VF2PostLayoutStopReason.NO_BETTER_SOLUTION_FOUND, None
+        return VF2PostLayoutStopReason.SOLUTION_FOUND, dict(mapping.items())
+
+    def _set_result(self, dag, stop_reason, mapping):
+        self.property_set["VF2PostLayout_stop_reason"] = stop_reason
+        if mapping is None:
             return
-        self.property_set["VF2PostLayout_stop_reason"] = VF2PostLayoutStopReason.SOLUTION_FOUND
-        layout = Layout({dag.qubits[virt]: phys for virt, phys in layout.items()})
+        layout = Layout({dag.qubits[virt]: phys for virt, phys in mapping.items()})
         for reg in dag.qregs.values():
             layout.add_register(reg)
         self.property_set["post_layout"] = layout
+
+    def _cache_key(self, dag):
+        hasher = hashlib.sha256()
+        hasher.update(
+            repr(
+                (
+                    self.seed,
+                    self.call_limit,
+                    self.max_trials,
+                    self.strict_direction,
+                    self.parallel,
+                    dag.num_qubits(),
+                )
+            ).encode()
+        )
+        if self._target_fingerprint is None:
+            # Like the rest of the configuration, the target is fixed for the lifetime of the pass.
+            self._target_fingerprint = self.target.fingerprint()
+        hasher.update(self._target_fingerprint.encode())
+        counts = collections.Counter()
+        _count_interactions(
+            ((node.op, node.qargs) for node in dag.op_nodes()),
+            {bit: i for i, bit in enumerate(dag.qubits)},
+            counts,
+        )
+        hasher.update(repr(sorted(counts.items())).encode())
+        return hasher.digest()
+
+
+def _count_interactions(instructions, wire_map, counts):
+    for operation, qubits in instructions:
+        counts[(operation.name, tuple(wire_map[bit] for bit in qubits))] += 1
+        if isinstance(operation, ControlFlowOp):
+            for block in operation.blocks:
+                _count_interactions(
+                    ((inst.operation, inst.qubits) for inst in block.data),
+                    {inner: wire_map[outer] for outer, inner in zip(qubits, block.qubits)},
+                    counts,
+                )
@@ -125,6 +125,7 @@ class BackwardMatch:
         qubits,
         clbits=None,
         heuristics_backward_param=None,
+        search_budget=None,
     ):
         """
         Create a ForwardMatch class with necessary arguments.
@@ -138,6 +139,8 @@ class BackwardMatch:
             clbits (list): list of considered clbits in the circuit.
             heuristics_backward_param (list): list that contains the two parameters for
             applying the heuristics (length and survivor).
+            search_budget (int): maximal number of scenarios that are extended, after which the
+            remaining scenarios are stored as they are. If ``None``, there is no limit.
         """
         self.circuit_dag_dep = circuit_dag_dep.copy()
         self.template_dag_dep = template_dag_dep.copy()
@@ -150,6 +153,7 @@ class BackwardMatch:
         self.heuristics_backward_param = (
             heuristics_backward_param if heuristics_backward_param is not None else []
         )
+        self.search_budget = search_budget
         self.matching_list = MatchingScenariosList()
 
     def _gate_indices(self):
@@ -393,6 +397,9 @@ class BackwardMatch:
 
         counter = 1
 
+        # Number of scenarios that have been extended, for the search budget.
+        extended = 0
+
         # Initialize the list of attributes matchedwith and isblocked.
         (
             circuit_matched,
@@ -448,15 +455,18 @@ class BackwardMatch:
 
             # Matches are stored if the counter is bigger than the length of the list of
             # candidates in the circuit. Or if number of gate left to match is the same as
-            # the length of the backward part of the match.
+            # the length of the backward part of the match. Or if the search budget is exhausted.
             if (
-                counter_scenario > len(gate_indices)
+                (self.search_budget is not None and extended >= self.search_budget)
+                or counter_scenario > len(gate_indices)
                 or len(match_backward) == number_of_gate_to_match
             ):
                 matches_scenario.sort(key=lambda x: x[0])
                 match_store_list.append(Match(matches_scenario, self.qubits, self.clbits))
                 continue
 
+            extended += 1
+
             # First circuit candidate.
             circuit_id = gate_indices[counter_scenario - 1]
             node_circuit = self.circuit_dag_dep.get_node(circuit_id)
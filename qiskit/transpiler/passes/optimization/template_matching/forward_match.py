@@ -146,7 +146,7 @@ class ForwardMatch:
                 if dir_succ not in matches:
                     succ = self.template_dag_dep.successors(dir_succ)
                     block = block + succ
-        self.candidates = list(
+        self.candidates = sorted(
             set(self.template_dag_dep.direct_successors(node_id_t)) - set(matches) - set(block)
         )
 
@@ -24,10 +24,46 @@ Exact and practical pattern matching for quantum circuit optimization.
 """
 
 import itertools
+from collections import defaultdict
+
+import numpy as np
 
 from qiskit.circuit.controlledgate import ControlledGate
 from qiskit.transpiler.passes.optimization.template_matching.forward_match import ForwardMatch
-from qiskit.transpiler.passes.optimization.template_matching.backward_match import BackwardMatch
+from qiskit.transpiler.passes.optimization.template_matching.backward_match import (
+    BackwardMatch,
+    Match,
+)
+from qiskit._accelerate.template_matching import MatchingGraph
+from qiskit._accelerate.template_matching import template_matching as template_matching_rs
+
+# Gates which are symmetric in their qubits.
+_SYMMETRIC_GATES = frozenset(("rxx", "ryy", "rzz", "swap", "iswap", "ms"))
+
+
+def _matching_graph(dag_dep):
+    """Build the graph of a DAGDependency that the native template matching works on."""
+    qargs = []
+    controls = []
+    symmetric = []
+    direct_successors = []
+    for node in dag_dep.get_nodes():
+        qargs.append(node.qindices)
+        if isinstance(node.op, ControlledGate):
+            controls.append(node.op.num_ctrl_qubits)
+            symmetric.append(node.op.base_gate.name in _SYMMETRIC_GATES)
+        else:
+            controls.append(None)
+            symmetric.append(node.op.name in _SYMMETRIC_GATES)
+        direct_successors.append(dag_dep.direct_successors(node.node_id))
+    return MatchingGraph(
+        len(dag_dep.qubits),
+        len(dag_dep.clbits),
+        qargs,
+        controls,
+        symmetric,
+        direct_successors,
+    )
 
 
 class TemplateMatching:
@@ -41,6 +77,7 @@ class TemplateMatching:
         template_dag_dep,
         heuristics_qubits_param=None,
         heuristics_backward_param=None,
+        search_budget=None,
     ):
         """
         Create a TemplateMatching object with necessary arguments.
@@ -49,6 +86,8 @@ class TemplateMatching:
             template_dag_dep (QuantumCircuit): template.
             heuristics_backward_param (list[int]): [length, survivor]
             heuristics_qubits_param (list[int]): [length]
+            search_budget (int): maximal number of scenarios extended by the backward part of
+                the algorithm for each initial match and qubit configuration.
         """
         self.circuit_dag_dep = circuit_dag_dep
         self.template_dag_dep = template_dag_dep
@@ -59,6 +98,7 @@ class TemplateMatching:
         self.heuristics_backward_param = (
             heuristics_backward_param if heuristics_backward_param is not None else []
         )
+        self.search_budget = search_budget
 
     def _list_first_match_new(self, node_circuit, node_template, n_qubits_t, n_clbits_t):
         """
@@ -203,7 +243,7 @@ class TemplateMatching:
         counter = 1
         qubit_set = set(self.circuit_dag_dep.get_node(node_id_c).qindices)
         if 2 * len(successors_template) > len(template_nodes):
-            successors = self.circuit_dag_dep.get_node(node_id_c).successors
+            successors = sorted(self.circuit_dag_dep.get_node(node_id_c).successors)
             for succ in successors:
                 qarg = self.circuit_dag_dep.get_node(succ).qindices
                 if (len(qubit_set | set(qarg))) <= n_qubits_t and counter <= length:
@@ -214,7 +254,7 @@ class TemplateMatching:
             return list(qubit_set)
 
         else:
-            not_successors = list(
+            not_successors = sorted(
                 set(circuit_nodes) - set(self.circuit_dag_dep.get_node(node_id_c).successors)
             )
             candidate = [
@@ -231,6 +271,26 @@ class TemplateMatching:
                     return list(qubit_set)
             return list(qubit_set)
 
+    def _compatibility_matrix(self):
+        """
+        Compare the operations of all the nodes of the circuit and of the template.
+        Returns:
+            np.ndarray: boolean matrix whose entry (i, j) is True if the operation of the node i
+            of the circuit matches the operation of the node j of the template.
+        """
+        compatible = np.zeros(
+            (self.circuit_dag_dep.size(), self.template_dag_dep.size()), dtype=bool
+        )
+        template_nodes = defaultdict(list)
+        for node in self.template_dag_dep.get_nodes():
+            template_nodes[node.op.name].append(node)
+        for node_circuit in self.circuit_dag_dep.get_nodes():
+            for node_template in template_nodes.get(node_circuit.op.name, ()):
+                compatible[node_circuit.node_id, node_template.node_id] = (
+                    node_circuit.op.soft_compare(node_template.op)
+                )
+        return compatible
+
     def run_template_matching(self):
         """
         Run the complete algorithm for finding all maximal matches for the given template and
@@ -239,6 +299,39 @@ class TemplateMatching:
         qubit configurations, we apply first the Forward part of the algorithm  and then
         the Backward part of the algorithm. The longest matches for the given configuration
         are stored. Finally, the list of stored matches is sorted.
+
+        The search is run natively, from all the initial matches in parallel. It finds the
+        same matches as running :class:`.ForwardMatch` and :class:`.BackwardMatch` for each
+        initial match and qubit configuration. The native search only assigns qubits, so a
+        template with clbits is matched in Python, which also fixes its clbit configuration.
+        """
+        if self.template_dag_dep.clbits:
+            self._run_template_matching_python()
+            return
+        found = template_matching_rs(
+            _matching_graph(self.circuit_dag_dep),
+            _matching_graph(self.template_dag_dep),
+            self._compatibility_matrix(),
+            heuristics_qubits=(
+                self.heuristics_qubits_param[0] if self.heuristics_qubits_param else None
+            ),
+            heuristics_backward=(
+                tuple(self.heuristics_backward_param[:2])
+                if self.heuristics_backward_param
+                else None
+            ),
+            search_budget=self.search_budget,
+        )
+        self.match_list = []
+        for match, qubits in found:
+            match_obj = Match(match, qubits[0], [])
+            match_obj.qubit = qubits
+            self.match_list.append(match_obj)
+
+    def _run_template_matching_python(self):
+        """
+        Run the complete algorithm for finding all maximal matches in Python, with
+        :class:`.ForwardMatch` and :class:`.BackwardMatch`.
         """
 
         # Get the number of qubits/clbits for both circuit and template.
@@ -332,6 +425,7 @@ class TemplateMatching:
                                                     list_qubit_circuit,
                                                     list_clbit_circuit,
                                                     self.heuristics_backward_param,
+                                                    self.search_budget,
                                                 )
 
                                                 backward.run_backward_match()
@@ -359,6 +453,7 @@ class TemplateMatching:
                                             list_qubit_circuit,
                                             [],
                                             self.heuristics_backward_param,
+                                            self.search_budget,
                                         )
                                         backward.run_backward_match()
 
@@ -50,6 +50,7 @@ class TemplateOptimization(TransformationPass):
         heuristics_qubits_param=None,
         heuristics_backward_param=None,
         user_cost_dict=None,
+        search_budget=None,
     ):
         """
         Args:
@@ -71,6 +72,11 @@ class TemplateOptimization(TransformationPass):
             user_cost_dict (Dict[str, int]): quantum cost dictionary passed to TemplateSubstitution
                 to configure its behavior. This will override any default values if None
                 is not given. The key is the name of the gate and the value its quantum cost.
+            search_budget (int): The maximal number of matching scenarios that the backward part
+                of the algorithm extends, for each initial match and qubit configuration. The
+                scenarios that are left once it is exhausted are kept as they are, so the budget
+                bounds the time spent on each match at the cost of possibly shorter matches. By
+                default, the search is exhaustive.
         """
         super().__init__()
         # If no template is given; the templates are set as x-x, cx-cx, ccx-ccx.
@@ -85,6 +91,7 @@ class TemplateOptimization(TransformationPass):
         )
 
         self.user_cost_dict = user_cost_dict
+        self.search_budget = search_budget
 
     def run(self, dag):
         """
@@ -132,6 +139,7 @@ class TemplateOptimization(TransformationPass):
                 template_dag_dep,
                 self.heuristics_qubits_param,
                 self.heuristics_backward_param,
+                self.search_budget,
             )
 
             template_m.run_template_matching()
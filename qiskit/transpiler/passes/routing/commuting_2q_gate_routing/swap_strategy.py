@@ -18,6 +18,7 @@ import numpy as np
 
 from qiskit.exceptions import QiskitError
 from qiskit.transpiler.coupling import CouplingMap
+from qiskit._accelerate.commuting_2q_gate_router import swap_strategy_distance_matrix
 
 
 class SwapStrategy:
@@ -173,19 +174,9 @@ class SwapStrategy:
             obtain a connection between physical qubits i and j.
         """
         if self._distance_matrix is None:
-            self._distance_matrix = np.full((self._num_vertices, self._num_vertices), -1, dtype=int)
-
-            for i in range(self._num_vertices):
-                self._distance_matrix[i, i] = 0
-
-            for i in range(len(self._swap_layers) + 1):
-                for j, k in self.swapped_coupling_map(i).get_edges():
-
-                    # This if ensures that the smallest distance is used.
-                    if self._distance_matrix[j, k] == -1:
-                        self._distance_matrix[j, k] = i
-                        self._distance_matrix[k, j] = i
-
+            self._distance_matrix = swap_strategy_distance_matrix(
+                self._num_vertices, list(self._coupling_map.get_edges()), self._swap_layers
+            )
             self._distance_matrix.setflags(write=False)
 
         return self._distance_matrix
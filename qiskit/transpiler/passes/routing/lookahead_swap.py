@@ -12,39 +12,14 @@
 
 """Map input circuit onto a backend topology via insertion of SWAPs."""
 
-import collections
-import copy
-import logging
-import math
+import numpy as np
 
-from qiskit.circuit.library.standard_gates import SwapGate
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.layout import Layout
-from qiskit.dagcircuit import DAGOpNode
 from qiskit.transpiler.target import Target
 from qiskit.transpiler.passes.layout import disjoint_utils
-
-logger = logging.getLogger(__name__)
-
-
-_Step = collections.namedtuple("_Step", ("state", "swaps_added", "gates_mapped", "gates_remaining"))
-"""Describes one possible step in the lookahead process.
-
-The fields are:
-
-    state (_SystemState): The current state of the system, including its virtual-to-physical layout.
-    swaps_added (list): List of qargs of swap gates introduced.
-    gates_mapped (list): Gates that were mapped, including added SWAPs.
-    gates_remaining (list): Gates that could not be mapped.
-"""
-
-_SystemState = collections.namedtuple(
-    "_SystemState",
-    ("layout", "coupling_map", "register", "swaps"),
-    # The None default applies to the right-most element, i.e. `swaps`.
-    defaults=(None,),
-)
+from qiskit._accelerate import lookahead_swap
 
 
 class LookaheadSwap(TransformationPass):
@@ -68,7 +43,8 @@ class LookaheadSwap(TransformationPass):
       layout and mark them as mapped.
     - For all possible SWAP gates, calculate the layout that would result from their
       application and rank them according to the distance of the resulting layout
-      over upcoming gates (see _calc_layout_distance.)
+      over upcoming gates (the sum of the coupling-map distances between the qubits of
+      each upcoming two-qubit gate.)
     - For the four (search_width) highest-ranking SWAPs, repeat the above process on
       the layout that would be generated if they were applied.
     - Repeat this process down to a depth of four (search_depth) SWAPs away from the
@@ -135,260 +111,30 @@ class LookaheadSwap(TransformationPass):
         )
 
         register = dag.qregs["q"]
-        current_state = _SystemState(
-            Layout.generate_trivial_layout(register), self.coupling_map, register
+        # Include symmetric couplings (e.g [0,1] and [1,0]) as one swap.  Swaps with equal scores
+        # are tried in the order of this set.
+        swaps = {((a, b) if a < b else (b, a)) for a, b in self.coupling_map.get_edges()}
+        mapped_dag, final_positions = lookahead_swap.run(
+            dag,
+            np.asarray(self.coupling_map.distance_matrix, dtype=np.float64),
+            list(swaps),
+            self.search_depth,
+            self.search_width,
+            self.fake_run,
         )
-
-        mapped_gates = []
-        gates_remaining = list(dag.serial_layers())
-
-        while gates_remaining:
-            logger.debug("Top-level routing step: %d gates remaining.", len(gates_remaining))
-
-            best_step = _search_forward_n_swaps(
-                current_state,
-                gates_remaining,
-                self.search_depth,
-                self.search_width,
-            )
-
-            if best_step is None:
-                raise TranspilerError(
-                    "Lookahead failed to find a swap which mapped gates or improved layout score."
-                )
-
-            logger.debug(
-                "Found best step: mapped %d gates. Added swaps: %s.",
-                len(best_step.gates_mapped),
-                best_step.swaps_added,
-            )
-
-            current_state = best_step.state
-            gates_mapped = best_step.gates_mapped
-            gates_remaining = best_step.gates_remaining
-
-            mapped_gates.extend(gates_mapped)
+        final_layout = Layout.from_intlist(final_positions, register)
 
         if self.property_set["final_layout"] is None:
-            self.property_set["final_layout"] = current_state.layout
+            self.property_set["final_layout"] = final_layout
         else:
             # The "final layout" can be thought of as a "comes from" permutation that you apply at
             # the end of the circuit to invert the routing.  So if there's an existing one, what we
             # apply at the end of the circuit needs to set the circuit qubits so they "come from"
             # the previous one, then those "come from" the one we've just added.
             self.property_set["final_layout"] = self.property_set["final_layout"].compose(
-                current_state.layout, dag.qubits
+                final_layout, dag.qubits
             )
 
         if self.fake_run:
             return dag
-
-        # Preserve input DAG's name, regs, wire_map, etc. but replace the graph.
-        mapped_dag = dag.copy_empty_like()
-        for node in mapped_gates:
-            mapped_dag.apply_operation_back(node.op, node.qargs, node.cargs, check=False)
-
         return mapped_dag
-
-
-def _search_forward_n_swaps(state, gates, depth, width):
-    """Search for SWAPs which allow for application of largest number of gates.
-
-    Args:
-        state (_SystemState): The ``namedtuple`` collection containing the state of the physical
-            system.  This includes the current layout, the coupling map, the canonical register and
-            the possible swaps available.
-        gates (list): Gates to be mapped.
-        depth (int): Number of SWAP layers to search before choosing a result.
-        width (int): Number of SWAPs to consider at each layer.
-    Returns:
-        Optional(_Step): Describes the solution step found.  If ``None``, no swaps leading to an
-        improvement were found.
-    """
-    if state.swaps is None:
-        # Include symmetric couplings (e.g [0,1] and [1,0]) as one swap.
-        state = state._replace(
-            swaps={((a, b) if a < b else (b, a)) for a, b in state.coupling_map.get_edges()}
-        )
-    gates_mapped, gates_remaining = _map_free_gates(state, gates)
-    base_step = _Step(state, [], gates_mapped, gates_remaining)
-
-    if not gates_remaining or depth == 0:
-        return base_step
-
-    ranked_swaps = sorted(
-        (_score_state_with_swap(swap, state, gates) for swap in state.swaps),
-        key=lambda x: x[0],
-    )
-    logger.debug(
-        "At depth %d, ranked candidate swaps: %s...",
-        depth,
-        [(swap, score) for score, swap, _ in ranked_swaps[: width * 2]],
-    )
-
-    best_swap, best_step, best_score = None, None, -math.inf
-    for rank, (_, swap, new_state) in enumerate(ranked_swaps):
-        next_step = _search_forward_n_swaps(new_state, gates_remaining, depth - 1, width)
-
-        if next_step is None:
-            continue
-
-        next_score = _score_step(next_step)
-        # ranked_swaps already sorted by distance, so distance is the tie-breaker.
-        if next_score > best_score:
-            logger.debug(
-                "At depth %d, updating best step: %s (score: %f).",
-                depth,
-                [swap] + next_step.swaps_added,
-                next_score,
-            )
-            best_swap, best_step, best_score = swap, next_step, next_score
-
-        if (
-            rank >= min(width, len(ranked_swaps) - 1)
-            and best_step is not None
-            and (
-                len(best_step.gates_mapped) > depth
-                or len(best_step.gates_remaining) < len(gates_remaining)
-                or (
-                    _calc_layout_distance(best_step.gates_remaining, best_step.state)
-                    < _calc_layout_distance(gates_remaining, new_state)
-                )
-            )
-        ):
-            # Once we've examined either $WIDTH swaps, or all available swaps,
-            # return the best-scoring swap provided it leads to an improvement
-            # in either the number of gates mapped, number of gates left to be
-            # mapped, or in the score of the ending layout.
-            break
-    else:
-        return None
-
-    best_swap_gate = _swap_ops_from_edge(best_swap, state)
-    out = _Step(
-        best_step.state,
-        [best_swap] + best_step.swaps_added,
-        gates_mapped + best_swap_gate + best_step.gates_mapped,
-        best_step.gates_remaining,
-    )
-    logger.debug("At depth %d, best_swap set: %s.", depth, out.swaps_added)
-    return out
-
-
-def _map_free_gates(state, gates):
-    """Map all gates that can be executed with the current layout.
-
-    Args:
-        state (_SystemState): The physical characteristics of the system, including its current
-            layout and the coupling map.
-        gates (list): Gates to be mapped.
-
-    Returns:
-        tuple:
-            mapped_gates (list): ops for gates that can be executed, mapped onto layout.
-            remaining_gates (list): gates that cannot be executed on the layout.
-    """
-    blocked_qubits = set()
-
-    mapped_gates = []
-    remaining_gates = []
-    layout_map = state.layout._v2p
-
-    for gate in gates:
-        # Gates without a partition (barrier, snapshot, save, load, noise) may
-        # still have associated qubits. Look for them in the qargs.
-        if not gate["partition"]:
-            qubits = _first_op_node(gate["graph"]).qargs
-
-            if not qubits:
-                continue
-
-            if blocked_qubits.intersection(qubits):
-                blocked_qubits.update(qubits)
-                remaining_gates.append(gate)
-            else:
-                mapped_gate = _transform_gate_for_system(gate, state)
-                mapped_gates.append(mapped_gate)
-            continue
-
-        qubits = gate["partition"][0]
-
-        if blocked_qubits.intersection(qubits):
-            blocked_qubits.update(qubits)
-            remaining_gates.append(gate)
-        elif len(qubits) == 1:
-            mapped_gate = _transform_gate_for_system(gate, state)
-            mapped_gates.append(mapped_gate)
-        elif state.coupling_map.distance(layout_map[qubits[0]], layout_map[qubits[1]]) == 1:
-            mapped_gate = _transform_gate_for_system(gate, state)
-            mapped_gates.append(mapped_gate)
-        else:
-            blocked_qubits.update(qubits)
-            remaining_gates.append(gate)
-
-    return mapped_gates, remaining_gates
-
-
-def _calc_layout_distance(gates, state, max_gates=None):
-    """Return the sum of the distances of two-qubit pairs in each CNOT in gates
-    according to the layout and the coupling.
-    """
-    if max_gates is None:
-        max_gates = 50 + 10 * len(state.coupling_map.physical_qubits)
-
-    layout_map = state.layout._v2p
-    out = 0
-    for gate in gates[:max_gates]:
-        if not gate["partition"]:
-            continue
-        qubits = gate["partition"][0]
-        if len(qubits) == 2:
-            out += state.coupling_map.distance(layout_map[qubits[0]], layout_map[qubits[1]])
-    return out
-
-
-def _score_state_with_swap(swap, state, gates):
-    """Calculate the relative score for a given SWAP.
-
-    Returns:
-        float: the score of the given swap.
-        Tuple[int, int]: the input swap that should be performed.
-        _SystemState: an updated system state with the new layout contained.
-    """
-    trial_layout = state.layout.copy()
-    trial_layout.swap(*swap)
-    new_state = state._replace(layout=trial_layout)
-    return _calc_layout_distance(gates, new_state), swap, new_state
-
-
-def _score_step(step):
-    """Count the mapped two-qubit gates, less the number of added SWAPs."""
-    # Each added swap will add 3 ops to gates_mapped, so subtract 3.
-    return len([g for g in step.gates_mapped if len(g.qargs) == 2]) - 3 * len(step.swaps_added)
-
-
-def _transform_gate_for_system(gate, state):
-    """Return op implementing a virtual gate on given layout."""
-    mapped_op_node = copy.copy(_first_op_node(gate["graph"]))
-
-    device_qreg = state.register
-    layout_map = state.layout._v2p
-    mapped_op_node.qargs = tuple(device_qreg[layout_map[a]] for a in mapped_op_node.qargs)
-
-    return mapped_op_node
-
-
-def _swap_ops_from_edge(edge, state):
-    """Generate list of ops to implement a SWAP gate along a coupling edge."""
-    device_qreg = state.register
-    qreg_edge = tuple(device_qreg[i] for i in edge)
-
-    # TODO shouldn't be making other nodes not by the DAG!!
-    return [DAGOpNode(op=SwapGate(), qargs=qreg_edge, cargs=())]
-
-
-def _first_op_node(dag):
-    """Get the first op node from a DAG."""
-    # This doesn't use `DAGCircuit.op_nodes` because that function always consumes the entire
-    # iterator to create a list, whereas we only need the first element.
-    return next(node for node in dag.nodes() if isinstance(node, DAGOpNode))
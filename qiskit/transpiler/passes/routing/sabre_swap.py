@@ -71,13 +71,23 @@ class SabreSwap(TransformationPass):
     `arXiv:1809.02573 <https://arxiv.org/pdf/1809.02573.pdf>`_
     """
 
-    def __init__(self, coupling_map, heuristic="basic", seed=None, fake_run=False, trials=None):
+    def __init__(
+        self,
+        coupling_map,
+        heuristic="basic",
+        seed=None,
+        fake_run=False,
+        trials=None,
+        time_limit=None,
+        lazy_distance=None,
+        window_size=None,
+    ):
         r"""SabreSwap initializer.
 
         Args:
             coupling_map (Union[CouplingMap, Target]): CouplingMap of the target backend.
             heuristic (str): The type of heuristic to use when deciding best
-                swap strategy ('basic' or 'lookahead' or 'decay').
+                swap strategy ('basic' or 'lookahead' or 'decay' or 'error').
             seed (int): random seed used to tie-break among candidate swaps.
             fake_run (bool): if true, it only pretend to do routing, i.e., no
                 swap is effectively added.
@@ -87,9 +97,29 @@ class SabreSwap(TransformationPass):
                 CPUs on the local system. For reproducible results it is recommended
                 that you set this explicitly, as the output will be deterministic for
                 a fixed number of trials.
+            time_limit (float): An optional budget, in seconds, for the routing trials.  Once it
+                is spent, no further trials are started, and the best result found so far is used.
+                The first trial is always completed.  The number of trials that were completed is
+                written to the ``sabre_swap_trials_completed`` field of the property set.  The
+                output is not reproducible when this is set, even with a fixed ``seed``.
+            lazy_distance (bool): If ``True``, the distances between physical qubits are computed
+                on demand during routing, and a bounded number of them are cached, rather than
+                computing the dense matrix of all distances up front.  This saves memory and setup
+                time for devices with thousands of qubits.  If ``False``, the dense matrix is always
+                used.  If not specified, the distances are computed on demand for devices with
+                more than 4096 qubits.  Lazy distances cannot be used with the 'error' heuristic.
+            window_size (int): If set, the circuit is routed in windows of this many operations,
+                taken in topological order, rather than all at once.  Each window is routed
+                starting from the layout at the end of the previous one, and appended to the
+                output before the next window is read, so the memory used by the router is
+                bounded by the window size rather than the size of the circuit.  This is useful
+                for very deep circuits, such as long Trotter evolutions.  The router cannot look
+                past the end of a window, so the output may have more swaps than without
+                windowing.
 
         Raises:
-            TranspilerError: If the specified heuristic is not valid.
+            TranspilerError: If the specified heuristic is not valid, if ``time_limit`` is
+                negative, or if ``window_size`` is not positive.
 
         Additional Information:
 
@@ -133,6 +163,15 @@ class SabreSwap(TransformationPass):
                     \frac{1}{\left|{F}\right|} \sum_{gate \in F} D[\pi(gate.q_1)][\pi(gate.q2)]\\
                     + W *\frac{1}{\left|{E}\right|} \sum_{gate \in E} D[\pi(gate.q_1)][\pi(gate.q2)]
                     }
+
+            - 'error':
+
+            This is the same as 'decay', but the distance :math:`D` between two physical qubits
+            is the cost of the cheapest path between them, where each coupler costs
+            :math:`1 + c / \bar{c}`, :math:`c` is the negative log of the fidelity of the best
+            two-qubit operation on the coupler in the :class:`.Target`, and :math:`\bar{c}` is the
+            mean of that over all couplers.  This steers SWAPs and gates towards the couplers with
+            lower error rates.  If the target has no error rates, this is the same as 'decay'.
         """
         super().__init__()
         self._routing_target = None
@@ -157,6 +196,13 @@ class SabreSwap(TransformationPass):
         self.seed = seed
         self.trials = default_num_processes() if trials is None else trials
         self.fake_run = fake_run
+        if time_limit is not None and not time_limit >= 0:
+            raise TranspilerError(f"The time limit must be non-negative, not {time_limit}.")
+        self.time_limit = time_limit
+        self.lazy_distance = lazy_distance
+        if window_size is not None and window_size < 1:
+            raise TranspilerError(f"The window size must be positive, not {window_size}.")
+        self.window_size = window_size
 
     @functools.cached_property
     def dist_matrix(self):
@@ -185,8 +231,6 @@ class SabreSwap(TransformationPass):
         """
         if self.target is None:
             raise TranspilerError("SabreSwap cannot run with coupling_map=None")
-        if self._routing_target is None:
-            self._routing_target = RoutingTarget.from_target(self.target)
         if len(dag.qregs) != 1 or dag.qregs.get("q", None) is None:
             raise TranspilerError("Sabre swap runs on physical circuits only.")
         num_dag_qubits = len(dag.qubits)
@@ -219,22 +263,41 @@ class SabreSwap(TransformationPass):
                 .with_basic(1.0, SetScaling.Constant)
                 .with_lookahead([0.5 / num_coupling_qubits], SetScaling.Constant)
             )
-        elif self.heuristic == "decay":
+        elif self.heuristic in ("decay", "error"):
             heuristic = (
                 Heuristic(attempt_limit=10 * num_dag_qubits)
                 .with_basic(1.0, SetScaling.Constant)
                 .with_lookahead([0.5 / num_coupling_qubits], SetScaling.Constant)
                 .with_decay(0.001, 5)
             )
+            if self.heuristic == "error":
+                heuristic = heuristic.with_error(1.0)
         else:
             raise TranspilerError(f"Heuristic {self.heuristic} not recognized.")
+        if self._routing_target is None:
+            # The distances only depend on the error part of the heuristic, which is the same on
+            # every run.
+            self._routing_target = RoutingTarget.from_target(
+                self.target,
+                lazy_distance=self.lazy_distance,
+                heuristic=heuristic,
+                fingerprint=self.target.fingerprint(),
+            )
         disjoint_utils.require_layout_isolated_to_component(dag, self.target)
 
         initial_layout = NLayout.generate_trivial_layout(num_dag_qubits)
         sabre_start = time.perf_counter()
-        dag, final_layout = sabre_routing(
-            dag, self._routing_target, heuristic, initial_layout, self.trials, self.seed
+        dag, final_layout, trials_completed = sabre_routing(
+            dag,
+            self._routing_target,
+            heuristic,
+            initial_layout,
+            self.trials,
+            self.seed,
+            time_limit=self.time_limit,
+            window_size=self.window_size,
         )
+        self.property_set["sabre_swap_trials_completed"] = trials_completed
         sabre_stop = time.perf_counter()
         LOG.debug("Sabre swap algorithm execution complete in: %s", sabre_stop - sabre_start)
         permutation = [
@@ -17,6 +17,7 @@ from collections.abc import Iterable
 from math import floor, log10
 
 from qiskit.circuit import Barrier
+from qiskit.circuit.controlflow import CONTROL_FLOW_OP_NAMES
 from qiskit.circuit.library import SwapGate
 from qiskit.dagcircuit import (
     DAGOpNode,
@@ -28,6 +29,7 @@ from qiskit.dagcircuit import (
 )
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.layout import Layout
+from qiskit._accelerate import star_prerouting as star_prerouting_rs
 
 
 class StarBlock:
@@ -254,20 +256,37 @@ class StarPreRouting(TransformationPass):
         return matching_blocks, processing_order
 
     def run(self, dag):
-        # Extract StarBlocks from DAGCircuit / DAGDependency / DAGDependencyV2
-        star_blocks, processing_order = self.determine_star_blocks_processing(dag, min_block_size=2)
+        if (
+            isinstance(dag, DAGCircuit)
+            and not dag.num_vars
+            and not CONTROL_FLOW_OP_NAMES.intersection(dag.count_ops(recurse=False))
+        ):
+            # The native implementation breaks ties between nodes with the same string keys as
+            # `star_preroute`, so its output is identical.
+            result = star_prerouting_rs.run(
+                dag, [str(bit) for bit in dag.qubits], [str(bit) for bit in dag.clbits]
+            )
+            if result is None:
+                return dag
+            new_dag, qubit_mapping = result
+        else:
+            # Extract StarBlocks from DAGCircuit / DAGDependency / DAGDependencyV2
+            star_blocks, processing_order = self.determine_star_blocks_processing(
+                dag, min_block_size=2
+            )
 
-        if not star_blocks:
-            return dag
+            if not star_blocks:
+                return dag
 
-        if all(b.size() < 3 for b in star_blocks):
-            # we only process blocks with less than 3 two-qubit gates in this pre-routing pass
-            # if they occur in a collection of larger stars, otherwise we consider them to be 'lines'
-            return dag
+            if all(b.size() < 3 for b in star_blocks):
+                # we only process blocks with less than 3 two-qubit gates in this pre-routing pass
+                # if they occur in a collection of larger stars, otherwise we consider them to be
+                # 'lines'
+                return dag
 
-        # Create a new DAGCircuit / DAGDependency / DAGDependencyV2, replacing each
-        # star block by a linear sequence of gates
-        new_dag, qubit_mapping = self.star_preroute(dag, star_blocks, processing_order)
+            # Create a new DAGCircuit / DAGDependency / DAGDependencyV2, replacing each
+            # star block by a linear sequence of gates
+            new_dag, qubit_mapping = self.star_preroute(dag, star_blocks, processing_order)
 
         # Fix output permutation -- copied from ElidePermutations
         input_qubit_mapping = {qubit: index for index, qubit in enumerate(dag.qubits)}
@@ -20,7 +20,7 @@ from .solovay_kitaev_synthesis import SolovayKitaev, SolovayKitaevSynthesis
 from .ross_selinger_plugin import RossSelingerSynthesis
 from .clifford_unitary_synth_plugin import CliffordUnitarySynthesis
 from .aqc_plugin import AQCSynthesisPlugin
-from .synthesize_rz_rotations import SynthesizeRZRotations
+from .synthesize_rz_rotations import SynthesizeRZRotations, RZSynthesisCacheInfo
 
 __all__ = [
     "AQCSynthesisPlugin",
@@ -28,6 +28,7 @@ __all__ = [
     "HLSConfig",
     "HighLevelSynthesis",
     "LinearFunctionsToPermutations",
+    "RZSynthesisCacheInfo",
     "RossSelingerSynthesis",
     "SolovayKitaev",
     "SolovayKitaevSynthesis",
@@ -12,11 +12,29 @@
 
 """Synthesize RZ gates to Clifford+T efficiently"""
 
+from typing import NamedTuple
+
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.dagcircuit import DAGCircuit
+from qiskit._accelerate import synthesize_rz_rotations as synthesize_rz_rotations_rs
 from qiskit._accelerate.synthesize_rz_rotations import synthesize_rz_rotations
 
 
+class RZSynthesisCacheInfo(NamedTuple):
+    """Statistics of the process-wide cache of :class:`.SynthesizeRZRotations`."""
+
+    hits: int
+    """The number of syntheses served from the cache."""
+    misses: int
+    """The number of syntheses that were not in the cache."""
+    evictions: int
+    """The number of entries evicted to keep the cache within its maximum size."""
+    currsize: int
+    """The current number of entries."""
+    maxsize: int
+    """The maximum number of entries."""
+
+
 class SynthesizeRZRotations(TransformationPass):
     r"""Replace RZ gates with Clifford+T decompositions.
 
@@ -59,6 +77,20 @@ class SynthesizeRZRotations(TransformationPass):
       # The circuits before and after the transformation are equivalent
       # (with the default value of approximation_degree used by SynthesizeRZRotations)
       assert Operator(qc) == Operator(qct)
+
+    The synthesis results are also cached across runs, in a cache that is shared by all instances
+    of the pass in the process, including the ones in the pass managers built by
+    :func:`.generate_preset_clifford_t_pass_manager`.  Entries are only reused for the same
+    canonical angle and synthesis error, so the output of a run does not depend on the state of
+    the cache.  The least recently used entries are evicted once the cache holds
+    :attr:`.RZSynthesisCacheInfo.maxsize` entries.  The cache can be inspected and managed with
+    the :meth:`cache_info`, :meth:`clear_cache` and :meth:`set_cache_size` class methods, and
+    written to and read from disk with :meth:`save_cache` and :meth:`load_cache`, for example to
+    share it with other processes or later sessions::
+
+      SynthesizeRZRotations.load_cache("rz_cache.bin")
+      # ... transpile many circuits ...
+      SynthesizeRZRotations.save_cache("rz_cache.bin")
     """
 
     def __init__(
@@ -66,6 +98,7 @@ class SynthesizeRZRotations(TransformationPass):
         approximation_degree: float | None = None,
         synthesis_error: float | None = None,
         cache_error: float | None = None,
+        use_cache: bool = True,
     ):
         r"""
         If both ``synthesis_error`` and ``cache_error`` are provided, they specify the error budget
@@ -81,15 +114,59 @@ class SynthesizeRZRotations(TransformationPass):
             cache_error: Maximum allowed error when reusing a cached synthesis
                 result for angles close to :math:`\theta`. If specified, must be in the
                 range ``[0, 1]``.
+            use_cache: Whether to reuse and store synthesis results in the process-wide cache.
         """
         super().__init__()
         self.approximation_degree = approximation_degree
         self.synthesis_error = synthesis_error
         self.cache_error = cache_error
+        self.use_cache = use_cache
 
     def run(self, dag: DAGCircuit) -> DAGCircuit:
         """Run the SynthesizeRZRotations pass on `dag`."""
         new_dag = synthesize_rz_rotations(
-            dag, self.approximation_degree, self.synthesis_error, self.cache_error
+            dag, self.approximation_degree, self.synthesis_error, self.cache_error, self.use_cache
         )
         return new_dag
+
+    @classmethod
+    def cache_info(cls) -> RZSynthesisCacheInfo:
+        """Get the statistics of the process-wide synthesis cache."""
+        return RZSynthesisCacheInfo(*synthesize_rz_rotations_rs.rz_cache_info())
+
+    @classmethod
+    def clear_cache(cls):
+        """Remove all entries from the process-wide synthesis cache, and reset its statistics."""
+        synthesize_rz_rotations_rs.clear_rz_cache()
+
+    @classmethod
+    def set_cache_size(cls, maxsize: int):
+        """Set the maximum number of entries of the process-wide synthesis cache.
+
+        If the cache holds more entries, the least recently used ones are evicted.
+
+        Args:
+            maxsize: The maximum number of entries. Zero disables the cache.
+        """
+        synthesize_rz_rotations_rs.set_rz_cache_size(maxsize)
+
+    @classmethod
+    def save_cache(cls, filename: str):
+        """Write the entries of the process-wide synthesis cache to a file.
+
+        Args:
+            filename: The file to write the cache to. It is replaced atomically.
+        """
+        synthesize_rz_rotations_rs.save_rz_cache(filename)
+
+    @classmethod
+    def load_cache(cls, filename: str) -> int:
+        """Add the entries in a file written by :meth:`save_cache` to the process-wide cache.
+
+        Args:
+            filename: The file to read the cache from.
+
+        Returns:
+            The number of entries read from the file.
+        """
+        return synthesize_rz_rotations_rs.load_rz_cache(filename)
@@ -67,6 +67,7 @@ class UnitarySynthesis(TransformationPass):
         plugin_config: dict | None = None,
         target: Target | None = None,
         fallback_on_default: bool = False,
+        cache_size: int = 4096,
     ):
         """Synthesize unitaries over some basis gates.
 
@@ -131,6 +132,13 @@ class UnitarySynthesis(TransformationPass):
                 in the case that a non-default synthesis ``method`` is specified but is either
                 unable to synthesize the operation or the synthesized circuit does not conform
                 to the target.
+            cache_size: The number of two-qubit synthesis results that the default method reuses
+                for repeated unitaries within a run.  Two-qubit unitaries whose matrix elements
+                agree to within :math:`10^{-12}`, and that are synthesized with the same
+                decomposers, are only decomposed once.  When the cache is full, it is emptied.
+                Set this to 0 to disable the cache.  The number of cache hits and misses of the
+                last run are stored in the ``UnitarySynthesis_cache_hits`` and
+                ``UnitarySynthesis_cache_misses`` fields of the property set.
 
         Raises:
             TranspilerError: if ``method`` was specified but is not found in the
@@ -150,6 +158,7 @@ class UnitarySynthesis(TransformationPass):
         self._natural_direction = natural_direction
         self._plugin_config = plugin_config
         self._fallback_on_default = fallback_on_default
+        self._cache_size = cache_size
         # Bypass target if it doesn't contain any basis gates (i.e it's _FakeTarget), as this
         # not part of the official target model.
         self._target = target if target is not None and len(target.operation_names) > 0 else None
@@ -189,7 +198,7 @@ class UnitarySynthesis(TransformationPass):
                 set(self._coupling_map.get_edges()) if self._coupling_map is not None else set()
             )
             qubit_indices = {bit: i for i, bit in enumerate(dag.qubits)}
-            out = run_main_loop(
+            out, hits, misses = run_main_loop(
                 dag,
                 list(qubit_indices.values()),
                 self._min_qubits,
@@ -200,7 +209,10 @@ class UnitarySynthesis(TransformationPass):
                 self._approximation_degree,
                 self._natural_direction,
                 self._pulse_optimize,
+                self._cache_size,
             )
+            self.property_set["UnitarySynthesis_cache_hits"] = hits
+            self.property_set["UnitarySynthesis_cache_misses"] = misses
             if out is None:
                 return dag
             else:
@@ -23,13 +23,15 @@ from typing import Any, TypeVar
 from qiskit.circuit import QuantumCircuit
 from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.dagcircuit import DAGCircuit
-from qiskit.passmanager.passmanager import BasePassManager
+from qiskit.passmanager.passmanager import BasePassManager, PassManagerPool
 from qiskit.passmanager.base_tasks import Task
 from qiskit.passmanager.flow_controllers import FlowControllerLinear
 from qiskit.passmanager.exceptions import PassManagerError
+from qiskit.passmanager.profiling import PassProfiler
 from .basepasses import BasePass
 from .exceptions import TranspilerError
 from .layout import TranspileLayout
+from .target import Target
 
 _CircuitsT = TypeVar("_CircuitsT", bound=list[QuantumCircuit] | QuantumCircuit)
 
@@ -131,6 +133,8 @@ class PassManager(BasePassManager):
         num_processes: int | None = None,
         *,
         property_set: dict[str, object] | None = None,
+        executor: str = "processes",
+        profiler: PassProfiler | None = None,
     ) -> _CircuitsT:
         """Run all the passes on the specified ``circuits``.
 
@@ -186,6 +190,19 @@ class PassManager(BasePassManager):
                 another, in cases where you know the analysis is safe to share.  Beware that some
                 analysis will be specific to the input circuit and the particular :class:`.Target`,
                 so you should take a lot of care when using this argument.
+            executor: How to transpile several circuits concurrently.  The default,
+                ``"processes"``, uses a pool of processes if parallel execution is enabled (see
+                :func:`.should_run_in_parallel`).  ``"threads"`` instead uses a pool of at most
+                ``num_processes`` threads within this process, regardless of the parallel
+                execution settings.  Each thread works on a copy of the pass manager, but all
+                threads share any :class:`.Target` the passes reference, so the memory cost and
+                the serialization time of process-based parallelism are avoided.  Many of the
+                built-in passes are implemented in Rust and do their heavy lifting without holding
+                the Python global interpreter lock, so can run concurrently.  If ``callback`` is
+                given, it must be safe to call concurrently from several threads.
+            profiler: If given, a :class:`.PassProfiler` that records the time and memory used by
+                every pass, and the size, depth and width of the :class:`.DAGCircuit` before and
+                after it.  Runs with a profiler never use parallel processes.
 
         Returns:
             The transformed circuit(s).
@@ -199,8 +216,129 @@ class PassManager(BasePassManager):
             output_name=output_name,
             num_processes=num_processes,
             property_set=property_set,
+            executor=executor,
+            profiler=profiler,
         )
 
+    def run_iter(  # pylint:disable=arguments-renamed
+        self,
+        circuits: Iterable[QuantumCircuit],
+        callback: Callable | None = None,
+        num_processes: int | None = None,
+        *,
+        max_in_flight: int | None = None,
+        ordered: bool = True,
+        property_set: dict[str, object] | None = None,
+        executor: str = "processes",
+    ) -> Iterator[QuantumCircuit]:
+        """Run all the passes on each circuit of an iterable, and yield the transformed circuits
+        as they become available.
+
+        Unlike :meth:`run`, this takes circuits from ``circuits`` only as workers become free, and
+        holds at most ``max_in_flight`` circuits in memory at any one time, so arbitrarily many
+        circuits can be streamed through the pass manager in bounded memory.  For example, to
+        transpile all the circuits in a directory of QPY files::
+
+            from qiskit import qpy
+            from qiskit.transpiler import generate_preset_pass_manager
+
+            def read_circuits(paths):
+                for path in paths:
+                    with open(path, "rb") as fd:
+                        yield from qpy.load(fd)
+
+            pm = generate_preset_pass_manager(optimization_level=2, backend=backend)
+            for isa_circuit in pm.run_iter(read_circuits(paths), max_in_flight=32):
+                ...
+
+        Args:
+            circuits: An iterable of the circuits to transform.
+            callback: A callback function that will be called after each pass execution, with
+                the same keyword arguments as described in :meth:`run`.
+            num_processes: The maximum number of parallel processes (or threads, if ``executor`` is
+                ``"threads"``) to use, as described in :meth:`run`.
+            max_in_flight: The maximum number of circuits that have been taken from ``circuits``
+                but whose outputs have not yet been yielded.  Defaults to twice the number of
+                workers.
+            ordered: If ``True`` (the default), the transpiled circuits are yielded in the order
+                of the input circuits.  If ``False``, each one is yielded as soon as it is ready.
+            property_set: If given, the initial value to use as the :class:`.PropertySet` for
+                each circuit, as described in :meth:`run`.
+            executor: How to transpile several circuits concurrently, as described in
+                :meth:`run`.
+
+        Returns:
+            An iterator over the transformed circuits.
+        """
+        if callback is not None:
+            callback = _legacy_style_callback(callback)
+
+        return super().run_iter(
+            circuits,
+            callback=callback,
+            num_processes=num_processes,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+            property_set=property_set,
+            executor=executor,
+        )
+
+    def _shared_objects(self):
+        # The `Target` is typically the largest object referenced by the passes, and passes only
+        # ever read from it, so all threads and worker processes can share the same instance.
+        targets = {}
+        seen = set()
+        stack = list(self._flatten_tasks(self._tasks))
+        while stack:
+            task = stack.pop()
+            if id(task) in seen:
+                continue
+            seen.add(id(task))
+            for value in getattr(task, "__dict__", {}).values():
+                if isinstance(value, Target):
+                    targets[id(value)] = value
+                elif isinstance(value, Task):
+                    stack.append(value)
+                elif isinstance(value, (list, tuple)):
+                    stack.extend(item for item in value if isinstance(item, Task))
+        return targets.values()
+
+    def worker_pool(
+        self,
+        num_processes: int | None = None,
+        *,
+        callback: Callable | None = None,
+    ) -> PassManagerPool:
+        """Create a persistent pool of worker processes for repeatedly running this pass manager.
+
+        The pass manager, and any :class:`.Target` its passes reference, is serialized once when
+        the pool is created, and the worker processes are kept alive between calls to
+        :meth:`.PassManagerPool.run`.  Only the input and output circuits are sent between
+        processes on each call.  For example::
+
+            from qiskit.transpiler import generate_preset_pass_manager
+
+            pm = generate_preset_pass_manager(optimization_level=2, backend=backend)
+            with pm.worker_pool() as pool:
+                for batch in batches:
+                    isa_circuits = pool.run(batch)
+
+        The pool's :meth:`~.PassManagerPool.run` method accepts the ``output_name`` and
+        ``property_set`` arguments of :meth:`run`.
+
+        Args:
+            num_processes: The maximum number of worker processes to launch.  This has the same
+                meaning as the argument of the same name to :meth:`run`.
+            callback: A callback function that will be called after each pass execution, with
+                the same keyword arguments as described in :meth:`run`.
+
+        Returns:
+            A new pool of workers for this pass manager.
+        """
+        if callback is not None:
+            callback = _legacy_style_callback(callback)
+        return super().worker_pool(num_processes, callback=callback)
+
     def draw(self, filename=None, style=None, raw=False):
         """Draw the pass manager.
 
@@ -414,9 +552,40 @@ class StagedPassManager(PassManager):
         num_processes: int | None = None,
         *,
         property_set: dict[str, object] | None = None,
+        executor: str = "processes",
+        profiler: PassProfiler | None = None,
     ) -> _CircuitsT:
         self._update_passmanager()
-        return super().run(circuits, output_name, callback, num_processes=num_processes)
+        return super().run(
+            circuits,
+            output_name,
+            callback,
+            num_processes=num_processes,
+            executor=executor,
+            profiler=profiler,
+        )
+
+    def run_iter(
+        self,
+        circuits: Iterable[QuantumCircuit],
+        callback: Callable | None = None,
+        num_processes: int | None = None,
+        *,
+        max_in_flight: int | None = None,
+        ordered: bool = True,
+        property_set: dict[str, object] | None = None,
+        executor: str = "processes",
+    ) -> Iterator[QuantumCircuit]:
+        self._update_passmanager()
+        return super().run_iter(
+            circuits,
+            callback,
+            num_processes,
+            max_in_flight=max_in_flight,
+            ordered=ordered,
+            property_set=property_set,
+            executor=executor,
+        )
 
     def to_flow_controller(self) -> FlowControllerLinear:
         self._update_passmanager()
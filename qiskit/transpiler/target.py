@@ -18,6 +18,7 @@ from a backend
 
 from __future__ import annotations
 
+import hashlib
 import itertools
 
 from typing import Any
@@ -27,6 +28,7 @@ import copy
 import logging
 import inspect
 
+import numpy as np
 import rustworkx as rx
 
 # import target class from the rust side
@@ -35,6 +37,7 @@ from qiskit._accelerate.target import (
     BaseInstructionProperties,
 )
 
+from qiskit.circuit import Instruction, QuantumCircuit
 from qiskit.circuit.library.standard_gates import get_standard_gate_name_mapping
 from qiskit.circuit.duration import duration_in_dt
 from qiskit.transpiler.coupling import CouplingMap
@@ -46,6 +49,62 @@ from qiskit.transpiler.timing_constraints import TimingConstraints
 logger = logging.getLogger(__name__)
 
 
+def _param_key(param):
+    """A deterministic representation of an operation parameter, for :meth:`.Target.fingerprint`."""
+    if isinstance(param, np.ndarray):
+        # The ``repr`` of a large array elides most of its entries.
+        return (param.dtype.str, param.shape, param.tobytes().hex())
+    if isinstance(param, QuantumCircuit):
+        return _circuit_key(param)
+    return param
+
+
+def _circuit_key(circuit):
+    """A deterministic representation of a circuit, for :meth:`.Target.fingerprint`."""
+    return (
+        circuit.num_qubits,
+        circuit.num_clbits,
+        _param_key(circuit.global_phase),
+        [
+            (
+                _operation_key(instruction.operation),
+                [circuit.find_bit(qubit).index for qubit in instruction.qubits],
+                [circuit.find_bit(clbit).index for clbit in instruction.clbits],
+            )
+            for instruction in circuit.data
+        ],
+    )
+
+
+def _operation_key(operation):
+    """A deterministic representation of an operation, for :meth:`.Target.fingerprint`.
+
+    Operations are identified by their type, parameters and control state.  An operation whose
+    class does not build its definition from its parameters, such as a gate made with
+    :meth:`.QuantumCircuit.to_gate`, is also identified by the definition attached to it, since two
+    of them with the same name can have different ones.
+    """
+    key = (
+        type(operation).__module__,
+        type(operation).__qualname__,
+        operation.name,
+        operation.num_qubits,
+        getattr(operation, "num_clbits", 0),
+        [_param_key(param) for param in getattr(operation, "params", ())],
+        getattr(operation, "ctrl_state", None),
+    )
+    if getattr(type(operation), "_define", None) is not Instruction._define:
+        # The definition is derived from the parameters, and may not have been built yet.
+        return key
+    definition = operation._definition
+    return key + (None if definition is None else _circuit_key(definition),)
+
+
+def _extra_fields(obj):
+    """The attributes a subclass of a properties class adds, for :meth:`.Target.fingerprint`."""
+    return sorted(getattr(obj, "__dict__", {}).items())
+
+
 class InstructionProperties(BaseInstructionProperties):
     """A representation of the properties of a gate implementation.
 
@@ -719,6 +778,66 @@ class Target(BaseTarget):
         """Returns pairs of Gate names and its property map (str, dict[tuple, InstructionProperties])"""
         return self._gate_map.items()
 
+    def fingerprint(self) -> str:
+        """Get a deterministic fingerprint of the contents of this target.
+
+        The fingerprint covers the number of qubits, ``dt``, the timing constraints, the qubit
+        properties, the concurrent measurements, and every operation in the target along with its
+        parameters, its angle bounds, its definition if one was attached to it rather than built
+        from its parameters, and its qargs and their instruction properties, including any fields
+        added by a subclass of :class:`.InstructionProperties`.  It does not cover the
+        :attr:`description`.  Two targets with the same contents have the same fingerprint
+        regardless of the order their instructions were added in, and the fingerprint is stable
+        between Python processes, so it can be used as part of a cache key.
+
+        The fingerprint is recomputed on each call, in time linear in the number of instructions
+        in the target.
+
+        Returns:
+            str: A hexadecimal digest of the target.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(
+            repr(
+                (
+                    self.num_qubits,
+                    self.dt,
+                    self.granularity,
+                    self.min_length,
+                    self.pulse_alignment,
+                    self.acquire_alignment,
+                    self.concurrent_measurements,
+                    [
+                        (
+                            None
+                            if props is None
+                            else (props.t1, props.t2, props.frequency, _extra_fields(props))
+                        )
+                        for props in self.qubit_properties or ()
+                    ],
+                )
+            ).encode()
+        )
+        # The angle bounds are only exposed through the state of the base class.
+        base_gate_map = super().__getstate__()["gate_map"] if self.has_angle_bounds() else {}
+        for name in sorted(self._gate_map):
+            operation = self.operation_from_name(name)
+            if inspect.isclass(operation):
+                # Globally defined variable-width operations are stored as their class.
+                op_key = (name, operation.__module__, operation.__qualname__)
+            else:
+                op_key = (name, _operation_key(operation))
+            angle_bounds = base_gate_map.get(name, {}).get("angle_bounds")
+            hasher.update(repr((op_key, angle_bounds)).encode())
+            props_map = self._gate_map[name]
+            for qargs in sorted(props_map, key=lambda qargs: (qargs is not None, qargs or ())):
+                props = props_map[qargs]
+                props_key = (
+                    None if props is None else (props.duration, props.error, _extra_fields(props))
+                )
+                hasher.update(repr((qargs, props_key)).encode())
+        return hasher.hexdigest()
+
     def __str__(self):
         output = io.StringIO()
         if self.description is not None:
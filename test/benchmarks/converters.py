@@ -44,3 +44,20 @@ class ConverterBenchmarks:
 
     def time_dag_to_circuit(self, *_):
         converters.dag_to_circuit(self.dag)
+
+
+class DAGDependencyConverterBenchmarks:
+    params = ([2, 5, 14, 20], [8, 128, 1024])
+    param_names = ["n_qubits", "depth"]
+    timeout = 600
+
+    def setup(self, n_qubits, depth):
+        seed = 42
+        self.qc = random_circuit(n_qubits, depth, measure=True, seed=seed)
+        self.dag = converters.circuit_to_dag(self.qc)
+
+    def time_circuit_to_dagdependency(self, *_):
+        converters.circuit_to_dagdependency(self.qc)
+
+    def time_dag_to_dagdependency(self, *_):
+        converters.dag_to_dagdependency(self.dag)
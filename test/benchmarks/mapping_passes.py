@@ -11,8 +11,12 @@
 # that they have been altered from the originals.
 
 
+import math
 from copy import deepcopy
 
+import numpy as np
+
+from qiskit import QuantumCircuit, QuantumRegister
 from qiskit.transpiler import CouplingMap
 from qiskit.transpiler.passes import (
     FullAncillaAllocation,
@@ -20,6 +24,8 @@ from qiskit.transpiler.passes import (
     ApplyLayout,
     SabreSwap,
     BasicSwap,
+    LookaheadSwap,
+    StarPreRouting,
     Layout2qDistance,
     DenseLayout,
     CheckMap,
@@ -122,6 +128,14 @@ class PassBenchmarks:
         swap.property_set["layout"] = self.layout
         swap.run(self.dag)
 
+    def time_lookahead_swap(self, _, __):
+        swap = LookaheadSwap(self.coupling_map)
+        swap.property_set["layout"] = self.layout
+        swap.run(self.dag)
+
+    def time_star_prerouting(self, _, __):
+        StarPreRouting().run(self.fresh_dag)
+
     def time_csp_layout(self, _, __):
         CSPLayout(self.coupling_map, seed=42).run(self.fresh_dag)
 
@@ -246,3 +260,59 @@ class RoutedPassBenchmarks:
 
     def time_check_map(self, _, __):
         CheckMap(self.coupling_map).run(self.routed_dag)
+
+
+class LargeDeviceRoutingBenchmarks:
+    """Routing on a device with thousands of qubits, with and without the dense distance matrix."""
+
+    params = ([1000, 10000], [False, True])
+
+    param_names = ["n_qubits", "lazy_distance"]
+    timeout = 600
+
+    def setup(self, n_qubits, lazy_distance):
+        # A square grid of at least `n_qubits` qubits.
+        side = math.isqrt(n_qubits - 1) + 1
+        self.coupling_map = CouplingMap.from_grid(side, side)
+        num_physical = self.coupling_map.size()
+        rng = np.random.default_rng(42)
+        # Random long-range interactions on a small fraction of the device, which is typical of a
+        # wide circuit that has already been laid out.
+        circuit = QuantumCircuit(QuantumRegister(num_physical, "q"))
+        for _ in range(500):
+            a, b = rng.choice(num_physical, size=2, replace=False)
+            circuit.cx(int(a), int(b))
+        self.dag = circuit_to_dag(circuit)
+
+    def time_sabre_swap(self, _, lazy_distance):
+        SabreSwap(self.coupling_map, "decay", seed=42, trials=1, lazy_distance=lazy_distance).run(
+            self.dag
+        )
+
+    def peakmem_sabre_swap(self, _, lazy_distance):
+        SabreSwap(self.coupling_map, "decay", seed=42, trials=1, lazy_distance=lazy_distance).run(
+            self.dag
+        )
+
+
+class StarPreRoutingBenchmarks:
+    """Pre-routing of circuits made of many star-shaped blocks of two-qubit gates."""
+
+    params = ([20, 100, 500], [10, 100])
+
+    param_names = ["n_qubits", "n_stars"]
+    timeout = 300
+
+    def setup(self, n_qubits, n_stars):
+        rng = np.random.default_rng(42)
+        circuit = QuantumCircuit(n_qubits)
+        for _ in range(n_stars):
+            center, *leaves = rng.choice(n_qubits, size=min(n_qubits, 10), replace=False)
+            circuit.h(int(center))
+            for leaf in leaves:
+                circuit.cx(int(center), int(leaf))
+        circuit.measure_all()
+        self.dag = circuit_to_dag(circuit)
+
+    def time_star_prerouting(self, _, __):
+        StarPreRouting().run(self.dag)
@@ -0,0 +1,151 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the transpile cache."""
+
+import math
+import tempfile
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import CXGate, CZGate, RXGate
+from qiskit.compiler import TranspileCache, transpile
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.quantum_info import Operator
+from qiskit.transpiler import Target
+from test import QiskitTestCase
+
+
+class TestTranspileCache(QiskitTestCase):
+    """Tests for TranspileCache."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = GenericBackendV2(num_qubits=5, seed=42)
+
+    def build(self, angle=0.5, name="circuit", param_name=None):
+        """Build a small test circuit."""
+        qc = QuantumCircuit(3, name=name)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.cx(0, 2)
+        qc.rz(angle if param_name is None else Parameter(param_name), 2)
+        return qc
+
+    def test_hit_on_identical_structure(self):
+        """Test that a structurally identical circuit hits the cache."""
+        cache = TranspileCache()
+        first = transpile(self.build(), self.backend, seed_transpiler=42, cache=cache)
+        qc = self.build(name="other")
+        qc.metadata = {"iteration": 1}
+        second = transpile(qc, self.backend, seed_transpiler=42, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(second.name, "other")
+        self.assertEqual(second.metadata, {"iteration": 1})
+        self.assertEqual(first.layout, second.layout)
+        self.assertEqual(first.data, second.data)
+        self.assertIsNot(first, second)
+
+    def test_miss_on_different_values_or_options(self):
+        """Test that bound values, the seed and the target are all part of the key."""
+        cache = TranspileCache()
+        transpile(self.build(), self.backend, seed_transpiler=42, cache=cache)
+        transpile(self.build(angle=0.25), self.backend, seed_transpiler=42, cache=cache)
+        transpile(self.build(), self.backend, seed_transpiler=7, cache=cache)
+        transpile(
+            self.build(),
+            GenericBackendV2(num_qubits=5, basis_gates=["cz", "rz", "sx", "x"], seed=42),
+            seed_transpiler=42,
+            cache=cache,
+        )
+        self.assertEqual((cache.hits, cache.misses), (0, 4))
+
+    def test_miss_on_targets_differing_in_angle_bounds_or_definitions(self):
+        """Test that targets which differ only in their angle bounds or in the definitions of their
+        custom gates don't share cache entries."""
+
+        def target(angle_bounds=None, custom_inner=None):
+            out = Target(num_qubits=2)
+            out.add_instruction(
+                RXGate(Parameter("theta")), {(0,): None, (1,): None}, angle_bounds=angle_bounds
+            )
+            out.add_instruction(CXGate(), {(0, 1): None})
+            if custom_inner is not None:
+                definition = QuantumCircuit(2, name="custom")
+                definition.append(custom_inner, [0, 1])
+                out.add_instruction(definition.to_gate(), {(0, 1): None})
+            return out
+
+        qc = QuantumCircuit(2)
+        qc.rx(0.5, 0)
+        qc.cx(0, 1)
+        for case, (first, second) in {
+            "angle bounds": (target(), target(angle_bounds=[(-math.pi, math.pi)])),
+            "definitions": (target(custom_inner=CXGate()), target(custom_inner=CZGate())),
+        }.items():
+            with self.subTest(case=case):
+                cache = TranspileCache()
+                transpile(qc, target=first, seed_transpiler=42, cache=cache)
+                out = transpile(qc, target=second, seed_transpiler=42, cache=cache)
+                self.assertEqual((cache.hits, cache.misses), (0, 2))
+                self.assertEqual(out, transpile(qc, target=second, seed_transpiler=42))
+
+    def test_parameters_keyed_by_name(self):
+        """Test that circuits with equal parameter names hit, and are rebound to the input."""
+        cache = TranspileCache()
+        transpile(self.build(param_name="a"), self.backend, seed_transpiler=42, cache=cache)
+        qc = self.build(param_name="a")
+        out = transpile(qc, self.backend, seed_transpiler=42, cache=cache)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(set(out.parameters), set(qc.parameters))
+        self.assertTrue(
+            Operator.from_circuit(out.assign_parameters([0.3])).equiv(qc.assign_parameters([0.3]))
+        )
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = TranspileCache(max_size=2)
+        for angle in (0.1, 0.2, 0.3):
+            transpile(self.build(angle), self.backend, seed_transpiler=42, cache=cache)
+        self.assertEqual(len(cache), 2)
+        transpile(self.build(0.1), self.backend, seed_transpiler=42, cache=cache)
+        self.assertEqual(cache.hits, 0)
+        transpile(self.build(0.3), self.backend, seed_transpiler=42, cache=cache)
+        self.assertEqual(cache.hits, 1)
+
+    def test_disk_store(self):
+        """Test that entries written to disk are found by a new cache."""
+        with tempfile.TemporaryDirectory() as directory:
+            first = transpile(
+                self.build(),
+                self.backend,
+                seed_transpiler=42,
+                cache=TranspileCache(directory=directory),
+            )
+            cache = TranspileCache(directory=directory)
+            second = transpile(self.build(), self.backend, seed_transpiler=42, cache=cache)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(first.layout.final_index_layout(), second.layout.final_index_layout())
+        self.assertEqual(Operator.from_circuit(first), Operator.from_circuit(second))
+
+    def test_callback_bypasses_cache(self):
+        """Test that the cache is not used when a callback is given."""
+        cache = TranspileCache()
+        for _ in range(2):
+            transpile(self.build(), self.backend, callback=lambda **_: None, cache=cache)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+    def test_invalid_max_size(self):
+        """Test that a non-positive size is rejected."""
+        with self.assertRaises(ValueError):
+            TranspileCache(max_size=0)
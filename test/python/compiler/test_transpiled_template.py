@@ -0,0 +1,107 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for TranspiledTemplate."""
+
+import numpy as np
+from ddt import ddt, data
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter, ParameterVector
+from qiskit.compiler import TranspiledTemplate
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.quantum_info import Operator
+from test import QiskitTestCase
+
+
+@ddt
+class TestTranspiledTemplate(QiskitTestCase):
+    """Tests for TranspiledTemplate."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = GenericBackendV2(num_qubits=5, seed=42)
+        theta = ParameterVector("θ", 4)
+        qc = QuantumCircuit(3)
+        qc.ry(theta[0], 0)
+        qc.cx(0, 1)
+        qc.u(theta[1], 2 * theta[2], 0.25, 2)
+        qc.cx(1, 2)
+        qc.rx(theta[3] - theta[0], 1)
+        self.circuit = qc
+
+    @data(0, 1, 2, 3)
+    def test_bind_matches_original(self, optimization_level):
+        """Test that bound circuits are ISA circuits equivalent to the bound input."""
+        template = TranspiledTemplate(
+            self.circuit,
+            self.backend,
+            optimization_level=optimization_level,
+            seed_transpiler=42,
+        )
+        values = np.random.default_rng(0).uniform(-np.pi, np.pi, size=(5, 4))
+        bound = template.bind(values)
+        self.assertEqual(len(bound), 5)
+        for row, circuit in zip(values, bound):
+            self.assertEqual(circuit.num_parameters, 0)
+            self.assertEqual(circuit.layout, template.layout)
+            for inst in circuit.data:
+                self.assertTrue(
+                    self.backend.target.instruction_supported(
+                        inst.name, tuple(circuit.find_bit(q).index for q in inst.qubits)
+                    )
+                )
+            self.assertTrue(
+                Operator.from_circuit(circuit).equiv(self.circuit.assign_parameters(row))
+            )
+
+    def test_bind_single(self):
+        """Test binding a single set of values."""
+        template = TranspiledTemplate(self.circuit, self.backend, seed_transpiler=42)
+        values = [0.1, 0.2, 0.3, 0.4]
+        bound = template.bind(values)
+        self.assertIsInstance(bound, QuantumCircuit)
+        self.assertEqual(bound, template.circuit.assign_parameters(values))
+
+    def test_bind_batch(self):
+        """Test that each row of a batch is bound as if it were bound on its own, into separate
+        circuits, and that the template is left parametric."""
+        template = TranspiledTemplate(self.circuit, self.backend, seed_transpiler=42)
+        parameters = list(template.circuit.parameters)
+        values = np.random.default_rng(1).uniform(-np.pi, np.pi, size=(8, 4))
+        bound = template.bind(values)
+        self.assertEqual(len(bound), 8)
+        self.assertEqual(len({id(circuit) for circuit in bound}), 8)
+        for row, circuit in zip(values, bound):
+            self.assertEqual(circuit, template.bind(row))
+        self.assertNotEqual(bound[0], bound[1])
+        self.assertEqual(list(template.circuit.parameters), parameters)
+
+    def test_unused_parameter(self):
+        """Test that parameters removed by the transpiler are accepted and ignored."""
+        a, b = Parameter("a"), Parameter("b")
+        qc = QuantumCircuit(1)
+        qc.rz(a, 0)
+        qc.rz(b, 0)
+        qc.rz(-b, 0)
+        template = TranspiledTemplate(qc, self.backend, seed_transpiler=42)
+        self.assertEqual(template.parameters, (a, b))
+        bound = template.bind([[0.5, 1.0], [0.5, 2.0]])
+        self.assertTrue(Operator.from_circuit(bound[0]).equiv(Operator.from_circuit(bound[1])))
+
+    def test_bad_shape(self):
+        """Test that values of the wrong shape are rejected."""
+        template = TranspiledTemplate(self.circuit, self.backend, seed_transpiler=42)
+        with self.assertRaises(ValueError):
+            template.bind([0.1, 0.2])
+        with self.assertRaises(ValueError):
+            template.bind(np.zeros((2, 2, 4)))
@@ -80,9 +80,10 @@ from qiskit.circuit.library import (
     XXPlusYYGate,
     RZZGate,
 )
-from qiskit.compiler import transpile
+from qiskit.compiler import transpile, transpile_iter
 from qiskit.converters import circuit_to_dag
 from qiskit.dagcircuit import DAGOpNode, DAGOutNode, DAGCircuit
+from qiskit.passmanager.passmanager import _dumps_with_shared_objects, _loads_with_shared_objects
 from qiskit.exceptions import QiskitError
 from qiskit.providers.backend import BackendV2
 from qiskit.providers.fake_provider import GenericBackendV2
@@ -108,7 +109,7 @@ from qiskit.transpiler import WrapAngleRegistry
 
 from test import QiskitTestCase, combine, slow_test
 
-from ..legacy_cmaps import MELBOURNE_CMAP, RUESCHLIKON_CMAP, TOKYO_CMAP, MUMBAI_CMAP
+from ..legacy_cmaps import MELBOURNE_CMAP, RUESCHLIKON_CMAP, TOKYO_CMAP, MUMBAI_CMAP, LAGOS_CMAP
 
 
 class CustomCX(Gate):
@@ -3041,6 +3042,67 @@ class TestTranspileParallel(QiskitTestCase):
         for circ in res:
             self.assertIsInstance(circ, QuantumCircuit)
 
+    @data(0, 1, 2, 3)
+    def test_parallel_worker_pool(self, opt_level):
+        """Test that a persistent worker pool can transpile several batches."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.measure_all()
+        pm = generate_preset_pass_manager(
+            opt_level, backend=GenericBackendV2(num_qubits=4), seed_transpiler=42
+        )
+        expected = pm.run(qc)
+        with pm.worker_pool(2) as pool:
+            self.assertTrue(pool.is_parallel)
+            for _ in range(2):
+                res = pool.run([qc, qc, qc])
+                self.assertEqual(len(res), 3)
+                for circ in res:
+                    self.assertEqual(circ, expected)
+                    self.assertEqual(circ.layout, expected.layout)
+
+    @data(0, 1, 2, 3)
+    def test_parallel_threads(self, opt_level):
+        """Test that transpiling on a pool of threads gives the same result as in serial."""
+        qc = QuantumCircuit(5)
+        qc.h(0)
+        for k in range(1, 5):
+            qc.cx(0, k)
+        qc.rz(0.5, 3)
+        qc.cx(4, 1)
+        qc.measure_all()
+        target = GenericBackendV2(num_qubits=7, coupling_map=LAGOS_CMAP, seed=42).target
+        expected = transpile(qc, target=target, optimization_level=opt_level, seed_transpiler=7)
+        res = transpile(
+            [qc] * 4,
+            target=target,
+            optimization_level=opt_level,
+            seed_transpiler=7,
+            num_processes=2,
+            executor="threads",
+        )
+        self.assertEqual(len(res), 4)
+        for circ in res:
+            self.assertEqual(circ, expected)
+            self.assertEqual(circ.layout, expected.layout)
+
+    def test_parallel_target_deserialized_once(self):
+        """Test that the target is serialized separately from the pass manager for worker
+        processes, and that each process only deserializes it once."""
+        target = GenericBackendV2(num_qubits=7, coupling_map=LAGOS_CMAP, seed=42).target
+        pm = generate_preset_pass_manager(2, target=target, seed_transpiler=42)
+        pass_manager_bin, shared_bin = _dumps_with_shared_objects(pm)
+        self.assertEqual(list(shared_bin), [f"Target:{target.fingerprint()}"])
+        first = _loads_with_shared_objects(pass_manager_bin, shared_bin)
+        second = _loads_with_shared_objects(pass_manager_bin, shared_bin)
+        self.assertIsNot(first, second)
+        (first_target,) = first._shared_objects()
+        (second_target,) = second._shared_objects()
+        self.assertIs(first_target, second_target)
+        self.assertIsNot(first_target, target)
+        self.assertEqual(first_target.fingerprint(), target.fingerprint())
+
     @data(0, 1, 2, 3)
     def test_parallel_with_target(self, opt_level):
         """Test that parallel dispatch works with a manual target."""
@@ -3319,6 +3381,137 @@ class TestTranspileParallel(QiskitTestCase):
                 )
 
 
+@ddt
+class TestTranspileNativePipeline(QiskitTestCase):
+    """Test transpile() dispatching to the native preset pipeline."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = GenericBackendV2(num_qubits=5, seed=42)
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.cx(0, 2)
+        qc.rz(0.5, 2)
+        self.circuit = qc
+
+    @data(0, 1, 2, 3)
+    def test_native_pipeline(self, opt_level):
+        """Test the native pipeline produces a valid circuit with a layout."""
+        with self.assertLogs("qiskit.compiler.transpiler", level="INFO") as cm:
+            out = transpile(
+                self.circuit,
+                self.backend,
+                optimization_level=opt_level,
+                seed_transpiler=42,
+                native_pipeline=True,
+            )
+        self.assertIn("with the native preset pipeline", "".join(cm.output))
+        self.assertIsNotNone(out.layout)
+        self.assertEqual(out.num_qubits, self.backend.num_qubits)
+        self.assertTrue(Operator.from_circuit(out).equiv(self.circuit))
+        for inst in out.data:
+            self.assertTrue(
+                self.backend.target.instruction_supported(
+                    inst.name, tuple(out.find_bit(x).index for x in inst.qubits)
+                )
+            )
+
+    def test_native_pipeline_batch_matches_single(self):
+        """Test that compiling a batch concurrently gives the same output as one at a time."""
+        circuits = [self.circuit.copy(name=f"circuit_{i}") for i in range(4)]
+        for i, circuit in enumerate(circuits):
+            circuit.rx(0.1 * i, 1)
+        with should_run_in_parallel.override(True):
+            batch = transpile(
+                circuits, self.backend, seed_transpiler=42, native_pipeline=True, num_processes=2
+            )
+        single = [
+            transpile(circuit, self.backend, seed_transpiler=42, native_pipeline=True)
+            for circuit in circuits
+        ]
+        self.assertEqual(batch, single)
+        self.assertEqual([circuit.name for circuit in batch], [c.name for c in circuits])
+
+    def test_native_pipeline_falls_back_per_circuit(self):
+        """Test that unsupported circuits fall back to the Python pass managers."""
+        custom = QuantumCircuit(2)
+        custom.append(CustomCX(), [0, 1])
+        with self.assertLogs("qiskit.compiler.transpiler", level="INFO") as cm:
+            out = transpile(
+                [self.circuit, custom], self.backend, seed_transpiler=42, native_pipeline=None
+            )
+        self.assertIn("Transpiled 1 of 2 circuits", "".join(cm.output))
+        self.assertTrue(Operator.from_circuit(out[0]).equiv(self.circuit))
+        self.assertTrue(Operator.from_circuit(out[1]).equiv(custom))
+
+    def test_native_pipeline_falls_back_for_options(self):
+        """Test that unsupported options use the Python pass managers."""
+        with self.assertLogs("qiskit.compiler.transpiler", level="INFO") as cm:
+            transpile(
+                self.circuit,
+                self.backend,
+                initial_layout=[0, 1, 2],
+                seed_transpiler=42,
+                native_pipeline=None,
+            )
+        self.assertIn("Using the Python preset pass managers", "".join(cm.output))
+
+    def test_native_pipeline_required(self):
+        """Test that requiring the native pipeline errors if it can't be used."""
+        with self.assertRaisesRegex(TranspilerError, "native preset pipeline"):
+            transpile(self.circuit, self.backend, layout_method="trivial", native_pipeline=True)
+        custom = QuantumCircuit(2)
+        custom.append(CustomCX(), [0, 1])
+        with self.assertRaisesRegex(TranspilerError, "native preset pipeline"):
+            transpile(custom, self.backend, native_pipeline=True)
+
+
+class TestTranspileIter(QiskitTestCase):
+    """Test the streaming transpile_iter() function."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = GenericBackendV2(num_qubits=5, seed=42)
+        self.circuits = []
+        for i in range(6):
+            qc = QuantumCircuit(3, name=f"circuit_{i}")
+            qc.h(0)
+            qc.cx(0, 1)
+            qc.cx(0, 2)
+            qc.rz(0.1 * i, 2)
+            self.circuits.append(qc)
+
+    def test_matches_transpile(self):
+        """Test that the streamed output is the same as the output of transpile."""
+        expected = transpile(self.circuits, self.backend, seed_transpiler=42)
+        out = list(transpile_iter(iter(self.circuits), self.backend, seed_transpiler=42))
+        self.assertEqual([qc.name for qc in out], [qc.name for qc in self.circuits])
+        self.assertEqual(out, expected)
+
+    def test_threads_unordered(self):
+        """Test that unordered results from several threads cover all the inputs."""
+        out = transpile_iter(
+            iter(self.circuits),
+            self.backend,
+            seed_transpiler=42,
+            executor="threads",
+            num_processes=2,
+            max_in_flight=2,
+            ordered=False,
+        )
+        self.assertEqual(sorted(qc.name for qc in out), sorted(qc.name for qc in self.circuits))
+
+    def test_too_wide(self):
+        """Test that a circuit that is too wide is rejected when it is reached."""
+        out = transpile_iter(
+            [self.circuits[0], QuantumCircuit(6)], self.backend, num_processes=1, max_in_flight=1
+        )
+        self.assertEqual(next(out).name, "circuit_0")
+        with self.assertRaises(CircuitTooWideForTarget):
+            next(out)
+
+
 @ddt
 class TestTranspileMultiChipTarget(QiskitTestCase):
     """Test transpile() with a disjoint coupling map."""
@@ -3268,6 +3268,29 @@ class TestDagProperties(DAGTest):
         dag = circuit_to_dag(qc)
         self.assertEqual(dag.depth(), 0)
 
+    def test_dag_depth_after_modification(self):
+        """Test that the depth follows changes to the DAG made after it was first computed."""
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.cx(0, 1)
+        dag = circuit_to_dag(qc)
+        self.assertEqual(dag.depth(), 2)
+        node = dag.apply_operation_back(CXGate(), dag.qubits[1:], ())
+        self.assertEqual(dag.depth(), 3)
+        snapshot = copy.copy(dag)
+        dag.remove_op_node(node)
+        self.assertEqual(dag.depth(), 2)
+        self.assertEqual(snapshot.depth(), 3)
+        replacement = QuantumCircuit(2)
+        replacement.h(0)
+        replacement.cx(0, 1)
+        replacement.cx(1, 0)
+        dag.substitute_node_with_dag(dag.op_nodes(CXGate)[0], circuit_to_dag(replacement))
+        self.assertEqual(dag.depth(), 4)
+        dag.remove_all_ops_named("h")
+        self.assertEqual(dag.depth(), 2)
+        self.assertEqual(snapshot.depth(), 3)
+
     def test_dag_idle_wires(self):
         """Test dag idle_wires."""
         wires = list(self.dag.idle_wires())
@@ -17,10 +17,12 @@ import unittest
 from qiskit.dagcircuit import DAGDependency
 from qiskit.circuit import QuantumRegister, ClassicalRegister, QuantumCircuit, Qubit, Clbit
 from qiskit.circuit import Measure
-from qiskit.circuit import Instruction
+from qiskit.circuit import Instruction, Parameter
 from qiskit.circuit.library.standard_gates.h import HGate
+from qiskit.circuit.random import random_circuit
 from qiskit.dagcircuit.exceptions import DAGDependencyError
-from qiskit.converters import circuit_to_dagdependency
+from qiskit.converters import circuit_to_dag, circuit_to_dagdependency, dag_to_dagdependency
+from qiskit._accelerate.dag_dependency import DAGDependencyCircuit
 from test import QiskitTestCase
 
 try:
@@ -326,5 +328,80 @@ class TestDagProperties(QiskitTestCase):
         self.assertEqual(qc.metadata, {})
 
 
+class TestNativeDependencyGraph(QiskitTestCase):
+    """Test the native construction of the edges of a DAGDependency."""
+
+    @staticmethod
+    def python_dagdependency(circuit):
+        """Build a DAGDependency by checking the commutation of each node with the earlier ones."""
+        dag = DAGDependency()
+        dag.add_qubits(circuit.qubits)
+        dag.add_clbits(circuit.clbits)
+        for instruction in circuit.data:
+            dag.add_op_node(instruction.operation, instruction.qubits, instruction.clbits)
+        dag._add_predecessors()
+        dag._add_successors()
+        return dag
+
+    def assertSameDependencies(self, native, expected):
+        """Assert that two DAGDependency objects have the same edges between the same nodes."""
+        self.assertEqual(native.get_all_edges(), expected.get_all_edges())
+        for node_id in range(expected.size()):
+            self.assertEqual(native.predecessors(node_id), sorted(expected.predecessors(node_id)))
+            self.assertEqual(native.successors(node_id), sorted(expected.successors(node_id)))
+
+    def commuting_circuit(self):
+        """A circuit with long runs of commuting gates, parameters and control flow."""
+        theta = Parameter("θ")
+        circuit = QuantumCircuit(4, 2)
+        for _ in range(3):
+            circuit.rz(0.1, 0)
+            circuit.cx(0, 1)
+            circuit.z(0)
+            circuit.rzz(0.3, 1, 2)
+            circuit.rz(theta, 2)
+            circuit.cx(2, 3)
+            circuit.x(3)
+            circuit.rx(0.2, 3)
+            circuit.h(1)
+        with circuit.if_test((circuit.clbits[0], True)):
+            circuit.x(2)
+        circuit.z(0)
+        circuit.measure([0, 1], [0, 1])
+        circuit.rz(0.0, 2)
+        circuit.cz(0, 3)
+        return circuit
+
+    def test_circuit_matches_python_construction(self):
+        """Test that circuit_to_dagdependency adds the same edges as the Python construction."""
+        circuits = [self.commuting_circuit()] + [
+            random_circuit(5, 10, max_operands=3, measure=True, seed=seed) for seed in range(5)
+        ]
+        for circuit in circuits:
+            with self.subTest(circuit=circuit.name):
+                self.assertSameDependencies(
+                    circuit_to_dagdependency(circuit), self.python_dagdependency(circuit)
+                )
+
+    def test_dag_matches_python_construction(self):
+        """Test that dag_to_dagdependency adds the same edges as the Python construction."""
+        dag = circuit_to_dag(self.commuting_circuit())
+        circuit = QuantumCircuit(dag.qubits, dag.clbits)
+        for node in dag.topological_op_nodes():
+            circuit.append(node.op, node.qargs, node.cargs)
+        self.assertSameDependencies(dag_to_dagdependency(dag), self.python_dagdependency(circuit))
+
+    def test_native_round_trip(self):
+        """Test that the native dependency DAG converts back to the same circuit."""
+        dag = circuit_to_dag(self.commuting_circuit())
+        native = DAGDependencyCircuit.from_dag(dag)
+        self.assertEqual(len(native), dag.size())
+        self.assertEqual(native.to_dag(), dag)
+        expected = dag_to_dagdependency(dag)
+        self.assertEqual(
+            native.graph.edges(), [(edge[0], edge[1]) for edge in expected.get_all_edges()]
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -13,10 +13,19 @@
 
 """Pass manager test cases."""
 
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
 from test.python.passmanager import PassManagerTestCase
 
-from qiskit.passmanager import GenericPass, BasePassManager
+from qiskit import QuantumCircuit
+from qiskit.converters import circuit_to_dag
+from qiskit.passmanager import GenericPass, BasePassManager, PassManagerError, PassProfiler
 from qiskit.passmanager.flow_controllers import DoWhileController, ConditionalController
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.transpiler import generate_preset_pass_manager
+from qiskit.utils import should_run_in_parallel
 
 
 class RemoveFive(GenericPass):
@@ -167,3 +176,252 @@ class TestPassManager(PassManagerTestCase):
 
         pm = IntPassManager([ZeroPass()])
         self.assertEqual(pm.run(5), 0)
+
+    def test_threads_executor(self):
+        """Test that several programs can be run on a pool of threads."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        out = pm.run([15, 55, 125, 515], num_processes=2, executor="threads")
+        self.assertEqual(out, [10, 0, 120, 10])
+
+    def test_threads_executor_does_not_share_tasks(self):
+        """Test that each thread gets its own copy of the tasks, so state stored on the task by one
+        thread cannot be seen by another."""
+
+        class RecordInput(GenericPass):
+            def run(self, passmanager_ir):
+                self.last_input = passmanager_ir
+                self.property_set["seen"] = self.last_input
+
+        task = RecordInput()
+        pm = ToyPassManager([task, AddDigit()])
+        out = pm.run(list(range(20)), num_processes=4, executor="threads")
+        self.assertEqual(out, [10 * x for x in range(20)])
+        self.assertFalse(hasattr(task, "last_input"))
+
+    def test_unknown_executor(self):
+        """Test that an unknown executor is rejected."""
+        pm = ToyPassManager([RemoveFive()])
+        with self.assertRaisesRegex(PassManagerError, "Unknown executor"):
+            pm.run([1, 2], executor="fibers")
+
+
+class TestPassManagerRunIter(PassManagerTestCase):
+    def test_serial(self):
+        """Test that programs are transformed lazily and in order."""
+        taken = []
+
+        def programs():
+            for program in [15, 55, 125, 515]:
+                taken.append(program)
+                yield program
+
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        out = pm.run_iter(programs(), num_processes=1)
+        self.assertEqual(taken, [])
+        self.assertEqual(next(out), 10)
+        self.assertEqual(taken, [15])
+        self.assertEqual(list(out), [0, 120, 10])
+
+    def test_threads_bounded(self):
+        """Test that the thread executor never takes more than ``max_in_flight`` programs ahead of
+        the consumer."""
+        taken = []
+
+        def programs():
+            for program in range(20):
+                taken.append(program)
+                yield program
+
+        pm = ToyPassManager([AddDigit()])
+        out = pm.run_iter(programs(), num_processes=2, max_in_flight=3, executor="threads")
+        for i, program in enumerate(out):
+            self.assertEqual(program, 10 * i)
+            self.assertLessEqual(len(taken), i + 3)
+        self.assertEqual(len(taken), 20)
+
+    def test_threads_unordered(self):
+        """Test that unordered results are all yielded."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        out = pm.run_iter(
+            iter([15, 55, 125, 515]), num_processes=2, ordered=False, executor="threads"
+        )
+        self.assertEqual(sorted(out), [0, 10, 10, 120])
+
+    def test_close_shuts_down_executor(self):
+        """Test that closing the iterator early shuts the workers down and stops taking
+        programs."""
+        taken = []
+
+        def programs():
+            for program in range(20):
+                taken.append(program)
+                yield program
+
+        pm = ToyPassManager([AddDigit()])
+        with mock.patch.object(
+            ThreadPoolExecutor, "shutdown", autospec=True, side_effect=ThreadPoolExecutor.shutdown
+        ) as shutdown:
+            out = pm.run_iter(programs(), num_processes=2, max_in_flight=3, executor="threads")
+            self.assertEqual(next(out), 0)
+            out.close()
+            shutdown.assert_called_once()
+        self.assertLessEqual(len(taken), 4)
+
+    def test_close_before_start_creates_no_executor(self):
+        """Test that closing an iterator that was never started does not leave a pool of workers
+        behind."""
+        pm = ToyPassManager([AddDigit()])
+        with (
+            should_run_in_parallel.override(True),
+            mock.patch("qiskit.passmanager.passmanager.ProcessPoolExecutor") as pool,
+        ):
+            out = pm.run_iter([1, 2, 3], num_processes=2)
+            out.close()
+        pool.assert_not_called()
+
+    def test_invalid_arguments(self):
+        """Test that invalid arguments are rejected before any program is taken."""
+        pm = ToyPassManager([RemoveFive()])
+        with self.assertRaisesRegex(PassManagerError, "max_in_flight"):
+            pm.run_iter([1, 2], max_in_flight=0)
+        with self.assertRaisesRegex(PassManagerError, "Unknown executor"):
+            pm.run_iter([1, 2], executor="fibers")
+
+
+class TestPassProfiler(PassManagerTestCase):
+    def test_records_tasks(self):
+        """Test that every pass execution is recorded, with metrics of the IR."""
+        profiler = PassProfiler(ir_metrics=lambda ir: {"length": len(ir)})
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        pm.run(12345, profiler=profiler)
+        records = profiler.records
+        self.assertEqual([record.name for record in records], ["RemoveFive", "AddDigit"])
+        self.assertEqual([record.count for record in records], [0, 1])
+        self.assertEqual(records[0].ir_before, {"length": 5})
+        self.assertEqual(records[0].ir_after, {"length": 4})
+        self.assertEqual(records[1].ir_after, {"length": 5})
+        for record in records:
+            self.assertEqual(record.kind, "task")
+            self.assertFalse(record.native)
+            self.assertGreaterEqual(record.wall_time, 0.0)
+
+    def test_records_iterations(self):
+        """Test that each iteration of a do-while loop is recorded."""
+
+        def _condition(property_set):
+            return property_set["ndigits"] < 7
+
+        profiler = PassProfiler(ir_metrics=False)
+        controller = DoWhileController([AddDigit(), CountDigits()], do_while=_condition)
+        pm = ToyPassManager(controller)
+        pm.run(12345, profiler=profiler)
+        iterations = [record for record in profiler.records if record.kind == "iteration"]
+        self.assertEqual([record.iteration for record in iterations], [0, 1])
+        self.assertEqual(len(profiler.records), 6)
+        self.assertEqual(profiler.records[0].ir_before, {})
+
+    def test_threads_executor(self):
+        """Test that runs on several threads are all recorded."""
+        profiler = PassProfiler()
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        out = pm.run([15, 55, 125, 515], num_processes=2, executor="threads", profiler=profiler)
+        self.assertEqual(out, [10, 0, 120, 10])
+        self.assertEqual(len(profiler.records), 8)
+
+    def test_processes_fall_back_to_serial(self):
+        """Test that a profiled run does not spawn processes, which would lose the records."""
+        profiler = PassProfiler()
+        pm = ToyPassManager([RemoveFive()])
+        out = pm.run([15, 55, 125, 515], num_processes=2, profiler=profiler)
+        self.assertEqual(out, [1, 0, 12, 1])
+        self.assertEqual(len(profiler.records), 4)
+
+    def test_default_metrics_with_control_flow(self):
+        """Test that a transpilation of circuits with control flow can be profiled with the default
+        metrics, which recurse into the control flow or are left out where that's ambiguous."""
+        backend = GenericBackendV2(num_qubits=3, control_flow=True, seed=42)
+        pm = generate_preset_pass_manager(optimization_level=1, backend=backend, seed_transpiler=0)
+
+        qc = QuantumCircuit(2, 1)
+        qc.h(0)
+        qc.measure(0, 0)
+        with qc.if_test((qc.clbits[0], 1)):
+            qc.x(1)
+        with qc.for_loop(range(3)):
+            qc.cx(0, 1)
+        profiler = PassProfiler()
+        self.assertEqual(pm.run(qc, profiler=profiler), pm.run(qc))
+        dag = circuit_to_dag(qc)
+        self.assertEqual(
+            profiler.records[0].ir_before,
+            {"size": dag.size(recurse=True), "depth": dag.depth(recurse=True), "num_qubits": 2},
+        )
+
+        with qc.while_loop((qc.clbits[0], 0)):
+            qc.x(0)
+        profiler = PassProfiler()
+        pm.run(qc, profiler=profiler)
+        self.assertEqual(
+            profiler.records[0].ir_before, {"size": None, "depth": None, "num_qubits": 2}
+        )
+
+    def test_export(self):
+        """Test the JSON and Chrome trace exports."""
+        profiler = PassProfiler()
+        ToyPassManager([RemoveFive(), AddDigit()]).run(12345, profiler=profiler)
+        as_json = json.loads(profiler.to_json())
+        self.assertEqual([record["name"] for record in as_json], ["RemoveFive", "AddDigit"])
+        trace = json.loads(profiler.to_chrome_trace())
+        self.assertEqual(
+            [(event["name"], event["ph"]) for event in trace["traceEvents"]],
+            [("RemoveFive", "X"), ("AddDigit", "X")],
+        )
+        profiler.clear()
+        self.assertEqual(profiler.records, [])
+
+
+class TestPassManagerPool(PassManagerTestCase):
+    """Tests of the persistent worker pool of a pass manager."""
+
+    def test_serial_pool(self):
+        """Test that a pool runs in serial if parallelism is disabled."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        with should_run_in_parallel.override(False), pm.worker_pool(2) as pool:
+            self.assertFalse(pool.is_parallel)
+            self.assertEqual(pool.run(12345), 12340)
+            self.assertEqual(pool.run([15, 55]), [10, 0])
+
+    def test_parallel_pool_is_reusable(self):
+        """Test that the workers of a parallel pool can be used for several batches."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        with should_run_in_parallel.override(True), pm.worker_pool(2) as pool:
+            self.assertTrue(pool.is_parallel)
+            self.assertEqual(pool.run([15, 55, 125]), [10, 0, 120])
+            self.assertEqual(pool.run([515, 1, 2, 3]), [10, 10, 20, 30])
+            self.assertEqual(pool.run(5), 0)
+
+    def test_pool_uses_snapshot_of_pass_manager(self):
+        """Test that modifying the pass manager after creating a parallel pool has no effect."""
+        pm = ToyPassManager([RemoveFive()])
+        with should_run_in_parallel.override(True), pm.worker_pool(2) as pool:
+            pm.append(AddDigit())
+            self.assertEqual(pool.run([15, 25]), [1, 2])
+            # A single program is run in the calling process, but on the same snapshot.
+            self.assertEqual(pool.run(35), 3)
+
+    def test_serial_pool_uses_snapshot_of_pass_manager(self):
+        """Test that modifying the pass manager after creating a serial pool has no effect."""
+        pm = ToyPassManager([RemoveFive()])
+        with should_run_in_parallel.override(False), pm.worker_pool(2) as pool:
+            pm.append(AddDigit())
+            self.assertEqual(pool.run([15, 25]), [1, 2])
+            self.assertEqual(pool.run(35), 3)
+
+    def test_closed_pool_raises(self):
+        """Test that a closed pool cannot be used."""
+        pool = ToyPassManager([RemoveFive()]).worker_pool(2)
+        pool.close()
+        with self.assertRaisesRegex(PassManagerError, "closed"):
+            pool.run([1, 2])
+        # Closing twice is allowed.
+        pool.close()
@@ -14,6 +14,8 @@
 
 import math
 
+from qiskit.circuit import Gate, QuantumCircuit
+from qiskit.converters import circuit_to_dag
 from qiskit.transpiler.passes import MinimumPoint
 from qiskit.dagcircuit import DAGCircuit
 from test import QiskitTestCase
@@ -287,3 +289,43 @@ class TestMinimumPointtPass(QiskitTestCase):
         self.assertEqual((0.775, 10, 10), state.score)
         self.assertTrue(min_pass.property_set["test_minimum_point"])
         self.assertIs(out_dag, state.dag)
+
+    def test_restored_minimum_is_independent_of_later_changes(self):
+        """Test that the stored minimum DAG is not affected by later modifications of the DAG
+        passed to the pass."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        dag = circuit_to_dag(qc)
+        min_pass = MinimumPoint(["size"], prefix="test", backtrack_depth=2)
+        min_pass.property_set["size"] = dag.size()
+        min_pass.run(dag)
+        min_pass.run(dag)
+        # Grow the DAG after it was recorded as the minimum, so that the next run backtracks.
+        dag.apply_operation_back(qc.data[0].operation, (dag.qubits[1],))
+        min_pass.property_set["size"] = dag.size()
+        out_dag = min_pass.run(dag)
+        self.assertTrue(min_pass.property_set["test_minimum_point"])
+        self.assertEqual(out_dag, circuit_to_dag(qc))
+        self.assertEqual(out_dag.depth(), 2)
+        self.assertEqual(dag.size(), 3)
+
+    def test_restored_minimum_is_independent_of_later_mutations(self):
+        """Test that the stored minimum DAG does not share mutable state with the DAG passed to
+        the pass."""
+        qc = QuantumCircuit(1, metadata={"stage": "initial"})
+        qc.append(Gate("custom", 1, [0.5]), [0])
+        dag = circuit_to_dag(qc)
+        min_pass = MinimumPoint(["size"], prefix="test", backtrack_depth=2)
+        min_pass.property_set["size"] = dag.size()
+        min_pass.run(dag)
+        min_pass.run(dag)
+        # Mutate the DAG in place after it was recorded as the minimum.
+        dag.metadata["stage"] = "mutated"
+        dag.op_nodes()[0].op.params[0] = 0.25
+        dag.apply_operation_back(Gate("custom", 1, [0.5]), (dag.qubits[0],))
+        min_pass.property_set["size"] = dag.size()
+        out_dag = min_pass.run(dag)
+        self.assertTrue(min_pass.property_set["test_minimum_point"])
+        self.assertEqual(out_dag.metadata, {"stage": "initial"})
+        self.assertEqual([node.op.params for node in out_dag.op_nodes()], [[0.5]])
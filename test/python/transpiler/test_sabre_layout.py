@@ -12,7 +12,10 @@
 
 """Test the SabreLayout pass"""
 
+import itertools
+import os
 import unittest
+from unittest import mock
 
 import math
 
@@ -21,7 +24,13 @@ from qiskit.circuit import library as lib, Parameter
 from qiskit.circuit.classical import expr, types
 from qiskit.circuit.library import efficient_su2, quantum_volume
 from qiskit.transpiler import CouplingMap, AnalysisPass, PassManager, Target, Layout
-from qiskit.transpiler.passes import SabreLayout, DenseLayout, Unroll3qOrMore, BasicSwap
+from qiskit.transpiler.passes import (
+    SabreLayout,
+    DenseLayout,
+    Unroll3qOrMore,
+    BasicSwap,
+    CheckMap,
+)
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.converters import circuit_to_dag
 from qiskit.compiler.transpiler import transpile
@@ -371,6 +380,76 @@ barrier q18585[5],q18585[2],q18585[8],q18585[3],q18585[6];
             expected.cx(0, target)
         self.assertEqual(out, expected)
 
+    def test_time_limit(self):
+        """Test that a spent time limit still gives a valid result from a single trial."""
+        qc = efficient_su2(12, entanglement="circular", reps=3)
+        qc.measure_all()
+        pm = PassManager(
+            [SabreLayout(CouplingMap.from_heavy_hex(3), seed=0, layout_trials=20, time_limit=0.0)]
+        )
+        out = pm.run(qc)
+        self.assertEqual(pm.property_set["sabre_layout_trials_completed"], 1)
+        self.assertIsNotNone(pm.property_set["layout"])
+        self.assertEqual(out.count_ops()["measure"], qc.num_qubits)
+
+        pm = PassManager([SabreLayout(CouplingMap.from_heavy_hex(3), seed=0, layout_trials=20)])
+        pm.run(qc)
+        # 20 random trials, plus the dense, trivial and reversed-trivial heuristic trials.
+        self.assertEqual(pm.property_set["sabre_layout_trials_completed"], 23)
+
+    def test_lazy_distance(self):
+        """Test that layout and routing work with the distances computed on demand."""
+        coupling = CouplingMap.from_heavy_hex(5)
+        qc = efficient_su2(20, entanglement="circular", reps=2)
+        pm = PassManager(
+            [SabreLayout(coupling, seed=0, layout_trials=4, swap_trials=4, lazy_distance=True)]
+        )
+        out = pm.run(qc)
+        # The trial seeded by `DenseLayout` needs the dense matrix, so is skipped.
+        self.assertEqual(pm.property_set["sabre_layout_trials_completed"], 4 + 2)
+        check_map = CheckMap(coupling)
+        check_map(out)
+        self.assertTrue(check_map.property_set["is_swap_mapped"])
+
+    def test_target_fingerprint_taken_once(self):
+        """Test that a pass takes the fingerprint of its target once, rather than on every run."""
+        target = Target.from_configuration(
+            basis_gates=["u", "cx"], coupling_map=CouplingMap.from_line(5)
+        )
+        qc = QuantumCircuit(3)
+        qc.cx(0, 2)
+        layout_pass = SabreLayout(target, seed=0, swap_trials=1, layout_trials=1)
+        with mock.patch.object(Target, "fingerprint", autospec=True, return_value="abc") as fp:
+            layout_pass(qc)
+            layout_pass(qc)
+        fp.assert_called_once_with(target)
+
+    def test_time_limit_invalid(self):
+        """Test that invalid time limits are rejected."""
+        with self.assertRaisesRegex(TranspilerError, "non-negative"):
+            SabreLayout(CouplingMap.from_line(5), time_limit=-1.0)
+        with self.assertRaisesRegex(TranspilerError, "cannot be set alongside"):
+            SabreLayout(CouplingMap.from_line(5), routing_pass=BasicSwap(None), time_limit=1.0)
+
+    def test_error_weight(self):
+        """Test that layout and routing work with the error-aware heuristic."""
+        backend = GenericBackendV2(num_qubits=27, coupling_map=MUMBAI_CMAP, seed=42)
+        qc = efficient_su2(12, entanglement="circular", reps=2)
+        pm = PassManager(
+            [SabreLayout(backend.target, seed=0, layout_trials=2, swap_trials=2, error_weight=1.0)]
+        )
+        out = pm.run(qc)
+        check_map = CheckMap(backend.target)
+        check_map(out)
+        self.assertTrue(check_map.property_set["is_swap_mapped"])
+
+    def test_error_weight_invalid(self):
+        """Test that invalid error weights are rejected."""
+        with self.assertRaisesRegex(TranspilerError, "non-negative"):
+            SabreLayout(CouplingMap.from_line(5), error_weight=-1.0)
+        with self.assertRaisesRegex(TranspilerError, "cannot be set alongside"):
+            SabreLayout(CouplingMap.from_line(5), routing_pass=BasicSwap(None), error_weight=1.0)
+
 
 class DensePartialSabreTrial(AnalysisPass):
     """Pass to run dense layout as a sabre trial."""
@@ -471,6 +550,64 @@ class TestDisjointDeviceSabreLayout(QiskitTestCase):
         layout = layout_routing_pass.property_set["layout"]
         self.assertEqual([layout[q] for q in qc.qubits], [3, 2, 1, 5, 4, 7, 6, 8])
 
+    def test_disjoint_target_routes_across_components(self):
+        """Test layout and final routing on a disjoint target, with a DAG that needs several of its
+        components and SWAPs within each of them."""
+        target = Target.from_configuration(
+            basis_gates=["u", "cx"], coupling_map=self.dual_grid_cmap
+        )
+        qc = QuantumCircuit(9)
+        for first, second in itertools.combinations(range(4), 2):
+            qc.cx(first, second)
+        for first, second in itertools.combinations(range(4, 9), 2):
+            qc.cx(first, second)
+        qc.measure_all()
+        layout_routing_pass = SabreLayout(target, seed=2025_10_18, swap_trials=2, layout_trials=2)
+        out = layout_routing_pass(qc)
+        check_map = CheckMap(target)
+        check_map(out)
+        self.assertTrue(check_map.property_set["is_swap_mapped"])
+        self.assertIn("swap", out.count_ops())
+        layout = layout_routing_pass.property_set["layout"]
+        self.assertEqual({layout[qc.qubits[i]] for i in range(4)}, {0, 1, 2, 3})
+        self.assertEqual({layout[qc.qubits[i]] for i in range(4, 9)}, {4, 5, 6, 7, 8})
+
+    def test_many_identical_components_deterministic(self):
+        """Test that laying out across several identical chips concurrently gives the same result
+        as doing so on one thread."""
+        chip = CouplingMap.from_heavy_hex(3)
+        num_chips = 4
+        cmap = CouplingMap()
+        for i in range(num_chips):
+            offset = i * chip.size()
+            cmap.add_physical_qubit(offset)
+            for q in range(1, chip.size()):
+                cmap.add_physical_qubit(offset + q)
+            for a, b in chip.get_edges():
+                cmap.add_edge(offset + a, offset + b)
+        qc = QuantumCircuit(num_chips * 5)
+        for i in range(num_chips):
+            qc.h(5 * i)
+            for q in range(1, 5):
+                qc.cx(5 * i, 5 * i + q)
+        qc.measure_all()
+
+        def run():
+            pass_ = SabreLayout(cmap, seed=2026, swap_trials=2, layout_trials=2)
+            out = pass_(qc)
+            return out.layout.initial_index_layout(), out.layout.final_index_layout()
+
+        parallel = run()
+        with mock.patch.dict(
+            os.environ, {"QISKIT_IN_PARALLEL": "TRUE", "QISKIT_FORCE_THREADS": ""}
+        ):
+            serial = run()
+        self.assertEqual(parallel, serial)
+        # Each GHZ state stays on a single chip.
+        initial = parallel[0]
+        for i in range(num_chips):
+            self.assertEqual(len({initial[q] // chip.size() for q in range(5 * i, 5 * i + 5)}), 1)
+
     def test_too_large_components(self):
         """Assert trying to run a circuit with too large a connected component raises."""
         qc = QuantumCircuit(8)
@@ -19,10 +19,11 @@ from copy import deepcopy
 import io
 
 import ddt
+import numpy as np
 import numpy.random
 
 from qiskit.circuit import Clbit, ControlFlowOp, Qubit
-from qiskit.circuit.library import CCXGate, HGate, Measure, SwapGate
+from qiskit.circuit.library import CCXGate, CXGate, HGate, Measure, SwapGate
 from qiskit.circuit.classical import expr, types
 from qiskit.circuit.random import random_circuit
 from qiskit.compiler.transpiler import transpile
@@ -30,7 +31,14 @@ from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.providers.fake_provider import GenericBackendV2
 from qiskit.transpiler.passes import SabreSwap, CheckMap
 from qiskit.transpiler.passes.routing.sabre_swap import Heuristic, SetScaling
-from qiskit.transpiler import CouplingMap, Layout, PassManager, Target, TranspilerError
+from qiskit.transpiler import (
+    CouplingMap,
+    InstructionProperties,
+    Layout,
+    PassManager,
+    Target,
+    TranspilerError,
+)
 from qiskit import ClassicalRegister, QuantumRegister, QuantumCircuit
 from qiskit.utils import optionals
 from test.utils._canonical import canonicalize_control_flow
@@ -402,6 +410,133 @@ class TestSabreSwap(QiskitTestCase):
         with self.assertRaisesRegex(TranspilerError, "Fewer qubits in the circuit"):
             pass_(qc)
 
+    def test_time_limit(self):
+        """Test that a spent time limit runs only the first trial, and that the output is the same
+        as from running that trial alone."""
+        qc = QuantumCircuit(10)
+        for i in range(5):
+            qc.cx(i, i + 5)
+            qc.cx(i, 9 - i)
+        coupling = CouplingMap.from_line(10)
+        limited = SabreSwap(coupling, "decay", seed=0, trials=8, time_limit=0.0)
+        single = SabreSwap(coupling, "decay", seed=0, trials=1)
+        out = limited(qc)
+        self.assertEqual(limited.property_set["sabre_swap_trials_completed"], 1)
+        self.assertEqual(out, single(qc))
+        check_map_pass = CheckMap(coupling)
+        check_map_pass(out)
+        self.assertTrue(check_map_pass.property_set["is_swap_mapped"])
+
+    @ddt.data("basic", "lookahead", "decay")
+    def test_lazy_distance(self, heuristic):
+        """Test that computing the distances on demand gives the same routing as the dense
+        matrix."""
+        coupling = CouplingMap.from_heavy_hex(5)
+        qc = random_circuit(coupling.size(), 10, max_operands=2, seed=2026)
+        dense = SabreSwap(coupling, heuristic, seed=0, trials=4, lazy_distance=False)
+        lazy = SabreSwap(coupling, heuristic, seed=0, trials=4, lazy_distance=True)
+        self.assertEqual(dense(qc), lazy(qc))
+        self.assertTrue(lazy._routing_target.lazy_distance)
+        np.testing.assert_array_equal(lazy.dist_matrix, dense.dist_matrix)
+
+    def test_window_size_single_window(self):
+        """Test that a window that covers the whole circuit gives the same output as no
+        windowing."""
+        coupling = CouplingMap.from_heavy_hex(3)
+        qc = random_circuit(coupling.size(), 10, max_operands=2, seed=2026)
+        full = SabreSwap(coupling, "decay", seed=0, trials=4)
+        windowed = SabreSwap(coupling, "decay", seed=0, trials=4, window_size=qc.size())
+        self.assertEqual(full(qc), windowed(qc))
+        self.assertEqual(full.property_set["final_layout"], windowed.property_set["final_layout"])
+
+    @ddt.data(1, 3, 10)
+    def test_window_size(self, window_size):
+        """Test that routing in small windows produces a valid routing of all the operations."""
+        coupling = CouplingMap.from_line(8)
+        qc = QuantumCircuit(8)
+        for layer in range(6):
+            for i in range(4):
+                qc.h(i)
+                qc.cx(i, 7 - ((i + layer) % 4))
+        qc.measure_all()
+        pass_ = SabreSwap(coupling, "decay", seed=0, trials=2, window_size=window_size)
+        out = pass_(qc)
+        check_map_pass = CheckMap(coupling)
+        check_map_pass(out)
+        self.assertTrue(check_map_pass.property_set["is_swap_mapped"])
+        out_ops = out.count_ops()
+        out_ops.pop("swap", None)
+        self.assertEqual(out_ops, qc.count_ops())
+
+    def test_window_size_invalid(self):
+        """Test that a non-positive window size is rejected."""
+        with self.assertRaisesRegex(TranspilerError, "window size must be positive"):
+            SabreSwap(CouplingMap.from_line(4), window_size=0)
+
+    def test_time_limit_invalid(self):
+        """Test that a negative time limit is rejected."""
+        with self.assertRaisesRegex(TranspilerError, "non-negative"):
+            SabreSwap(CouplingMap.from_line(4), time_limit=-0.5)
+
+    def test_error_heuristic(self):
+        """Test that the error heuristic routes around a coupler with a high error rate."""
+        # On a ring of six qubits, qubits 0 and 3 are equally far apart both ways round, but the
+        # way through qubits 1 and 2 has a bad coupler.
+        coupling = CouplingMap.from_ring(6)
+        bad = {(1, 2), (2, 1)}
+        target = Target(num_qubits=6)
+        target.add_instruction(
+            CXGate(),
+            {
+                edge: InstructionProperties(error=0.2 if edge in bad else 1e-3)
+                for edge in coupling.get_edges()
+            },
+        )
+        qc = QuantumCircuit(6)
+        qc.cx(0, 3)
+        qc.cx(3, 0)
+        for seed in range(5):
+            sabre = SabreSwap(target, "error", seed=seed, trials=1)
+            routed = sabre(qc)
+            self.assertFalse(
+                [
+                    inst
+                    for inst in routed.data
+                    if {routed.find_bit(q).index for q in inst.qubits} == {1, 2}
+                ]
+            )
+            distance = sabre.dist_matrix
+            self.assertGreater(distance[1, 2], 2.0)
+            self.assertAlmostEqual(distance[0, 3], distance[3, 0])
+            # The routing target keeps its weights when pickled.
+            np.testing.assert_array_equal(
+                pickle.loads(pickle.dumps(sabre._routing_target)).distance_matrix(), distance
+            )
+        # Without error rates in the target, this is the same as 'decay'.
+        plain = Target.from_configuration(["u", "cx"], coupling_map=coupling)
+        self.assertEqual(
+            SabreSwap(plain, "error", seed=0, trials=2)(qc),
+            SabreSwap(plain, "decay", seed=0, trials=2)(qc),
+        )
+
+    def test_error_heuristic_lazy_distance(self):
+        """Test that the error heuristic cannot be used with lazy distances."""
+        backend = GenericBackendV2(num_qubits=5, coupling_map=CouplingMap.from_line(5), seed=0)
+        qc = QuantumCircuit(5)
+        qc.cx(0, 4)
+        with self.assertRaisesRegex(TranspilerError, "lazy distances"):
+            SabreSwap(backend.target, "error", lazy_distance=True)(qc)
+
+    def test_heuristic_with_error_pickle(self):
+        """Test that a heuristic with the error component can be pickled."""
+        heuristic = Heuristic(attempt_limit=50).with_basic(1.0, SetScaling.Constant)
+        with_error = heuristic.with_error(2.0)
+        self.assertNotEqual(heuristic, with_error)
+        self.assertEqual(pickle.loads(pickle.dumps(with_error)), with_error)
+        self.assertIn("ErrorHeuristic(weight=2.0", repr(with_error))
+        with self.assertRaises(ValueError):
+            heuristic.with_error(-1.0)
+
 
 @ddt.ddt
 class TestSabreSwapControlFlow(QiskitTestCase):
@@ -14,6 +14,7 @@
 
 import os
 import unittest
+import unittest.mock
 import tempfile
 import numpy as np
 import scipy
@@ -45,7 +46,10 @@ from qiskit.synthesis.discrete_basis.generate_basis_approximations import (
 from qiskit.transpiler import PassManager
 from qiskit.transpiler.passes import UnitarySynthesis, Collect1qRuns, ConsolidateBlocks
 from qiskit.transpiler.passes.synthesis import SolovayKitaev, SolovayKitaevSynthesis
-from qiskit.synthesis.discrete_basis import SolovayKitaevDecomposition
+from qiskit.synthesis.discrete_basis import SolovayKitaevDecomposition, solovay_kitaev
+from qiskit._accelerate.synthesis.discrete_basis import (
+    SolovayKitaevSynthesis as RustSolovayKitaevSynthesis,
+)
 from test import QiskitTestCase, combine
 
 
@@ -495,6 +499,34 @@ class TestSolovayKitaevDecomposition(QiskitTestCase):
 
         self.assertEqual(synth, expected)
 
+    def test_cache_directory(self):
+        """Test generated basic approximations are cached and reloaded."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with unittest.mock.patch.dict(os.environ, {"QISKIT_SK_CACHE_DIR": tmp_dir}):
+                reference = SolovayKitaevDecomposition(basis_gates=["h", "s", "sdg"], depth=4)
+                cached = os.listdir(tmp_dir)
+                self.assertEqual(cached, ["h_s_sdg-depth4-v2.bin"])
+
+                with unittest.mock.patch.object(
+                    solovay_kitaev, "RustSolovayKitaevSynthesis", wraps=RustSolovayKitaevSynthesis
+                ) as rust_sk:
+                    loaded = SolovayKitaevDecomposition(basis_gates=["h", "s", "sdg"], depth=4)
+                rust_sk.assert_not_called()
+                rust_sk.from_basic_approximations.assert_called_once()
+
+                # A corrupted cache is regenerated.
+                path = os.path.join(tmp_dir, cached[0])
+                with open(path, "wb") as file:
+                    file.write(b"QKSKBA02")
+                regenerated = SolovayKitaevDecomposition(basis_gates=["h", "s", "sdg"], depth=4)
+
+            uncached = SolovayKitaevDecomposition(
+                basis_gates=["h", "s", "sdg"], depth=4, use_cache=False
+            )
+
+        for sk in (loaded, regenerated, uncached):
+            self.assertEqual(sk.run(RXGate(0.8), 3), reference.run(RXGate(0.8), 3))
+
     @data("cx", CXGate())
     def test_rejects_multi_qubit_basis_gate(self, gate):
         """Test that multi-qubit basis gates are rejected before calling into Rust."""
@@ -25,6 +25,7 @@ from qiskit.quantum_info import Operator
 from qiskit.transpiler.passes import VF2Layout, ApplyLayout, SabreSwap, SabreLayout
 from qiskit.transpiler.passes.routing.star_prerouting import StarPreRouting
 from qiskit.transpiler.coupling import CouplingMap
+from qiskit.transpiler.layout import Layout
 from qiskit.transpiler.passmanager import PassManager
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 from qiskit.utils.optionals import HAS_AER
@@ -505,3 +506,23 @@ class TestStarPreRouting(QiskitTestCase):
             edge for node in new_dag.op_nodes() if (edge := get_edge(node, new_dag)) is not None
         }
         self.assertEqual(len(edges), new_dag.num_qubits() - 1)
+
+    @ddt.data(4, 8, 16)
+    def test_native_matches_python(self, num_qubits):
+        """Test that the native implementation gives the same circuit as the Python one."""
+        qc = synth_qft_full(num_qubits, do_swaps=False)
+        qc.h(0)
+        qc.cx(0, range(1, num_qubits))
+        qc.measure_all()
+        dag = circuit_to_dag(qc)
+
+        pass_ = StarPreRouting()
+        blocks, processing_order = pass_.determine_star_blocks_processing(dag, min_block_size=2)
+        expected_dag, expected_mapping = pass_.star_preroute(dag, blocks, processing_order)
+        new_dag = pass_.run(dag)
+
+        self.assertEqual(dag_to_circuit(new_dag), dag_to_circuit(expected_dag))
+        self.assertEqual(
+            pass_.property_set["virtual_permutation_layout"],
+            Layout({dag.qubits[out]: idx for idx, out in enumerate(expected_mapping)}),
+        )
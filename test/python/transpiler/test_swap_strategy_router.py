@@ -614,6 +614,29 @@ class TestPauliEvolutionSwapStrategies(QiskitTestCase):
         self.assertEqual(swapped.layout.routing_permutation(), [3, 1, 2, 0])
         self.assertEqual(full.layout.routing_permutation(), [0, 1, 2, 3])
 
+    def test_dense_block_on_line(self):
+        """Test routing a block of commuting gates between every pair of qubits on a line."""
+        num_qubits = 8
+        terms = []
+        for i in range(num_qubits):
+            for j in range(i):
+                label = ["I"] * num_qubits
+                label[i] = label[j] = "Z"
+                terms.append(("".join(label), i + j / 10))
+        circ = QuantumCircuit(num_qubits)
+        circ.append(PauliEvolutionGate(SparsePauliOp.from_list(terms), 1), range(num_qubits))
+
+        swap_strat = SwapStrategy.from_line(list(range(num_qubits)))
+        pm_ = PassManager([FindCommutingPauliEvolutions(), Commuting2qGateRouter(swap_strat)])
+        swapped = pm_.run(circ)
+
+        line_edges = set(CouplingMap.from_line(num_qubits).get_edges())
+        for instruction in swapped.data:
+            qubits = tuple(swapped.find_bit(qubit).index for qubit in instruction.qubits)
+            self.assertIn(qubits, line_edges)
+        self.assertEqual(swapped.count_ops()["PauliEvolution"], len(terms))
+        self.assertTrue(Operator.from_circuit(swapped).equiv(Operator(circ)))
+
 
 class TestSwapRouterExceptions(QiskitTestCase):
     """Test that exceptions are properly raised."""
@@ -12,6 +12,9 @@
 
 """Test the SynthesizeRZRotations pass"""
 
+import os
+import tempfile
+
 import numpy as np
 
 from ddt import ddt, data
@@ -223,6 +226,73 @@ class TestSynthesizeRzRotations(QiskitTestCase):
 
         self.assertLessEqual(operator_norm_distance(qc, full_angle), full_error)
 
+    def test_cache_across_runs(self):
+        """Test synthesis results are reused across runs and pass instances."""
+        SynthesizeRZRotations.clear_cache()
+        self.addCleanup(SynthesizeRZRotations.clear_cache)
+
+        qc = QuantumCircuit(1)
+        qc.rz(0.123, 0)
+        qc.rz(0.123, 0)
+        qc.rz(1.0, 0)
+        first = SynthesizeRZRotations(synthesis_error=1e-8, cache_error=0.0)(qc)
+        self.assertEqual(SynthesizeRZRotations.cache_info()[:4], (0, 2, 0, 2))
+
+        second = SynthesizeRZRotations(synthesis_error=1e-8, cache_error=0.0)(qc)
+        self.assertEqual(second, first)
+        self.assertEqual(SynthesizeRZRotations.cache_info()[:4], (2, 2, 0, 2))
+
+        # A different synthesis error has its own entries.
+        SynthesizeRZRotations(synthesis_error=1e-6, cache_error=0.0)(qc)
+        self.assertEqual(SynthesizeRZRotations.cache_info().currsize, 4)
+
+        uncached = SynthesizeRZRotations(synthesis_error=1e-8, cache_error=0.0, use_cache=False)
+        self.assertEqual(uncached(qc), first)
+        self.assertEqual(SynthesizeRZRotations.cache_info().hits, 2)
+
+    def test_cache_eviction(self):
+        """Test the least recently used entries are evicted."""
+        SynthesizeRZRotations.clear_cache()
+        maxsize = SynthesizeRZRotations.cache_info().maxsize
+        self.addCleanup(SynthesizeRZRotations.set_cache_size, maxsize)
+        self.addCleanup(SynthesizeRZRotations.clear_cache)
+        SynthesizeRZRotations.set_cache_size(2)
+
+        synth = SynthesizeRZRotations(synthesis_error=1e-6, cache_error=0.0)
+        for angle in [0.1, 0.2, 0.1, 0.3, 0.2]:
+            qc = QuantumCircuit(1)
+            qc.rz(angle, 0)
+            synth(qc)
+        info = SynthesizeRZRotations.cache_info()
+        self.assertEqual((info.hits, info.misses, info.evictions, info.currsize), (1, 4, 2, 2))
+
+    def test_cache_save_load(self):
+        """Test the cache can be written to and read from disk."""
+        SynthesizeRZRotations.clear_cache()
+        self.addCleanup(SynthesizeRZRotations.clear_cache)
+
+        qc = QuantumCircuit(1)
+        qc.rz(0.4, 0)
+        qc.rz(0.9, 0)
+        synth = SynthesizeRZRotations(synthesis_error=1e-8, cache_error=0.0)
+        expected = synth(qc)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "rz_cache.bin")
+            SynthesizeRZRotations.save_cache(filename)
+            SynthesizeRZRotations.clear_cache()
+            self.assertEqual(SynthesizeRZRotations.load_cache(filename), 2)
+
+        self.assertEqual(synth(qc), expected)
+        self.assertEqual(SynthesizeRZRotations.cache_info()[:2], (2, 0))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "not_a_cache.bin")
+            with open(filename, "wb") as file:
+                file.write(b"QKRZC001\x05")
+            with self.assertRaises(OSError):
+                SynthesizeRZRotations.load_cache(filename)
+
 
 def operator_norm_distance(circuit, angle):
     """Return the operator norm distance of the circuit to RZ(angle)."""
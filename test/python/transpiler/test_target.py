@@ -33,7 +33,7 @@ from qiskit.circuit.library import (
     CZGate,
     UnitaryGate,
 )
-from qiskit.circuit import IfElseOp, ForLoopOp, WhileLoopOp, SwitchCaseOp
+from qiskit.circuit import IfElseOp, ForLoopOp, WhileLoopOp, SwitchCaseOp, QuantumCircuit
 from qiskit.circuit.measure import Measure
 from qiskit.circuit.parameter import Parameter
 from qiskit.transpiler.coupling import CouplingMap
@@ -1223,6 +1223,88 @@ Instructions:
         target.add_instruction(CZGate(), {None: None})
         self.assertEqual(target.num_qubits, num_qubits)
 
+    def test_fingerprint_independent_of_order(self):
+        """Test that the fingerprint doesn't depend on the order instructions were added in."""
+        cx_props = {(0, 1): InstructionProperties(error=1e-2), (1, 2): None}
+        x_props = {(0,): InstructionProperties(duration=3e-8), (1,): None, (2,): None}
+        first = Target(num_qubits=3, description="first")
+        first.add_instruction(CXGate(), cx_props)
+        first.add_instruction(XGate(), x_props)
+        first.add_instruction(IfElseOp, name="if_else")
+        second = Target(num_qubits=3, description="second")
+        second.add_instruction(IfElseOp, name="if_else")
+        second.add_instruction(XGate(), dict(reversed(x_props.items())))
+        second.add_instruction(CXGate(), dict(reversed(cx_props.items())))
+        self.assertEqual(first.fingerprint(), second.fingerprint())
+        self.assertEqual(first.fingerprint(), loads(dumps(first)).fingerprint())
+
+    def test_fingerprint_covers_contents(self):
+        """Test that changes to the contents of the target change the fingerprint."""
+        target = GenericBackendV2(num_qubits=3, seed=42).target
+        fingerprint = target.fingerprint()
+        qargs = next(iter(target["cx"]))
+        target.update_instruction_properties("cx", qargs, InstructionProperties(error=0.5))
+        updated = target.fingerprint()
+        self.assertNotEqual(fingerprint, updated)
+        target.add_instruction(RXGate(self.theta), {(0,): None})
+        self.assertNotEqual(updated, target.fingerprint())
+        self.assertNotEqual(
+            Target(num_qubits=3).fingerprint(), Target(num_qubits=3, dt=1e-9).fingerprint()
+        )
+
+    def test_fingerprint_covers_angle_bounds(self):
+        """Test that targets which differ only in their angle bounds have different fingerprints."""
+        fingerprints = set()
+        for angle_bounds in [None, [(0, math.pi)], [(-math.pi, math.pi)]]:
+            target = Target(num_qubits=1)
+            target.add_instruction(RZGate(self.theta), {(0,): None}, angle_bounds=angle_bounds)
+            fingerprints.add(target.fingerprint())
+            self.assertEqual(target.fingerprint(), loads(dumps(target)).fingerprint())
+        self.assertEqual(len(fingerprints), 3)
+
+    def test_fingerprint_covers_gate_definitions(self):
+        """Test that custom gates of the same type and name with different definitions give
+        different fingerprints."""
+
+        def custom_gate(inner):
+            definition = QuantumCircuit(2, name="custom")
+            definition.append(inner, [0, 1])
+            return definition.to_gate()
+
+        fingerprints = set()
+        for inner in [CXGate(), CZGate(), UnitaryGate(np.eye(4))]:
+            target = Target(num_qubits=2)
+            target.add_instruction(custom_gate(inner), {(0, 1): None})
+            fingerprints.add(target.fingerprint())
+        self.assertEqual(len(fingerprints), 3)
+
+        # Large matrices are hashed in full, rather than through their elided ``repr``.
+        first, second = Target(num_qubits=6), Target(num_qubits=6)
+        matrix = np.eye(2**6)
+        first.add_instruction(UnitaryGate(matrix), {tuple(range(6)): None}, name="unitary")
+        matrix[[-2, -1]] = matrix[[-1, -2]]
+        second.add_instruction(UnitaryGate(matrix), {tuple(range(6)): None}, name="unitary")
+        self.assertNotEqual(first.fingerprint(), second.fingerprint())
+
+    def test_fingerprint_covers_extra_instruction_properties(self):
+        """Test that fields added by a subclass of InstructionProperties are in the fingerprint."""
+
+        class CalibratedProperties(InstructionProperties):
+            """Properties with an extra field."""
+
+            def __init__(self, duration=None, error=None, calibration=None):
+                super().__init__(duration, error)
+                self.calibration = calibration
+
+        fingerprints = set()
+        for calibration in ["a", "b"]:
+            target = Target(num_qubits=2)
+            target.add_instruction(
+                CXGate(), {(0, 1): CalibratedProperties(error=1e-2, calibration=calibration)}
+            )
+            fingerprints.add(target.fingerprint())
+        self.assertEqual(len(fingerprints), 2)
+
 
 class TestGlobalVariableWidthOperations(QiskitTestCase):
     def setUp(self):
@@ -33,6 +33,7 @@ from qiskit.converters.circuit_to_dag import circuit_to_dag
 from qiskit.converters.circuit_to_dagdependency import circuit_to_dagdependency
 from qiskit.transpiler import PassManager
 from qiskit.transpiler.passes import TemplateOptimization
+from qiskit.transpiler.passes.optimization.template_matching import TemplateMatching
 from qiskit.circuit.library.templates import rzx
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.utils import optionals
@@ -839,6 +840,87 @@ class TestTemplateMatching(QiskitTestCase):
         self.assertEqual(result.count_ops(), {})
         self.assertEqual(Operator(circuit_in), Operator(result))
 
+    def test_native_matching_agrees_with_python(self):
+        """The native template matching finds the same matches as the Python implementation."""
+        qr = QuantumRegister(5, "qr")
+        circuit_in = QuantumCircuit(qr)
+        circuit_in.ccx(qr[3], qr[4], qr[0])
+        circuit_in.cx(qr[1], qr[4])
+        circuit_in.cx(qr[2], qr[1])
+        circuit_in.h(qr[3])
+        circuit_in.z(qr[1])
+        circuit_in.cx(qr[2], qr[3])
+        circuit_in.ccx(qr[2], qr[3], qr[0])
+        circuit_in.cx(qr[1], qr[4])
+        circuit_in.swap(qr[0], qr[2])
+        circuit_in.cx(qr[2], qr[1])
+        circuit_dag_dep = circuit_to_dagdependency(circuit_in)
+
+        templates = [template_nct_2a_2(), template_nct_5a_3(), clifford_2_4(), clifford_3_1()]
+        for template in templates:
+            template_dag_dep = circuit_to_dagdependency(template)
+            for heuristics_qubits, heuristics_backward in [(None, None), ([1], [3, 1])]:
+                with self.subTest(template=template.name, heuristics=heuristics_qubits):
+                    native = TemplateMatching(
+                        circuit_dag_dep, template_dag_dep, heuristics_qubits, heuristics_backward
+                    )
+                    native.run_template_matching()
+                    python = TemplateMatching(
+                        circuit_dag_dep, template_dag_dep, heuristics_qubits, heuristics_backward
+                    )
+                    python._run_template_matching_python()
+                    self.assertEqual(
+                        [(match.match, match.qubit) for match in native.match_list],
+                        [(match.match, match.qubit) for match in python.match_list],
+                    )
+
+    def test_template_with_clbits_keeps_clbit_configuration(self):
+        """A template with clbits is matched with the clbits of the circuit it is mapped to."""
+        circuit_in = QuantumCircuit(2, 2)
+        circuit_in.x(1)
+        circuit_in.x(1)
+        circuit_in.measure(1, 1)
+        template = QuantumCircuit(1, 1)
+        template.x(0)
+        template.x(0)
+        template.measure(0, 0)
+
+        matching = TemplateMatching(
+            circuit_to_dagdependency(circuit_in), circuit_to_dagdependency(template)
+        )
+        matching.run_template_matching()
+        longest = matching.match_list[0]
+        self.assertEqual(len(longest.match), 3)
+        self.assertEqual(longest.qubit, [[1]])
+        self.assertEqual(longest.clbit, [[1]])
+
+    def test_search_budget(self):
+        """A search budget bounds the backward search without changing the circuit's action."""
+        qr = QuantumRegister(5, "qr")
+        circuit_in = QuantumCircuit(qr)
+        circuit_in.ccx(qr[3], qr[4], qr[0])
+        circuit_in.cx(qr[1], qr[4])
+        circuit_in.cx(qr[2], qr[1])
+        circuit_in.h(qr[3])
+        circuit_in.z(qr[1])
+        circuit_in.cx(qr[2], qr[3])
+        circuit_in.ccx(qr[2], qr[3], qr[0])
+        circuit_in.cx(qr[1], qr[4])
+
+        for budget in [0, 1, 10]:
+            with self.subTest(budget=budget):
+                pass_ = TemplateOptimization([template_nct_5a_3()], search_budget=budget)
+                circuit_out = PassManager(pass_).run(circuit_in)
+                self.assertTrue(Operator(circuit_in).equiv(circuit_out))
+
+        # The budget is large enough to explore every scenario, so the match of the template is
+        # found as without it.
+        unbounded = PassManager(TemplateOptimization([template_nct_5a_3()])).run(circuit_in)
+        bounded = PassManager(
+            TemplateOptimization([template_nct_5a_3()], search_budget=10**6)
+        ).run(circuit_in)
+        self.assertEqual(unbounded, bounded)
+
 
 if __name__ == "__main__":
     unittest.main()
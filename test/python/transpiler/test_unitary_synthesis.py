@@ -502,6 +502,25 @@ class TestUnitarySynthesisBasisGates(QiskitTestCase):
                 result.assign_parameters([math.pi, -math.pi], inplace=True)
                 self.assertEqual(Operator(result), Operator(qc))
 
+    def test_repeated_unitaries_are_cached(self):
+        """Test that repeated two-qubit unitaries are decomposed once, with the same output."""
+        blocks = [random_unitary(4, seed=seed) for seed in range(3)]
+        qc = QuantumCircuit(5)
+        for _ in range(4):
+            for i, block in enumerate(blocks):
+                qc.unitary(block, [i, i + 1])
+                qc.unitary(block, [i + 1, i + 2])
+
+        cached = UnitarySynthesis(basis_gates=["cx", "u"])
+        uncached = UnitarySynthesis(basis_gates=["cx", "u"], cache_size=0)
+        self.assertEqual(cached(qc), uncached(qc))
+        hits = cached.property_set["UnitarySynthesis_cache_hits"]
+        misses = cached.property_set["UnitarySynthesis_cache_misses"]
+        self.assertEqual(hits + misses, 24)
+        # At worst, each block is decomposed once on each of the two links it acts on.
+        self.assertLessEqual(misses, 6)
+        self.assertEqual(uncached.property_set["UnitarySynthesis_cache_hits"], 0)
+
 
 @ddt
 class TestUnitarySynthesisTarget(QiskitTestCase):
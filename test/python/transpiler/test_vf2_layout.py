@@ -619,6 +619,24 @@ class TestVF2LayoutOther(LayoutTestCase):
 
         self.assertNotEqual(layout_1, layout_2)
 
+    def test_parallel_matches_serial(self):
+        """The parallel search finds the same layout as the serial one when no limit is hit."""
+        backend = GenericBackendV2(num_qubits=27, seed=42)
+        circuit = QuantumCircuit(6)
+        circuit.cx(0, range(1, 6))
+        circuit.cx(1, 2)
+        circuit.cx(3, 4)
+        dag = circuit_to_dag(circuit)
+        layouts = []
+        for parallel in (False, True):
+            vf2_pass = VF2Layout(target=backend.target, seed=2026, parallel=parallel)
+            vf2_pass.run(dag)
+            self.assertEqual(
+                vf2_pass.property_set["VF2Layout_stop_reason"], VF2LayoutStopReason.SOLUTION_FOUND
+            )
+            layouts.append(vf2_pass.property_set["layout"])
+        self.assertEqual(layouts[0], layouts[1])
+
     def test_3_q_gate(self):
         """The pass does not handle gates with more than 2 qubits"""
         seed_1 = 42
@@ -12,13 +12,19 @@
 
 """Test the VF2Layout pass"""
 
+from unittest import mock
+
 import ddt
 
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.circuit import ControlFlowOp, Parameter, library as lib
 from qiskit.transpiler import Layout, TranspilerError, PassManager, passes
 from qiskit.transpiler.passes import TrivialLayout, ApplyLayout
-from qiskit.transpiler.passes.layout.vf2_post_layout import VF2PostLayout, VF2PostLayoutStopReason
+from qiskit.transpiler.passes.layout.vf2_post_layout import (
+    VF2PostLayout,
+    VF2PostLayoutCache,
+    VF2PostLayoutStopReason,
+)
 from qiskit.converters import circuit_to_dag
 from qiskit.providers.fake_provider import GenericBackendV2
 from qiskit.compiler.transpiler import transpile
@@ -159,6 +165,87 @@ class TestVF2PostLayout(QiskitTestCase):
         self.assertLayoutV2(dag, backend.target, pass_.property_set)
         self.assertNotEqual(pass_.property_set["post_layout"], initial_layout)
 
+    def test_parallel_matches_serial(self):
+        """Test that the parallel search finds the same layout as the serial one."""
+        backend = GenericBackendV2(num_qubits=16, seed=2026)
+        qc = QuantumCircuit(5)
+        qc.h(0)
+        qc.cx(0, range(1, 5))
+        qc.measure_all()
+        tqc = transpile(qc, backend, seed_transpiler=self.seed, layout_method="trivial")
+        dag = circuit_to_dag(tqc)
+        layouts = []
+        for parallel in (False, True):
+            pass_ = VF2PostLayout(target=backend.target, seed=self.seed, parallel=parallel)
+            pass_.run(dag)
+            self.assertLayoutV2(dag, backend.target, pass_.property_set)
+            layouts.append(pass_.property_set["post_layout"])
+        self.assertEqual(layouts[0], layouts[1])
+
+    def test_cache_reuses_result(self):
+        """Test that the cache is hit by circuits with the same interactions but other angles."""
+        backend = GenericBackendV2(num_qubits=16, seed=2026)
+        cache = VF2PostLayoutCache()
+
+        def build(angle):
+            qc = QuantumCircuit(5)
+            qc.h(0)
+            qc.cx(0, range(1, 5))
+            qc.rz(angle, range(5))
+            qc.measure_all()
+            return transpile(qc, backend, seed_transpiler=self.seed, layout_method="trivial")
+
+        results = []
+        for angle in (0.1, 0.2):
+            dag = circuit_to_dag(build(angle))
+            pass_ = VF2PostLayout(target=backend.target, seed=self.seed, cache=cache)
+            pass_.run(dag)
+            self.assertLayoutV2(dag, backend.target, pass_.property_set)
+            results.append(pass_.property_set)
+        self.assertFalse(results[0]["VF2PostLayout_cache_hit"])
+        self.assertTrue(results[1]["VF2PostLayout_cache_hit"])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(results[0]["post_layout"], results[1]["post_layout"])
+
+    def test_cache_miss_on_different_target(self):
+        """Test that the error rates of the target are part of the cache key."""
+        cache = VF2PostLayoutCache()
+        qc = QuantumCircuit(2)
+        qc.cx(0, 1)
+        dag = circuit_to_dag(qc)
+        for error in (0.1, 0.2):
+            target = Target(num_qubits=3)
+            target.add_instruction(
+                lib.CXGate(),
+                {
+                    (0, 1): InstructionProperties(error=error),
+                    (1, 2): InstructionProperties(error=0.15),
+                },
+            )
+            VF2PostLayout(target=target, seed=self.seed, cache=cache).run(dag)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertEqual(len(cache), 2)
+
+    def test_cache_key_uses_target_fingerprint_once(self):
+        """Test that a pass takes the fingerprint of its target once, rather than on every run."""
+        target = Target(num_qubits=3)
+        target.add_instruction(
+            lib.CXGate(),
+            {
+                (0, 1): InstructionProperties(error=0.1),
+                (1, 2): InstructionProperties(error=0.15),
+            },
+        )
+        qc = QuantumCircuit(2)
+        qc.cx(0, 1)
+        dag = circuit_to_dag(qc)
+        pass_ = VF2PostLayout(target=target, seed=self.seed, cache=VF2PostLayoutCache())
+        with mock.patch.object(Target, "fingerprint", autospec=True, return_value="abc") as fp:
+            pass_.run(dag)
+            pass_.run(dag)
+        fp.assert_called_once_with(target)
+        self.assertEqual((pass_.cache.hits, pass_.cache.misses), (1, 1))
+
     def test_2q_circuit_5q_backend_v2(self):
         """A simple example, without considering the direction
           0 - 1